@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_asgi_application()
+
+# Datos de referencia (monedas, tipos de donante, estados...) cargados al arrancar
+from core.refdata import warm_all  # noqa: E402
+
+warm_all()
@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/5.2/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -39,11 +40,15 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'corsheaders',   
+    'core',
     'users',
     'finance',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.DBTimingMiddleware',
+    'core.profiling.ProfilerMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -78,15 +83,73 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
 # Database Configuration
+# Sessions come from a python-oracledb pool (OPTIONS['pool'] is handed to
+# oracledb.create_pool). Set DB_POOL_ENABLED=0 to go back to one logon per
+# request. CONN_MAX_AGE must stay at 0: the pool keeps the sessions alive.
+DB_POOL_ENABLED = os.environ.get('DB_POOL_ENABLED', '1') == '1'
+DB_POOL_OPTIONS = {
+    'min': int(os.environ.get('DB_POOL_MIN', 2)),
+    'max': int(os.environ.get('DB_POOL_MAX', 10)),
+    'increment': int(os.environ.get('DB_POOL_INCREMENT', 1)),
+    # Sesiones ociosas más de N segundos se validan con un ping antes de entregarse
+    'ping_interval': int(os.environ.get('DB_POOL_PING_INTERVAL', 60)),
+    'stmtcachesize': int(os.environ.get('DB_STMT_CACHE_SIZE', 40)),
+}
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.oracle',
+        'ENGINE': 'core.backends.oracle',
         'NAME': 'localhost:1521/XEPDB1',  
         'USER': 'redRomero',
         'PASSWORD': 'red123',
+        'CONN_MAX_AGE': 0,
+        'OPTIONS': {'pool': DB_POOL_OPTIONS} if DB_POOL_ENABLED else {},
     }
 }
 
+# DB_ENGINE=standin runs against a local SQLite file built from scripts/
+# (core/backends/standin) instead of Oracle: for tests, benchmarks and work
+# without an XE instance. STANDIN_SEED=0 skips the sample data.
+DB_ENGINE = os.environ.get('DB_ENGINE', 'oracle')
+if DB_ENGINE == 'standin':
+    DATABASES['default'] = {
+        'ENGINE': 'core.backends.standin',
+        'NAME': os.environ.get('STANDIN_DB', str(BASE_DIR / 'standin.sqlite3')),
+        'OPTIONS': {'seed': os.environ.get('STANDIN_SEED', '1') == '1'},
+    }
+
+# Cache backend. Table version counters (core/cache.py) live here; use a
+# shared backend (Redis/Memcached) when running several worker processes so a
+# write in one process invalidates cached data in all of them. Token
+# revocations (users/authentication.py) live here too: with DEBUG off and
+# JWT_CLAIMS_USER on, a per-process backend is refused at startup.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'redromero'),
+    }
+}
+
+# Reference data (core/refdata.py): how often a process re-checks table
+# versions to pick up changes made by other processes.
+REFDATA_VERSION_CHECK_SECONDS = int(os.environ.get('REFDATA_VERSION_CHECK_SECONDS', 5))
+
+# Query-result cache (core/querycache.py). Entries are invalidated through
+# table versions; the TTL is only a safety net for writes made outside the app.
+QUERY_CACHE_TIMEOUT = int(os.environ.get('QUERY_CACHE_TIMEOUT', 600))
+
+# Independent dashboard queries run concurrently, each on its own pooled
+# session, through a bounded thread pool (see core/concurrency.py).
+DASHBOARD_PARALLEL_QUERIES = os.environ.get('DASHBOARD_PARALLEL_QUERIES', '1') == '1'
+DB_FANOUT_WORKERS = int(os.environ.get('DB_FANOUT_WORKERS', 4))
+
+# Admin and finance dashboards are served stale-while-revalidate (core/swr.py):
+# older than the soft TTL -> refreshed in the background; older than the hard
+# TTL -> recomputed on the request.
+DASHBOARD_SWR = os.environ.get('DASHBOARD_SWR', '1') == '1'
+DASHBOARD_SOFT_TTL = int(os.environ.get('DASHBOARD_SOFT_TTL', 30))
+DASHBOARD_HARD_TTL = int(os.environ.get('DASHBOARD_HARD_TTL', 900))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -143,6 +206,56 @@ SIMPLE_JWT = {
 }
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.ClaimsJWTAuthentication',
     ),
-}
\ No newline at end of file
+}
+# request.user is built from the token claims (users/authentication.py)
+# instead of loading System_User on every request.
+JWT_CLAIMS_USER = os.environ.get('JWT_CLAIMS_USER', '1') == '1'
+
+# Keyset pagination for date-ordered feeds (donations, reports, audit logs)
+KEYSET_PAGE_SIZE = 50
+KEYSET_MAX_PAGE_SIZE = 200
+
+# Per-request DB statistics (core/middleware.py): Server-Timing header plus
+# one JSON log line per request on the 'core.requests' logger. Budgets are
+# keyed by URL name; a request over budget is logged as a warning.
+DB_INSTRUMENTATION = os.environ.get('DB_INSTRUMENTATION', '1') == '1'
+DB_QUERY_BUDGETS = {
+    'default': {'queries': 8, 'db_ms': 300},
+    'admin_dashboard_data': {'queries': 4},
+    'volunteer_dashboard_data': {'queries': 2},
+    'representative_my_ngo': {'queries': 2},
+    'reports-analytics': {'queries': 4},
+}
+
+# Slow-query log (core/slowlog.py): statements over SLOW_QUERY_MS are stored
+# with binds and execution plan in a rotating JSONL file.
+# `python manage.py slowqueries` lists the top offenders.
+SLOW_QUERY_MS = int(os.environ.get('SLOW_QUERY_MS', 500))
+# Binds are stored as type and length; '1' stores their values (personal
+# data such as passwords, emails and phones stays masked)
+SLOW_QUERY_LOG_BIND_VALUES = os.environ.get('SLOW_QUERY_LOG_BIND_VALUES', '0') == '1'
+SLOW_QUERY_CAPTURE_PLAN = os.environ.get('SLOW_QUERY_CAPTURE_PLAN', '1') == '1'
+SLOW_QUERY_LOG = os.environ.get('SLOW_QUERY_LOG', BASE_DIR / 'logs' / 'slow_queries.jsonl')
+SLOW_QUERY_LOG_MAX_BYTES = 5 * 1024 * 1024
+SLOW_QUERY_LOG_BACKUPS = 3
+
+# Prometheus metrics at /metrics (core/metrics.py). With METRICS_DIR set,
+# every worker process writes its metrics there and the endpoint merges them;
+# empty the directory on deploy. METRICS_TOKEN, if set, is required as a
+# Bearer token to scrape; without it only clients in METRICS_ALLOWED_NETWORKS
+# (comma-separated CIDRs, loopback by default) may scrape. Behind a reverse
+# proxy REMOTE_ADDR is the proxy, so set a token there.
+METRICS_DIR = os.environ.get('METRICS_DIR') or None
+METRICS_FLUSH_SECONDS = int(os.environ.get('METRICS_FLUSH_SECONDS', 5))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_ALLOWED_NETWORKS = [
+    net.strip() for net in os.environ.get('METRICS_ALLOWED_NETWORKS', '127.0.0.0/8,::1/128').split(',')
+    if net.strip()
+]
+
+# ?profile=1 (folded stacks) or ?profile=json on any endpoint, ADMIN only:
+# the request runs under a sampling profiler (core/profiling.py).
+REQUEST_PROFILING = os.environ.get('REQUEST_PROFILING', '1') == '1'
+PROFILE_INTERVAL_MS = float(os.environ.get('PROFILE_INTERVAL_MS', 2))
@@ -108,4 +108,7 @@ urlpatterns = [
     
     # --- FINANCE & WORKFLOW ---
     path('', include('finance.urls')),
+
+    # --- INFRASTRUCTURE (pool stats) ---
+    path('', include('core.urls')),
 ]
\ No newline at end of file
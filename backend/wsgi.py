@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_wsgi_application()
+
+# Datos de referencia (monedas, tipos de donante, estados...) cargados al arrancar
+from core.refdata import warm_all  # noqa: E402
+
+warm_all()
@@ -0,0 +1,166 @@
+"""
+Benchmark: AdminDashboardData with serial vs. concurrent query fan-out.
+
+By default GET /api/admin/dashboard-data/ is requested through harness.py
+(django.test.Client, JWT, middleware and core.db as in production) against
+the local database, first with DASHBOARD_PARALLEL_QUERIES off and then on.
+Stale-while-revalidate and the result cache are turned off for the run
+(DASHBOARD_SWR=False, QUERY_CACHE_TIMEOUT=0), so every request runs the four
+dashboard queries. On the SQLite stand-in there is no network round trip:
+the numbers show the fan-out overhead, not the latency it hides on Oracle.
+
+--synthetic measures no database at all. The four queries are replaced by
+a time.sleep model (one round trip plus a per-query service time, with
+jitter, limited by a semaphore the size of DB_POOL_MAX) that returns canned
+rows; only the view, the thread pool and the result merging are real. Its
+report and JSON are labelled SYNTHETIC.
+
+Usage (from the repo root):
+
+    python manage.py generate_dataset
+    python benchmarks/dashboard_fanout.py --requests 200 --clients 4
+    python benchmarks/dashboard_fanout.py --synthetic --rtt-ms 8
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import harness  # noqa: E402
+
+DATABASE = harness.setup()
+
+from django.conf import settings  # noqa: E402
+from django.test import override_settings  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from users import views as user_views  # noqa: E402
+
+PATH = '/api/admin/dashboard-data/'
+SYNTHETIC_LABEL = 'SYNTHETIC (time.sleep latency model, no database)'
+
+# Tiempo de servicio (ms) de cada consulta en Oracle, medido a ojo en XE
+SERVICE_MS = {
+    'PKG_DASHBOARD_ANALYTICS.get_main_kpis': 12.0,
+    'PKG_DASHBOARD_ANALYTICS.get_projects_paginated': 9.0,
+    'PKG_DASHBOARD_ANALYTICS.get_donation_trends': 7.0,
+    'PKG_DASHBOARD_ANALYTICS.get_project_status_distribution': 4.0,
+}
+
+
+class LatencyStandIn:
+    """Sleeps RTT + service time per call and hands back canned rows (--synthetic only)."""
+
+    def __init__(self, rtt_ms, jitter, pool_max, seed):
+        self.rtt_ms = rtt_ms
+        self.jitter = jitter
+        self.sessions = threading.BoundedSemaphore(pool_max)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def _delay(self, name):
+        with self.lock:
+            factor = 1 + self.rng.uniform(-self.jitter, self.jitter)
+        return (self.rtt_ms + SERVICE_MS[name]) * factor / 1000.0
+
+    def _call(self, name, rows):
+        with self.sessions:
+            time.sleep(self._delay(name))
+        return rows
+
+    def fetch_pipelined_function(self, function_name, mode=None):
+        return self._call(function_name, [
+            {'metric_name': 'ACTIVE_PROJECTS', 'current_value': 42, 'percentage_change': 5.0, 'trend': 'UP'},
+            {'metric_name': 'MONTHLY_DONATIONS', 'current_value': 125000, 'percentage_change': 2.5, 'trend': 'DOWN'},
+            {'metric_name': 'ACTIVE_VOLUNTEERS', 'current_value': 310, 'percentage_change': 0.0, 'trend': 'STABLE'},
+            {'metric_name': 'PENDING_APPROVALS', 'current_value': 7, 'percentage_change': 1.0, 'trend': 'UP'},
+        ])
+
+    def fetch_procedure_cursor(self, procedure_call, params=None, out_args_count=0, **kwargs):
+        if procedure_call.endswith('get_projects_paginated'):
+            rows = [
+                {'project_id': i, 'name': f'Project {i}', 'ngo_name': f'NGO {i % 3}',
+                 'status_name': 'ACTIVO', 'end_date': date.today() + timedelta(days=i), 'total_count': 42}
+                for i in range(1, 11)
+            ]
+        elif procedure_call.endswith('get_donation_trends'):
+            rows = [{'mes_nombre': m, 'monto_total': 1000 * i}
+                    for i, m in enumerate(['January', 'February', 'March', 'April'], 1)]
+        else:
+            rows = [{'status_name': s, 'cantidad': n} for s, n in [('ACTIVO', 20), ('CERRADO', 12)]]
+        return self._call(procedure_call, rows), None
+
+
+def http_task(args):
+    """One dashboard request as the admin user, through the whole stack."""
+    session = harness.Session('ADMIN', args.user or f'{args.prefix}_admin')
+    session.login(args.password)
+
+    def one(_):
+        sample, body = session.request('get', PATH)
+        return sample
+    return one
+
+
+def synthetic_task(args):
+    """The view called directly, with core.db replaced by LatencyStandIn."""
+    stand_in = LatencyStandIn(args.rtt_ms, args.jitter, settings.DB_POOL_OPTIONS['max'], args.seed)
+    user_views.fetch_pipelined_function = stand_in.fetch_pipelined_function
+    user_views.fetch_procedure_cursor = stand_in.fetch_procedure_cursor
+    factory = APIRequestFactory()
+    view = user_views.AdminDashboardData.as_view()
+
+    def one(_):
+        start = time.perf_counter()
+        response = view(factory.get(PATH))
+        return harness.Sample((time.perf_counter() - start) * 1000, response.status_code, 0, 0.0)
+    return one
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--clients', type=int, default=1, help='concurrent dashboard requests')
+    parser.add_argument('--prefix', default='gen', help='generate_dataset prefix of the admin user')
+    parser.add_argument('--user', help='admin username (default <prefix>_admin)')
+    parser.add_argument('--password', default='bench123', help='password of the admin user')
+    parser.add_argument('--synthetic', action='store_true', help='time.sleep latency model instead of the database')
+    parser.add_argument('--rtt-ms', type=float, default=8.0, help='--synthetic: simulated network round trip')
+    parser.add_argument('--jitter', type=float, default=0.25, help='--synthetic: +/- fraction applied to each call')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='JSON results file (default bench_results/...)')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        task = synthetic_task(args)
+        kind, database = 'dashboard_fanout-synthetic', SYNTHETIC_LABEL
+        print(f"{SYNTHETIC_LABEL}: rtt={args.rtt_ms}ms jitter=±{args.jitter:.0%}")
+    else:
+        task = http_task(args)
+        kind, database = 'dashboard_fanout', DATABASE
+    print(f"AdminDashboardData fan-out on {database}: {args.requests} requests, {args.clients} client(s), "
+          f"pool max={settings.DB_POOL_OPTIONS['max']}, workers={settings.DB_FANOUT_WORKERS}")
+    print(f"{'mode':<10}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}{'queries':>10}{'5xx':>6}")
+
+    results = []
+    for label, parallel in (('serial', False), ('parallel', True)):
+        # Sin stale-while-revalidate ni cache de resultados: cada petición llega a la base
+        with override_settings(DASHBOARD_PARALLEL_QUERIES=parallel, DASHBOARD_SWR=False, QUERY_CACHE_TIMEOUT=0):
+            task(-1)  # calentamiento (arranca los hilos del executor)
+            samples, wall = harness.drive(task, args.requests, args.clients)
+        summary = harness.summarize(samples, wall)
+        results.append({'mode': label, **summary})
+        print(f"{label:<10}{summary['p50_ms']:>10.1f}{summary['p95_ms']:>10.1f}{summary['mean_ms']:>10.1f}"
+              f"{summary['queries']:>10.1f}{summary['errors']:>6}")
+
+    payload = {'meta': harness.metadata(kind, database, args), 'results': results}
+    print(f"Results saved to {harness.save(payload, args.output)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+"""
+Benchmark: every API route in backend/urls.py (finance/ and core/ included),
+as the role that uses it, at a configurable concurrency.
+
+Routes are discovered from the URL resolver. Each one is requested with GET
+by the role its prefix belongs to (api/admin, api/finance, api/workflow and
+api/audit as ADMIN; api/employee, api/representative and api/volunteer as
+their role; api/profile as all four), once per query variant in VARIANTS.
+Routes with no GET handler only write and are listed as skipped; the
+scripted journeys in scenarios.py cover them. The login and refresh routes
+are measured with POST.
+
+For each (route, role, variant) the report shows throughput, p50/p95/p99
+latency and queries per request, and the whole run is saved as JSON
+(bench_results/ by default) so it can be compared with another commit:
+
+    python manage.py generate_dataset --donations 200000
+    python benchmarks/endpoints.py --requests 100 --concurrency 8
+    python benchmarks/endpoints.py --compare bench_results/endpoints-<commit>-<time>.json
+    python benchmarks/endpoints.py --only donations --user ADMIN=admin_global --password ...
+
+Application caches stay as configured; export DASHBOARD_SWR=0 or
+QUERY_CACHE_TIMEOUT=0 before running to measure the database path only.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import harness  # noqa: E402
+
+DATABASE = harness.setup()
+
+from django.urls import URLPattern, URLResolver, get_resolver  # noqa: E402
+
+from core.db import fetch_raw_query  # noqa: E402
+
+# Prefijo de ruta -> roles que la usan (el primero que coincide)
+ROUTE_ROLES = (
+    ('api/profile/', harness.ROLES),
+    ('api/employee/', ('EMPLOYEE',)),
+    ('api/representative/', ('REPRESENTATIVE',)),
+    ('api/volunteer/', ('VOLUNTEER',)),
+    ('api/', ('ADMIN',)),
+    ('metrics', ('ADMIN',)),
+)
+
+# Parámetros de consulta de cada ruta (por nombre de URL); una medición por variante
+VARIANTS = {
+    'admin_config': [{'type': t} for t in ('categories', 'specialties', 'donorTypes', 'sdgGoals',
+                                           'currencies', 'statuses')],
+    'audit-logs': [{'type': t} for t in range(5)],
+    'audit_logs': [{'type': t} for t in ('approvals', 'projects', 'finance')],
+    'finance_reports_analytics': [{'type': t} for t in ('budget_status', 'donor_ranking', 'currency_trends')],
+    'manage_budgets': [{}, {'project_id': '{project_id}'}],
+    'manage_donations': [{}, {'project_id': '{project_id}'}],
+    'admin_volunteers_specialties': [{'volunteer_id': '{volunteer_id}'}],
+    'employee_volunteer_assignment': [{'type': 'assignments'}, {'type': 'available'}],
+}
+
+# Rutas fuera del benchmark
+SKIP_PREFIXES = ('admin/',)
+POST_ROUTES = ('token_obtain_pair', 'token_refresh')
+
+
+def _walk(patterns, prefix=''):
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            yield from _walk(entry.url_patterns, prefix + str(entry.pattern))
+        elif isinstance(entry, URLPattern):
+            yield prefix + str(entry.pattern), entry
+
+
+def discover():
+    """[(route, url name, view class)] for every route under ROOT_URLCONF."""
+    routes = []
+    for route, pattern in _walk(get_resolver().url_patterns):
+        view_class = getattr(pattern.callback, 'view_class', None)
+        routes.append((route, pattern.name, view_class))
+    return routes
+
+
+def roles_for(route):
+    for prefix, roles in ROUTE_ROLES:
+        if route.startswith(prefix):
+            return roles
+    return ('ADMIN',)
+
+
+def sample_ids(sessions):
+    """Ids substituted into path and query parameters."""
+    rows = fetch_raw_query("""
+        SELECT MIN(p.project_id) AS project_id
+        FROM Project p JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        WHERE ps.status_name = 'ACTIVO'
+    """)
+    return {
+        'project_id': rows[0]['project_id'] if rows else 1,
+        'volunteer_id': sessions['VOLUNTEER'].claims.get('volunteer_id')
+                        or fetch_raw_query("SELECT MIN(volunteer_id) AS v FROM Volunteer")[0]['v'],
+    }
+
+
+def _path(route, ids):
+    # <int:project_id> -> valor de ejemplo
+    path = route
+    for name, value in ids.items():
+        path = path.replace(f'<int:{name}>', str(value))
+    return '/' + path
+
+
+def _params(variant, ids):
+    return {key: str(value).format(**ids) for key, value in variant.items()}
+
+
+def plan(routes, sessions, ids, password, only=None):
+    """[(label, role, method, path, data)] and [(route, reason)] skipped."""
+    cases, skipped, seen = [], [], set()
+    for route, name, view_class in routes:
+        if only and not any(term in route or term == name for term in only):
+            continue
+        skip = next((prefix for prefix in SKIP_PREFIXES if route.startswith(prefix)), None)
+        if skip:
+            if skip not in seen:
+                skipped.append((skip, 'Django admin site'))
+                seen.add(skip)
+            continue
+        if route in seen:
+            # Django resuelve siempre el primer patrón con la misma ruta
+            skipped.append((route, f"shadowed by an earlier pattern ({name} is unreachable)"))
+            continue
+        seen.add(route)
+        if name in POST_ROUTES:
+            volunteer = sessions['VOLUNTEER']
+            data = ({'refresh': volunteer.refresh} if name == 'token_refresh'
+                    else {'username': volunteer.username, 'password': password})
+            cases.append((f"POST /{route}", None, 'post', '/' + route, data))
+            continue
+        if view_class is not None and not hasattr(view_class, 'get'):
+            methods = sorted(m.upper() for m in view_class.http_method_names if hasattr(view_class, m))
+            skipped.append((route, f"no GET ({', '.join(methods)} only)"))
+            continue
+        if '<' in _path(route, ids):
+            skipped.append((route, 'no sample value for its path parameter'))
+            continue
+        for role in roles_for(route):
+            for variant in VARIANTS.get(name, [{}]):
+                params = _params(variant, ids)
+                query = '&'.join(f"{k}={v}" for k, v in params.items())
+                label = f"GET /{route}" + (f"?{query}" if query else '')
+                cases.append((label, role, 'get', _path(route, ids), params))
+    return cases, skipped
+
+
+def run_case(case, sessions, requests, concurrency, warmup):
+    label, role, method, path, data = case
+    session = sessions[role] if role else harness.Session()
+
+    def task(_):
+        sample, _ = session.request(method, path, data, auth=role is not None)
+        return sample
+
+    for i in range(warmup):
+        task(i)
+    samples, wall = harness.drive(task, requests, concurrency)
+    return {'endpoint': label, 'role': role or 'ANON', **harness.summarize(samples, wall)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=50, help='measured requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=4, help='client threads per endpoint')
+    parser.add_argument('--warmup', type=int, default=2, help='unmeasured requests per endpoint')
+    parser.add_argument('--prefix', default='gen', help='generate_dataset prefix of the default users')
+    parser.add_argument('--user', action='append', metavar='ROLE=USERNAME', help='override a role\'s user')
+    parser.add_argument('--password', default='bench123', help='password of the benchmark users')
+    parser.add_argument('--only', action='append', help='only routes containing this text (or URL name)')
+    parser.add_argument('--output', help='JSON results file (default bench_results/...)')
+    parser.add_argument('--compare', help='previous JSON results to compare with')
+    args = parser.parse_args()
+
+    sessions = {}
+    for role, username in harness.parse_users(args.user, args.prefix).items():
+        sessions[role] = harness.Session(role, username)
+        sessions[role].login(args.password)
+
+    ids = sample_ids(sessions)
+    cases, skipped = plan(discover(), sessions, ids, args.password, args.only)
+
+    print(f"{len(cases)} endpoint cases on {DATABASE}, {args.requests} requests each, "
+          f"concurrency {args.concurrency}")
+    print(f"{'endpoint':<64}{'role':<16}{'rps':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'queries':>9}  status")
+    results = []
+    for case in cases:
+        row = run_case(case, sessions, args.requests, args.concurrency, args.warmup)
+        results.append(row)
+        statuses = ' '.join(f"{code}×{n}" for code, n in sorted(row['statuses'].items()))
+        print(f"{row['endpoint'][:63]:<64}{row['role']:<16}{row['rps']:>8.1f}{row['p50_ms']:>8.1f}"
+              f"{row['p95_ms']:>8.1f}{row['p99_ms']:>8.1f}{row['queries']:>9.1f}  {statuses}")
+    for route, reason in skipped:
+        print(f"skipped /{route}: {reason}")
+
+    payload = {
+        'meta': harness.metadata('endpoints', DATABASE, args),
+        'results': results,
+        'skipped': [{'route': route, 'reason': reason} for route, reason in skipped],
+    }
+    print(f"Results saved to {harness.save(payload, args.output)}")
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        print(f"\nCompared with {baseline['meta'].get('commit')} ({baseline['meta'].get('started_at')}):")
+        for line in harness.compare(results, baseline['results'], key=lambda r: f"{r['endpoint']} {r['role']}"):
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+"""
+Shared pieces of the HTTP benchmarks (endpoints.py, scenarios.py).
+
+Requests go through django.test.Client inside this process: middleware,
+JWT authentication, views and core.db run as in production, without a web
+server in front. Each request records its wall time, status and statements:
+
+- `queries`: statements run through the core.db helpers (as counted by the
+  Server-Timing header, fan-out threads included) plus those the view sent
+  straight through connection.cursor() (counted with an execute_wrapper).
+- `db_ms`: time spent in the core.db helpers (Server-Timing `db`).
+
+setup() only accepts a local database: the SQLite stand-in (the default
+here, DB_ENGINE=standin) or an Oracle listener on this host. Load a dataset
+first with `python manage.py generate_dataset`; its <prefix>_admin,
+<prefix>_emp_1, <prefix>_rep_1 and <prefix>_vol_1 users are the defaults.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Los benchmarks nunca apuntan a una base compartida: por defecto, el stand-in
+os.environ.setdefault('DB_ENGINE', 'standin')
+
+ROLES = ('ADMIN', 'EMPLOYEE', 'REPRESENTATIVE', 'VOLUNTEER')
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1', '[::1]')
+RESULTS_DIR = ROOT / 'bench_results'
+
+_SERVER_TIMING_RE = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries')
+
+
+def setup():
+    """django.setup() and check that the default database is local; returns its description."""
+    import logging
+
+    import django
+    django.setup()
+    # Cada petición ya queda en el informe; sin la línea JSON de core.requests
+    for name in ('core.requests', 'django.request'):
+        logging.getLogger(name).setLevel(logging.ERROR)
+
+    from django.conf import settings
+    db = settings.DATABASES['default']
+    if 'standin' in db['ENGINE'] or 'sqlite' in db['ENGINE']:
+        return f"stand-in {db['NAME']}"
+    host = str(db.get('HOST') or db['NAME']).split('/')[0].rsplit(':', 1)[0]
+    if host not in LOCAL_HOSTS:
+        raise SystemExit(f"Refusing to benchmark against {db['NAME']}: only a local database is allowed")
+    return f"oracle {db['NAME']}"
+
+
+def default_users(prefix):
+    return {
+        'ADMIN': f'{prefix}_admin',
+        'EMPLOYEE': f'{prefix}_emp_1',
+        'REPRESENTATIVE': f'{prefix}_rep_1',
+        'VOLUNTEER': f'{prefix}_vol_1',
+    }
+
+
+def parse_users(pairs, prefix):
+    """['ADMIN=admin_global', ...] over the generated defaults."""
+    users = default_users(prefix)
+    for pair in pairs or []:
+        role, _, username = pair.partition('=')
+        if role.upper() not in ROLES or not username:
+            raise SystemExit(f"--user expects ROLE=username with ROLE in {', '.join(ROLES)}: {pair}")
+        users[role.upper()] = username
+    return users
+
+
+class Sample:
+    __slots__ = ('ms', 'status', 'queries', 'db_ms')
+
+    def __init__(self, ms, status, queries, db_ms):
+        self.ms = ms
+        self.status = status
+        self.queries = queries
+        self.db_ms = db_ms
+
+
+class _CursorCounter:
+    """execute_wrapper: statements a view runs outside the core.db helpers."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        from core import instrumentation
+        if not instrumentation.in_statement():
+            self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Session:
+    """One logged-in user; safe to share between client threads (one Client per thread)."""
+
+    def __init__(self, role=None, username=None):
+        self.role = role
+        self.username = username
+        self.access = None
+        self.refresh = None
+        self.claims = {}
+        self._local = threading.local()
+
+    @property
+    def client(self):
+        from django.test import Client
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = Client(HTTP_HOST='localhost')
+        return client
+
+    def login(self, password):
+        sample, body = self.request('post', '/api/token/', {'username': self.username, 'password': password},
+                                    auth=False)
+        if sample.status != 200:
+            raise SystemExit(f"Login failed for {self.role} {self.username} ({sample.status}): {body}")
+        self.access, self.refresh = body['access'], body['refresh']
+        self.claims = body
+        return sample
+
+    def request(self, method, path, data=None, auth=True):
+        """Send one request; returns (Sample, decoded JSON body or None)."""
+        from django.db import connection
+
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {self.access}'} if auth and self.access else {}
+        counter = _CursorCounter()
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            if method == 'get':
+                response = self.client.get(path, data or {}, **headers)
+            else:
+                response = getattr(self.client, method)(path, data or {}, content_type='application/json',
+                                                        **headers)
+            # Las respuestas en streaming se consumen dentro de la medición
+            content = b''.join(response.streaming_content) if response.streaming else response.content
+        elapsed = (time.perf_counter() - start) * 1000
+
+        queries, db_ms = counter.count, 0.0
+        match = _SERVER_TIMING_RE.search(response.get('Server-Timing', ''))
+        if match:
+            db_ms = float(match.group(1))
+            queries += int(match.group(2))
+        try:
+            body = json.loads(content) if content else None
+        except ValueError:
+            body = None
+        return Sample(elapsed, response.status_code, queries, db_ms), body
+
+
+def drive(task, requests, concurrency):
+    """Run task(i) `requests` times over `concurrency` threads; returns (samples, wall seconds)."""
+    from django.db import connection
+
+    samples = []
+    lock = threading.Lock()
+    counter = iter(range(requests))
+
+    def worker():
+        try:
+            while True:
+                with lock:
+                    i = next(counter, None)
+                if i is None:
+                    return
+                sample = task(i)
+                with lock:
+                    samples.append(sample)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(max(1, min(concurrency, requests)))]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - start
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(samples, wall_s=None):
+    times = [s.ms for s in samples]
+    statuses = {}
+    for sample in samples:
+        statuses[str(sample.status)] = statuses.get(str(sample.status), 0) + 1
+    count = len(samples) or 1
+    summary = {
+        'requests': len(samples),
+        'errors': sum(1 for s in samples if s.status >= 500),
+        'statuses': statuses,
+        'p50_ms': round(percentile(times, 50), 2),
+        'p95_ms': round(percentile(times, 95), 2),
+        'p99_ms': round(percentile(times, 99), 2),
+        'mean_ms': round(sum(times) / count, 2),
+        'queries': round(sum(s.queries for s in samples) / count, 2),
+        'db_ms': round(sum(s.db_ms for s in samples) / count, 2),
+    }
+    if wall_s is not None:
+        summary['rps'] = round(len(samples) / wall_s, 1) if wall_s else 0.0
+    return summary
+
+
+def _git(*args):
+    try:
+        return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(kind, database, args):
+    return {
+        'benchmark': kind,
+        'commit': _git('rev-parse', '--short', 'HEAD'),
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'database': database,
+        'args': {key: value for key, value in vars(args).items() if key not in ('password', 'compare')},
+    }
+
+
+def save(payload, output=None):
+    """Write the results as JSON (default bench_results/<kind>-<commit>-<time>.json); returns the path."""
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = RESULTS_DIR / f"{payload['meta']['benchmark']}-{payload['meta']['commit'] or 'nogit'}-{stamp}.json"
+    with open(output, 'w') as fh:
+        json.dump(payload, fh, indent=2, default=str)
+    return output
+
+
+def _num(value):
+    return '-' if value is None else f"{value:.1f}"
+
+
+def compare(rows, baseline_rows, key):
+    """Lines comparing p95, throughput and queries with a previous run, matched by `key`."""
+    baseline = {key(row): row for row in baseline_rows}
+    lines = [f"{'':<48}{'p95 ms':>16}{'rps':>16}{'queries':>14}"]
+    for row in rows:
+        old = baseline.get(key(row))
+        if old is None:
+            continue
+        lines.append(
+            f"{key(row)[:48]:<48}"
+            f"{old['p95_ms']:>7.1f} → {row['p95_ms']:<7.1f}"
+            f"{_num(old.get('rps')):>7} → {_num(row.get('rps')):<7}"
+            f"{old['queries']:>6.1f} → {row['queries']:<6.1f}"
+        )
+    return lines
@@ -0,0 +1,354 @@
+"""
+Load test: scripted user journeys in a weighted mix, with think times and
+ramp-up, reporting latency per step.
+
+Journeys (SCENARIOS):
+
+- volunteer: log in, open the dashboard, browse projects, open one, apply.
+- representative: log in, open My NGO, list own projects, file a report.
+- finance: log in, open the financial KPIs, register a donation, check
+  the budget and the donations of that project.
+
+Each virtual user (VU) is one thread that logs in as its own generated user
+(<prefix>_vol_<n>, <prefix>_rep_<n>, <prefix>_emp_<n> from generate_dataset).
+It repeats its journey until --duration runs out, pausing between steps for
+the step's think time (uniform between 0.5× and 1.5×, scaled by
+--think-scale). VUs start evenly spread over --ramp-up seconds.
+
+Steps write to the database (applications, reports, donations), so run this
+against a disposable local database. 4xx answers (e.g. "already applied")
+count as rejections, not errors. Results are saved as JSON like endpoints.py:
+
+    python manage.py generate_dataset
+    python benchmarks/scenarios.py --users 40 --ramp-up 20 --duration 120
+    python benchmarks/scenarios.py --mix volunteer=8,representative=1,finance=1 --think-scale 0.1
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import harness  # noqa: E402
+
+DATABASE = harness.setup()
+
+from core.db import fetch_raw_query  # noqa: E402
+
+
+class Step:
+    """One request of a journey; `action(vu)` returns a harness.Sample."""
+
+    def __init__(self, name, think_s, action):
+        self.name = name
+        self.think_s = think_s
+        self.action = action
+
+
+class Scenario:
+    def __init__(self, name, role, user_kind, steps):
+        self.name = name
+        self.role = role
+        self.user_kind = user_kind
+        self.steps = steps
+
+
+class VirtualUser:
+    def __init__(self, number, scenario, username, password, pools, seed):
+        self.number = number
+        self.scenario = scenario
+        self.session = harness.Session(scenario.role, username)
+        self.password = password
+        self.pools = pools
+        self.rng = random.Random(seed)
+        # Lo que un paso deja al siguiente (proyecto elegido, etc.)
+        self.state = {}
+
+    def get(self, path, params=None):
+        return self.session.request('get', path, params)
+
+    def post(self, path, data):
+        return self.session.request('post', path, data)
+
+
+# ----------------------------------------------------------------------
+# Pasos
+# ----------------------------------------------------------------------
+
+def login(vu):
+    sample, body = vu.session.request('post', '/api/token/',
+                                      {'username': vu.session.username, 'password': vu.password}, auth=False)
+    if sample.status == 200:
+        vu.session.access, vu.session.refresh = body['access'], body['refresh']
+        vu.session.claims = body
+    return sample
+
+
+def volunteer_dashboard(vu):
+    return vu.get('/api/volunteer/dashboard-data/')[0]
+
+
+def volunteer_explore(vu):
+    sample, body = vu.get('/api/volunteer/explore-projects/')
+    projects = body if isinstance(body, list) else []
+    vu.state['project_id'] = (vu.rng.choice(projects)['project_id'] if projects
+                              else vu.rng.choice(vu.pools['projects']))
+    return sample
+
+
+def volunteer_details(vu):
+    return vu.get(f"/api/volunteer/project-details/{vu.state['project_id']}/")[0]
+
+
+def volunteer_apply(vu):
+    return vu.post('/api/volunteer/apply-project/', {'project_id': vu.state['project_id']})[0]
+
+
+def representative_ngo(vu):
+    return vu.get('/api/representative/my-ngo/')[0]
+
+
+def representative_projects(vu):
+    sample, body = vu.get('/api/representative/my-projects/')
+    projects = body if isinstance(body, list) else []
+    vu.state['project_id'] = vu.rng.choice(projects)['project_id'] if projects else None
+    return sample
+
+
+def representative_report(vu):
+    project_id = vu.state.get('project_id') or vu.rng.choice(vu.pools['projects'])
+    return vu.post('/api/workflow/reports/', {
+        'project_id': project_id,
+        'title': f"Informe de avance {vu.rng.randrange(1, 10 ** 6)}",
+        'description': 'Informe generado por la prueba de carga.',
+    })[0]
+
+
+def finance_kpis(vu):
+    return vu.get('/api/finance/kpis/')[0]
+
+
+def finance_donation(vu):
+    vu.state['project_id'] = vu.rng.choice(vu.pools['projects'])
+    return vu.post('/api/finance/donations/', {
+        'amount': round(vu.rng.lognormvariate(6.5, 1.0), 2),
+        'project_id': vu.state['project_id'],
+        'currency_id': vu.rng.choice(vu.pools['currencies']),
+        'donor_id': vu.rng.choice(vu.pools['donors']),
+    })[0]
+
+
+def finance_budget(vu):
+    return vu.get('/api/finance/budgets/', {'project_id': vu.state['project_id']})[0]
+
+
+def finance_donations(vu):
+    return vu.get('/api/finance/donations/', {'project_id': vu.state['project_id']})[0]
+
+
+SCENARIOS = {
+    'volunteer': Scenario('volunteer', 'VOLUNTEER', 'vol', [
+        Step('login', 2, login),
+        Step('dashboard', 5, volunteer_dashboard),
+        Step('explore projects', 8, volunteer_explore),
+        Step('project details', 10, volunteer_details),
+        Step('apply', 5, volunteer_apply),
+    ]),
+    'representative': Scenario('representative', 'REPRESENTATIVE', 'rep', [
+        Step('login', 2, login),
+        Step('my ngo', 6, representative_ngo),
+        Step('my projects', 6, representative_projects),
+        Step('file report', 20, representative_report),
+    ]),
+    'finance': Scenario('finance', 'EMPLOYEE', 'emp', [
+        Step('login', 2, login),
+        Step('financial kpis', 5, finance_kpis),
+        Step('register donation', 15, finance_donation),
+        Step('check budget', 5, finance_budget),
+        Step('project donations', 5, finance_donations),
+    ]),
+}
+
+DEFAULT_MIX = 'volunteer=7,representative=1,finance=2'
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario '{name}' (known: {', '.join(SCENARIOS)})")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def assign(users, mix):
+    """Scenario of each VU: largest remainder over the weights, interleaved."""
+    total = sum(mix.values())
+    counts = {name: users * weight // total for name, weight in mix.items()}
+    by_remainder = sorted(mix, key=lambda name: users * mix[name] % total, reverse=True)
+    for name in by_remainder[:users - sum(counts.values())]:
+        counts[name] += 1
+    order = []
+    while len(order) < users:
+        for name in mix:
+            if counts[name]:
+                order.append(name)
+                counts[name] -= 1
+    return order
+
+
+def pools():
+    """Ids the journeys pick from (only projects already running receive donations)."""
+    return {
+        'projects': [row['project_id'] for row in fetch_raw_query("""
+            SELECT p.project_id FROM Project p
+            JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            WHERE ps.status_name = 'ACTIVO'
+        """)],
+        'donors': [row['donor_id'] for row in fetch_raw_query("SELECT donor_id FROM Donor")],
+        'currencies': [row['currency_id'] for row in fetch_raw_query("SELECT currency_id FROM Currency")],
+    }
+
+
+class Recorder:
+    """Samples per (scenario, step) and per time window, shared by all VUs."""
+
+    def __init__(self, window_s):
+        self.window_s = window_s
+        self.steps = {}
+        self.windows = {}
+        self.iterations = {}
+        self.active = 0
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def add(self, scenario, step, sample):
+        window = int((time.perf_counter() - self.started) // self.window_s)
+        with self.lock:
+            self.steps.setdefault((scenario, step), []).append(sample)
+            self.windows.setdefault(window, {'samples': [], 'active': self.active})['samples'].append(sample)
+            self.windows[window]['active'] = max(self.windows[window]['active'], self.active)
+
+    def vu(self, delta):
+        with self.lock:
+            self.active += delta
+
+    def iteration(self, scenario):
+        with self.lock:
+            self.iterations[scenario] = self.iterations.get(scenario, 0) + 1
+
+
+def run_vu(vu, recorder, start_at, deadline, think_scale):
+    from django.db import connection
+
+    def pause(seconds):
+        time.sleep(max(0.0, min(seconds, deadline - time.perf_counter())))
+
+    pause(start_at - time.perf_counter())
+    recorder.vu(+1)
+    try:
+        while time.perf_counter() < deadline:
+            vu.state.clear()
+            for step in vu.scenario.steps:
+                if time.perf_counter() >= deadline:
+                    return
+                recorder.add(vu.scenario.name, step.name, step.action(vu))
+                pause(step.think_s * think_scale * vu.rng.uniform(0.5, 1.5))
+            recorder.iteration(vu.scenario.name)
+    finally:
+        recorder.vu(-1)
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=20, help='virtual users')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'scenario weights (default {DEFAULT_MIX})')
+    parser.add_argument('--ramp-up', type=float, default=10.0, help='seconds over which the VUs start')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds of load, ramp-up included')
+    parser.add_argument('--think-scale', type=float, default=1.0, help='multiplier for every think time')
+    parser.add_argument('--window', type=float, default=10.0, help='seconds per timeline window')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--prefix', default='gen', help='generate_dataset prefix of the users')
+    parser.add_argument('--password', default='bench123', help='password of the generated users')
+    parser.add_argument('--output', help='JSON results file (default bench_results/...)')
+    parser.add_argument('--compare', help='previous JSON results to compare with')
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    ids = pools()
+    recorder = Recorder(args.window)
+    numbers = {}
+    vus = []
+    for i, name in enumerate(assign(args.users, mix)):
+        scenario = SCENARIOS[name]
+        numbers[name] = numbers.get(name, 0) + 1
+        username = f"{args.prefix}_{scenario.user_kind}_{numbers[name]}"
+        vus.append(VirtualUser(i, scenario, username, args.password, ids, args.seed * 1000 + i))
+
+    print(f"{args.users} VUs ({', '.join(f'{n} {name}' for name, n in numbers.items())}) on {DATABASE}: "
+          f"ramp-up {args.ramp_up:.0f}s, duration {args.duration:.0f}s, think ×{args.think_scale}")
+    start = time.perf_counter()
+    deadline = start + args.duration
+    threads = [
+        threading.Thread(target=run_vu, args=(vu, recorder, start + args.ramp_up * i / max(1, args.users),
+                                              deadline, args.think_scale))
+        for i, vu in enumerate(vus)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    steps = []
+    for name, scenario in SCENARIOS.items():
+        for step in scenario.steps:
+            samples = recorder.steps.get((name, step.name))
+            if samples:
+                summary = harness.summarize(samples)
+                summary['rejected'] = sum(1 for s in samples if 400 <= s.status < 500)
+                steps.append({'scenario': name, 'step': step.name, **summary})
+    all_samples = [s for samples in recorder.steps.values() for s in samples]
+    timeline = [
+        {'t_s': round(window * args.window), 'active_vus': data['active'],
+         **harness.summarize(data['samples'], min(args.window, wall - window * args.window))}
+        for window, data in sorted(recorder.windows.items())
+    ]
+
+    print(f"{'scenario':<16}{'step':<20}{'count':>7}{'p50':>8}{'p95':>8}{'p99':>8}{'queries':>9}"
+          f"{'4xx':>6}{'5xx':>6}")
+    for row in steps:
+        print(f"{row['scenario']:<16}{row['step']:<20}{row['requests']:>7}{row['p50_ms']:>8.1f}"
+              f"{row['p95_ms']:>8.1f}{row['p99_ms']:>8.1f}{row['queries']:>9.1f}"
+              f"{row['rejected']:>6}{row['errors']:>6}")
+    print(f"\n{'t (s)':>6}{'VUs':>6}{'req/s':>8}{'p95':>8}")
+    for row in timeline:
+        print(f"{row['t_s']:>6}{row['active_vus']:>6}{row['rps']:>8.1f}{row['p95_ms']:>8.1f}")
+    overall = harness.summarize(all_samples, wall)
+    print(f"\nTotal: {overall['requests']} requests in {wall:.0f}s ({overall['rps']} req/s), "
+          f"iterations {recorder.iterations}, p95 {overall['p95_ms']} ms, {overall['errors']} errors")
+
+    payload = {
+        'meta': harness.metadata('scenarios', DATABASE, args),
+        'overall': {**overall, 'iterations': recorder.iterations},
+        'results': steps,
+        'timeline': timeline,
+    }
+    print(f"Results saved to {harness.save(payload, args.output)}")
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        print(f"\nCompared with {baseline['meta'].get('commit')} ({baseline['meta'].get('started_at')}):")
+        for line in harness.compare(steps, baseline['results'], key=lambda r: f"{r['scenario']} / {r['step']}"):
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
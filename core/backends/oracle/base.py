@@ -0,0 +1,19 @@
+"""
+Oracle backend that records pool acquisition statistics.
+
+Identical to django.db.backends.oracle except that, when OPTIONS['pool'] is
+set, each session checkout is timed so core.pool.pool_stats() can report
+acquires and waits next to the pool's own busy/open counters.
+"""
+from django.db.backends.oracle import base as oracle_base
+
+from core.pool import timed_acquire
+
+
+class DatabaseWrapper(oracle_base.DatabaseWrapper):
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        return timed_acquire(self.alias, pool)
@@ -0,0 +1,200 @@
+"""
+SQLite-backed stand-in for the Oracle backend.
+
+Runs the app without an Oracle instance (tests, benchmarks, laptops). The
+database file is built on first connect from the scripts in scripts/ (see
+schema.py), the SQL the views send is rewritten to SQLite by dialect.py, and
+the cursor exposes the python-oracledb surface core.db relies on:
+`cursor.cursor`, `rowfactory`, `prefetchrows`, `callproc` on the packaged
+procedures of procedures.py, `getimplicitresults()` and `var()`.
+
+Constraint violations are reported with the ORA- codes the views look for
+(ORA-00001, ORA-02290, ORA-02291, ORA-02292, ORA-01400). OPTIONS:
+
+- seed: load scripts/RedRomero_Data.sql into a new database (default True).
+"""
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+
+from django.db.backends.sqlite3 import base as sqlite_base
+
+from core.backends.standin import schema
+from core.backends.standin.dialect import DATETIME_FORMAT, register_functions, translate
+from core.backends.standin.procedures import PIPELINED, PROCEDURES, Call, OutVar
+
+_TABLE_FUNCTION_RE = re.compile(r'\bTABLE\s*\(\s*([\w.]+)\s*\(\s*\)\s*\)', re.IGNORECASE)
+_CONSTRAINT_NAME_RE = re.compile(r'CHECK constraint failed:\s*(\w+)')
+
+# Rutas ya inicializadas en este proceso (evita releer sqlite_master en cada conexión)
+_ready = set()
+_ready_lock = threading.Lock()
+
+
+def _adapt(value):
+    # Oracle DATE/TIMESTAMP binds: se guardan con el mismo formato que TO_DATE
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    if isinstance(value, date):
+        return f"{value.isoformat()} 00:00:00"
+    return value
+
+
+def _adapt_params(params):
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {key: _adapt(value) for key, value in params.items()}
+    return [_adapt(value) for value in params]
+
+
+def _oracle_error(error, sql):
+    """Translate an sqlite3.IntegrityError into the equivalent ORA- message."""
+    message = str(error)
+    if 'FOREIGN KEY' in message:
+        if sql.lstrip().upper().startswith('DELETE'):
+            text = 'ORA-02292: integrity constraint (REDROMERO.FK) violated - child record found'
+        else:
+            text = 'ORA-02291: integrity constraint (REDROMERO.FK) violated - parent key not found'
+    elif 'UNIQUE' in message:
+        text = f"ORA-00001: unique constraint violated ({message})"
+    elif 'CHECK' in message:
+        match = _CONSTRAINT_NAME_RE.search(message)
+        name = match.group(1).upper() if match else 'CHECK'
+        text = f"ORA-02290: check constraint (REDROMERO.{name}) violated"
+    elif 'NOT NULL' in message:
+        text = f"ORA-01400: cannot insert NULL ({message})"
+    else:
+        text = message
+    return sqlite3.IntegrityError(text)
+
+
+class StandinCursor(sqlite_base.SQLiteCursorWrapper):
+    """SQLite cursor that speaks enough python-oracledb for core.db."""
+
+    prefetchrows = None
+
+    def __init__(self, connection):
+        super().__init__(connection)
+        self._rowfactory = None
+        self._implicit = []
+
+    @property
+    def cursor(self):
+        # core.db.native_cursor() baja por cursor.cursor.cursor
+        return self
+
+    @property
+    def rowfactory(self):
+        return self._rowfactory
+
+    @rowfactory.setter
+    def rowfactory(self, fn):
+        self._rowfactory = fn
+        self.row_factory = (lambda cursor, row: fn(*row)) if fn else None
+
+    def _pipelined(self, sql):
+        """Materialize TABLE(PKG.fn()) into a temp table and query that instead."""
+        def replace(match):
+            name = match.group(1)
+            entry = PIPELINED.get(name.upper())
+            if entry is None:
+                raise sqlite3.DatabaseError(f"ORA-00904: \"{name.upper()}\": invalid identifier")
+            fn, columns = entry
+            table = 'pipe_' + name.split('.')[-1].lower()
+            rows = fn(Call(self.connection))
+            conn = self.connection
+            conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+            conn.execute(f"DELETE FROM {table}")
+            conn.executemany(f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})", rows)
+            return table
+        return _TABLE_FUNCTION_RE.sub(replace, sql)
+
+    def execute(self, query, params=None):
+        if _TABLE_FUNCTION_RE.search(query):
+            query = self._pipelined(query)
+        try:
+            return super().execute(translate(query), _adapt_params(params))
+        except sqlite3.IntegrityError as e:
+            raise _oracle_error(e, query) from e
+
+    def executemany(self, query, param_list):
+        try:
+            return super().executemany(translate(query), [_adapt_params(params) for params in param_list])
+        except sqlite3.IntegrityError as e:
+            raise _oracle_error(e, query) from e
+
+    def var(self, type_=None, *args, **kwargs):
+        return OutVar(type_)
+
+    def callproc(self, name, parameters=None):
+        entry = PROCEDURES.get(name.upper())
+        if entry is None:
+            raise sqlite3.DatabaseError(f"ORA-06550: PLS-00302: component '{name}' must be declared")
+        fn, writes = entry
+        args = _adapt_params(list(parameters or []))
+        call = Call(self.connection)
+        conn = self.connection
+        nested = conn.in_transaction
+        if writes:
+            # Un procedimiento es atómico: se deshace entero si falla
+            conn.execute('SAVEPOINT standin_call' if nested else 'BEGIN IMMEDIATE')
+        try:
+            fn(call, *args)
+        except sqlite3.IntegrityError as e:
+            self._abort(writes, nested)
+            raise _oracle_error(e, '') from e
+        except Exception:
+            self._abort(writes, nested)
+            raise
+        if writes:
+            conn.execute('RELEASE SAVEPOINT standin_call' if nested else 'COMMIT')
+        self._implicit = call.results
+        return parameters
+
+    def _abort(self, writes, nested):
+        if writes:
+            self.connection.execute('ROLLBACK TO SAVEPOINT standin_call' if nested else 'ROLLBACK')
+
+    def getimplicitresults(self):
+        return list(self._implicit)
+
+
+class StandinConnection(sqlite3.Connection):
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or StandinCursor)
+
+    def var(self, type_=None, *args, **kwargs):
+        return OutVar(type_)
+
+
+class DatabaseWrapper(sqlite_base.DatabaseWrapper):
+    vendor = 'sqlite'
+    display_name = 'Oracle stand-in (SQLite)'
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        self.seed = params.pop('seed', True)
+        params.setdefault('timeout', 30)
+        params['factory'] = StandinConnection
+        return params
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        register_functions(conn)
+        conn.execute('PRAGMA journal_mode = WAL')
+        path = conn_params['database']
+        with _ready_lock:
+            if path not in _ready:
+                previous, conn.isolation_level = conn.isolation_level, None
+                try:
+                    schema.load(conn, seed=self.seed)
+                finally:
+                    conn.isolation_level = previous
+                _ready.add(path)
+        return conn
+
+    def create_cursor(self, name=None):
+        return self.connection.cursor(factory=StandinCursor)
@@ -0,0 +1,623 @@
+"""
+Oracle SQL -> SQLite translation for the stand-in backend.
+
+Two layers:
+
+- `translate(sql)` rewrites the constructs SQLite cannot parse: SYSDATE /
+  SYSTIMESTAMP, FETCH FIRST / OFFSET ... ROWS, ROWNUM limits, EXTRACT,
+  LISTAGG ... WITHIN GROUP, `date - date`, `x + INTERVAL 'n' DAY`, FROM DUAL
+  and MINUS. Division is forced to floating point (Oracle NUMBER never
+  truncates). String literals and quoted identifiers are never touched.
+- `register_functions(conn)` installs Python versions of the Oracle
+  functions the SQL calls as-is: TO_CHAR, TO_DATE, TO_TIMESTAMP, TO_NUMBER,
+  TRUNC, ADD_MONTHS, MONTHS_BETWEEN, LAST_DAY, NVL2, DECODE, INITCAP,
+  LPAD/RPAD, GREATEST/LEAST and the LISTAGG aggregate.
+
+Dates are stored as ISO text ('YYYY-MM-DD HH:MM:SS'); the functions accept
+and return that form. The rewrites cover the SQL in this repo, not the whole
+Oracle grammar: ROWNUM limits are applied after ORDER BY, and `a - b` only
+becomes a day difference when both operands look like dates (their text
+mentions a date column or SYSDATE).
+"""
+import calendar
+import functools
+import math
+import re
+from datetime import datetime, timedelta
+
+# --- Literales -------------------------------------------------------------
+
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"")
+_MASK_RE = re.compile(r'__L(\d+)__')
+
+
+def _mask(sql):
+    literals = []
+
+    def keep(match):
+        literals.append(match.group(0))
+        return f'__L{len(literals) - 1}__'
+    return _LITERAL_RE.sub(keep, sql), literals
+
+
+def _unmask(sql, literals):
+    return _MASK_RE.sub(lambda m: literals[int(m.group(1))], sql)
+
+
+def _literal_value(token, literals):
+    match = _MASK_RE.fullmatch(token.strip())
+    if not match:
+        return token.strip()
+    return literals[int(match.group(1))][1:-1].replace("''", "'")
+
+
+# --- Operandos -------------------------------------------------------------
+
+_IDENT_CHARS = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.$#')
+
+
+def _matching_paren(sql, start):
+    """Index of the ')' closing the '(' at `start`."""
+    depth = 0
+    for i in range(start, len(sql)):
+        if sql[i] == '(':
+            depth += 1
+        elif sql[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    raise ValueError(f"Unbalanced parentheses in: {sql}")
+
+
+def _operand_before(sql, end):
+    """(start, end) of the operand that finishes right before `end`."""
+    i = end
+    while i > 0 and sql[i - 1].isspace():
+        i -= 1
+    stop = i
+    if i > 0 and sql[i - 1] == ')':
+        depth = 0
+        while i > 0:
+            i -= 1
+            if sql[i] == ')':
+                depth += 1
+            elif sql[i] == '(':
+                depth -= 1
+                if depth == 0:
+                    break
+    while i > 0 and sql[i - 1] in _IDENT_CHARS:
+        i -= 1
+    return i, stop
+
+
+def _operand_after(sql, start):
+    """(start, end) of the operand that begins right after `start`."""
+    i = start
+    while i < len(sql) and sql[i].isspace():
+        i += 1
+    begin = i
+    while i < len(sql) and sql[i] in _IDENT_CHARS:
+        i += 1
+    if i < len(sql) and sql[i] == '(':
+        i = _matching_paren(sql, i) + 1
+    return begin, i
+
+
+_DATELIKE_RE = re.compile(r'date|ORA_SYSDATE|timestamp', re.IGNORECASE)
+
+
+def _datelike(text):
+    return bool(text) and bool(_DATELIKE_RE.search(text)) and 'MONTHS_BETWEEN' not in text.upper()
+
+
+# --- Reescrituras ----------------------------------------------------------
+
+_SYSDATE_RE = re.compile(r'\b(?:SYSDATE|SYSTIMESTAMP|LOCALTIMESTAMP|CURRENT_DATE)\b(?!\s*\()', re.IGNORECASE)
+_DUAL_RE = re.compile(r'\s+FROM\s+DUAL\b', re.IGNORECASE)
+_MINUS_RE = re.compile(r'\bMINUS\b', re.IGNORECASE)
+_NVL_RE = re.compile(r'\bNVL\s*\(', re.IGNORECASE)
+_EXTRACT_RE = re.compile(r'\bEXTRACT\s*\(\s*(YEAR|MONTH|DAY|HOUR|MINUTE|SECOND)\s+FROM\s+', re.IGNORECASE)
+_INTERVAL_RE = re.compile(r'([+-])\s*INTERVAL\s+(__L\d+__)\s+(YEAR|MONTH|DAY|HOUR|MINUTE|SECOND)S?\b',
+                          re.IGNORECASE)
+_OFFSET_FETCH_RE = re.compile(
+    r'\bOFFSET\s+(\S+?)\s+ROWS?\s+FETCH\s+(?:FIRST|NEXT)\s+(\S+?)\s+ROWS?\s+ONLY\b', re.IGNORECASE)
+_FETCH_RE = re.compile(r'\bFETCH\s+(?:FIRST|NEXT)\s+(?:(\S+?)\s+)?ROWS?\s+ONLY\b', re.IGNORECASE)
+_OFFSET_RE = re.compile(r'\bOFFSET\s+(\S+?)\s+ROWS?\b', re.IGNORECASE)
+_ROWNUM_RE = re.compile(r'\b(WHERE|AND)\s+ROWNUM\s*(<=|<|=)\s*(\d+)(\s+AND\b)?', re.IGNORECASE)
+_LISTAGG_RE = re.compile(r'\bLISTAGG\s*\(', re.IGNORECASE)
+_WITHIN_RE = re.compile(r'\s*WITHIN\s+GROUP\s*\(\s*ORDER\s+BY\s+', re.IGNORECASE)
+_DIVIDE_RE = re.compile(r'(?<![*/])/(?![*/])')
+
+
+def _split_top_level(text):
+    parts, depth, current = [], 0, []
+    for ch in text:
+        if ch == ',' and depth == 0:
+            parts.append(''.join(current))
+            current = []
+            continue
+        depth += ch == '('
+        depth -= ch == ')'
+        current.append(ch)
+    parts.append(''.join(current))
+    return [p.strip() for p in parts]
+
+
+def _rewrite_listagg(sql):
+    while True:
+        match = _LISTAGG_RE.search(sql)
+        if not match:
+            return sql
+        open_at = match.end() - 1
+        close_at = _matching_paren(sql, open_at)
+        args = _split_top_level(sql[open_at + 1:close_at])
+        distinct = re.match(r'DISTINCT\s+', args[0], re.IGNORECASE)
+        if distinct:
+            args[0] = args[0][distinct.end():]
+        separator = args[1] if len(args) > 1 else "''"
+        key, descending, end = 'NULL', 0, close_at + 1
+        within = _WITHIN_RE.match(sql, close_at + 1)
+        if within:
+            group_close = _matching_paren(sql, sql.rindex('(', close_at, within.end()))
+            order = _split_top_level(sql[within.end():group_close])[0]
+            descending = int(bool(re.search(r'\s+DESC$', order, re.IGNORECASE)))
+            key = re.sub(r'\s+(ASC|DESC)$', '', order, flags=re.IGNORECASE)
+            end = group_close + 1
+        name = 'ORA_LISTAGG_DISTINCT' if distinct else 'ORA_LISTAGG'
+        sql = f"{sql[:match.start()]}{name}({args[0]}, {separator}, {key}, {descending}){sql[end:]}"
+
+
+def _rewrite_intervals(sql, literals):
+    while True:
+        match = _INTERVAL_RE.search(sql)
+        if not match:
+            return sql
+        start, stop = _operand_before(sql, match.start())
+        amount = _literal_value(match.group(2), literals)
+        sign = '-' if match.group(1) == '-' else ''
+        unit = match.group(3).upper()
+        sql = f"{sql[:start]}ORA_ADD_INTERVAL({sql[start:stop]}, {sign}{amount}, '{unit}'){sql[match.end():]}"
+
+
+def _rewrite_date_differences(sql):
+    i = 0
+    while True:
+        i = sql.find(' - ', i)
+        if i < 0:
+            return sql
+        left_start, left_end = _operand_before(sql, i + 1)
+        right_start, right_end = _operand_after(sql, i + 2)
+        left, right = sql[left_start:left_end], sql[right_start:right_end]
+        if _datelike(left) and _datelike(right):
+            replacement = f"ORA_DAYS_BETWEEN({left}, {right})"
+            sql = sql[:left_start] + replacement + sql[right_end:]
+            i = left_start + len(replacement)
+        else:
+            i += 3
+
+
+def _rewrite_rownum(sql):
+    # Solo el límite del nivel superior; SQLite lo aplica después del ORDER BY
+    match = _ROWNUM_RE.search(sql)
+    if not match:
+        return sql
+    limit = int(match.group(3)) - (1 if match.group(2) == '<' else 0)
+    replacement = match.group(1).upper() if match.group(4) else ''
+    sql = f"{sql[:match.start()]}{replacement}{sql[match.end():]}"
+    return f"{sql.rstrip().rstrip(';').rstrip()} LIMIT {max(limit, 0)}"
+
+
+@functools.lru_cache(maxsize=1024)
+def translate(sql):
+    """SQLite version of an Oracle statement (cached by SQL text)."""
+    masked, literals = _mask(sql)
+    masked = _SYSDATE_RE.sub('ORA_SYSDATE()', masked)
+    masked = _DUAL_RE.sub('', masked)
+    masked = _MINUS_RE.sub('EXCEPT', masked)
+    masked = _NVL_RE.sub('IFNULL(', masked)
+    masked = _EXTRACT_RE.sub(lambda m: f"ORA_EXTRACT('{m.group(1).upper()}', ", masked)
+    masked = _rewrite_listagg(masked)
+    masked = _rewrite_intervals(masked, literals)
+    masked = _rewrite_date_differences(masked)
+    masked = _OFFSET_FETCH_RE.sub(r'LIMIT \1, \2', masked)
+    masked = _FETCH_RE.sub(lambda m: f"LIMIT {m.group(1) or 1}", masked)
+    masked = _OFFSET_RE.sub(r'LIMIT -1 OFFSET \1', masked)
+    masked = _rewrite_rownum(masked)
+    masked = _DIVIDE_RE.sub('* 1.0 /', masked)
+    return _unmask(masked, literals)
+
+
+# --- Fechas ----------------------------------------------------------------
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+MONTHS = {
+    'ENGLISH': ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December'],
+    'SPANISH': ['Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio', 'Julio',
+                'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre'],
+}
+MONTH_ABBR = {
+    'ENGLISH': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+    'SPANISH': ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic'],
+}
+DAYS = {
+    'ENGLISH': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'],
+    'SPANISH': ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes', 'Sábado', 'Domingo'],
+}
+
+_DATE_TOKEN_RE = re.compile(
+    r'"[^"]*"|FM|YYYY|YY|MONTH|Month|month|MON|Mon|mon|MM|DDD|DD|DAY|Day|day|DY|Dy|dy|D|'
+    r'HH24|HH12|HH|MI|SS|FF\d?|AM|PM|Q|IW|WW', re.IGNORECASE)
+
+
+def to_datetime(value):
+    """datetime for an ISO text/datetime value, None if it is not a date."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.strip().replace('T', ' '))
+        except ValueError:
+            return None
+    return None
+
+
+def from_datetime(value):
+    return value.strftime(DATETIME_FORMAT) if value is not None else None
+
+
+def _language(nls):
+    if nls and 'SPANISH' in nls.upper():
+        return 'SPANISH'
+    return 'ENGLISH'
+
+
+def _cased(text, token):
+    if token.isupper():
+        return text.upper()
+    if token.islower():
+        return text.lower()
+    return text
+
+
+def _format_date(dt, fmt, language):
+    fill = True
+
+    def token(match):
+        nonlocal fill
+        tok = match.group(0)
+        upper = tok.upper()
+        if tok.startswith('"'):
+            return tok[1:-1]
+        if upper == 'FM':
+            fill = False
+            return ''
+        if upper == 'YYYY':
+            return f'{dt.year:04d}'
+        if upper == 'YY':
+            return f'{dt.year % 100:02d}'
+        if upper == 'MONTH':
+            name = _cased(MONTHS[language][dt.month - 1], tok)
+            return name.ljust(9) if fill else name
+        if upper == 'MON':
+            return _cased(MONTH_ABBR[language][dt.month - 1], tok)
+        if upper == 'MM':
+            return f'{dt.month:02d}'
+        if upper == 'DDD':
+            return f'{dt.timetuple().tm_yday:03d}'
+        if upper == 'DD':
+            return f'{dt.day:02d}'
+        if upper == 'DAY':
+            name = _cased(DAYS[language][dt.weekday()], tok)
+            return name.ljust(9) if fill else name
+        if upper == 'DY':
+            return _cased(DAYS[language][dt.weekday()][:3], tok)
+        if upper == 'D':
+            return str((dt.isoweekday() % 7) + 1)
+        if upper == 'HH24':
+            return f'{dt.hour:02d}'
+        if upper in ('HH', 'HH12'):
+            return f'{(dt.hour % 12) or 12:02d}'
+        if upper == 'MI':
+            return f'{dt.minute:02d}'
+        if upper == 'SS':
+            return f'{dt.second:02d}'
+        if upper.startswith('FF'):
+            digits = int(upper[2:] or 6)
+            return f'{dt.microsecond:06d}'[:digits]
+        if upper in ('AM', 'PM'):
+            return 'AM' if dt.hour < 12 else 'PM'
+        if upper == 'Q':
+            return str((dt.month - 1) // 3 + 1)
+        if upper == 'IW':
+            return f'{dt.isocalendar()[1]:02d}'
+        if upper == 'WW':
+            return f'{(dt.timetuple().tm_yday - 1) // 7 + 1:02d}'
+        return tok
+    return _DATE_TOKEN_RE.sub(token, fmt)
+
+
+_STRPTIME = [
+    ('YYYY', '%Y'), ('YY', '%y'), ('MONTH', '%B'), ('MON', '%b'), ('MM', '%m'),
+    ('DD', '%d'), ('HH24', '%H'), ('HH12', '%I'), ('HH', '%I'), ('MI', '%M'),
+    ('SS', '%S'), ('FF', '%f'), ('AM', '%p'), ('PM', '%p'),
+]
+
+
+def _strptime_format(fmt):
+    out, i, upper = [], 0, fmt.upper()
+    while i < len(fmt):
+        for token, directive in _STRPTIME:
+            if upper.startswith(token, i):
+                out.append(directive)
+                i += len(token)
+                break
+        else:
+            out.append(fmt[i].replace('%', '%%'))
+            i += 1
+    return ''.join(out)
+
+
+def _add_months(dt, months):
+    month_index = dt.month - 1 + int(months)
+    year, month = dt.year + month_index // 12, month_index % 12 + 1
+    last = calendar.monthrange(year, month)[1]
+    # Como Oracle: del último día de un mes al último día del mes destino
+    day = last if dt.day == calendar.monthrange(dt.year, dt.month)[1] else min(dt.day, last)
+    return dt.replace(year=year, month=month, day=day)
+
+
+def _trunc_date(dt, fmt):
+    fmt = (fmt or 'DD').upper()
+    if fmt in ('DD', 'DDD', 'J'):
+        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    if fmt in ('MM', 'MON', 'MONTH', 'RM'):
+        return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if fmt in ('YYYY', 'YEAR', 'YY', 'Y', 'SYYYY'):
+        return dt.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    if fmt == 'Q':
+        return dt.replace(month=(dt.month - 1) // 3 * 3 + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    if fmt in ('IW', 'DAY', 'DY', 'D'):
+        monday = dt - timedelta(days=dt.weekday())
+        return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+    if fmt in ('HH', 'HH24', 'HH12'):
+        return dt.replace(minute=0, second=0, microsecond=0)
+    if fmt == 'MI':
+        return dt.replace(second=0, microsecond=0)
+    raise ValueError(f"Unsupported TRUNC format: {fmt}")
+
+
+def _number(value):
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def _number_text(value):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _format_number(value, fmt):
+    fmt = fmt.upper().replace('FM', '')
+    decimals = len(fmt.split('.')[1]) if '.' in fmt else 0
+    grouped = ',' if ',' in fmt else ''
+    return format(value, f'{grouped}.{decimals}f')
+
+
+# --- Funciones SQL ---------------------------------------------------------
+
+def ora_sysdate():
+    return datetime.now().strftime(DATETIME_FORMAT)
+
+
+def ora_to_char(value, fmt=None, nls=None):
+    if value is None:
+        return None
+    dt = to_datetime(value) if isinstance(value, (str, datetime)) else None
+    if dt is not None and (fmt or not isinstance(value, str)):
+        return _format_date(dt, fmt or 'DD-MON-YY', _language(nls))
+    if isinstance(value, (int, float)):
+        return _format_number(value, fmt) if fmt else _number_text(value)
+    return str(value)
+
+
+def ora_to_date(value, fmt=None, nls=None):
+    if value is None or value == '':
+        return None
+    if fmt is None:
+        return from_datetime(to_datetime(value))
+    return from_datetime(datetime.strptime(str(value).strip(), _strptime_format(fmt)))
+
+
+def ora_to_number(value, fmt=None):
+    if value is None or value == '':
+        return None
+    number = _number(str(value).replace(',', '') if fmt else value)
+    if number is None:
+        raise ValueError(f"ORA-01722: invalid number ({value})")
+    return number
+
+
+def ora_trunc(value, fmt=None):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        dt = to_datetime(value)
+        if dt is not None:
+            return from_datetime(_trunc_date(dt, fmt))
+        value = _number(value)
+        if value is None:
+            return None
+    digits = int(fmt or 0)
+    factor = 10 ** digits
+    truncated = math.trunc(value * factor) / factor
+    return int(truncated) if digits <= 0 else truncated
+
+
+def ora_add_months(value, months):
+    dt = to_datetime(value)
+    if dt is None or months is None:
+        return None
+    return from_datetime(_add_months(dt, months))
+
+
+def ora_months_between(a, b):
+    d1, d2 = to_datetime(a), to_datetime(b)
+    if d1 is None or d2 is None:
+        return None
+    months = (d1.year - d2.year) * 12 + (d1.month - d2.month)
+    last1 = d1.day == calendar.monthrange(d1.year, d1.month)[1]
+    last2 = d2.day == calendar.monthrange(d2.year, d2.month)[1]
+    if d1.day == d2.day or (last1 and last2):
+        return float(months)
+    seconds = lambda d: d.hour * 3600 + d.minute * 60 + d.second  # noqa: E731
+    return months + ((d1.day - d2.day) + (seconds(d1) - seconds(d2)) / 86400) / 31
+
+
+def ora_last_day(value):
+    dt = to_datetime(value)
+    if dt is None:
+        return None
+    return from_datetime(dt.replace(day=calendar.monthrange(dt.year, dt.month)[1]))
+
+
+def ora_extract(unit, value):
+    dt = to_datetime(value)
+    if dt is None:
+        return None
+    return getattr(dt, unit.lower())
+
+
+def ora_add_interval(value, amount, unit):
+    dt = to_datetime(value)
+    if dt is None or amount is None:
+        return None
+    amount = _number(amount)
+    if unit == 'YEAR':
+        return from_datetime(_add_months(dt, amount * 12))
+    if unit == 'MONTH':
+        return from_datetime(_add_months(dt, amount))
+    return from_datetime(dt + timedelta(**{f'{unit.lower()}s': amount}))
+
+
+def ora_days_between(a, b):
+    d1, d2 = to_datetime(a), to_datetime(b)
+    if d1 is None or d2 is None:
+        return None
+    days = (d1 - d2).total_seconds() / 86400
+    return int(days) if days.is_integer() else days
+
+
+def ora_nvl2(value, if_not_null, if_null):
+    return if_not_null if value is not None else if_null
+
+
+def ora_decode(value, *pairs):
+    # DECODE compara NULL con NULL como iguales
+    for search, result in zip(pairs[0::2], pairs[1::2]):
+        if value == search or (value is None and search is None):
+            return result
+    return pairs[-1] if len(pairs) % 2 else None
+
+
+def ora_initcap(value):
+    return value.title() if isinstance(value, str) else value
+
+
+def ora_lpad(value, length, pad=' '):
+    if value is None:
+        return None
+    return str(value).rjust(int(length), pad or ' ')[:int(length)]
+
+
+def ora_rpad(value, length, pad=' '):
+    if value is None:
+        return None
+    return str(value).ljust(int(length), pad or ' ')[:int(length)]
+
+
+def _extreme(pick):
+    def fn(*values):
+        if any(v is None for v in values):
+            return None
+        return pick(values)
+    return fn
+
+
+class ListAgg:
+    """LISTAGG(expr, sep) WITHIN GROUP (ORDER BY key [DESC])."""
+
+    def __init__(self):
+        self.items = []
+        self.separator = ''
+        self.descending = False
+
+    def step(self, value, separator, key, descending):
+        if value is None:
+            return
+        self.separator = separator or ''
+        self.descending = bool(descending)
+        self.items.append((key if key is not None else value, str(value)))
+
+    def finalize(self):
+        if not self.items:
+            return None
+        self.items.sort(key=lambda item: item[0], reverse=self.descending)
+        return self.separator.join(text for _, text in self.items)
+
+
+class ListAggDistinct(ListAgg):
+    """LISTAGG(DISTINCT expr, sep): keeps the first occurrence of each value."""
+
+    def finalize(self):
+        seen = set()
+        self.items = [item for item in self.items if not (item[1] in seen or seen.add(item[1]))]
+        return super().finalize()
+
+
+FUNCTIONS = [
+    ('ORA_SYSDATE', 0, ora_sysdate, False),
+    ('TO_CHAR', 1, ora_to_char, True),
+    ('TO_CHAR', 2, ora_to_char, True),
+    ('TO_CHAR', 3, ora_to_char, True),
+    ('TO_DATE', 1, ora_to_date, True),
+    ('TO_DATE', 2, ora_to_date, True),
+    ('TO_DATE', 3, ora_to_date, True),
+    ('TO_TIMESTAMP', 1, ora_to_date, True),
+    ('TO_TIMESTAMP', 2, ora_to_date, True),
+    ('TO_NUMBER', 1, ora_to_number, True),
+    ('TO_NUMBER', 2, ora_to_number, True),
+    ('TRUNC', 1, ora_trunc, True),
+    ('TRUNC', 2, ora_trunc, True),
+    ('ADD_MONTHS', 2, ora_add_months, True),
+    ('MONTHS_BETWEEN', 2, ora_months_between, True),
+    ('LAST_DAY', 1, ora_last_day, True),
+    ('ORA_EXTRACT', 2, ora_extract, True),
+    ('ORA_ADD_INTERVAL', 3, ora_add_interval, True),
+    ('ORA_DAYS_BETWEEN', 2, ora_days_between, True),
+    ('NVL2', 3, ora_nvl2, True),
+    ('DECODE', -1, ora_decode, True),
+    ('INITCAP', 1, ora_initcap, True),
+    ('LPAD', 2, ora_lpad, True),
+    ('LPAD', 3, ora_lpad, True),
+    ('RPAD', 2, ora_rpad, True),
+    ('RPAD', 3, ora_rpad, True),
+    ('GREATEST', -1, _extreme(max), True),
+    ('LEAST', -1, _extreme(min), True),
+]
+
+
+def register_functions(conn):
+    for name, nargs, fn, deterministic in FUNCTIONS:
+        conn.create_function(name, nargs, fn, deterministic=deterministic)
+    conn.create_aggregate('ORA_LISTAGG', 4, ListAgg)
+    conn.create_aggregate('ORA_LISTAGG_DISTINCT', 4, ListAggDistinct)
@@ -0,0 +1,983 @@
+"""
+Python ports of the PL/SQL package entry points the views call.
+
+Each procedure receives a `Call` plus the positional arguments of
+`cursor.callproc`, in the order of the package spec. OUT arguments arrive as
+`OutVar` objects (set with `setvalue(0, value)`) and SYS_REFCURSOR arguments
+as cursors, opened with `call.open(ref, sql, params)`. Implicit result sets
+(DBMS_SQL.RETURN_RESULT) go through `call.return_result(sql, params)`.
+
+The SQL inside is kept in Oracle syntax and runs through the same dialect
+translator as the views' own queries. Error codes and messages follow the
+package bodies in scripts/RedRomero_ProgrammingObjectsv2.sql, so the
+'ORA-' string checks in the views behave the same way.
+"""
+import sqlite3
+
+PROCEDURES = {}
+PIPELINED = {}
+
+
+class NoDataFound(sqlite3.DatabaseError):
+    """SELECT ... INTO without rows (NO_DATA_FOUND)."""
+
+    def __init__(self):
+        super().__init__('ORA-01403: no data found')
+
+
+def procedure(name, writes=True):
+    """Register `fn` as the body of the packaged procedure `name`."""
+    def register(fn):
+        PROCEDURES[name.upper()] = (fn, writes)
+        return fn
+    return register
+
+
+def pipelined(name, columns):
+    """Register `fn` as a PIPELINED function returning rows of `columns`."""
+    def register(fn):
+        PIPELINED[name.upper()] = (fn, columns)
+        return fn
+    return register
+
+
+def raise_application_error(code, message):
+    raise sqlite3.DatabaseError(f"ORA{code}: {message}")
+
+
+def _int(value):
+    return int(value) if value not in (None, '') else None
+
+
+class OutVar:
+    """Minimal stand-in for an oracledb bind variable."""
+
+    def __init__(self, type_=None):
+        self.type = type_
+        self.value = None
+
+    def getvalue(self, pos=0):
+        return self.value
+
+    def setvalue(self, pos, value):
+        self.value = value
+
+
+class Call:
+    """Execution context of one callproc: statements, ref cursors and results."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.results = []
+
+    def execute(self, sql, params=()):
+        cursor = self.connection.cursor()
+        cursor.execute(sql, list(params))
+        return cursor
+
+    def one(self, sql, params=()):
+        return self.execute(sql, params).fetchone()
+
+    def scalar(self, sql, params=()):
+        row = self.one(sql, params)
+        return row[0] if row else None
+
+    def select_into(self, sql, params=()):
+        row = self.one(sql, params)
+        if row is None:
+            raise NoDataFound()
+        return row
+
+    def insert(self, sql, params=()):
+        """INSERT ... RETURNING <identity> INTO: returns the new id."""
+        return self.execute(sql, params).lastrowid
+
+    def rowcount(self, sql, params=()):
+        """DML returning SQL%ROWCOUNT."""
+        return self.execute(sql, params).rowcount
+
+    def open(self, ref, sql, params=()):
+        ref.execute(sql, list(params))
+
+    def return_result(self, sql, params=()):
+        self.results.append(self.execute(sql, params))
+
+
+# =============================================================================
+# PKG_PROJECT_MGMT
+# =============================================================================
+
+@procedure('PKG_PROJECT_MGMT.create_project')
+def create_project(call, name, desc, start, end, status, ong, rep, new_id):
+    try:
+        new_id.setvalue(0, call.insert(
+            "INSERT INTO Project(name, description, start_date, end_date, project_status_id, ong_id, representative_id) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            [name, desc, start, end, status, ong, rep],
+        ))
+    except sqlite3.DatabaseError as e:
+        raise_application_error(-20201, f"Error creating project: {e}")
+
+
+@procedure('PKG_PROJECT_MGMT.update_project_details')
+def update_project_details(call, id_, name, desc, start, end, status, ong, rep):
+    updated = call.rowcount(
+        "UPDATE Project SET name=%s, description=%s, start_date=%s, end_date=%s, "
+        "project_status_id=%s, ong_id=%s, representative_id=%s WHERE project_id = %s",
+        [name, desc, start, end, status, ong, rep, id_],
+    )
+    if updated == 0:
+        raise_application_error(-20202, 'Project not found')
+
+
+@procedure('PKG_PROJECT_MGMT.delete_project')
+def delete_project(call, id_):
+    if call.scalar("SELECT COUNT(*) FROM Donation WHERE project_id = %s", [id_]) > 0:
+        raise_application_error(-20204, 'Cannot delete: Project has donations.')
+    if call.rowcount("DELETE FROM Project WHERE project_id = %s", [id_]) == 0:
+        raise_application_error(-20206, 'Project not found')
+
+
+@procedure('PKG_PROJECT_MGMT.create_project_status')
+def create_project_status(call, name, new_id):
+    new_id.setvalue(0, call.insert("INSERT INTO Project_Status(status_name) VALUES (%s)", [name]))
+
+
+@procedure('PKG_PROJECT_MGMT.update_project_status')
+def update_project_status(call, id_, name):
+    call.execute("UPDATE Project_Status SET status_name = %s WHERE project_status_id = %s", [name, id_])
+
+
+@procedure('PKG_PROJECT_MGMT.delete_project_status')
+def delete_project_status(call, id_):
+    call.execute("DELETE FROM Project_Status WHERE project_status_id = %s", [id_])
+
+
+@procedure('PKG_PROJECT_MGMT.assign_sdg')
+def assign_sdg(call, proj_id, sdg_id, contrib, user, new_id):
+    if call.scalar("SELECT COUNT(*) FROM Project_SDG WHERE project_id=%s AND sdg_id=%s", [proj_id, sdg_id]) > 0:
+        raise_application_error(-20601, 'SDG already assigned')
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Project_SDG(project_id, sdg_id, contribution_level, assigned_by_user_id) VALUES (%s, %s, %s, %s)",
+        [proj_id, sdg_id, contrib, user],
+    ))
+
+
+@procedure('PKG_PROJECT_MGMT.create_sdg_goal')
+def create_sdg_goal(call, num, name, desc, icon, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO SDG_Goal(goal_number, goal_name, description, icon_url) VALUES (%s, %s, %s, %s)",
+        [num, name, desc, icon],
+    ))
+
+
+@procedure('PKG_PROJECT_MGMT.close_project')
+def close_project(call, project_id):
+    try:
+        (status_id,) = call.select_into(
+            "SELECT project_status_id FROM Project_Status WHERE status_name = 'COMPLETADO'"
+        )
+        call.execute("UPDATE Project SET project_status_id = %s, end_date = SYSDATE WHERE project_id = %s",
+                     [status_id, project_id])
+        call.execute("UPDATE Volunteer_Project SET end_date = SYSDATE, status = 'I' "
+                     "WHERE project_id = %s AND status = 'A'", [project_id])
+    except sqlite3.DatabaseError as e:
+        raise_application_error(-20801, f"Error closing project: {e}")
+
+
+@procedure('PKG_PROJECT_MGMT.reactivate_project')
+def reactivate_project(call, project_id):
+    (status_id,) = call.select_into("SELECT project_status_id FROM Project_Status WHERE status_name = 'ACTIVO'")
+    call.execute("UPDATE Project SET project_status_id = %s, end_date = NULL WHERE project_id = %s",
+                 [status_id, project_id])
+
+
+@procedure('PKG_PROJECT_MGMT.extend_deadline')
+def extend_deadline(call, project_id, months):
+    updated = call.rowcount("UPDATE Project SET end_date = ADD_MONTHS(end_date, %s) WHERE project_id = %s",
+                            [months, project_id])
+    if updated == 0:
+        raise_application_error(-20903, 'Project not found')
+
+
+@procedure('PKG_PROJECT_MGMT.process_approval')
+def process_approval(call, approval_id, decision, emp_id):
+    (status_id,) = call.select_into("SELECT approval_status_id FROM Approval_Status WHERE status_name = %s",
+                                    [decision])
+    project_id = call.scalar("SELECT project_id FROM Approval WHERE approval_id = %s", [approval_id])
+    call.execute("UPDATE Approval SET approval_status_id = %s, approval_date = SYSTIMESTAMP, employee_id = %s "
+                 "WHERE approval_id = %s", [status_id, emp_id, approval_id])
+    if decision == 'APROBADO':
+        call.execute("UPDATE Project SET project_status_id = "
+                     "(SELECT project_status_id FROM Project_Status WHERE status_name = 'ACTIVO') "
+                     "WHERE project_id = %s", [project_id])
+
+
+@procedure('PKG_PROJECT_MGMT.create_report')
+def create_report(call, proj, date, title, desc, file_url, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Report(project_id, report_date, title, description, file_url) VALUES (%s, %s, %s, %s, %s)",
+        [proj, date, title, desc, file_url],
+    ))
+
+
+@procedure('PKG_PROJECT_MGMT.create_approval')
+def create_approval(call, date, stat, emp, proj, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Approval(approval_date, approval_status_id, employee_id, project_id) VALUES (%s, %s, %s, %s)",
+        [date, stat, emp, proj],
+    ))
+
+
+# =============================================================================
+# PKG_FINANCE_CORE
+# =============================================================================
+
+_ROLLUP_CELL = "month_start = TRUNC(%s, 'MM') AND project_id = %s AND currency_id = %s"
+_DONOR_CELL = "month_start = TRUNC(%s, 'MM') AND currency_id = %s AND donor_id = %s"
+
+
+def _rollup_add(call, date, proj, curr, donor, amount):
+    # rollup_add: SQLite serializa las escrituras, no hay carrera al abrir la celda
+    if call.rowcount(
+        "UPDATE Donation_Rollup SET donation_count = donation_count + 1, total_amount = total_amount + %s, "
+        "min_amount = LEAST(min_amount, %s), max_amount = GREATEST(max_amount, %s) WHERE " + _ROLLUP_CELL,
+        [amount, amount, amount, date, proj, curr],
+    ) == 0:
+        call.execute(
+            "INSERT INTO Donation_Rollup (month_start, project_id, currency_id, donation_count, total_amount, "
+            "min_amount, max_amount) VALUES (TRUNC(%s, 'MM'), %s, %s, 1, %s, %s, %s)",
+            [date, proj, curr, amount, amount, amount],
+        )
+    add_kpi_delta(call, 'MONTHLY_DONATIONS', amount, date)
+    if call.rowcount(
+        "UPDATE Donation_Donor_Rollup SET donation_count = donation_count + 1 WHERE " + _DONOR_CELL,
+        [date, curr, donor],
+    ) == 0:
+        call.execute(
+            "INSERT INTO Donation_Donor_Rollup (month_start, currency_id, donor_id, donation_count) "
+            "VALUES (TRUNC(%s, 'MM'), %s, %s, 1)",
+            [date, curr, donor],
+        )
+
+
+def _rollup_refresh(call, date, proj, curr):
+    # TRUNC en vez del rango de Oracle: una fecha enviada como texto sin hora
+    # ('2025-03-01') quedaría fuera de ">= '2025-03-01 00:00:00'"
+    old_total = call.scalar("SELECT total_amount FROM Donation_Rollup WHERE " + _ROLLUP_CELL, [date, proj, curr])
+    if old_total is None:
+        return
+    count, total, low, high = call.one(
+        "SELECT COUNT(*), NVL(SUM(amount), 0), MIN(amount), MAX(amount) FROM Donation "
+        "WHERE project_id = %s AND currency_id = %s AND TRUNC(donation_date, 'MM') = TRUNC(%s, 'MM')",
+        [proj, curr, date],
+    )
+    if count == 0:
+        call.execute("DELETE FROM Donation_Rollup WHERE " + _ROLLUP_CELL, [date, proj, curr])
+    else:
+        call.execute(
+            "UPDATE Donation_Rollup SET donation_count = %s, total_amount = %s, min_amount = %s, max_amount = %s "
+            "WHERE " + _ROLLUP_CELL,
+            [count, total, low, high, date, proj, curr],
+        )
+    add_kpi_delta(call, 'MONTHLY_DONATIONS', total - old_total, date)
+
+
+@procedure('PKG_FINANCE_CORE.register_donation')
+def register_donation(call, date, amount, proj, curr, donor, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Donation(donation_date, amount, project_id, currency_id, donor_id) VALUES (%s, %s, %s, %s, %s)",
+        [date, amount, proj, curr, donor],
+    ))
+    _rollup_add(call, date, proj, curr, donor, amount)
+
+
+@procedure('PKG_FINANCE_CORE.update_donation')
+def update_donation(call, id_, amount):
+    row = call.one("SELECT donation_date, project_id, currency_id FROM Donation WHERE donation_id = %s", [id_])
+    if row is None or call.rowcount("UPDATE Donation SET amount = %s WHERE donation_id = %s", [amount, id_]) == 0:
+        raise_application_error(-20302, 'Donation not found')
+    _rollup_refresh(call, *row)
+
+
+@procedure('PKG_FINANCE_CORE.delete_donation')
+def delete_donation(call, id_):
+    row = call.one("SELECT donation_date, project_id, currency_id, donor_id FROM Donation WHERE donation_id = %s",
+                   [id_])
+    if row is None or call.rowcount("DELETE FROM Donation WHERE donation_id = %s", [id_]) == 0:
+        raise_application_error(-20304, 'Donation not found')
+    date, proj, curr, donor = row
+    _rollup_refresh(call, date, proj, curr)
+    call.execute("UPDATE Donation_Donor_Rollup SET donation_count = donation_count - 1 WHERE " + _DONOR_CELL,
+                 [date, curr, donor])
+    call.execute("DELETE FROM Donation_Donor_Rollup WHERE " + _DONOR_CELL + " AND donation_count <= 0",
+                 [date, curr, donor])
+
+
+@procedure('PKG_FINANCE_CORE.create_budget')
+def create_budget(call, amount, desc, proj, curr, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Budget(initial_amount, creation_date, description, project_id, currency_id) "
+        "VALUES (%s, SYSTIMESTAMP, %s, %s, %s)",
+        [amount, desc, proj, curr],
+    ))
+
+
+@procedure('PKG_FINANCE_CORE.update_budget')
+def update_budget(call, id_, amount, proj, curr):
+    call.execute("UPDATE Budget SET initial_amount=%s, project_id=%s, currency_id=%s WHERE budget_id=%s",
+                 [amount, proj, curr, id_])
+
+
+@procedure('PKG_FINANCE_CORE.delete_budget')
+def delete_budget(call, id_):
+    call.execute("DELETE FROM Budget WHERE budget_id = %s", [id_])
+
+
+@procedure('PKG_FINANCE_CORE.register_donor')
+def register_donor(call, name, email, phone, type_id, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Donor(name, email, phone, type_id) VALUES (%s, %s, %s, %s)",
+        [name, email, phone, type_id],
+    ))
+
+
+@procedure('PKG_FINANCE_CORE.update_donor')
+def update_donor(call, id_, name, email, phone, type_id):
+    call.execute("UPDATE Donor SET name=%s, email=%s, phone=%s, type_id=%s WHERE donor_id=%s",
+                 [name, email, phone, type_id, id_])
+
+
+@procedure('PKG_FINANCE_CORE.delete_donor')
+def delete_donor(call, id_):
+    call.execute("DELETE FROM Donor WHERE donor_id = %s", [id_])
+
+
+@procedure('PKG_FINANCE_CORE.create_donor_type')
+def create_donor_type(call, name, desc, new_id):
+    new_id.setvalue(0, call.insert("INSERT INTO Donor_Type(type_name, description) VALUES (%s, %s)", [name, desc]))
+
+
+@procedure('PKG_FINANCE_CORE.anonymize_donor')
+def anonymize_donor(call, donor_id):
+    call.execute("UPDATE Donor SET name='Anonymous '||%s, email=NULL, phone=NULL WHERE donor_id=%s",
+                 [donor_id, donor_id])
+    call.execute("DELETE FROM Identity_Document WHERE donor_id=%s", [donor_id])
+
+
+@procedure('PKG_FINANCE_CORE.create_currency')
+def create_currency(call, name, code, sym, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Currency(currency_name, currency_code, symbol, exchange_rate_to_usd) VALUES (%s, %s, %s, 1)",
+        [name, code, sym],
+    ))
+
+
+@procedure('PKG_FINANCE_CORE.update_currency_rate')
+def update_currency_rate(call, code, rate):
+    call.execute("UPDATE Currency SET exchange_rate_to_usd = %s, last_updated = SYSTIMESTAMP WHERE currency_code = %s",
+                 [rate, code])
+
+
+@procedure('PKG_FINANCE_CORE.get_financial_summary', writes=False)
+def get_financial_summary(call, proj_id, budget, donations, balance):
+    budget.setvalue(0, call.scalar("SELECT NVL(SUM(initial_amount), 0) FROM Budget WHERE project_id = %s", [proj_id]))
+    donations.setvalue(0, call.scalar("SELECT NVL(SUM(amount), 0) FROM Donation WHERE project_id = %s", [proj_id]))
+    balance.setvalue(0, budget.getvalue() - donations.getvalue())
+
+
+# =============================================================================
+# PKG_WORKFORCE
+# =============================================================================
+
+@procedure('PKG_WORKFORCE.create_employee')
+def create_employee(call, fname, lname, birth, addr, email, phone, hire, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Employee(first_name, last_name, birth_date, address, email, phone, hire_date) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+        [fname, lname, birth, addr, email, phone, hire],
+    ))
+
+
+@procedure('PKG_WORKFORCE.update_employee')
+def update_employee(call, id_, fname, lname, email, phone):
+    call.execute("UPDATE Employee SET first_name=%s, last_name=%s, email=%s, phone=%s WHERE employee_id=%s",
+                 [fname, lname, email, phone, id_])
+
+
+@procedure('PKG_WORKFORCE.delete_employee')
+def delete_employee(call, id_):
+    call.execute("DELETE FROM Employee WHERE employee_id = %s", [id_])
+
+
+@procedure('PKG_WORKFORCE.create_volunteer')
+def create_volunteer(call, fname, lname, birth, addr, email, phone, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Volunteer(first_name, last_name, birth_date, address, email, phone) "
+        "VALUES (%s, %s, %s, %s, %s, %s)",
+        [fname, lname, birth, addr, email, phone],
+    ))
+
+
+@procedure('PKG_WORKFORCE.update_volunteer')
+def update_volunteer(call, id_, fname, lname, email, phone):
+    call.execute("UPDATE Volunteer SET first_name=%s, last_name=%s, email=%s, phone=%s WHERE volunteer_id=%s",
+                 [fname, lname, email, phone, id_])
+
+
+@procedure('PKG_WORKFORCE.delete_volunteer')
+def delete_volunteer(call, id_):
+    call.execute("DELETE FROM Volunteer WHERE volunteer_id = %s", [id_])
+
+
+@procedure('PKG_WORKFORCE.create_representative')
+def create_representative(call, fname, lname, birth, addr, email, phone, ong, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Representative(first_name, last_name, birth_date, address, email, phone, ong_id) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+        [fname, lname, birth, addr, email, phone, ong],
+    ))
+
+
+@procedure('PKG_WORKFORCE.delete_representative')
+def delete_representative(call, id_):
+    call.execute("DELETE FROM Representative WHERE representative_id = %s", [id_])
+
+
+@procedure('PKG_WORKFORCE.create_ngo')
+def create_ngo(call, name, reg, ctry, email, new_id):
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO NGO(name, registration_number, country, city, contact_email) VALUES (%s, %s, %s, 'Unknown', %s)",
+        [name, reg, ctry, email],
+    ))
+
+
+@procedure('PKG_WORKFORCE.delete_ngo')
+def delete_ngo(call, id_):
+    call.execute("DELETE FROM NGO WHERE ong_id = %s", [id_])
+
+
+@procedure('PKG_WORKFORCE.create_specialty')
+def create_specialty(call, name, desc, new_id):
+    new_id.setvalue(0, call.insert("INSERT INTO Specialty(specialty_name, description) VALUES (%s, %s)", [name, desc]))
+
+
+@procedure('PKG_WORKFORCE.add_volunteer_specialty')
+def add_volunteer_specialty(call, vol_id, spec_id, new_id):
+    if call.scalar("SELECT COUNT(*) FROM Volunteer_Specialty WHERE volunteer_id=%s AND specialty_id=%s",
+                   [vol_id, spec_id]) > 0:
+        raise_application_error(-20701, 'Specialty already assigned')
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Volunteer_Specialty(volunteer_id, specialty_id, assignment_date) VALUES (%s, %s, SYSTIMESTAMP)",
+        [vol_id, spec_id],
+    ))
+
+
+@procedure('PKG_WORKFORCE.assign_volunteer_to_project')
+def assign_volunteer_to_project(call, proj_id, vol_id, new_id):
+    if call.scalar("SELECT COUNT(*) FROM Volunteer_Project WHERE project_id=%s AND volunteer_id=%s AND status='A'",
+                   [proj_id, vol_id]) > 0:
+        raise_application_error(-20501, 'Volunteer active in project')
+    new_id.setvalue(0, call.insert(
+        "INSERT INTO Volunteer_Project(project_id, volunteer_id, assignment_date, status) "
+        "VALUES (%s, %s, SYSTIMESTAMP, 'A')",
+        [proj_id, vol_id],
+    ))
+
+
+def can_volunteer_apply(call, volunteer_id, project_id):
+    row = call.one(
+        "SELECT ps.status_name, p.end_date, CASE WHEN p.end_date < SYSDATE THEN 1 ELSE 0 END "
+        "FROM Project p JOIN Project_Status ps ON p.project_status_id = ps.project_status_id "
+        "WHERE p.project_id = %s",
+        [project_id],
+    )
+    if row is None:
+        return 'ERROR: Project does not exist'
+    status_name, end_date, ended = row
+    if status_name != 'ACTIVO':
+        return 'ERROR: Project is not active'
+    if end_date is not None and ended:
+        return 'ERROR: Project has already ended'
+    if call.scalar("SELECT COUNT(*) FROM Volunteer_Project "
+                   "WHERE volunteer_id = %s AND project_id = %s AND status = 'A'", [volunteer_id, project_id]) > 0:
+        return 'ERROR: You are already assigned to this project'
+    if call.scalar("SELECT COUNT(*) FROM Volunteer_Application "
+                   "WHERE volunteer_id = %s AND project_id = %s AND status IN ('PENDING', 'PENDIENTE')",
+                   [volunteer_id, project_id]) > 0:
+        return 'ERROR: You already have a pending application for this project'
+    return 'Y'
+
+
+@procedure('PKG_WORKFORCE.volunteer_apply_to_project')
+def volunteer_apply_to_project(call, volunteer_id, project_id, user_id, application_id):
+    try:
+        try:
+            (user_volunteer_id,) = call.select_into(
+                "SELECT volunteer_id FROM System_User WHERE user_id = %s AND user_role = 'VOLUNTEER'", [user_id]
+            )
+        except NoDataFound:
+            raise_application_error(-20001, 'Unauthorized user')
+        if _int(user_volunteer_id) != _int(volunteer_id):
+            raise_application_error(-20002, 'Cannot apply on behalf of another volunteer')
+        validation = can_volunteer_apply(call, volunteer_id, project_id)
+        if validation != 'Y':
+            raise_application_error(-20003, validation)
+        # Fecha y estado pendiente: DEFAULT de la columna, como en Oracle
+        application_id.setvalue(0, call.insert(
+            "INSERT INTO Volunteer_Application (volunteer_id, project_id) VALUES (%s, %s)",
+            [volunteer_id, project_id],
+        ))
+    except sqlite3.IntegrityError as e:
+        if 'UNIQUE' not in str(e):
+            raise_application_error(-20004, f"Error creating application: {e}")
+        # DUP_VAL_ON_INDEX en uq_application_pending
+        raise_application_error(-20003, 'ERROR: You already have a pending application for this project')
+    except sqlite3.DatabaseError as e:
+        # Los errores de validación llegan tal cual
+        if str(e).startswith(('ORA-20001:', 'ORA-20002:', 'ORA-20003:')):
+            raise
+        raise_application_error(-20004, f"Error creating application: {e}")
+
+
+@procedure('PKG_WORKFORCE.review_volunteer_application')
+def review_volunteer_application(call, application_id, employee_id, decision, rejection_reason=None):
+    try:
+        if decision not in ('APPROVED', 'REJECTED'):
+            raise_application_error(-20005, 'Invalid decision. Use APPROVED or REJECTED')
+        try:
+            volunteer_id, project_id, current_status = call.select_into(
+                "SELECT volunteer_id, project_id, status FROM Volunteer_Application WHERE application_id = %s",
+                [application_id],
+            )
+        except NoDataFound:
+            raise_application_error(-20006, 'Application not found')
+        if current_status != 'PENDING':
+            raise_application_error(-20007, 'Application has already been processed')
+        call.execute(
+            "UPDATE Volunteer_Application SET status = %s, reviewed_by_employee_id = %s, "
+            "reviewed_date = SYSTIMESTAMP, rejection_reason = %s WHERE application_id = %s",
+            [decision, employee_id, rejection_reason, application_id],
+        )
+        if decision == 'APPROVED':
+            call.insert(
+                "INSERT INTO Volunteer_Project (project_id, volunteer_id, assignment_date, status) "
+                "VALUES (%s, %s, SYSTIMESTAMP, 'A')",
+                [project_id, volunteer_id],
+            )
+            call.execute(
+                "INSERT INTO Project_Assignment_History (project_id, volunteer_id, assignment_type, action, "
+                "assignment_date, reason, assigned_by_user_id) VALUES (%s, %s, 'VOLUNTEER', 'ASSIGNED', "
+                "SYSTIMESTAMP, 'Self-registration approval', "
+                "(SELECT user_id FROM System_User WHERE employee_id = %s LIMIT 1))",
+                [project_id, volunteer_id, employee_id],
+            )
+    except sqlite3.DatabaseError as e:
+        raise_application_error(-20008, f"Error processing application: {e}")
+
+
+@procedure('PKG_WORKFORCE.cancel_volunteer_application')
+def cancel_volunteer_application(call, application_id, volunteer_id):
+    try:
+        try:
+            app_volunteer_id, app_status = call.select_into(
+                "SELECT volunteer_id, status FROM Volunteer_Application WHERE application_id = %s", [application_id]
+            )
+        except NoDataFound:
+            raise_application_error(-20009, 'Application not found')
+        if _int(app_volunteer_id) != _int(volunteer_id):
+            raise_application_error(-20010, 'Cannot cancel another volunteer application')
+        if app_status != 'PENDING':
+            raise_application_error(-20011, 'Can only cancel pending applications')
+        call.execute("UPDATE Volunteer_Application SET status = 'CANCELLED' WHERE application_id = %s",
+                     [application_id])
+    except sqlite3.DatabaseError as e:
+        raise_application_error(-20012, f"Error cancelling application: {e}")
+
+
+@procedure('PKG_WORKFORCE.get_volunteer_applications', writes=False)
+def get_volunteer_applications(call, volunteer_id, ref):
+    call.open(ref, """
+        SELECT va.application_id, va.application_date, va.status, p.project_id,
+               p.name AS project_name, p.description AS project_description,
+               ps.status_name AS project_status, n.name AS ngo_name, va.reviewed_date,
+               e.first_name || ' ' || e.last_name AS reviewed_by, va.rejection_reason
+        FROM Volunteer_Application va
+        JOIN Project p ON va.project_id = p.project_id
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        JOIN NGO n ON p.ong_id = n.ong_id
+        LEFT JOIN Employee e ON va.reviewed_by_employee_id = e.employee_id
+        WHERE va.volunteer_id = %s
+        ORDER BY va.application_date DESC
+    """, [volunteer_id])
+
+
+@procedure('PKG_WORKFORCE.get_pending_applications', writes=False)
+def get_pending_applications(call, project_id, ref):
+    specialties = """(SELECT LISTAGG(s.specialty_name, ', ') WITHIN GROUP (ORDER BY s.specialty_name)
+                      FROM Volunteer_Specialty vs
+                      JOIN Specialty s ON vs.specialty_id = s.specialty_id
+                      WHERE vs.volunteer_id = v.volunteer_id) AS specialties"""
+    if project_id is None:
+        call.open(ref, f"""
+            SELECT va.application_id, va.application_date, v.volunteer_id,
+                   v.first_name || ' ' || v.last_name AS volunteer_name, v.email AS volunteer_email,
+                   p.project_id, p.name AS project_name, n.name AS ngo_name, {specialties}
+            FROM Volunteer_Application va
+            JOIN Volunteer v ON va.volunteer_id = v.volunteer_id
+            JOIN Project p ON va.project_id = p.project_id
+            JOIN NGO n ON p.ong_id = n.ong_id
+            WHERE va.status = 'PENDING'
+            ORDER BY va.application_date ASC
+        """)
+    else:
+        call.open(ref, f"""
+            SELECT va.application_id, va.application_date, v.volunteer_id,
+                   v.first_name || ' ' || v.last_name AS volunteer_name, v.email AS volunteer_email,
+                   v.phone AS volunteer_phone, {specialties},
+                   (SELECT COUNT(*) FROM Volunteer_Project vp WHERE vp.volunteer_id = v.volunteer_id) AS projects_completed
+            FROM Volunteer_Application va
+            JOIN Volunteer v ON va.volunteer_id = v.volunteer_id
+            WHERE va.project_id = %s AND va.status = 'PENDING'
+            ORDER BY va.application_date ASC
+        """, [project_id])
+
+
+# =============================================================================
+# PKG_SYSTEM_SECURITY
+# =============================================================================
+
+@procedure('PKG_SYSTEM_SECURITY.create_user')
+def create_user(call, user, password, ctry, role, emp, vol, rep):
+    call.execute(
+        "INSERT INTO System_User(username, password, country_of_issue, user_role, employee_id, volunteer_id, "
+        "representative_id, is_active) VALUES (%s, %s, %s, %s, %s, %s, %s, 1)",
+        [user, password, ctry, role, emp, vol, rep],
+    )
+
+
+@procedure('PKG_SYSTEM_SECURITY.create_full_user')
+def create_full_user(call, username, password, role, country, first_name, last_name, email, phone, address,
+                     birth_date, ong_id=None):
+    emp_id = vol_id = rep_id = None
+    person = [first_name, last_name, birth_date, address, email, phone]
+    if role in ('ADMIN', 'EMPLOYEE'):
+        emp_id = call.insert(
+            "INSERT INTO Employee (first_name, last_name, birth_date, address, email, phone, hire_date) "
+            "VALUES (%s, %s, %s, %s, %s, %s, SYSDATE)", person,
+        )
+    elif role == 'VOLUNTEER':
+        vol_id = call.insert(
+            "INSERT INTO Volunteer (first_name, last_name, birth_date, address, email, phone) "
+            "VALUES (%s, %s, %s, %s, %s, %s)", person,
+        )
+    elif role == 'REPRESENTATIVE':
+        if ong_id is None:
+            raise_application_error(-20001, 'ONG ID is required for Representatives')
+        rep_id = call.insert(
+            "INSERT INTO Representative (first_name, last_name, birth_date, address, email, phone, ong_id) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s)", person + [ong_id],
+        )
+    admin = 1 if role == 'ADMIN' else 0
+    call.execute(
+        "INSERT INTO System_User (username, password, country_of_issue, user_role, employee_id, volunteer_id, "
+        "representative_id, is_active, is_staff, is_superuser) VALUES (%s, %s, %s, %s, %s, %s, %s, 1, %s, %s)",
+        [username, password, country, role, emp_id, vol_id, rep_id, admin, admin],
+    )
+
+
+@procedure('PKG_SYSTEM_SECURITY.update_user')
+def update_user(call, id_, user, role):
+    call.execute("UPDATE System_User SET username=%s, user_role=%s WHERE user_id=%s", [user, role, id_])
+
+
+@procedure('PKG_SYSTEM_SECURITY.delete_user')
+def delete_user(call, id_):
+    call.execute("DELETE FROM System_User WHERE user_id=%s", [id_])
+
+
+@procedure('PKG_SYSTEM_SECURITY.login_user', writes=False)
+def login_user(call, user, password, id_, role, ok):
+    row = call.one("SELECT user_id, user_role FROM System_User WHERE username=%s AND password=%s", [user, password])
+    if row is None:
+        ok.setvalue(0, 0)
+        return
+    id_.setvalue(0, row[0])
+    role.setvalue(0, row[1])
+    ok.setvalue(0, 1)
+
+
+@procedure('PKG_SYSTEM_SECURITY.create_identity_doc')
+def create_identity_doc(call, type_, num, ctry, rep, emp, vol, donor):
+    call.execute(
+        "INSERT INTO Identity_Document(document_type, document_number, country_of_issue, representative_id, "
+        "employee_id, volunteer_id, donor_id) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+        [type_, num, ctry, rep, emp, vol, donor],
+    )
+
+
+@procedure('PKG_SYSTEM_SECURITY.update_identity_doc')
+def update_identity_doc(call, id_, type_, num):
+    call.execute("UPDATE Identity_Document SET document_type=%s, document_number=%s WHERE document_id=%s",
+                 [type_, num, id_])
+
+
+@procedure('PKG_SYSTEM_SECURITY.delete_identity_doc')
+def delete_identity_doc(call, id_):
+    call.execute("DELETE FROM Identity_Document WHERE document_id=%s", [id_])
+
+
+# =============================================================================
+# PKG_DASHBOARD_ANALYTICS
+# =============================================================================
+
+def _kpi(name, current, previous):
+    current = current or 0
+    previous = current if previous is None else previous
+    change = round((current - previous) / previous * 100, 2) if previous else None
+    trend = 'UP' if current > previous else 'DOWN' if current < previous else 'STABLE'
+    return (name, current, previous, change, trend)
+
+
+def _state_value(call, metric, months_back):
+    return call.scalar(
+        "SELECT metric_value FROM KPI_Snapshot WHERE metric_name = %s AND period_start = ("
+        "SELECT MAX(period_start) FROM KPI_Snapshot "
+        "WHERE metric_name = %s AND period_start <= ADD_MONTHS(TRUNC(SYSDATE, 'MM'), %s))",
+        [metric, metric, -months_back],
+    )
+
+
+def _flow_value(call, metric, months_back):
+    return call.scalar(
+        "SELECT metric_value FROM KPI_Snapshot "
+        "WHERE metric_name = %s AND period_start = ADD_MONTHS(TRUNC(SYSDATE, 'MM'), %s)",
+        [metric, -months_back],
+    ) or 0
+
+
+@pipelined('PKG_DASHBOARD_ANALYTICS.get_main_kpis',
+           columns=('metric_name', 'current_value', 'previous_value', 'percentage_change', 'trend'))
+def get_main_kpis(call):
+    return [
+        _kpi('ACTIVE_PROJECTS', _state_value(call, 'ACTIVE_PROJECTS', 0), _state_value(call, 'ACTIVE_PROJECTS', 1)),
+        _kpi('MONTHLY_DONATIONS', _flow_value(call, 'MONTHLY_DONATIONS', 0),
+             _flow_value(call, 'MONTHLY_DONATIONS', 1)),
+        _kpi('ACTIVE_VOLUNTEERS', _state_value(call, 'ACTIVE_VOLUNTEERS', 0),
+             _state_value(call, 'ACTIVE_VOLUNTEERS', 1)),
+        _kpi('TOTAL_NGOS', _state_value(call, 'TOTAL_NGOS', 0), _state_value(call, 'TOTAL_NGOS', 1)),
+    ]
+
+
+@procedure('PKG_DASHBOARD_ANALYTICS.add_kpi_delta')
+def add_kpi_delta(call, metric, delta, period=None):
+    # Los triggers del stand-in hacen lo mismo en SQL (schema.KPI_TRIGGERS)
+    if not delta:
+        return
+    month, month_params = ("TRUNC(%s, 'MM')", [period]) if period is not None else ("TRUNC(SYSDATE, 'MM')", [])
+    if call.rowcount(
+        "UPDATE KPI_Snapshot SET metric_value = metric_value + %s, updated_at = SYSTIMESTAMP "
+        f"WHERE metric_name = %s AND period_start = {month}",
+        [delta, metric] + month_params,
+    ) == 0:
+        base = 0
+        if period is None:
+            base = _state_value(call, metric, 1) or 0
+        call.execute(
+            "INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at) "
+            f"VALUES (%s, {month}, %s, SYSTIMESTAMP)",
+            [metric] + month_params + [base + delta],
+        )
+
+
+@procedure('PKG_DASHBOARD_ANALYTICS.refresh_kpi_snapshot')
+def refresh_kpi_snapshot(call):
+    from core.summaries import SUMMARIES
+    _, statements = SUMMARIES['kpi_snapshot']
+    for sql in statements:
+        call.execute(sql)
+
+
+@procedure('PKG_DASHBOARD_ANALYTICS.get_donation_trends', writes=False)
+def get_donation_trends(call, year, ref):
+    year = _int(year)
+    start, end = f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+    call.open(ref, """
+        SELECT TO_CHAR(r.month_start, 'YYYY-MM') AS mes,
+               TO_CHAR(r.month_start, 'Month', 'NLS_DATE_LANGUAGE=ENGLISH') AS mes_nombre,
+               r.num_donaciones,
+               r.monto_total,
+               NVL(r.monto_total / NULLIF(r.num_donaciones, 0), 0) AS monto_promedio,
+               NVL(dr.donantes_unicos, 0) AS donantes_unicos
+        FROM (
+            SELECT month_start, SUM(donation_count) AS num_donaciones, NVL(SUM(total_amount), 0) AS monto_total
+            FROM Donation_Rollup
+            WHERE month_start >= TO_DATE(%s, 'YYYY-MM-DD') AND month_start < TO_DATE(%s, 'YYYY-MM-DD')
+            GROUP BY month_start
+        ) r
+        LEFT JOIN (
+            SELECT month_start, COUNT(DISTINCT donor_id) AS donantes_unicos
+            FROM Donation_Donor_Rollup
+            WHERE month_start >= TO_DATE(%s, 'YYYY-MM-DD') AND month_start < TO_DATE(%s, 'YYYY-MM-DD')
+            GROUP BY month_start
+        ) dr ON r.month_start = dr.month_start
+        ORDER BY mes
+    """, [start, end, start, end])
+
+
+@procedure('PKG_DASHBOARD_ANALYTICS.get_project_status_distribution', writes=False)
+def get_project_status_distribution(call, ref):
+    call.open(ref, """
+        SELECT ps.status_name,
+               COUNT(*) AS cantidad,
+               ROUND((COUNT(*) * 100.0 / SUM(COUNT(*)) OVER ()), 2) AS porcentaje
+        FROM Project p
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        GROUP BY ps.status_name
+        ORDER BY cantidad DESC
+    """)
+
+
+@procedure('PKG_DASHBOARD_ANALYTICS.get_projects_paginated', writes=False)
+def get_projects_paginated(call, page, page_size, status_name, ong_id, ref):
+    page, page_size = _int(page) or 1, _int(page_size) or 10
+    call.open(ref, """
+        SELECT p.project_id, p.name, p.description, ps.status_name, n.name AS ngo_name,
+               p.start_date, p.end_date, COUNT(*) OVER () AS total_count
+        FROM Project p
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        JOIN NGO n ON p.ong_id = n.ong_id
+        WHERE (%s IS NULL OR ps.status_name = %s)
+        AND (%s IS NULL OR p.ong_id = %s)
+        ORDER BY p.start_date DESC, p.project_id DESC
+        OFFSET %s ROWS FETCH NEXT %s ROWS ONLY
+    """, [status_name, status_name, ong_id, ong_id, (page - 1) * page_size, page_size])
+
+
+@procedure('PKG_DASHBOARD_ANALYTICS.get_volunteer_dashboard', writes=False)
+def get_volunteer_dashboard(call, volunteer_id):
+    days = """CASE WHEN vp.end_date IS NOT NULL THEN TRUNC(vp.end_date) - TRUNC(vp.assignment_date)
+                   ELSE TRUNC(SYSDATE) - TRUNC(vp.assignment_date) END"""
+    # 1. Active projects
+    call.return_result("""
+        SELECT COUNT(*) AS count
+        FROM Volunteer_Project vp
+        JOIN Project p ON vp.project_id = p.project_id
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        WHERE vp.volunteer_id = %s AND vp.status = 'A' AND ps.status_name = 'ACTIVO'
+    """, [volunteer_id])
+    # 2. Hours this month (days assigned as proxy)
+    call.return_result(f"""
+        SELECT NVL(SUM({days}), 0) AS hours
+        FROM Volunteer_Project vp
+        WHERE vp.volunteer_id = %s AND vp.status = 'A'
+        AND EXTRACT(MONTH FROM vp.assignment_date) = EXTRACT(MONTH FROM SYSDATE)
+        AND EXTRACT(YEAR FROM vp.assignment_date) = EXTRACT(YEAR FROM SYSDATE)
+    """, [volunteer_id])
+    # 3. Projects completed
+    call.return_result("""
+        SELECT COUNT(*) AS count
+        FROM Volunteer_Project vp
+        JOIN Project p ON vp.project_id = p.project_id
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        WHERE vp.volunteer_id = %s AND ps.status_name = 'COMPLETADO'
+    """, [volunteer_id])
+    # 4. Specialties
+    call.return_result("""
+        SELECT s.specialty_name, s.description
+        FROM Volunteer_Specialty vs
+        JOIN Specialty s ON vs.specialty_id = s.specialty_id
+        WHERE vs.volunteer_id = %s
+        ORDER BY vs.assignment_date DESC
+    """, [volunteer_id])
+    # 5. Contribution by month (current year)
+    call.return_result(f"""
+        SELECT TO_CHAR(vp.assignment_date, 'MON') AS month,
+               TO_CHAR(vp.assignment_date, 'MM') AS month_num,
+               COUNT(*) AS project_count,
+               SUM({days}) AS hours
+        FROM Volunteer_Project vp
+        WHERE vp.volunteer_id = %s
+        AND EXTRACT(YEAR FROM vp.assignment_date) = EXTRACT(YEAR FROM SYSDATE)
+        GROUP BY TO_CHAR(vp.assignment_date, 'MON'), TO_CHAR(vp.assignment_date, 'MM')
+        ORDER BY TO_NUMBER(TO_CHAR(vp.assignment_date, 'MM'))
+    """, [volunteer_id])
+    # 6. Available opportunities (not assigned / not applied)
+    call.return_result("""
+        SELECT p.project_id, p.name AS project_name, n.name AS ngo_name,
+               n.city || ', ' || n.country AS location,
+               TO_CHAR(TRUNC(p.start_date), 'Mon DD, YYYY') AS start_date,
+               ROUND((p.end_date - p.start_date)) AS duration_days,
+               ps.status_name AS project_status,
+               (SELECT COUNT(*) FROM Volunteer_Project vp2
+                WHERE vp2.project_id = p.project_id AND vp2.status = 'A') AS team_size
+        FROM Project p
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        JOIN NGO n ON p.ong_id = n.ong_id
+        WHERE ps.status_name = 'ACTIVO'
+        AND p.project_id NOT IN (
+            SELECT project_id FROM Volunteer_Project WHERE volunteer_id = %s AND status = 'A'
+        )
+        AND p.project_id NOT IN (
+            SELECT project_id FROM Volunteer_Application
+            WHERE volunteer_id = %s AND status IN ('PENDING', 'PENDIENTE')
+        )
+        ORDER BY p.start_date DESC, p.project_id DESC
+        FETCH FIRST 5 ROWS ONLY
+    """, [volunteer_id, volunteer_id])
+    # 7. Volunteer first name (greeting)
+    call.return_result("SELECT first_name FROM Volunteer WHERE volunteer_id = %s", [volunteer_id])
+
+
+@procedure('PKG_DASHBOARD_ANALYTICS.get_representative_ngo_dashboard', writes=False)
+def get_representative_ngo_dashboard(call, representative_id):
+    ong_id = call.scalar("SELECT ong_id FROM Representative WHERE representative_id = %s", [representative_id])
+    # 1. NGO info (no rows if the representative has no NGO)
+    call.return_result("""
+        SELECT n.ong_id, n.name, n.registration_number, n.country, n.city,
+               n.address, n.contact_email, n.phone
+        FROM NGO n
+        WHERE n.ong_id = %s
+    """, [ong_id])
+    # 2. Financial overview
+    call.return_result("""
+        SELECT COUNT(p.project_id) AS total_projects,
+               NVL(SUM(s.budget_count), 0) AS active_budgets,
+               NVL(SUM(s.total_budget), 0) AS total_budget,
+               NVL(SUM(s.total_received), 0) AS total_donations_received
+        FROM Project p
+        LEFT JOIN Project_Finance_Summary s ON p.project_id = s.project_id
+        WHERE p.ong_id = %s
+    """, [ong_id])
+    # 3. Representative info
+    call.return_result("""
+        SELECT r.first_name || ' ' || r.last_name AS representative_name, r.email AS rep_email
+        FROM Representative r
+        WHERE r.representative_id = %s
+    """, [representative_id])
+    # 4. Active projects with budget info
+    call.return_result("""
+        SELECT p.project_id, p.name AS project_name, ps.status_name,
+               NVL(b.initial_amount, 0) AS budget_amount,
+               NVL(c.currency_code, 'USD') AS currency_code,
+               NVL(s.total_received, 0) AS total_received,
+               CASE WHEN NVL(b.initial_amount, 0) > 0
+                    THEN ROUND((NVL(s.total_received, 0) / b.initial_amount) * 100, 2)
+                    ELSE 0
+               END AS budget_utilization_percent
+        FROM Project p
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        LEFT JOIN Project_Finance_Summary s ON p.project_id = s.project_id
+        LEFT JOIN Budget b ON p.project_id = b.project_id
+        LEFT JOIN Currency c ON b.currency_id = c.currency_id
+        WHERE p.ong_id = %s AND ps.status_name = 'ACTIVO'
+        ORDER BY p.name, b.budget_id
+    """, [ong_id])
+    # 5. Success rate inputs
+    call.return_result("""
+        SELECT COUNT(CASE WHEN ps.status_name = 'COMPLETADO' THEN 1 END) AS completed,
+               COUNT(*) AS total
+        FROM Project p
+        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        WHERE p.ong_id = %s
+    """, [ong_id])
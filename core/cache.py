@@ -0,0 +1,152 @@
+"""
+Table version counters used to invalidate cached query results.
+
+Every cached dataset records the versions of the tables it was read from.
+A write bumps the version of each table it touches, and any cache entry
+holding an older version is then stale. The counters live in the Django
+cache (CACHES['default']), so with a shared backend a write in one worker
+invalidates every worker.
+
+Writes made through `core.db.execute_procedure_native` are bumped
+automatically from PROCEDURE_TABLES, which covers every write procedure of
+the PKG_* packages. Views that write with plain SQL call
+`bump_tables` themselves after the statement succeeds.
+"""
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'tblver:{}'
+
+# Procedimiento almacenado -> tablas que modifica (incluye las que escriben
+# sus triggers de auditoría, de resúmenes y de KPIs y el rollup de donaciones, ver
+# scripts/RedRomero_Logs.sql y scripts/RedRomero_Summaries.sql)
+PROCEDURE_TABLES = {
+    # PKG_PROJECT_MGMT
+    'PKG_PROJECT_MGMT.create_project': ('Project', 'Project_Finance_Summary', 'KPI_Snapshot'),
+    'PKG_PROJECT_MGMT.update_project_details': ('Project', 'NGO_Donor_Summary', 'KPI_Snapshot'),
+    'PKG_PROJECT_MGMT.delete_project': ('Project', 'Project_Finance_Summary', 'KPI_Snapshot'),
+    'PKG_PROJECT_MGMT.extend_deadline': ('Project',),
+    'PKG_PROJECT_MGMT.reactivate_project': ('Project', 'KPI_Snapshot'),
+    'PKG_PROJECT_MGMT.close_project': (
+        'Project', 'Volunteer_Project', 'Volunteer_Activity_Summary', 'KPI_Snapshot'),
+    'PKG_PROJECT_MGMT.create_project_status': ('Project_Status',),
+    'PKG_PROJECT_MGMT.update_project_status': ('Project_Status',),
+    'PKG_PROJECT_MGMT.delete_project_status': ('Project_Status',),
+    'PKG_PROJECT_MGMT.assign_sdg': ('Project_SDG',),
+    'PKG_PROJECT_MGMT.create_sdg_goal': ('SDG_Goal',),
+    'PKG_PROJECT_MGMT.process_approval': ('Approval', 'Approval_History', 'Project', 'KPI_Snapshot'),
+    'PKG_PROJECT_MGMT.create_approval': ('Approval',),
+    'PKG_PROJECT_MGMT.create_report': ('Report',),
+    # PKG_FINANCE_CORE
+    'PKG_FINANCE_CORE.register_donation': (
+        'Donation', 'Project_Finance_Summary', 'NGO_Donor_Summary', 'Donation_Rollup', 'Donation_Donor_Rollup',
+        'KPI_Snapshot'),
+    'PKG_FINANCE_CORE.update_donation': (
+        'Donation', 'Donation_Transaction_Log', 'Project_Finance_Summary', 'NGO_Donor_Summary', 'Donation_Rollup',
+        'KPI_Snapshot'),
+    'PKG_FINANCE_CORE.delete_donation': (
+        'Donation', 'Project_Finance_Summary', 'NGO_Donor_Summary', 'Donation_Rollup', 'Donation_Donor_Rollup',
+        'KPI_Snapshot'),
+    'PKG_FINANCE_CORE.create_budget': ('Budget', 'Project_Finance_Summary'),
+    'PKG_FINANCE_CORE.update_budget': ('Budget', 'Project_Finance_Summary'),
+    'PKG_FINANCE_CORE.delete_budget': ('Budget', 'Project_Finance_Summary'),
+    'PKG_FINANCE_CORE.register_donor': ('Donor',),
+    'PKG_FINANCE_CORE.update_donor': ('Donor',),
+    'PKG_FINANCE_CORE.delete_donor': ('Donor',),
+    'PKG_FINANCE_CORE.anonymize_donor': ('Donor', 'Identity_Document'),
+    'PKG_FINANCE_CORE.create_donor_type': ('Donor_Type',),
+    'PKG_FINANCE_CORE.create_currency': ('Currency',),
+    'PKG_FINANCE_CORE.update_currency_rate': ('Currency',),
+    # PKG_WORKFORCE
+    'PKG_WORKFORCE.create_employee': ('Employee',),
+    'PKG_WORKFORCE.update_employee': ('Employee',),
+    'PKG_WORKFORCE.delete_employee': ('Employee',),
+    'PKG_WORKFORCE.create_volunteer': ('Volunteer',),
+    'PKG_WORKFORCE.update_volunteer': ('Volunteer',),
+    'PKG_WORKFORCE.delete_volunteer': ('Volunteer',),
+    'PKG_WORKFORCE.create_representative': ('Representative',),
+    'PKG_WORKFORCE.delete_representative': ('Representative',),
+    'PKG_WORKFORCE.create_ngo': ('NGO', 'KPI_Snapshot'),
+    'PKG_WORKFORCE.delete_ngo': ('NGO', 'KPI_Snapshot'),
+    'PKG_WORKFORCE.create_specialty': ('Specialty',),
+    'PKG_WORKFORCE.add_volunteer_specialty': ('Volunteer_Specialty',),
+    'PKG_WORKFORCE.assign_volunteer_to_project': ('Volunteer_Project', 'Volunteer_Activity_Summary', 'KPI_Snapshot'),
+    'PKG_WORKFORCE.volunteer_apply_to_project': ('Volunteer_Application',),
+    'PKG_WORKFORCE.cancel_volunteer_application': ('Volunteer_Application',),
+    'PKG_WORKFORCE.review_volunteer_application': (
+        'Volunteer_Application', 'Volunteer_Project', 'Project_Assignment_History', 'Volunteer_Activity_Summary',
+        'KPI_Snapshot'),
+    # PKG_SYSTEM_SECURITY
+    'PKG_SYSTEM_SECURITY.create_user': ('System_User',),
+    'PKG_SYSTEM_SECURITY.create_full_user': ('System_User', 'Employee', 'Volunteer', 'Representative'),
+    'PKG_SYSTEM_SECURITY.update_user': ('System_User',),
+    'PKG_SYSTEM_SECURITY.delete_user': ('System_User',),
+    'PKG_SYSTEM_SECURITY.create_identity_doc': ('Identity_Document',),
+    'PKG_SYSTEM_SECURITY.update_identity_doc': ('Identity_Document',),
+    'PKG_SYSTEM_SECURITY.delete_identity_doc': ('Identity_Document',),
+}
+
+_PROCEDURE_TABLES_CI = {}
+
+# Escrituras hechas por ESTE proceso (tabla -> contador). Permite a los caches
+# en memoria notar un cambio local al instante, sin consultar el cache compartido.
+_local_writes = {}
+
+
+def _key(table):
+    return VERSION_KEY.format(table.lower())
+
+
+def _initial_version():
+    # Un contador que se pierde (desalojo, reinicio del cache) se recrea con
+    # un valor mayor que cualquiera anterior, así nunca coincide con datos viejos
+    return time.time_ns() // 1000
+
+
+def table_versions(tables):
+    """Return {table: version} for `tables`, creating missing counters."""
+    keys = {table: _key(table) for table in tables}
+    found = cache.get_many(list(keys.values()))
+    missing = [key for key in keys.values() if key not in found]
+    if missing:
+        for key in missing:
+            cache.add(key, _initial_version(), timeout=None)
+        found.update(cache.get_many(missing))
+    return {table: found.get(key) for table, key in keys.items()}
+
+
+def bump_tables(*tables):
+    """Mark `tables` as changed; cached data read from them becomes stale."""
+    for table in tables:
+        key = _key(table)
+        # add() es atómico: solo inicializa si la clave no existe
+        cache.add(key, _initial_version(), timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # La clave fue desalojada entre add() e incr()
+            cache.set(key, _initial_version(), timeout=None)
+        _local_writes[table.lower()] = _local_writes.get(table.lower(), 0) + 1
+    if tables:
+        logger.debug(f"Bumped table versions: {', '.join(tables)}")
+
+
+def local_write_marks(tables):
+    """Cheap process-local fingerprint of the writes this process made to `tables`."""
+    return tuple(_local_writes.get(table.lower(), 0) for table in tables)
+
+
+def tables_for_procedure(proc_name):
+    if not _PROCEDURE_TABLES_CI:
+        _PROCEDURE_TABLES_CI.update({name.upper(): tables for name, tables in PROCEDURE_TABLES.items()})
+    return _PROCEDURE_TABLES_CI.get(proc_name.upper(), ())
+
+
+def bump_for_procedure(proc_name):
+    tables = tables_for_procedure(proc_name)
+    if tables:
+        bump_tables(*tables)
@@ -0,0 +1,72 @@
+"""
+Run independent read queries concurrently on separate pooled sessions.
+
+Django connections are thread-local, so every worker thread of the executor
+opens (acquires from the pool) its own session. The session is handed back
+with `connections.close_all()` as soon as each task finishes, so an idle
+worker never holds a session. The executor is shared and bounded
+(DB_FANOUT_WORKERS); size DB_POOL_MAX with that fan-out in mind.
+"""
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'DB_FANOUT_WORKERS', 4),
+                    thread_name_prefix='db-fanout',
+                )
+    return _executor
+
+
+def _run_in_own_session(fn):
+    try:
+        return fn()
+    finally:
+        # Devuelve la sesión al pool (con pool, close() solo la libera)
+        connections.close_all()
+
+
+def run_concurrently(tasks, parallel=True):
+    """
+    Run a dict of name -> zero-argument callable and return name -> result.
+
+    With parallel=False (or a single task) everything runs serially on the
+    caller's connection. An exception raised by any task is re-raised after
+    all tasks have finished.
+    """
+    if not parallel or len(tasks) < 2:
+        return {name: fn() for name, fn in tasks.items()}
+
+    executor = get_executor()
+    # Cada tarea corre en una copia del contexto: sus consultas se suman a las
+    # estadísticas de la petición (core/instrumentation.py)
+    futures = {
+        name: executor.submit(contextvars.copy_context().run, _run_in_own_session, fn)
+        for name, fn in tasks.items()
+    }
+    results = {}
+    error = None
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            logger.error(f"Concurrent task {name} failed: {e}")
+            error = error or e
+    if error is not None:
+        raise error
+    return results
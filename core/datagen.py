@@ -0,0 +1,431 @@
+"""
+Synthetic data at benchmark scale (`python manage.py generate_dataset`).
+
+scripts/RedRomero_Data.sql only seeds a few dozen rows. This module keeps its
+reference data (currencies, statuses, specialties, SDGs, categories, donor
+types) and appends NGOs, representatives, employees, volunteers, donors,
+projects with their budgets and approvals, assignments, donations and history
+rows in whatever volume the benchmark needs.
+
+- Deterministic: every value comes from one random.Random(seed) consumed in a
+  fixed order. The same seed, scale and `until` date give the same rows.
+- Array-bound: rows are sent in batches with cursor.executemany (one round
+  trip per batch with python-oracledb), one transaction per batch.
+- Referentially consistent: children only point at ids read back from the
+  parent table right after it was filled.
+- Every generated representative, employee and volunteer gets a System_User
+  named <prefix>_rep_<n>, <prefix>_emp_<n> or <prefix>_vol_<n>, plus one
+  ADMIN (<prefix>_admin, tied to the first generated employee), all with the
+  same password, so benchmarks and load tests can log in as any role.
+
+Donations and donors are skewed (a few projects and donors take most of the
+money), which is what makes the dashboard aggregates expensive.
+"""
+import itertools
+import logging
+import random
+import time
+from array import array
+from datetime import date, datetime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+
+from core import summaries
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCALE = {
+    'ngos': 100,
+    'employees': 200,
+    'volunteers': 10_000,
+    'donors': 20_000,
+    'projects': 2_000,
+    'donations': 1_000_000,
+    'history': 1_000_000,
+}
+
+# Reparto de --history entre las tablas de auditoría
+HISTORY_SHARE = (
+    ('Donation_Transaction_Log', 0.30),
+    ('Project_Status_History', 0.25),
+    ('Approval_History', 0.20),
+    ('Budget_History', 0.15),
+    ('Project_Assignment_History', 0.10),
+)
+
+PROJECT_STATUS_MIX = (
+    ('ACTIVO', 45), ('COMPLETADO', 35), ('PLANIFICACION', 10), ('SUSPENDIDO', 5), ('CANCELADO', 5),
+)
+APPROVAL_FOR_PROJECT = {
+    'ACTIVO': 'APROBADO', 'COMPLETADO': 'APROBADO', 'SUSPENDIDO': 'APROBADO',
+    'PLANIFICACION': 'EN_REVISION', 'CANCELADO': 'RECHAZADO',
+}
+
+FIRST_NAMES = ['Ana', 'Luis', 'María', 'Carlos', 'Lucía', 'Jorge', 'Sofía', 'Diego', 'Valeria', 'Pedro',
+               'Camila', 'Miguel', 'Elena', 'Andrés', 'Paula', 'Javier', 'Rosa', 'Tomás', 'Isabel', 'Raúl']
+LAST_NAMES = ['García', 'Quispe', 'Torres', 'Mendoza', 'Rojas', 'Flores', 'Vargas', 'Castillo', 'Ramos',
+              'Morales', 'Herrera', 'Silva', 'Paredes', 'Díaz', 'Soto', 'Romero', 'Chávez', 'Vega']
+PLACES = [('Perú', ['Lima', 'Cusco', 'Arequipa', 'Puno']), ('Argentina', ['Buenos Aires', 'Córdoba']),
+          ('España', ['Madrid', 'Barcelona', 'Sevilla']), ('USA', ['New York', 'Miami']),
+          ('Colombia', ['Bogotá', 'Medellín']), ('México', ['CDMX', 'Oaxaca'])]
+PROJECT_TOPICS = ['Agua Limpia', 'Escuela Rural', 'Salud Comunitaria', 'Huertos Urbanos', 'Energía Solar',
+                  'Reforestación', 'Biblioteca Móvil', 'Apoyo a Refugiados', 'Reciclaje', 'Nutrición Infantil']
+CONTRIBUTION_LEVELS = ['ALTO', 'MEDIO', 'BAJO']
+
+
+class DatasetGenerator:
+    """Appends a synthetic, referentially consistent dataset to the default database."""
+
+    def __init__(self, seed=42, prefix='gen', batch_size=5000, years=3, until=None,
+                 password='bench123', log=None):
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.until = datetime.combine(until or date.today(), datetime.min.time())
+        self.since = self.until - timedelta(days=365 * years)
+        self.password = password
+        self.log = log or logger.info
+        self.counts = {}
+
+    # ------------------------------------------------------------------
+    # Acceso a datos
+    # ------------------------------------------------------------------
+
+    def _rows(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params or [])
+            return cursor.fetchall()
+
+    def _max_id(self, table, pk):
+        return self._rows(f"SELECT NVL(MAX({pk}), 0) FROM {table}")[0][0]
+
+    def _ids_after(self, table, pk, start):
+        """Ids created by the last insert, in insertion order (identity values only grow)."""
+        return array('q', (row[0] for row in self._rows(
+            f"SELECT {pk} FROM {table} WHERE {pk} > %s ORDER BY {pk}", [start]
+        )))
+
+    def _insert(self, table, columns, rows, pk=None):
+        """Bulk insert `rows` in batches; returns the new ids when `pk` is given."""
+        start = self._max_id(table, pk) if pk else None
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        total, began = 0, time.monotonic()
+        rows = iter(rows)
+        while True:
+            batch = list(itertools.islice(rows, self.batch_size))
+            if not batch:
+                break
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(sql, batch)
+            total += len(batch)
+        self.counts[table] = self.counts.get(table, 0) + total
+        self.log(f"{table}: {total} rows in {time.monotonic() - began:.1f}s")
+        return self._ids_after(table, pk, start) if pk else None
+
+    def _reference(self):
+        def by_name(table, pk, name):
+            return {row[1]: row[0] for row in self._rows(f"SELECT {pk}, {name} FROM {table}")}
+
+        self.project_status = by_name('Project_Status', 'project_status_id', 'status_name')
+        self.approval_status = by_name('Approval_Status', 'approval_status_id', 'status_name')
+        self.currencies = [row[0] for row in self._rows("SELECT currency_id FROM Currency ORDER BY currency_id")]
+        self.donor_types = [row[0] for row in self._rows("SELECT type_id FROM Donor_Type ORDER BY type_id")]
+        self.specialties = [row[0] for row in self._rows("SELECT specialty_id FROM Specialty ORDER BY specialty_id")]
+        self.sdgs = [row[0] for row in self._rows("SELECT sdg_id FROM SDG_Goal ORDER BY sdg_id")]
+        self.categories = [row[0] for row in self._rows(
+            "SELECT category_id FROM Project_Category ORDER BY category_id"
+        )]
+        admin = self._rows("SELECT MIN(user_id) FROM System_User WHERE user_role = 'ADMIN'")
+        self.admin_user_id = admin[0][0] if admin else None
+        missing = [name for name, values in (
+            ('Project_Status', self.project_status), ('Approval_Status', self.approval_status),
+            ('Currency', self.currencies), ('Donor_Type', self.donor_types),
+        ) if not values]
+        if missing:
+            raise ValueError(f"Reference data missing in {', '.join(missing)}: load scripts/RedRomero_Data.sql first")
+
+    def already_generated(self):
+        return bool(self._rows("SELECT 1 FROM NGO WHERE registration_number = %s", [self._registration(1)]))
+
+    # ------------------------------------------------------------------
+    # Valores
+    # ------------------------------------------------------------------
+
+    def _registration(self, n):
+        return f"{self.prefix.upper()}-NGO-{n:06d}"
+
+    def _date_between(self, start, end):
+        span = max((end - start).total_seconds(), 0)
+        return (start + timedelta(seconds=int(self.rng.random() * span))).replace(microsecond=0)
+
+    def _birth_date(self):
+        return datetime(1960, 1, 1) + timedelta(days=self.rng.randrange(365 * 44))
+
+    def _person(self, kind, n):
+        rng = self.rng
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        return (first, last, self._birth_date(), f"Calle {rng.randrange(1, 999)} #{n}",
+                f"{self.prefix}.{kind}{n}@example.org", f"9{rng.randrange(10 ** 8):08d}")
+
+    def _skewed(self, ids, exponent=1.1):
+        """Cumulative weights for rng.choices: the first ids get most of the picks."""
+        return list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(len(ids))))
+
+    def _amount(self, mu=6.5, sigma=1.2):
+        return round(min(self.rng.lognormvariate(mu, sigma), 500_000) + 1, 2)
+
+    # ------------------------------------------------------------------
+    # Entidades
+    # ------------------------------------------------------------------
+
+    def _ngos(self, count):
+        rng = self.rng
+        for n in range(1, count + 1):
+            country, cities = rng.choice(PLACES)
+            yield (f"ONG {rng.choice(LAST_NAMES)} {n}", self._registration(n), country, rng.choice(cities),
+                   f"Av. Principal {rng.randrange(1, 2000)}", f"contacto{n}@{self.prefix}-ngo.org",
+                   f"01{rng.randrange(10 ** 7):07d}")
+
+    def _projects(self, count):
+        rng = self.rng
+        names, weights = zip(*[(name, weight) for name, weight in PROJECT_STATUS_MIX
+                               if name in self.project_status])
+        self.project_info = []
+        for n in range(1, count + 1):
+            status = rng.choices(names, weights)[0]
+            ngo_index = rng.randrange(len(self.ngo_ids))
+            duration = timedelta(days=rng.randrange(90, 720))
+            if status == 'PLANIFICACION':
+                start = self.until + timedelta(days=rng.randrange(1, 120))
+            elif status == 'COMPLETADO':
+                start = self._date_between(self.since, self.until - duration - timedelta(days=1))
+            else:
+                start = self._date_between(max(self.since, self.until - duration), self.until)
+            start = start.replace(hour=0, minute=0, second=0)
+            end = start + duration
+            self.project_info.append((start, min(end, self.until), status))
+            yield (f"{rng.choice(PROJECT_TOPICS)} {n}", f"Proyecto sintético {n}.", start, end,
+                   self.project_status[status], self.ngo_ids[ngo_index], rng.choice(self.reps_by_ngo[ngo_index]))
+
+    def _budgets(self):
+        rng = self.rng
+        for project_id, (start, _, _) in zip(self.project_ids, self.project_info):
+            for _ in range(1 if rng.random() < 0.8 else 2):
+                yield (self._amount(10, 0.8), start - timedelta(days=rng.randrange(1, 60)),
+                       'Presupuesto sintético', project_id, rng.choice(self.currencies))
+
+    def _approvals(self):
+        rng = self.rng
+        for project_id, (start, _, status) in zip(self.project_ids, self.project_info):
+            decision = APPROVAL_FOR_PROJECT.get(status, 'PENDIENTE')
+            yield (start - timedelta(days=rng.randrange(1, 30)),
+                   self.approval_status.get(decision, next(iter(self.approval_status.values()))),
+                   rng.choice(self.employee_ids), project_id)
+
+    def _donations(self, count):
+        rng = self.rng
+        project_weights = self._skewed(self.project_ids)
+        donor_weights = self._skewed(self.donor_ids, 0.8)
+        # Solo proyectos ya iniciados reciben donaciones
+        funded = [i for i, (start, _, _) in enumerate(self.project_info) if start <= self.until]
+        funded_weights = list(itertools.accumulate(
+            project_weights[i] - (project_weights[i - 1] if i else 0) for i in funded
+        ))
+        for _ in range(count):
+            index = rng.choices(funded, cum_weights=funded_weights)[0]
+            start, end, _ = self.project_info[index]
+            yield (self._date_between(start, end), self._amount(), self.project_ids[index],
+                   rng.choice(self.currencies), rng.choices(self.donor_ids, cum_weights=donor_weights)[0])
+
+    def _volunteer_projects(self):
+        rng = self.rng
+        active = {i for i, info in enumerate(self.project_info) if info[2] == 'ACTIVO'}
+        started = [i for i, info in enumerate(self.project_info) if info[0] <= self.until]
+        self.assignments = []
+        for volunteer_id in self.volunteer_ids:
+            for index in rng.sample(started, min(len(started), rng.randrange(1, 5))):
+                start, end, _ = self.project_info[index]
+                assigned = self._date_between(start, end)
+                if index in active and rng.random() < 0.7:
+                    row = (self.project_ids[index], volunteer_id, assigned, None, 'A')
+                else:
+                    row = (self.project_ids[index], volunteer_id, assigned, self._date_between(assigned, end), 'I')
+                self.assignments.append((row[0], row[1], row[2], row[3]))
+                yield row
+
+    def _volunteer_specialties(self):
+        rng = self.rng
+        for volunteer_id in self.volunteer_ids:
+            for specialty_id in rng.sample(self.specialties, min(len(self.specialties), rng.randrange(1, 4))):
+                yield (specialty_id, volunteer_id, self._date_between(self.since, self.until))
+
+    def _project_sdgs(self):
+        rng = self.rng
+        for project_id, (start, _, _) in zip(self.project_ids, self.project_info):
+            for sdg_id in rng.sample(self.sdgs, min(len(self.sdgs), rng.randrange(1, 4))):
+                yield (project_id, sdg_id, rng.choice(CONTRIBUTION_LEVELS), start, self.admin_user_id)
+
+    def _project_categories(self):
+        rng = self.rng
+        for project_id, (start, _, _) in zip(self.project_ids, self.project_info):
+            chosen = rng.sample(self.categories, min(len(self.categories), rng.randrange(1, 3)))
+            for position, category_id in enumerate(chosen):
+                yield (project_id, category_id, 'Y' if position == 0 else 'N', start, self.admin_user_id)
+
+    def _users(self):
+        password = make_password(self.password)
+        yield (f"{self.prefix}_admin", password, 'Perú', 'ADMIN', self.employee_ids[0], None, None)
+        for role, kind, column, ids in (('EMPLOYEE', 'emp', 'employee_id', self.employee_ids),
+                                        ('REPRESENTATIVE', 'rep', 'representative_id', self.rep_ids),
+                                        ('VOLUNTEER', 'vol', 'volunteer_id', self.volunteer_ids)):
+            for n, person_id in enumerate(ids, 1):
+                yield (f"{self.prefix}_{kind}_{n}", password, 'Perú', role,
+                       person_id if column == 'employee_id' else None,
+                       person_id if column == 'volunteer_id' else None,
+                       person_id if column == 'representative_id' else None)
+
+    # ------------------------------------------------------------------
+    # Historia
+    # ------------------------------------------------------------------
+
+    def _history_rows(self, table, count):
+        rng = self.rng
+        statuses = list(self.project_status)
+        approvals = list(self.approval_status)
+        for _ in range(count):
+            if table == 'Donation_Transaction_Log':
+                old, new = self._amount(), self._amount()
+                old_currency = rng.choice(self.currencies)
+                new_currency = old_currency if rng.random() < 0.9 else rng.choice(self.currencies)
+                yield (rng.choice(self.donation_ids), rng.choice(('INSERT', 'UPDATE', 'UPDATE', 'DELETE')),
+                       old, new, old_currency, new_currency, self._date_between(self.since, self.until),
+                       self.admin_user_id, f"10.0.{rng.randrange(256)}.{rng.randrange(256)}",
+                       'Synthetic audit entry')
+            elif table == 'Project_Status_History':
+                previous, new = rng.sample(statuses, 2)
+                yield (rng.choice(self.project_ids), previous, new, self._date_between(self.since, self.until),
+                       rng.choice(self.employee_ids), 'Cambio de estado sintético')
+            elif table == 'Approval_History':
+                previous, new = rng.sample(approvals, 2)
+                yield (rng.choice(self.approval_ids), previous, new, self._date_between(self.since, self.until),
+                       rng.choice(self.employee_ids), 'Revisión sintética')
+            elif table == 'Budget_History':
+                old = self._amount(10, 0.8)
+                yield (rng.choice(self.budget_ids), rng.choice(self.employee_ids), old,
+                       round(old * rng.uniform(0.8, 1.3), 2), 'Ajuste sintético',
+                       self._date_between(self.since, self.until), rng.choice(('CREATE', 'UPDATE', 'ADJUST')))
+            else:
+                project_id, volunteer_id, assigned, ended = rng.choice(self.assignments)
+                removed = ended is not None
+                yield (project_id, volunteer_id, 'VOLUNTEER', 'REMOVED' if removed else 'ASSIGNED', assigned,
+                       ended, 'Asignación sintética', self.admin_user_id)
+
+    HISTORY_COLUMNS = {
+        'Donation_Transaction_Log': ('donation_id', 'action_type', 'old_amount', 'new_amount', 'old_currency_id',
+                                     'new_currency_id', 'change_date', 'changed_by_user_id', 'ip_address',
+                                     'reason'),
+        'Project_Status_History': ('project_id', 'previous_status', 'new_status', 'change_date', 'employee_id',
+                                   'reason'),
+        'Approval_History': ('approval_id', 'previous_status', 'new_status', 'change_date', 'employee_id',
+                             'comments'),
+        'Budget_History': ('budget_id', 'employee_id', 'old_amount', 'new_amount', 'reason', 'change_date',
+                           'action_type'),
+        'Project_Assignment_History': ('project_id', 'volunteer_id', 'assignment_type', 'action',
+                                       'assignment_date', 'removal_date', 'reason', 'assigned_by_user_id'),
+    }
+
+    # ------------------------------------------------------------------
+
+    def generate(self, scale=None):
+        """Insert the whole dataset; returns {table: rows inserted}."""
+        scale = {**DEFAULT_SCALE, **(scale or {})}
+        if scale['ngos'] < 1 or scale['employees'] < 1 or scale['projects'] < 1:
+            raise ValueError("ngos, employees and projects must be at least 1")
+        self._reference()
+        rng = self.rng
+        person = ('first_name', 'last_name', 'birth_date', 'address', 'email', 'phone')
+
+        self.ngo_ids = self._insert(
+            'NGO', ('name', 'registration_number', 'country', 'city', 'address', 'contact_email', 'phone'),
+            self._ngos(scale['ngos']), pk='ong_id',
+        )
+        # 1 a 3 representantes por ONG, en el mismo orden que las ONG
+        rep_ngo = [i for i in range(len(self.ngo_ids)) for _ in range(rng.randrange(1, 4))]
+        self.rep_ids = self._insert(
+            'Representative', person + ('ong_id',),
+            (self._person('rep', n) + (self.ngo_ids[i],) for n, i in enumerate(rep_ngo, 1)),
+            pk='representative_id',
+        )
+        self.reps_by_ngo = [[] for _ in self.ngo_ids]
+        for rep_id, i in zip(self.rep_ids, rep_ngo):
+            self.reps_by_ngo[i].append(rep_id)
+        self.employee_ids = self._insert(
+            'Employee', person + ('hire_date',),
+            (self._person('emp', n) + (self._date_between(self.since, self.until),)
+             for n in range(1, scale['employees'] + 1)),
+            pk='employee_id',
+        )
+        self.volunteer_ids = self._insert(
+            'Volunteer', person, (self._person('vol', n) for n in range(1, scale['volunteers'] + 1)),
+            pk='volunteer_id',
+        )
+        self.donor_ids = self._insert(
+            'Donor', ('name', 'email', 'phone', 'type_id'),
+            ((f"Donante {rng.choice(LAST_NAMES)} {n}", f"{self.prefix}.donor{n}@example.org" if n % 5 else None,
+              None, rng.choice(self.donor_types)) for n in range(1, scale['donors'] + 1)),
+            pk='donor_id',
+        )
+        self._insert('System_User', ('username', 'password', 'country_of_issue', 'user_role', 'employee_id',
+                                     'volunteer_id', 'representative_id'), self._users())
+
+        self.project_ids = self._insert(
+            'Project', ('name', 'description', 'start_date', 'end_date', 'project_status_id', 'ong_id',
+                        'representative_id'),
+            self._projects(scale['projects']), pk='project_id',
+        )
+        self.budget_ids = self._insert(
+            'Budget', ('initial_amount', 'creation_date', 'description', 'project_id', 'currency_id'),
+            self._budgets(), pk='budget_id',
+        )
+        self.approval_ids = self._insert(
+            'Approval', ('approval_date', 'approval_status_id', 'employee_id', 'project_id'),
+            self._approvals(), pk='approval_id',
+        )
+        if self.sdgs:
+            self._insert('Project_SDG', ('project_id', 'sdg_id', 'contribution_level', 'assignment_date',
+                                         'assigned_by_user_id'), self._project_sdgs())
+        if self.categories:
+            self._insert('Project_Category_Assignment', ('project_id', 'category_id', 'is_primary',
+                                                         'assignment_date', 'assigned_by_user_id'),
+                         self._project_categories())
+        if self.volunteer_ids:
+            self._insert('Volunteer_Project', ('project_id', 'volunteer_id', 'assignment_date', 'end_date',
+                                               'status'), self._volunteer_projects())
+            if self.specialties:
+                self._insert('Volunteer_Specialty', ('specialty_id', 'volunteer_id', 'assignment_date'),
+                             self._volunteer_specialties())
+        if self.donor_ids:
+            self.donation_ids = self._insert(
+                'Donation', ('donation_date', 'amount', 'project_id', 'currency_id', 'donor_id'),
+                self._donations(scale['donations']), pk='donation_id',
+            )
+            # Insertadas sin pasar por register_donation: el rollup se recalcula
+            summaries.rebuild(['donation_rollup'], log=self.log)
+        else:
+            self.donation_ids = array('q')
+
+        for table, share in HISTORY_SHARE:
+            count = int(scale['history'] * share)
+            if table == 'Donation_Transaction_Log' and not self.donation_ids:
+                continue
+            if table == 'Project_Assignment_History' and not getattr(self, 'assignments', None):
+                continue
+            self._insert(table, self.HISTORY_COLUMNS[table], self._history_rows(table, count))
+
+        # La historia generada es anterior a los snapshots de KPI que hubiera:
+        # se descartan y el rebuild estima de nuevo el cierre del mes anterior
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("DELETE FROM KPI_Snapshot WHERE metric_name <> 'MONTHLY_DONATIONS'")
+        summaries.rebuild(['kpi_snapshot'], log=self.log)
+        return dict(self.counts)
@@ -0,0 +1,206 @@
+"""
+Shared data-access helpers for the raw-SQL views in `users` and `finance`.
+
+Every row-returning helper accepts a result `mode`:
+
+- ROWS_DICT: list of dicts keyed by lowercase column name (the historical
+  shape). Rows are built by the driver through `cursor.rowfactory`, so there
+  is no second pass over the fetched tuples.
+- ROWS_TUPLE: list of plain tuples in SELECT order. Use it on hot list
+  endpoints that reshape rows anyway; no per-row dict is allocated.
+- ROWS_COLUMNAR: dict of column name -> list of values.
+
+`arraysize` / `prefetchrows` can be tuned per statement: large lists should
+raise arraysize to cut fetch round trips, single-row lookups can lower it.
+"""
+import logging
+
+import oracledb
+from django.db import connection
+
+from core.cache import bump_for_procedure
+from core.instrumentation import track
+
+logger = logging.getLogger(__name__)
+
+ROWS_DICT = 'dict'
+ROWS_TUPLE = 'tuple'
+ROWS_COLUMNAR = 'columnar'
+
+# arraysize para listados grandes (el driver usa 100 por defecto)
+LIST_ARRAYSIZE = 500
+
+
+def native_cursor(cursor):
+    """Return the python-oracledb cursor wrapped by a Django cursor."""
+    return cursor.cursor.cursor
+
+
+def _tune(cursor, arraysize=None, prefetchrows=None):
+    # Ambos valores deben fijarse ANTES de ejecutar la sentencia
+    if arraysize:
+        cursor.arraysize = arraysize
+    if prefetchrows is not None:
+        cursor.prefetchrows = prefetchrows
+
+
+def _collect(cursor, mode=ROWS_DICT):
+    """Fetch every row from an executed oracledb cursor in the requested mode."""
+    if cursor.description is None:
+        return [] if mode != ROWS_COLUMNAR else {}
+
+    columns = [col[0].lower() for col in cursor.description]
+
+    if mode == ROWS_DICT:
+        cursor.rowfactory = lambda *row: dict(zip(columns, row))
+        return cursor.fetchall()
+
+    rows = cursor.fetchall()
+    if mode == ROWS_TUPLE:
+        return rows
+    if mode == ROWS_COLUMNAR:
+        if not rows:
+            return {name: [] for name in columns}
+        return {name: list(values) for name, values in zip(columns, zip(*rows))}
+    raise ValueError(f"Unknown result mode: {mode}")
+
+
+def fetch_raw_query(query, params=None, mode=ROWS_DICT, arraysize=None, prefetchrows=None):
+    """Executes a raw SQL query (Django '%s' placeholders)."""
+    with connection.cursor() as cursor, track('query', query, params) as probe:
+        native = native_cursor(cursor)
+        _tune(native, arraysize, prefetchrows)
+        cursor.execute(query, params if params else [])
+        return probe.fetched(_collect(native, mode))
+
+
+def fetch_pipelined_function(function_name, mode=ROWS_DICT):
+    """Executes an Oracle PIPELINED function."""
+    with connection.cursor() as cursor, track('function', function_name) as probe:
+        try:
+            cursor.execute(f"SELECT * FROM TABLE({function_name}())")
+            return probe.fetched(_collect(native_cursor(cursor), mode))
+        except Exception as e:
+            logger.error(f"Error executing pipelined function {function_name}: {e}")
+            return []
+
+
+def fetch_procedure_cursor(procedure_call, params=None, out_args_count=0, mode=ROWS_DICT,
+                           arraysize=None, prefetchrows=None):
+    """
+    Executes a stored procedure whose last argument is an OUT SYS_REFCURSOR.
+    Returns (rows, first OUT number or None).
+    """
+    with connection.cursor() as cursor, track('procedure', procedure_call, params) as probe:
+        try:
+            native_conn = connection.connection
+
+            out_vars = []
+            for _ in range(out_args_count):
+                out_vars.append(native_conn.var(oracledb.NUMBER))
+
+            # Ref Cursor: el tuning se aplica antes de que Oracle lo abra
+            ref_cursor = native_conn.cursor()
+            _tune(ref_cursor, arraysize, prefetchrows)
+
+            args = []
+            if params: args.extend(params)
+            args.extend(out_vars)
+            args.append(ref_cursor)
+
+            cursor.callproc(procedure_call, args)
+            bump_for_procedure(procedure_call)
+
+            data = probe.fetched(_collect(ref_cursor, mode))
+            ref_cursor.close()
+
+            if out_args_count > 0:
+                return data, out_vars[0].getvalue()
+
+            return data, None
+
+        except Exception as e:
+            logger.error(f"Error executing procedure {procedure_call}: {e}")
+            return [], None
+
+
+def fetch_implicit_results(procedure_call, params=None, names=None, mode=ROWS_DICT,
+                           arraysize=None):
+    """
+    Calls a procedure that returns its data as implicit result sets
+    (DBMS_SQL.RETURN_RESULT) and reads every set in one round trip.
+
+    Returns a list of row collections in the order the procedure returned
+    them, or a dict keyed by `names` when given (must match that order).
+    """
+    connection.ensure_connection()
+    cursor = connection.connection.cursor()
+    try:
+        with track('procedure', procedure_call, params) as probe:
+            cursor.callproc(procedure_call, list(params) if params else [])
+            bump_for_procedure(procedure_call)
+            results = []
+            for result_cursor in cursor.getimplicitresults():
+                _tune(result_cursor, arraysize)
+                results.append(probe.fetched(_collect(result_cursor, mode)))
+    finally:
+        cursor.close()
+
+    if names is None:
+        return results
+    if len(names) != len(results):
+        raise ValueError(
+            f"{procedure_call} returned {len(results)} result sets, expected {len(names)}"
+        )
+    return dict(zip(names, results))
+
+
+def execute_procedure_native(proc_name, params, out_param_index=None, out_param_type=oracledb.NUMBER):
+    """
+    Ejecuta un procedimiento almacenado usando un cursor 100% nativo de Oracle
+    para evitar conflictos de tipos con Django (DPY-3002).
+    """
+    # 1. Aseguramos que Django tenga una sesión (del pool si está habilitado)
+    connection.ensure_connection()
+
+    # 2. Obtenemos la conexión cruda (Raw Connection)
+    native_conn = connection.connection
+
+    # 3. Creamos un cursor nativo nuevo
+    cursor = native_conn.cursor()
+
+    try:
+        # Preparar argumentos
+        final_params = list(params)
+        out_var = None
+
+        # Si hay un parámetro de salida, lo creamos con el cursor nativo
+        if out_param_index is not None:
+            out_var = cursor.var(out_param_type)
+            # Insertamos la variable en la posición correcta (o al final si index es -1)
+            if out_param_index == -1:
+                final_params.append(out_var)
+            else:
+                final_params.insert(out_param_index, out_var)
+
+        # Ejecutar
+        with track('procedure', proc_name, params):
+            cursor.callproc(proc_name, final_params)
+
+        # Invalida los datos cacheados de las tablas que toca el procedimiento
+        bump_for_procedure(proc_name)
+
+        # Retornar valor si existe
+        if out_var:
+            return out_var.getvalue()
+        return None
+
+    except Exception as e:
+        # Si algo falla, hacemos rollback por seguridad
+        try: native_conn.rollback()
+        except: pass
+        raise e # Re-lanzamos el error para que lo capture la vista
+
+    finally:
+        # Cerramos el cursor nativo para no dejar fugas
+        cursor.close()
@@ -0,0 +1,175 @@
+"""
+Per-request statistics for the statements run through the core.db helpers.
+
+`DBTimingMiddleware` (core/middleware.py) opens a `RequestStats` for each
+request. Every helper in core.db wraps its statement in `track()`, which
+records the kind, a short label (SQL head or procedure name), the rows
+fetched, their approximate size and the wall time. Outside a request (for
+example a management command or a background refresh) `track()` records
+nothing.
+
+Statements run by `run_concurrently` are attributed to the request that
+started them. Statements slower than SLOW_QUERY_MS also go to the slow-query
+log (core/slowlog.py), inside a request or not. "bytes" is an estimate of the Python payload, sampled from the
+first rows, not what went over the wire.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+from core import metrics, slowlog
+
+_current = contextvars.ContextVar('db_request_stats', default=None)
+
+# Filas que se miden para estimar el tamaño del resultado
+SIZE_SAMPLE_ROWS = 20
+
+# Sentencia en curso por hilo; solo se llena mientras hay algún perfil activo
+# (core/profiling.py), que la añade como hoja de las muestras
+profilers = 0
+active_statements = {}
+
+# Profundidad de track() en el hilo actual: distingue las sentencias de los
+# helpers de core.db de las que una vista lanza con connection.cursor()
+_local = threading.local()
+
+
+class Statement:
+    __slots__ = ('kind', 'label', 'rows', 'bytes', 'ms')
+
+    def __init__(self, kind, label, rows, nbytes, ms):
+        self.kind = kind
+        self.label = label
+        self.rows = rows
+        self.bytes = nbytes
+        self.ms = ms
+
+    def as_dict(self):
+        return {'kind': self.kind, 'label': self.label, 'rows': self.rows,
+                'bytes': self.bytes, 'ms': round(self.ms, 2)}
+
+
+class RequestStats:
+    def __init__(self):
+        self.statements = []
+        self._lock = threading.Lock()
+
+    def add(self, statement):
+        # Las tareas de run_concurrently escriben desde otros hilos
+        with self._lock:
+            self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    @property
+    def rows(self):
+        return sum(s.rows for s in self.statements)
+
+    @property
+    def bytes(self):
+        return sum(s.bytes for s in self.statements)
+
+    @property
+    def db_ms(self):
+        return sum(s.ms for s in self.statements)
+
+    def slowest(self, n=3):
+        return sorted(self.statements, key=lambda s: s.ms, reverse=True)[:n]
+
+
+def begin():
+    """Start collecting for the current request; returns (stats, token)."""
+    stats = RequestStats()
+    return stats, _current.set(stats)
+
+
+def end(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+def in_statement():
+    """True while the current thread is inside a core.db helper's track()."""
+    return getattr(_local, 'depth', 0) > 0
+
+
+def _value_size(value):
+    if value is None:
+        return 1
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    # Números y fechas
+    return 8
+
+
+def approx_size(rows):
+    """Rough byte size of a fetched result (list of dicts/tuples or columnar dict)."""
+    if isinstance(rows, dict):
+        return sum(approx_size([(v,) for v in values[:SIZE_SAMPLE_ROWS]]) * len(values)
+                   // max(1, min(len(values), SIZE_SAMPLE_ROWS))
+                   for values in rows.values())
+    if not rows:
+        return 0
+    sample = rows[:SIZE_SAMPLE_ROWS]
+    total = 0
+    for row in sample:
+        values = row.values() if isinstance(row, dict) else row
+        total += sum(_value_size(v) for v in values)
+    return total * len(rows) // len(sample)
+
+
+def row_count(rows):
+    if isinstance(rows, dict):
+        return len(next(iter(rows.values()), []))
+    return len(rows) if rows else 0
+
+
+def label_for(sql):
+    return ' '.join(sql.split())[:80]
+
+
+class _Probe:
+    __slots__ = ('active', 'rows', 'bytes')
+
+    def __init__(self, active):
+        self.active = active
+        self.rows = 0
+        self.bytes = 0
+
+    def fetched(self, rows):
+        """Record the rows a statement returned (size only inside a request)."""
+        self.rows += row_count(rows)
+        if self.active:
+            self.bytes += approx_size(rows)
+        return rows
+
+
+@contextmanager
+def track(kind, label, params=None):
+    """Time one statement; `label` is its SQL text or procedure name."""
+    stats = _current.get()
+    probe = _Probe(stats is not None)
+    profiled = profilers > 0
+    if profiled:
+        active_statements[threading.get_ident()] = label
+    _local.depth = getattr(_local, 'depth', 0) + 1
+    start = time.perf_counter()
+    try:
+        yield probe
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        _local.depth -= 1
+        if profiled:
+            active_statements.pop(threading.get_ident(), None)
+        if stats is not None:
+            stats.add(Statement(kind, label_for(label), probe.rows, probe.bytes, elapsed))
+        metrics.observe_statement(kind, label, elapsed / 1000)
+        if elapsed >= slowlog.threshold_ms():
+            # Se registra también fuera de una petición (comandos, refrescos)
+            slowlog.record(kind, label, params, elapsed, probe.rows)
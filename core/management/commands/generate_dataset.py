@@ -0,0 +1,36 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.datagen import DEFAULT_SCALE, DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = ("Append a reproducible synthetic dataset (core/datagen.py) on top of the reference data of "
+            "scripts/RedRomero_Data.sql, at benchmark scale.")
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_SCALE.items():
+            parser.add_argument(f'--{name}', type=int, default=default, help=f'rows to generate (default {default})')
+        parser.add_argument('--seed', type=int, default=42, help='random seed; same seed, same dataset')
+        parser.add_argument('--years', type=int, default=3, help='years of activity before --until')
+        parser.add_argument('--until', type=date.fromisoformat, default=None,
+                            help='last day of generated activity, YYYY-MM-DD (default today)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='rows per executemany round trip')
+        parser.add_argument('--prefix', default='gen', help='prefix for usernames, emails and NGO registrations')
+        parser.add_argument('--password', default='bench123', help='password of every generated user')
+
+    def handle(self, *args, **options):
+        generator = DatasetGenerator(
+            seed=options['seed'], prefix=options['prefix'], batch_size=options['batch_size'],
+            years=options['years'], until=options['until'], password=options['password'],
+            log=self.stdout.write,
+        )
+        if generator.already_generated():
+            raise CommandError(f"A dataset with prefix '{options['prefix']}' already exists; use another --prefix")
+        try:
+            counts = generator.generate({name: options[name] for name in DEFAULT_SCALE})
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f"Generated {sum(counts.values())} rows (seed {options['seed']})"))
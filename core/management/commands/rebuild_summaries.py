@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core import summaries
+
+
+class Command(BaseCommand):
+    help = "Recompute the summary and rollup tables (core/summaries.py) from the base tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', metavar='summary',
+                            help=f"summaries to rebuild (default all: {', '.join(summaries.SUMMARIES)})")
+
+    def handle(self, *args, **options):
+        try:
+            summaries.rebuild(options['names'] or None, log=self.stdout.write)
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS("Summaries rebuilt"))
@@ -0,0 +1,38 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from core import slowlog
+
+
+class Command(BaseCommand):
+    help = "List the slowest recorded statements (core/slowlog.py), grouped by SQL, by total time."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10, help='number of statements to show')
+        parser.add_argument('--plan', action='store_true', help='print the plan of the slowest sample')
+        parser.add_argument('--file', help='read this log instead of SLOW_QUERY_LOG')
+
+    def handle(self, *args, **options):
+        groups = defaultdict(list)
+        for entry in slowlog.read_entries(options['file']):
+            groups[(entry.get('kind'), entry.get('sql'))].append(entry)
+
+        if not groups:
+            self.stdout.write("No slow statements recorded.")
+            return
+
+        ranked = sorted(groups.items(), key=lambda item: sum(e['ms'] for e in item[1]), reverse=True)
+        for rank, ((kind, sql), entries) in enumerate(ranked[:options['top']], 1):
+            times = [e['ms'] for e in entries]
+            worst = max(entries, key=lambda e: e['ms'])
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"#{rank} {kind}: total {sum(times):.0f} ms, {len(times)} calls, "
+                f"avg {sum(times) / len(times):.0f} ms, max {worst['ms']:.0f} ms, last seen {entries[-1]['ts']}"
+            ))
+            self.stdout.write(f"  {sql[:300]}")
+            self.stdout.write(f"  slowest binds: {worst.get('binds')}")
+            if options['plan'] and worst.get('plan'):
+                for line in worst['plan']:
+                    self.stdout.write(f"    {line}")
+            self.stdout.write("")
@@ -0,0 +1,366 @@
+"""
+Prometheus metrics, aggregated across worker processes.
+
+Each process keeps its counters and histograms in memory. When METRICS_DIR is
+set, a background thread writes them every METRICS_FLUSH_SECONDS (and at exit)
+to `<METRICS_DIR>/metrics_<pid>_<start>.json`, where start identifies the
+process, so a recycled pid gets a new file instead of overwriting (and
+resetting) the one of the worker that exited. The /metrics endpoint merges
+every file: counters and histograms are summed. Files of dead workers are
+folded into `metrics_dead.json` and removed, so counters never go backwards
+and the directory does not grow with every restart. Gauges (pool sessions)
+are summed over live processes only. Empty METRICS_DIR on deploy, the same
+way prometheus_client's multiprocess mode requires. Without METRICS_DIR,
+/metrics shows only the process that answers.
+
+Exposed series:
+- redromero_http_request_duration_seconds{view,method}: histogram per URL name
+- redromero_http_requests_total{view,method,status}
+- redromero_db_statement_duration_seconds{kind,name}: name is the procedure
+  or function, or "sql:<first table after FROM>" for plain SQL
+- redromero_db_pool_{open,busy,max}_sessions, redromero_db_pool_acquires_total,
+  redromero_db_pool_waits_total
+- redromero_cache_requests_total{cache,result}: hit/miss (and stale for SWR)
+"""
+import atexit
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows (solo desarrollo): sin bloqueo entre procesos
+    fcntl = None
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# nombre -> (tipo, ayuda)
+METRICS = {
+    'redromero_http_request_duration_seconds': ('histogram', 'Request latency by URL name.'),
+    'redromero_http_requests_total': ('counter', 'Requests by URL name, method and status code.'),
+    'redromero_db_statement_duration_seconds': ('histogram', 'Database statement latency by procedure or table.'),
+    'redromero_db_pool_open_sessions': ('gauge', 'Sessions open in the connection pools.'),
+    'redromero_db_pool_busy_sessions': ('gauge', 'Sessions checked out of the connection pools.'),
+    'redromero_db_pool_max_sessions': ('gauge', 'Maximum size of the connection pools.'),
+    'redromero_db_pool_acquires_total': ('counter', 'Sessions acquired from the pool.'),
+    'redromero_db_pool_waits_total': ('counter', 'Acquisitions that had to wait for a free session.'),
+    'redromero_cache_requests_total': ('counter', 'Cache lookups by cache and result.'),
+}
+
+_FROM_RE = re.compile(r'\bFROM\s+(?:TABLE\s*\(\s*)?([A-Za-z_][\w.$#]*)', re.IGNORECASE)
+
+
+def statement_name(kind, label):
+    """Low-cardinality name for a statement: procedure name or first table read."""
+    if kind in ('procedure', 'function'):
+        return label
+    match = _FROM_RE.search(label)
+    return f"sql:{match.group(1).lower()}" if match else 'sql:other'
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, labels, amount=1):
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, labels, value):
+        key = (name, labels)
+        index = bisect.bisect_left(LATENCY_BUCKETS, value)
+        with self._lock:
+            entry = self.histograms.get(key)
+            if entry is None:
+                # Un contador por bucket más el de +Inf, luego la suma
+                entry = self.histograms[key] = [[0] * (len(LATENCY_BUCKETS) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': [[name, list(labels), value] for (name, labels), value in self.counters.items()],
+                'histograms': [[name, list(labels), list(counts), total]
+                               for (name, labels), (counts, total) in self.histograms.items()],
+            }
+
+
+registry = Registry()
+
+_flusher_started = False
+_flusher_lock = threading.Lock()
+
+DEAD_FILE = 'metrics_dead.json'
+LOCK_FILE = 'metrics.lock'
+
+# (pid, inicio) de este proceso; se renueva tras un fork
+_identity = (None, None)
+
+
+def _metrics_dir():
+    return getattr(settings, 'METRICS_DIR', None)
+
+
+def _process_identity():
+    global _identity
+    pid = os.getpid()
+    if _identity[0] != pid:
+        _identity = (pid, time.time_ns())
+    return _identity
+
+
+def _labels(**labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _ensure_flusher():
+    global _flusher_started
+    if _flusher_started or not _metrics_dir():
+        return
+    with _flusher_lock:
+        if _flusher_started:
+            return
+        _flusher_started = True
+        os.makedirs(_metrics_dir(), exist_ok=True)
+        threading.Thread(target=_flush_loop, name='metrics-flush', daemon=True).start()
+        atexit.register(flush)
+
+
+def _flush_loop():
+    interval = getattr(settings, 'METRICS_FLUSH_SECONDS', 5)
+    while True:
+        time.sleep(interval)
+        flush()
+
+
+def _gauges():
+    """Pool gauges and counters of this process (read at flush/scrape time)."""
+    from core.pool import pool_stats
+    from django.db import connections
+
+    gauges, counters = [], []
+    for alias in connections:
+        try:
+            stats = pool_stats(alias)
+        except Exception:
+            continue
+        if not stats.get('pooled'):
+            continue
+        labels = [['alias', alias]]
+        gauges += [
+            ['redromero_db_pool_open_sessions', labels, stats['open']],
+            ['redromero_db_pool_busy_sessions', labels, stats['busy']],
+            ['redromero_db_pool_max_sessions', labels, stats['max']],
+        ]
+        counters += [
+            ['redromero_db_pool_acquires_total', labels, stats['acquires']],
+            ['redromero_db_pool_waits_total', labels, stats['waits']],
+        ]
+    return gauges, counters
+
+
+def _process_snapshot():
+    data = registry.snapshot()
+    gauges, pool_counters = _gauges()
+    data['gauges'] = gauges
+    data['counters'] += pool_counters
+    data['pid'], data['start'] = _process_identity()
+    return data
+
+
+def _write_json(path, data):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as fh:
+        json.dump(data, fh)
+    os.replace(tmp, path)
+
+
+def flush():
+    """Write this process's metrics to METRICS_DIR (no-op without it)."""
+    directory = _metrics_dir()
+    if not directory:
+        return
+    pid, start = _process_identity()
+    path = os.path.join(directory, f'metrics_{pid}_{start}.json')
+    try:
+        _write_json(path, _process_snapshot())
+    except Exception as e:
+        logger.warning(f"Could not write metrics file {path}: {e}")
+
+
+# --- Registro --------------------------------------------------------------
+
+def observe_request(view, method, status_code, seconds):
+    _ensure_flusher()
+    registry.observe('redromero_http_request_duration_seconds', _labels(view=view, method=method), seconds)
+    registry.inc('redromero_http_requests_total', _labels(view=view, method=method, status=status_code))
+
+
+def observe_statement(kind, label, seconds):
+    _ensure_flusher()
+    registry.observe('redromero_db_statement_duration_seconds',
+                     _labels(kind=kind, name=statement_name(kind, label)), seconds)
+
+
+def cache_lookup(cache_name, result):
+    _ensure_flusher()
+    registry.inc('redromero_cache_requests_total', _labels(cache=cache_name, result=result))
+
+
+# --- Exposición ------------------------------------------------------------
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+def _merge(counters, histograms, snap):
+    for name, labels, value in snap.get('counters', []):
+        key = (name, tuple(map(tuple, labels)))
+        counters[key] = counters.get(key, 0) + value
+    for name, labels, counts, total in snap.get('histograms', []):
+        key = (name, tuple(map(tuple, labels)))
+        merged = histograms.setdefault(key, [[0] * len(counts), 0.0])
+        merged[0] = [a + b for a, b in zip(merged[0], counts)]
+        merged[1] += total
+
+
+def _read_directory(directory):
+    """Live snapshots plus the aggregate of dead ones (folded on the way)."""
+    files = {}
+    for name in os.listdir(directory):
+        if name == DEAD_FILE or not (name.startswith('metrics_') and name.endswith('.json')):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            with open(path) as fh:
+                files[path] = json.load(fh)
+        except (OSError, ValueError):
+            continue
+
+    # Con el mismo pid solo puede estar vivo el proceso que arrancó último
+    newest = {}
+    for snap in files.values():
+        pid = snap.get('pid', 0)
+        newest[pid] = max(newest.get(pid, 0), snap.get('start', 0))
+    own = _process_identity()
+
+    dead_path = os.path.join(directory, DEAD_FILE)
+    try:
+        with open(dead_path) as fh:
+            dead = json.load(fh)
+    except (OSError, ValueError):
+        dead = {'counters': [], 'histograms': []}
+
+    live, folded = [], []
+    dead_counters, dead_histograms = {}, {}
+    _merge(dead_counters, dead_histograms, dead)
+    for path, snap in files.items():
+        pid, start = snap.get('pid', 0), snap.get('start', 0)
+        if (pid, start) == own or (start == newest[pid] and _alive(pid)):
+            live.append(snap)
+        else:
+            folded.append(path)
+            _merge(dead_counters, dead_histograms, snap)
+    dead = {
+        'counters': [[name, list(labels), value] for (name, labels), value in dead_counters.items()],
+        'histograms': [[name, list(labels), counts, total]
+                       for (name, labels), (counts, total) in dead_histograms.items()],
+    }
+    if folded:
+        # Primero el agregado, luego borrar: si falla a medias se cuenta de más
+        # una vez en vez de perder los contadores
+        try:
+            _write_json(dead_path, dead)
+            for path in folded:
+                os.remove(path)
+        except OSError as e:
+            logger.warning(f"Could not fold dead worker metrics in {directory}: {e}")
+    return live + [dead]
+
+
+def collect():
+    """Merged snapshot of every process (or just this one without METRICS_DIR)."""
+    directory = _metrics_dir()
+    if not directory:
+        snapshots = [_process_snapshot()]
+    else:
+        flush()
+        # Un solo proceso a la vez pliega los ficheros de workers muertos
+        with open(os.path.join(directory, LOCK_FILE), 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                snapshots = _read_directory(directory)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    counters, histograms, gauges = {}, {}, {}
+    for snap in snapshots:
+        _merge(counters, histograms, snap)
+        for name, labels, value in snap.get('gauges', []):
+            key = (name, tuple(map(tuple, labels)))
+            gauges[key] = gauges.get(key, 0) + value
+    return counters, histograms, gauges
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _fmt_labels(labels, extra=None):
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def render():
+    """Prometheus text exposition format (version 0.0.4)."""
+    counters, histograms, gauges = collect()
+    by_metric = {}
+    for source in (counters, gauges):
+        for (name, labels), value in source.items():
+            by_metric.setdefault(name, []).append((labels, value))
+    for (name, labels), value in histograms.items():
+        by_metric.setdefault(name, []).append((labels, value))
+
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        series = by_metric.get(name)
+        if not series:
+            continue
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in sorted(series):
+            if kind != 'histogram':
+                lines.append(f'{name}{_fmt_labels(labels)} {value}')
+                continue
+            counts, total = value
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{_fmt_labels(labels, ("le", repr(bound)))} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{name}_bucket{_fmt_labels(labels, ("le", "+Inf"))} {cumulative}')
+            lines.append(f'{name}_sum{_fmt_labels(labels)} {total}')
+            lines.append(f'{name}_count{_fmt_labels(labels)} {cumulative}')
+    return '\n'.join(lines) + '\n'
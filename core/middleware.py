@@ -0,0 +1,102 @@
+"""
+Request instrumentation middleware.
+
+MetricsMiddleware feeds the latency histograms served at /metrics
+(core/metrics.py).
+
+DBTimingMiddleware: per-request database statistics.
+
+For every request it adds a `Server-Timing` header (visible in the browser's
+network panel):
+
+    Server-Timing: db;dur=41.2;desc="6 queries, 180 rows", app;dur=55.0
+
+`db` is the summed time of all statements, so with concurrent fan-out it can
+exceed `app`. It also writes one JSON log line to the `core.requests` logger.
+If the request goes over its query budget (DB_QUERY_BUDGETS, looked up by URL name and
+falling back to 'default'), the line is logged as a warning and includes the
+slowest statements.
+"""
+import json
+import logging
+import time
+
+from django.conf import settings
+
+from core import instrumentation, metrics
+
+logger = logging.getLogger('core.requests')
+
+
+def _budget_for(url_name):
+    budgets = getattr(settings, 'DB_QUERY_BUDGETS', {})
+    budget = dict(budgets.get('default', {}))
+    budget.update(budgets.get(url_name, {}))
+    return budget
+
+
+def _url_name(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.url_name if match else None
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        # Las rutas sin nombre (404, admin) se agrupan para acotar las series
+        metrics.observe_request(_url_name(request) or 'unmatched', request.method,
+                                response.status_code, time.perf_counter() - start)
+        return response
+
+
+class DBTimingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'DB_INSTRUMENTATION', True)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        stats, token = instrumentation.begin()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.end(token)
+        total_ms = (time.perf_counter() - start) * 1000
+
+        response['Server-Timing'] = (
+            f'db;dur={stats.db_ms:.1f};desc="{stats.count} queries, {stats.rows} rows", '
+            f'app;dur={total_ms:.1f}'
+        )
+
+        url_name = _url_name(request)
+        budget = _budget_for(url_name)
+        exceeded = [
+            name for name, value in (('queries', stats.count), ('db_ms', stats.db_ms))
+            if name in budget and value > budget[name]
+        ]
+
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': url_name,
+            'status': response.status_code,
+            'queries': stats.count,
+            'rows': stats.rows,
+            'bytes': stats.bytes,
+            'db_ms': round(stats.db_ms, 1),
+            'total_ms': round(total_ms, 1),
+        }
+        if exceeded:
+            record['over_budget'] = {name: budget[name] for name in exceeded}
+            record['slowest'] = [s.as_dict() for s in stats.slowest()]
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
+        return response
@@ -0,0 +1,116 @@
+"""
+Keyset ("cursor") pagination for the raw-SQL feeds ordered by (date, id).
+
+Instead of OFFSET, each page continues strictly after the last (date, id)
+pair returned, so Oracle can walk the date index from the cursor position
+and stop after `page_size` rows no matter how deep the client has paged.
+
+The cursor sent to the client is opaque (urlsafe base64 of a small JSON
+payload); clients must only echo it back in `?cursor=`.
+
+Typical use inside a view::
+
+    page = KeysetPage(request, 'dn.donation_date', 'dn.donation_id')
+    where_sql, where_params = page.where()
+    query = and_where(query, where_sql) + page.order_and_limit()
+    rows = fetch_raw_query(query, params + where_params + page.limit_params())
+    rows = page.trim(rows, key=lambda r: (r['donation_date'], r['donation_id']))
+    return Response(page.envelope(rows))
+"""
+import base64
+import binascii
+import json
+import re
+from datetime import date, datetime
+
+from django.conf import settings
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    """Raised when the `cursor` query parameter cannot be decoded."""
+
+
+def encode_cursor(date_value, row_id):
+    payload = json.dumps([date_value.isoformat(), int(row_id)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        date_str, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(date_str), int(row_id)
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {token!r}") from e
+
+
+def get_page_size(request, default=None, maximum=None):
+    default = default or getattr(settings, 'KEYSET_PAGE_SIZE', DEFAULT_PAGE_SIZE)
+    maximum = maximum or getattr(settings, 'KEYSET_MAX_PAGE_SIZE', MAX_PAGE_SIZE)
+    try:
+        size = int(request.query_params.get('page_size', default))
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+class KeysetPage:
+    """
+    One page of a feed ordered by `date_column DESC, id_column DESC`.
+
+    Raises InvalidCursor on construction if `?cursor=` is malformed; views
+    should turn that into a 400.
+    """
+
+    def __init__(self, request, date_column, id_column, default_size=None):
+        self.date_column = date_column
+        self.id_column = id_column
+        self.page_size = get_page_size(request, default=default_size)
+        token = request.query_params.get('cursor')
+        self.after = decode_cursor(token) if token else None
+        self.next_cursor = None
+
+    def where(self):
+        """
+        Returns (sql, params) restricting rows to those after the cursor, or
+        ("", []) for the first page. The SQL has no leading WHERE/AND.
+        """
+        if self.after is None:
+            return "", []
+        last_date, last_id = self.after
+        sql = (f"({self.date_column} < %s OR "
+               f"({self.date_column} = %s AND {self.id_column} < %s))")
+        return sql, [last_date, last_date, last_id]
+
+    def order_and_limit(self):
+        # Se pide una fila extra para saber si existe una página siguiente
+        return (f" ORDER BY {self.date_column} DESC, {self.id_column} DESC"
+                f" FETCH FIRST %s ROWS ONLY")
+
+    def limit_params(self):
+        return [self.page_size + 1]
+
+    def trim(self, rows, key):
+        """Drop the look-ahead row and remember the cursor for the next page."""
+        rows = list(rows)
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            last_date, last_id = key(rows[-1])
+            if isinstance(last_date, date) and not isinstance(last_date, datetime):
+                last_date = datetime(last_date.year, last_date.month, last_date.day)
+            self.next_cursor = encode_cursor(last_date, last_id)
+        return rows
+
+    def envelope(self, results):
+        return {"results": results, "next": self.next_cursor}
+
+
+def and_where(sql, condition):
+    """Append `condition` to a query with (or without) an existing WHERE."""
+    if not condition:
+        return sql
+    keyword = " AND " if re.search(r"\bWHERE\b", sql, re.IGNORECASE) else " WHERE "
+    return sql + keyword + condition
@@ -0,0 +1,83 @@
+import threading
+import time
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# ==============================================================================
+# Estadísticas del pool de sesiones Oracle (python-oracledb)
+# ==============================================================================
+
+class AcquireStats:
+    """Counts pool acquisitions per database alias (per worker process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def record(self, alias, elapsed, waited):
+        with self._lock:
+            entry = self._data.setdefault(alias, {
+                'acquires': 0,
+                'waits': 0,
+                'acquire_time_ms': 0.0,
+                'max_acquire_ms': 0.0,
+            })
+            elapsed_ms = elapsed * 1000
+            entry['acquires'] += 1
+            entry['acquire_time_ms'] += elapsed_ms
+            entry['max_acquire_ms'] = max(entry['max_acquire_ms'], elapsed_ms)
+            if waited:
+                entry['waits'] += 1
+
+    def snapshot(self, alias):
+        with self._lock:
+            return dict(self._data.get(alias, {
+                'acquires': 0,
+                'waits': 0,
+                'acquire_time_ms': 0.0,
+                'max_acquire_ms': 0.0,
+            }))
+
+
+acquire_stats = AcquireStats()
+
+
+def timed_acquire(alias, pool):
+    """
+    Acquire a session from the pool and record how long it took.
+    An acquisition counts as a wait when every open session was busy and the
+    pool could not grow any further.
+    """
+    waited = pool.busy >= pool.max
+    started = time.monotonic()
+    conn = pool.acquire()
+    acquire_stats.record(alias, time.monotonic() - started, waited)
+    return conn
+
+
+def pool_stats(alias=DEFAULT_DB_ALIAS):
+    """Return a JSON-friendly snapshot of the connection pool behind `alias`."""
+    wrapper = connections[alias]
+    pool = getattr(wrapper, 'pool', None)
+    if pool is None:
+        return {'alias': alias, 'pooled': False}
+
+    stats = acquire_stats.snapshot(alias)
+    acquires = stats['acquires']
+    return {
+        'alias': alias,
+        'pooled': True,
+        'min': pool.min,
+        'max': pool.max,
+        'increment': pool.increment,
+        'open': pool.opened,
+        'busy': pool.busy,
+        'idle': pool.opened - pool.busy,
+        'utilization_percent': round((pool.busy / pool.max) * 100, 2) if pool.max else 0,
+        'ping_interval': pool.ping_interval,
+        'stmtcachesize': pool.stmtcachesize,
+        'acquires': acquires,
+        'waits': stats['waits'],
+        'avg_acquire_ms': round(stats['acquire_time_ms'] / acquires, 3) if acquires else 0,
+        'max_acquire_ms': round(stats['max_acquire_ms'], 3),
+    }
@@ -0,0 +1,143 @@
+"""
+On-demand sampling profiler for single requests.
+
+`ProfilerMiddleware` profiles a request when an ADMIN adds `?profile=1`
+(or `?profile=json`). A sampler thread reads the request thread's stack
+every PROFILE_INTERVAL_MS. The view runs normally, but its response is
+replaced by the profile:
+
+- `profile=1`: folded stacks ("frame;frame;frame count"), ready for
+  flamegraph.pl or speedscope.
+- `profile=json`: the folded stacks plus a summary: wall time, status of the
+  real response, and every DB statement with its time and rows (from
+  core.instrumentation).
+
+While a statement runs, samples get an extra leaf frame `[db] <sql or
+procedure>`. That way the flamegraph separates time spent waiting on Oracle
+from time spent in Python. Only the request thread is sampled; queries
+fanned out by run_concurrently show up in the JSON statement list.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+
+from core import instrumentation
+
+_profilers_lock = threading.Lock()
+
+
+def _frame_name(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler:
+    """Samples the stack of one thread from a background thread."""
+
+    def __init__(self, thread_id, interval, root_code=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root_code = root_code
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and frame.f_code is not self.root_code:
+                stack.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            statement = instrumentation.active_statements.get(self.thread_id)
+            if statement:
+                stack.append(f"[db] {instrumentation.label_for(statement)}")
+            self.stacks[';'.join(stack)] += 1
+            self.samples += 1
+
+    def folded(self):
+        return '\n'.join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + '\n'
+
+
+def _wants_profile(request):
+    mode = request.GET.get('profile')
+    if mode not in ('1', 'json') or not getattr(settings, 'REQUEST_PROFILING', True):
+        return None
+    # El JWT lo valida DRF dentro de la vista; aquí se autentica antes para
+    # saber si quien pide el perfil es ADMIN
+    from users.authentication import ClaimsJWTAuthentication
+    try:
+        result = ClaimsJWTAuthentication().authenticate(request)
+    except Exception:
+        return None
+    if result is None or getattr(result[0], 'user_role', None) != 'ADMIN':
+        return None
+    return mode
+
+
+class ProfilerMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = _wants_profile(request)
+        if mode is None:
+            return self.get_response(request)
+        return self._profile(request, mode)
+
+    def _profile(self, request, mode):
+        stats = instrumentation.current()
+        token = None
+        if stats is None:
+            stats, token = instrumentation.begin()
+
+        interval = getattr(settings, 'PROFILE_INTERVAL_MS', 2) / 1000
+        sampler = Sampler(threading.get_ident(), interval, root_code=self._profile.__code__)
+        with _profilers_lock:
+            instrumentation.profilers += 1
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            response = self.get_response(request)
+            # Las respuestas en streaming también se consumen dentro del perfil
+            if getattr(response, 'streaming', False):
+                for _ in response.streaming_content:
+                    pass
+        finally:
+            sampler.stop()
+            wall_ms = (time.perf_counter() - start) * 1000
+            with _profilers_lock:
+                instrumentation.profilers -= 1
+            if token is not None:
+                instrumentation.end(token)
+
+        if mode == '1':
+            return HttpResponse(sampler.folded(), content_type='text/plain; charset=utf-8')
+        return JsonResponse({
+            'path': request.path,
+            'status': response.status_code,
+            'wall_ms': round(wall_ms, 1),
+            'interval_ms': interval * 1000,
+            'samples': sampler.samples,
+            'db': {
+                'queries': stats.count,
+                'db_ms': round(stats.db_ms, 1),
+                'statements': [s.as_dict() for s in stats.statements],
+            },
+            'folded': sampler.folded(),
+        })
@@ -0,0 +1,96 @@
+"""
+Result cache for read queries over heavy aggregate views.
+
+An entry is keyed by the SQL text, its bind values and the result mode, plus
+the current version of every table the query reads (see core/cache.py). The
+caller declares those tables. When a write bumps one of them, the key
+changes and the old entry is simply never read again; QUERY_CACHE_TIMEOUT
+only bounds how long such orphans (and writes made outside the app) live.
+
+Declare the BASE tables behind a view, not the view name: VIEW_TABLES lists
+them for the views cached here. `cached_procedure_cursor` does the same for a
+read-only procedure that returns a ref cursor, keyed by its name and binds.
+"""
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core import metrics
+from core.cache import table_versions
+from core.db import ROWS_DICT, fetch_procedure_cursor, fetch_raw_query
+
+logger = logging.getLogger(__name__)
+
+RESULT_KEY = 'qres:{}'
+
+# Vista -> tablas base que lee (scripts/RedRomero_ProgrammingObjectsv2.sql)
+VIEW_TABLES = {
+    # Estas tres leen los resúmenes que mantiene scripts/RedRomero_Summaries.sql
+    'vw_project_budget_status': ('Project', 'Budget', 'Currency', 'Project_Finance_Summary'),
+    'vw_ngo_financial_overview': ('NGO', 'Project', 'Project_Finance_Summary', 'NGO_Donor_Summary'),
+    'vw_donation_trends_by_currency': ('Currency', 'Donation_Rollup', 'Donation_Donor_Rollup'),
+    'vw_donor_contributions_ranking': ('Donor', 'Donor_Type', 'Donation', 'Currency'),
+    'vw_volunteer_expertise_mapping': ('Volunteer', 'Volunteer_Specialty', 'Volunteer_Project'),
+}
+
+
+def _timeout():
+    return getattr(settings, 'QUERY_CACHE_TIMEOUT', 600)
+
+
+def result_key(query, params, mode, versions):
+    digest = hashlib.sha1()
+    digest.update(query.encode('utf-8'))
+    digest.update(repr(list(params or [])).encode('utf-8'))
+    digest.update(mode.encode('utf-8'))
+    digest.update(repr(sorted(versions.items())).encode('utf-8'))
+    return RESULT_KEY.format(digest.hexdigest())
+
+
+def cached_query(query, params=None, tables=(), mode=ROWS_DICT, timeout=None):
+    """
+    Same as `fetch_raw_query`, served from the cache while none of `tables`
+    has been written. `tables` must name every table the query reads.
+    """
+    if not tables:
+        raise ValueError("cached_query needs the tables the query reads")
+
+    # Versiones leídas ANTES de consultar: una escritura concurrente deja
+    # la entrada bajo una clave que ya nadie volverá a pedir
+    key = result_key(query, params, mode, table_versions(tables))
+    rows = cache.get(key)
+    if rows is not None:
+        metrics.cache_lookup('query', 'hit')
+        return rows
+    metrics.cache_lookup('query', 'miss')
+
+    rows = fetch_raw_query(query, params, mode=mode)
+    cache.set(key, rows, _timeout() if timeout is None else timeout)
+    return rows
+
+
+def cached_view_query(view, query, params=None, mode=ROWS_DICT, timeout=None):
+    """`cached_query` over one of the views in VIEW_TABLES."""
+    return cached_query(query, params, VIEW_TABLES[view], mode=mode, timeout=timeout)
+
+
+def cached_procedure_cursor(procedure, params=None, tables=(), timeout=None):
+    """
+    Rows of `fetch_procedure_cursor(procedure, params)`, served from the cache
+    while none of `tables` has been written. The procedure must only read.
+    """
+    if not tables:
+        raise ValueError("cached_procedure_cursor needs the tables the procedure reads")
+
+    key = result_key(f"CALL {procedure}", params, ROWS_DICT, table_versions(tables))
+    rows = cache.get(key)
+    if rows is not None:
+        metrics.cache_lookup('query', 'hit')
+        return rows
+    metrics.cache_lookup('query', 'miss')
+
+    rows, _ = fetch_procedure_cursor(procedure, params, out_args_count=0)
+    cache.set(key, rows, _timeout() if timeout is None else timeout)
+    return rows
@@ -0,0 +1,138 @@
+"""
+In-process cache for the reference tables behind every dropdown:
+Currency, Donor_Type, Project_Status, Specialty, SDG_Goal and
+Project_Category.
+
+These tables change a few times a year, yet they were read from Oracle on
+every render. Each dataset is loaded once per process (`warm_all()` runs at
+WSGI/ASGI startup) and kept together with the table version it was read at
+(see core/cache.py). A write to the table, whether through a mapped
+procedure or an explicit `bump_tables`, raises that version. The next read
+sees the change and reloads. Other processes notice it within
+REFDATA_VERSION_CHECK_SECONDS.
+
+Rows are shared between requests: treat them as read-only.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+from core import metrics
+from core.cache import table_versions, local_write_marks
+from core.db import fetch_raw_query
+
+logger = logging.getLogger(__name__)
+
+# nombre -> (tablas de origen, consulta). Las columnas usan los alias que
+# espera el frontend (id, name, ...).
+DATASETS = {
+    'currencies': (('Currency',), """
+        SELECT currency_id AS id, currency_name AS name, currency_code AS code,
+               symbol, exchange_rate_to_usd AS rate
+        FROM Currency ORDER BY currency_id
+    """),
+    'donor_types': (('Donor_Type',), """
+        SELECT type_id AS id, type_name AS name, description
+        FROM Donor_Type ORDER BY type_id
+    """),
+    'project_statuses': (('Project_Status',), """
+        SELECT project_status_id AS id, status_name AS name
+        FROM Project_Status ORDER BY project_status_id
+    """),
+    'specialties': (('Specialty',), """
+        SELECT specialty_id AS id, specialty_name AS name, description
+        FROM Specialty ORDER BY specialty_id
+    """),
+    'sdg_goals': (('SDG_Goal',), """
+        SELECT sdg_id AS id, goal_name AS name, goal_number AS "number", description
+        FROM SDG_Goal ORDER BY goal_number
+    """),
+    'project_categories': (('Project_Category',), """
+        SELECT c.category_id AS id, c.category_name AS name, c.description,
+               p.category_name AS parent
+        FROM Project_Category c
+        LEFT JOIN Project_Category p ON c.parent_category_id = p.category_id
+        WHERE c.is_active = 'Y'
+        ORDER BY c.category_name
+    """),
+}
+
+
+class _Entry:
+    __slots__ = ('rows', 'versions', 'local_marks', 'checked_at')
+
+    def __init__(self, rows, versions, local_marks):
+        self.rows = rows
+        self.versions = versions
+        self.local_marks = local_marks
+        self.checked_at = time.monotonic()
+
+
+_entries = {}
+_locks = {name: threading.Lock() for name in DATASETS}
+
+
+def _check_interval():
+    return getattr(settings, 'REFDATA_VERSION_CHECK_SECONDS', 5)
+
+
+def _load(name):
+    tables, sql = DATASETS[name]
+    # La versión se lee ANTES de la consulta: si alguien escribe durante la
+    # carga, la versión guardada ya queda vieja y se recarga en la próxima
+    local_marks = local_write_marks(tables)
+    versions = table_versions(tables)
+    rows = fetch_raw_query(sql)
+    _entries[name] = _Entry(rows, versions, local_marks)
+    return rows
+
+
+def get(name):
+    """Return the cached rows of reference dataset `name`."""
+    if name not in DATASETS:
+        raise KeyError(f"Unknown reference dataset: {name}")
+
+    tables = DATASETS[name][0]
+    entry = _entries.get(name)
+    # Una escritura de este mismo proceso invalida en el acto; las de otros
+    # procesos se detectan al revisar las versiones compartidas
+    if entry is not None and entry.local_marks == local_write_marks(tables):
+        if time.monotonic() - entry.checked_at < _check_interval():
+            metrics.cache_lookup('refdata', 'hit')
+            return entry.rows
+        if table_versions(tables) == entry.versions:
+            entry.checked_at = time.monotonic()
+            metrics.cache_lookup('refdata', 'hit')
+            return entry.rows
+
+    metrics.cache_lookup('refdata', 'miss')
+    with _locks[name]:
+        # Otro hilo pudo recargarlo mientras esperábamos el lock
+        current = _entries.get(name)
+        if current is not None and current is not entry:
+            return current.rows
+        return _load(name)
+
+
+def invalidate(name=None):
+    """Drop the local copy of one dataset (or all) so the next get() reloads."""
+    if name is None:
+        _entries.clear()
+    else:
+        _entries.pop(name, None)
+
+
+def warm_all():
+    """Load every dataset; called once at process startup. Never raises."""
+    try:
+        for name in DATASETS:
+            get(name)
+    except Exception as e:
+        # Sin base de datos al arrancar: cada dataset se cargará en su primer uso
+        logger.warning(f"Reference data not preloaded ({e}); loading on first use")
+    finally:
+        # La sesión usada al arrancar vuelve al pool
+        connections.close_all()
@@ -0,0 +1,67 @@
+"""
+Single-flight: identical concurrent reads share one computation.
+
+When several threads of this process call `do(key, fn)` with the same key
+while a call is still running, only the first one runs `fn`. The others wait
+for it and receive the same result (or the same exception). Nothing is kept
+after the call ends. Pair it with a cache when results should also outlive
+the call.
+
+Results are shared between requests, so treat them as read-only. A key built
+with `request_key` covers the endpoint and its query string only. When the
+result depends on who is asking, add the user through `extra`.
+"""
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+_calls = {}
+_lock = threading.Lock()
+
+
+def request_key(request, endpoint=None, extra=None):
+    """Key for a GET request: endpoint plus its query params in a stable order."""
+    params = sorted((name, tuple(sorted(values))) for name, values in request.query_params.lists())
+    return (endpoint or request.path, tuple(params), extra)
+
+
+def do(key, fn):
+    """Run `fn()` once for all concurrent callers that pass the same `key`."""
+    with _lock:
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = _calls[key] = _Call()
+        else:
+            call.waiters += 1
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = fn()
+    except Exception as e:
+        call.error = e
+        raise
+    finally:
+        with _lock:
+            del _calls[key]
+        if call.waiters:
+            logger.debug(f"Single-flight {key!r}: {call.waiters} caller(s) shared one computation")
+        call.done.set()
+    return call.result
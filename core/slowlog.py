@@ -0,0 +1,149 @@
+"""
+Slow-query recorder.
+
+Any statement tracked by core.instrumentation that takes longer than
+SLOW_QUERY_MS is appended as one JSON line to SLOW_QUERY_LOG. The line holds
+the kind, SQL (or procedure name), binds, elapsed time and rows. Binds are
+stored as type and length ('str(12)', 'int'); their values only with
+SLOW_QUERY_LOG_BIND_VALUES. Either way, the binds of the
+PKG_SYSTEM_SECURITY procedures, of statements that mention a password,
+email or phone, and named binds with those words, are stored as '***'. For plain
+SQL it also holds the execution plan that Oracle actually used:
+DBMS_XPLAN.DISPLAY_CURSOR is read on the same session right after the
+statement. That needs SELECT access to V$SQL_PLAN, V$SQL and V$SESSION; if
+the plan cannot be read, the entry is stored without it.
+
+The file rotates at SLOW_QUERY_LOG_MAX_BYTES and keeps
+SLOW_QUERY_LOG_BACKUPS old files. `python manage.py slowqueries` lists the
+worst statements by total time.
+"""
+import json
+import logging
+import logging.handlers
+import os
+import threading
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+PLAN_SQL = "SELECT plan_table_output FROM TABLE(DBMS_XPLAN.DISPLAY_CURSOR(NULL, NULL, 'TYPICAL'))"
+
+# Solo las sentencias SQL tienen plan propio; el de un procedimiento sería el
+# de su última consulta interna
+PLAN_KINDS = ('query', 'stream')
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def threshold_ms():
+    return getattr(settings, 'SLOW_QUERY_MS', 500)
+
+
+def log_path():
+    return str(getattr(settings, 'SLOW_QUERY_LOG', os.path.join(settings.BASE_DIR, 'logs', 'slow_queries.jsonl')))
+
+
+def _get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = log_path()
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    path,
+                    maxBytes=getattr(settings, 'SLOW_QUERY_LOG_MAX_BYTES', 5 * 1024 * 1024),
+                    backupCount=getattr(settings, 'SLOW_QUERY_LOG_BACKUPS', 3),
+                    encoding='utf-8',
+                )
+                handler.setFormatter(logging.Formatter('%(message)s'))
+                store = logging.getLogger('core.slowlog.store')
+                store.addHandler(handler)
+                store.setLevel(logging.INFO)
+                store.propagate = False
+                _store = store
+    return _store
+
+
+# Datos personales: nunca se guardan, ni con SLOW_QUERY_LOG_BIND_VALUES
+SENSITIVE_WORDS = ('password', 'email', 'phone')
+# Procedimientos de usuarios (hash de contraseña, correo, nombre, teléfono)
+SENSITIVE_PROCEDURES = ('PKG_SYSTEM_SECURITY.',)
+
+
+def _describe(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}({len(value)})"
+    return type(value).__name__
+
+
+def _safe_binds(sql, params):
+    if not params:
+        return []
+    log_values = getattr(settings, 'SLOW_QUERY_LOG_BIND_VALUES', False)
+    # Para un procedimiento `sql` es su nombre; en una sentencia no se sabe
+    # qué bind va a qué columna, así que se ocultan todos
+    mask_all = (sql.upper().startswith(SENSITIVE_PROCEDURES)
+                or any(word in sql.lower() for word in SENSITIVE_WORDS))
+
+    def safe(name, value):
+        if mask_all or (name and any(word in name.lower() for word in SENSITIVE_WORDS)):
+            return '***'
+        return value if log_values else _describe(value)
+
+    if isinstance(params, dict):
+        return {name: safe(name, value) for name, value in params.items()}
+    return [safe(None, value) for value in params]
+
+
+def _capture_plan():
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(PLAN_SQL)
+            return [row[0] for row in cursor.fetchall() if row[0] is not None]
+    except Exception as e:
+        logger.debug(f"Execution plan not available: {e}")
+        return None
+
+
+def record(kind, sql, params, elapsed_ms, rows):
+    """Store one slow statement. Never raises."""
+    try:
+        entry = {
+            'ts': datetime.now().isoformat(timespec='seconds'),
+            'kind': kind,
+            'sql': ' '.join(sql.split()),
+            'binds': _safe_binds(sql, params),
+            'ms': round(elapsed_ms, 1),
+            'rows': rows,
+        }
+        if kind in PLAN_KINDS and getattr(settings, 'SLOW_QUERY_CAPTURE_PLAN', True):
+            entry['plan'] = _capture_plan()
+        _get_store().info(json.dumps(entry, default=str, ensure_ascii=False))
+    except Exception as e:
+        logger.warning(f"Could not record slow statement: {e}")
+
+
+def read_entries(path=None):
+    """Yield every stored entry, oldest backup first."""
+    path = path or log_path()
+    backups = getattr(settings, 'SLOW_QUERY_LOG_BACKUPS', 3)
+    files = [f"{path}.{n}" for n in range(backups, 0, -1)] + [path]
+    for name in files:
+        if not os.path.exists(name):
+            continue
+        with open(name, encoding='utf-8') as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
@@ -0,0 +1,98 @@
+"""
+Streaming JSON responses for large list endpoints.
+
+`streaming_json_response` runs the query up front, so SQL errors still reach
+the view's try/except and become a normal 500. Then it hands Django a
+generator that pulls rows with `fetchmany` and writes the JSON array in
+chunks, one chunk per batch. The full result is never held in memory (not
+as rows and not as a rendered body), and the first bytes go out as soon as
+the first batch is fetched.
+
+The Django cursor stays open until the response is closed. If the client
+disconnects, the generator's `finally` closes it. An error after the first
+byte can no longer change the status code; it is logged and the array is
+left unterminated.
+"""
+import json
+import logging
+
+from django.db import connection
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.db import ROWS_DICT, ROWS_TUPLE, LIST_ARRAYSIZE, native_cursor
+from core.instrumentation import track
+
+logger = logging.getLogger(__name__)
+
+
+class RowStream:
+    """Executed query whose rows are consumed batch by batch with fetchmany."""
+
+    def __init__(self, query, params=None, mode=ROWS_DICT, chunk_size=LIST_ARRAYSIZE):
+        if mode not in (ROWS_DICT, ROWS_TUPLE):
+            raise ValueError(f"Unsupported streaming mode: {mode}")
+        self.chunk_size = chunk_size
+        self._cursor = connection.cursor()
+        try:
+            # Solo se mide la ejecución y el primer lote: el resto se lee
+            # mientras se envía la respuesta, ya fuera de la petición
+            with track('stream', query, params) as probe:
+                native = native_cursor(self._cursor)
+                native.arraysize = chunk_size
+                self._cursor.execute(query, params if params else [])
+                if mode == ROWS_DICT:
+                    columns = [col[0].lower() for col in native.description]
+                    native.rowfactory = lambda *row: dict(zip(columns, row))
+                self._native = native
+                # El primer lote se lee aquí para que un error llegue a la vista
+                self._first = probe.fetched(native.fetchmany(chunk_size))
+        except Exception:
+            self._cursor.close()
+            raise
+
+    def batches(self):
+        try:
+            batch = self._first
+            self._first = None
+            while batch:
+                yield batch
+                batch = self._native.fetchmany(self.chunk_size)
+        finally:
+            self._cursor.close()
+
+
+def _encode(value):
+    return json.dumps(value, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+
+
+def iter_json_array(rows, row_builder=None):
+    """Yield the JSON encoding of every row of `rows` as one array, chunk by chunk."""
+    yield b'['
+    first = True
+    try:
+        for batch in rows.batches():
+            items = batch if row_builder is None else map(row_builder, batch)
+            chunk = ','.join(_encode(item) for item in items)
+            if not chunk:
+                continue
+            yield (chunk if first else ',' + chunk).encode('utf-8')
+            first = False
+    except Exception as e:
+        logger.error(f"Error streaming rows: {e}")
+        return
+    yield b']'
+
+
+def streaming_json_response(query, params=None, row_builder=None, mode=ROWS_DICT,
+                            chunk_size=LIST_ARRAYSIZE, status=200):
+    """
+    Returns a StreamingHttpResponse with the rows of `query` as a JSON array.
+    `row_builder` (optional) maps each fetched row to the object to emit.
+    """
+    rows = RowStream(query, params, mode=mode, chunk_size=chunk_size)
+    return StreamingHttpResponse(
+        iter_json_array(rows, row_builder),
+        content_type='application/json',
+        status=status,
+    )
@@ -0,0 +1,139 @@
+"""
+Full rebuilds of the summary tables (created in scripts/RedRomero_Objects.sql,
+loaded by scripts/RedRomero_Summaries.sql).
+
+The finance summaries are kept current by row triggers, the donation rollup
+by the donation procedures of PKG_FINANCE_CORE, and the KPI snapshots by
+both plus a daily job. The statements here recompute them from the base
+tables (for the KPI snapshots, only the current month). Use them after
+loading rows straight into the base tables (the rollup does not see those),
+after a restore, or whenever a summary is suspected of drift
+(`python manage.py rebuild_summaries`).
+Each summary is rebuilt in one transaction, so readers see either the old
+totals or the new ones, and the versions of its tables are bumped so cached
+results built on them are dropped (core/cache.py).
+"""
+import logging
+import time
+
+from django.db import connection, transaction
+
+from core.cache import bump_tables
+
+logger = logging.getLogger(__name__)
+
+# nombre -> (tablas que reescribe, sentencias); mismas consultas que las
+# secciones 3, 5.2 y 6.4 del script SQL
+SUMMARIES = {
+    'project_finance': (('Project_Finance_Summary',), [
+        "DELETE FROM Project_Finance_Summary",
+        """
+        INSERT INTO Project_Finance_Summary (project_id, budget_count, total_budget, donation_count, total_received)
+        SELECT
+          p.project_id,
+          NVL(b.budget_count, 0),
+          NVL(b.total_budget, 0),
+          NVL(d.donation_count, 0),
+          NVL(d.total_received, 0)
+        FROM Project p
+        LEFT JOIN (
+          SELECT project_id, COUNT(*) AS budget_count, SUM(initial_amount) AS total_budget
+          FROM Budget GROUP BY project_id
+        ) b ON p.project_id = b.project_id
+        LEFT JOIN (
+          SELECT project_id, COUNT(*) AS donation_count, SUM(amount) AS total_received
+          FROM Donation GROUP BY project_id
+        ) d ON p.project_id = d.project_id
+        """,
+    ]),
+    'ngo_donors': (('NGO_Donor_Summary',), [
+        "DELETE FROM NGO_Donor_Summary",
+        """
+        INSERT INTO NGO_Donor_Summary (ong_id, donor_id, donation_count)
+        SELECT p.ong_id, d.donor_id, COUNT(*)
+        FROM Donation d
+        JOIN Project p ON d.project_id = p.project_id
+        GROUP BY p.ong_id, d.donor_id
+        """,
+    ]),
+    'donation_rollup': (('Donation_Rollup', 'Donation_Donor_Rollup'), [
+        "DELETE FROM Donation_Rollup",
+        """
+        INSERT INTO Donation_Rollup (month_start, project_id, currency_id, donation_count, total_amount,
+                                     min_amount, max_amount)
+        SELECT TRUNC(donation_date, 'MM'), project_id, currency_id, COUNT(*), SUM(amount), MIN(amount), MAX(amount)
+        FROM Donation
+        GROUP BY TRUNC(donation_date, 'MM'), project_id, currency_id
+        """,
+        "DELETE FROM Donation_Donor_Rollup",
+        """
+        INSERT INTO Donation_Donor_Rollup (month_start, currency_id, donor_id, donation_count)
+        SELECT TRUNC(donation_date, 'MM'), currency_id, donor_id, COUNT(*)
+        FROM Donation
+        GROUP BY TRUNC(donation_date, 'MM'), currency_id, donor_id
+        """,
+    ]),
+    # Igual que PKG_DASHBOARD_ANALYTICS.refresh_kpi_snapshot (el job diario):
+    # recuenta el mes en curso; los meses cerrados son historia y no se tocan.
+    # Lee Donation_Rollup, así que va después de 'donation_rollup'.
+    'kpi_snapshot': (('Volunteer_Activity_Summary', 'KPI_Snapshot'), [
+        "DELETE FROM Volunteer_Activity_Summary",
+        """
+        INSERT INTO Volunteer_Activity_Summary (volunteer_id, active_assignments)
+        SELECT volunteer_id, COUNT(*) FROM Volunteer_Project WHERE status = 'A' GROUP BY volunteer_id
+        """,
+        "DELETE FROM KPI_Snapshot WHERE period_start = TRUNC(SYSDATE, 'MM') AND metric_name <> 'MONTHLY_DONATIONS'",
+        """
+        INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at)
+        SELECT 'ACTIVE_PROJECTS', TRUNC(SYSDATE, 'MM'), COUNT(*), SYSTIMESTAMP
+        FROM Project p JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        WHERE ps.status_name = 'ACTIVO'
+        UNION ALL
+        SELECT 'ACTIVE_VOLUNTEERS', TRUNC(SYSDATE, 'MM'), COUNT(*), SYSTIMESTAMP FROM Volunteer_Activity_Summary
+        UNION ALL
+        SELECT 'TOTAL_NGOS', TRUNC(SYSDATE, 'MM'), COUNT(*), SYSTIMESTAMP FROM NGO
+        """,
+        """
+        INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at)
+        SELECT e.metric_name, ADD_MONTHS(TRUNC(SYSDATE, 'MM'), -1), e.metric_value, SYSTIMESTAMP
+        FROM (
+            SELECT 'ACTIVE_PROJECTS' AS metric_name, COUNT(*) AS metric_value
+            FROM Project p JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            WHERE ps.status_name = 'ACTIVO' AND p.start_date < TRUNC(SYSDATE, 'MM')
+            UNION ALL
+            SELECT 'ACTIVE_VOLUNTEERS', COUNT(DISTINCT volunteer_id)
+            FROM Volunteer_Project WHERE status = 'A' AND assignment_date < TRUNC(SYSDATE, 'MM')
+            UNION ALL
+            SELECT 'TOTAL_NGOS', COUNT(*) FROM NGO
+        ) e
+        WHERE NOT EXISTS (SELECT 1 FROM KPI_Snapshot k
+                          WHERE k.metric_name = e.metric_name AND k.period_start < TRUNC(SYSDATE, 'MM'))
+        """,
+        "DELETE FROM KPI_Snapshot WHERE metric_name = 'MONTHLY_DONATIONS'",
+        """
+        INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at)
+        SELECT 'MONTHLY_DONATIONS', month_start, SUM(total_amount), SYSTIMESTAMP
+        FROM Donation_Rollup GROUP BY month_start
+        """,
+    ]),
+}
+
+
+def rebuild(names=None, log=None):
+    """Recompute the named summaries (all by default); returns {name: rows written}."""
+    log = log or logger.info
+    unknown = set(names or ()) - set(SUMMARIES)
+    if unknown:
+        raise ValueError(f"Unknown summaries: {', '.join(sorted(unknown))} (known: {', '.join(SUMMARIES)})")
+
+    written = {}
+    for name in names or SUMMARIES:
+        tables, statements = SUMMARIES[name]
+        start = time.monotonic()
+        with transaction.atomic(), connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+            written[name] = cursor.rowcount
+        bump_tables(*tables)
+        log(f"{name}: {written[name]} rows in {time.monotonic() - start:.1f}s")
+    return written
@@ -0,0 +1,107 @@
+"""
+Stale-while-revalidate cache for dashboard payloads.
+
+`get_or_refresh` returns the cached payload straight away. The payload goes
+stale when it is older than the soft TTL or when one of the tables it was
+built from has been written (see core/cache.py). A stale payload is still
+served, and a background thread recomputes it. Only a missing entry (first
+request, or nothing computed within the hard TTL) makes the caller wait.
+
+Refreshes are coalesced: a `cache.add` lock (shared by every worker when the
+cache backend is shared) lets a single thread recompute a given payload,
+while everyone else keeps getting the stale copy. Cold misses are coalesced
+per process through a fixed set of striped locks, so the number of payload
+names never grows memory.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from core import metrics
+from core.cache import table_versions
+
+logger = logging.getLogger(__name__)
+
+ENTRY_KEY = 'swr:{}'
+LOCK_KEY = 'swr-lock:{}'
+
+# Si un refresco muere sin liberar el lock, expira solo
+REFRESH_LOCK_SECONDS = 60
+
+_refresher = None
+_refresher_lock = threading.Lock()
+# Locks de arranque en frío: nombre -> hash(nombre) % COLD_LOCK_STRIPES. Dos
+# nombres pueden compartir lock; solo se espera de más en un miss. RLock: un
+# compute que pida otro payload del mismo lock no se bloquea a sí mismo.
+COLD_LOCK_STRIPES = 64
+_cold_locks = [threading.RLock() for _ in range(COLD_LOCK_STRIPES)]
+
+
+def _get_refresher():
+    global _refresher
+    if _refresher is None:
+        with _refresher_lock:
+            if _refresher is None:
+                # Pool propio: un refresco puede usar run_concurrently y no debe
+                # ocupar los hilos del executor de fan-out
+                _refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix='swr-refresh')
+    return _refresher
+
+
+def _cold_lock(name):
+    return _cold_locks[hash(name) % COLD_LOCK_STRIPES]
+
+
+def _store(name, compute, tables, hard_ttl):
+    # Versiones leídas ANTES de calcular: una escritura concurrente deja el
+    # payload marcado como viejo y provoca otro refresco
+    versions = table_versions(tables) if tables else {}
+    payload = compute()
+    cache.set(ENTRY_KEY.format(name), (payload, time.time(), versions), hard_ttl)
+    return payload
+
+
+def _refresh(name, compute, tables, hard_ttl):
+    try:
+        _store(name, compute, tables, hard_ttl)
+    except Exception as e:
+        logger.error(f"Background refresh of {name} failed: {e}")
+    finally:
+        cache.delete(LOCK_KEY.format(name))
+        # Devuelve al pool la sesión usada por este hilo
+        connections.close_all()
+
+
+def get_or_refresh(name, compute, tables=(), soft_ttl=None, hard_ttl=None):
+    """
+    Return the payload cached under `name`, computing it with `compute()`
+    (a zero-argument callable) when missing and refreshing it in the
+    background once stale. `tables` are the tables the payload is built from.
+    """
+    if not getattr(settings, 'DASHBOARD_SWR', True):
+        return compute()
+    soft_ttl = settings.DASHBOARD_SOFT_TTL if soft_ttl is None else soft_ttl
+    hard_ttl = settings.DASHBOARD_HARD_TTL if hard_ttl is None else hard_ttl
+
+    entry = cache.get(ENTRY_KEY.format(name))
+    if entry is None:
+        metrics.cache_lookup('swr', 'miss')
+        with _cold_lock(name):
+            # Otro hilo pudo calcularlo mientras esperábamos
+            entry = cache.get(ENTRY_KEY.format(name))
+            if entry is None:
+                return _store(name, compute, tables, hard_ttl)
+
+    payload, computed_at, versions = entry
+    stale = time.time() - computed_at >= soft_ttl
+    if not stale and tables:
+        stale = table_versions(tables) != versions
+    metrics.cache_lookup('swr', 'stale' if stale else 'hit')
+    if stale and cache.add(LOCK_KEY.format(name), 1, REFRESH_LOCK_SECONDS):
+        _get_refresher().submit(_refresh, name, compute, tables, hard_ttl)
+    return payload
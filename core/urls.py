@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import DatabasePoolStatsView, metrics_view
+
+urlpatterns = [
+    # Diagnóstico de infraestructura
+    path('api/admin/db-pool/', DatabasePoolStatsView.as_view(), name='db_pool_stats'),
+    # Prometheus
+    path('metrics', metrics_view, name='metrics'),
+]
@@ -0,0 +1,52 @@
+import hmac
+import ipaddress
+import logging
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+
+from . import metrics
+from .pool import pool_stats
+
+logger = logging.getLogger(__name__)
+
+
+class DatabasePoolStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Pool utilization (busy, open, waits) for this worker process."""
+        if request.user.user_role != 'ADMIN':
+            return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
+        try:
+            return Response(pool_stats(), status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Error reading pool stats: {e}")
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _internal_address(addr):
+    try:
+        ip = ipaddress.ip_address(addr)
+    except ValueError:
+        return False
+    return any(ip in ipaddress.ip_network(net) for net in settings.METRICS_ALLOWED_NETWORKS)
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint (all worker processes, see core/metrics.py).
+
+    With METRICS_TOKEN it requires that Bearer token; without it only
+    addresses in METRICS_ALLOWED_NETWORKS (loopback by default) may scrape.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return HttpResponse(status=401)
+    elif not _internal_address(request.META.get('REMOTE_ADDR', '')):
+        return HttpResponse(status=403)
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
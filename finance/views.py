@@ -5,65 +5,20 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from django.db import connection
-import oracledb
+from core.db import (
+    ROWS_TUPLE, LIST_ARRAYSIZE,
+    fetch_raw_query, execute_procedure_native,
+)
+from core.pagination import KeysetPage, InvalidCursor, and_where
+from core.streaming import streaming_json_response
+from core.cache import bump_tables
+from core.querycache import cached_query, cached_view_query, VIEW_TABLES
+from core.swr import get_or_refresh
+from core import refdata
+from users.principal import representative_ngo
 
 logger = logging.getLogger(__name__)
 
-# --- UTILS ---
-def fetch_raw_query(query, params=None):
-    """Para consultas SELECT simples usamos el cursor normal de Django."""
-    with connection.cursor() as cursor:
-        cursor.execute(query, params if params else [])
-        columns = [col[0].lower() for col in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-def execute_procedure_native(proc_name, params, out_param_index=None, out_param_type=oracledb.NUMBER):
-    """
-    Ejecuta un procedimiento almacenado usando un cursor 100% nativo de Oracle
-    para evitar conflictos de tipos con Django (DPY-3002).
-    """
-    # 1. Aseguramos que Django haya abierto la conexión
-    if connection.connection is None:
-        connection.connect()
-        
-    # 2. Obtenemos la conexión cruda (Raw Connection)
-    native_conn = connection.connection
-    
-    # 3. Creamos un cursor nativo nuevo
-    native_cursor = native_conn.cursor()
-    
-    try:
-        # Preparar argumentos
-        final_params = list(params)
-        out_var = None
-
-        # Si hay un parámetro de salida, lo creamos con el cursor nativo
-        if out_param_index is not None:
-            out_var = native_cursor.var(out_param_type)
-            # Insertamos la variable en la posición correcta (o al final si index es -1)
-            if out_param_index == -1:
-                final_params.append(out_var)
-            else:
-                final_params.insert(out_param_index, out_var)
-
-        # Ejecutar
-        native_cursor.callproc(proc_name, final_params)
-        
-        # Retornar valor si existe
-        if out_var:
-            return out_var.getvalue()
-        return None
-    
-    except Exception as e:
-        # Si algo falla, hacemos rollback por seguridad
-        try: native_conn.rollback() 
-        except: pass
-        raise e # Re-lanzamos el error para que lo capture la vista
-
-    finally:
-        # Cerramos el cursor nativo para no dejar fugas
-        native_cursor.close()
-
 # ==============================================================================
 #  MÓDULO 1: GESTIÓN FINANCIERA (PKG_FINANCE_CORE)
 # ==============================================================================
@@ -75,8 +30,7 @@ class DonorTypesView(APIView):
     def get(self, request):
         """Obtener lista de tipos de donantes para dropdowns"""
         try:
-            sql = "SELECT type_id, type_name as name FROM Donor_Type ORDER BY type_id ASC"
-            data = fetch_raw_query(sql)
+            data = [{'type_id': row['id'], 'name': row['name']} for row in refdata.get('donor_types')]
             return Response(data, status=200)
         except Exception as e:
             logger.error(f"Error fetching donor types: {e}")
@@ -109,7 +63,7 @@ class DonorManagementView(APIView):
             logger.error(f"Error registering donor: {e}")
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     def get(self, request):
-        """Listar todos los donantes."""
+        """Listar todos los donantes (respuesta en streaming, lote a lote)."""
         try:
             # Puedes usar una vista de Oracle si la tienes, o query directa
             query = """
@@ -119,8 +73,7 @@ class DonorManagementView(APIView):
                 JOIN Donor_Type dt ON d.type_id = dt.type_id
                 ORDER BY d.donor_id DESC
             """
-            data = fetch_raw_query(query)
-            return Response(data, status=200)
+            return streaming_json_response(query)
         except Exception as e:
             return Response({'error': str(e)}, status=500)
     def put(self, request):
@@ -168,7 +121,22 @@ class DonationTransactionView(APIView):
             return Response({'error': str(e)}, status=500)
     
     def get(self, request):
-        """Listar historial de donaciones. Filtra por ONG si el usuario es representante."""
+        """
+        Listar historial de donaciones (paginado por cursor sobre fecha/id).
+        Filtra por ONG si el usuario es representante y por ?project_id= si se envía.
+        """
+        try:
+            page = KeysetPage(request, 'dn.donation_date', 'dn.donation_id')
+        except InvalidCursor as e:
+            return Response({'error': str(e)}, status=400)
+
+        project_id = request.query_params.get('project_id')
+        if project_id:
+            try:
+                project_id = int(project_id)
+            except ValueError:
+                return Response({'error': 'project_id must be an integer'}, status=400)
+
         try:
             user = request.user
             # Query nativa uniendo tablas para obtener nombres
@@ -196,11 +164,19 @@ class DonationTransactionView(APIView):
                     WHERE r.representative_id = %s
                 """
                 params.append(user.representative_id)
-            
-            query += " ORDER BY dn.donation_date DESC"
-            
-            data = fetch_raw_query(query, params if params else None)
-            return Response(data, status=200)
+
+            if project_id:
+                query = and_where(query, "dn.project_id = %s")
+                params.append(project_id)
+
+            # La página recorre idx_donation_date_currency desde el cursor
+            keyset_sql, keyset_params = page.where()
+            query = and_where(query, keyset_sql) + page.order_and_limit()
+            params += keyset_params + page.limit_params()
+
+            data = fetch_raw_query(query, params, arraysize=LIST_ARRAYSIZE)
+            data = page.trim(data, key=lambda row: (row['donation_date'], row['donation_id']))
+            return Response(page.envelope(data), status=200)
         except Exception as e:
             logger.error(f"Error fetching donations: {e}")
             import traceback
@@ -216,10 +192,11 @@ class BudgetManagementView(APIView):
             if project_id:
                 # Usamos la vista SQL que creamos
                 sql = "SELECT * FROM vw_project_budget_status WHERE project_id = %s"
-                data = fetch_raw_query(sql, [project_id])
+                data = cached_view_query('vw_project_budget_status', sql, [project_id])
             else:
-                sql = "SELECT DISTINCT project_id, project_name FROM vw_project_budget_status ORDER BY project_name"
-                data = fetch_raw_query(sql)
+                # La vista devuelve todos los proyectos: basta con Project
+                sql = "SELECT project_id, name AS project_name FROM Project ORDER BY name"
+                data = cached_query(sql, tables=('Project',))
             return Response(data, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({'error': str(e)}, status=500)
@@ -320,7 +297,12 @@ class ProjectReportsView(APIView):
             return Response({'error': str(e)}, status=500)
     
     def get(self, request):
-        """Listar reportes de proyectos con JOIN a la tabla de proyectos. Filtra por ONG si el usuario es representante."""
+        """Listar reportes de proyectos (paginado por cursor). Filtra por ONG si el usuario es representante."""
+        try:
+            page = KeysetPage(request, 'r.report_date', 'r.report_id')
+        except InvalidCursor as e:
+            return Response({'error': str(e)}, status=400)
+
         try:
             user = request.user
             # Usamos alias (AS) para evitar confusiones con los nombres de columnas
@@ -332,7 +314,8 @@ class ProjectReportsView(APIView):
                     r.description, 
                     p.name as project_name,
                     p.project_id,
-                    TO_CHAR(r.report_date, 'YYYY-MM-DD') as date_str
+                    TO_CHAR(r.report_date, 'YYYY-MM-DD') as date_str,
+                    r.report_date
                 FROM Report r
                 JOIN Project p ON r.project_id = p.project_id
             """
@@ -346,25 +329,28 @@ class ProjectReportsView(APIView):
                 """
                 params.append(user.representative_id)
             
-            query += " ORDER BY r.report_date DESC"
+            keyset_sql, keyset_params = page.where()
+            query = and_where(query, keyset_sql) + page.order_and_limit()
+            params += keyset_params + page.limit_params()
             
-            # Ejecutamos la consulta cruda
-            # fetch_raw_query devuelve una lista de diccionarios con claves en minúsculas
-            raw_data = fetch_raw_query(query, params if params else None)
+            # Ejecutamos la consulta cruda en modo tupla (orden del SELECT),
+            # así no se crea un diccionario intermedio por fila
+            raw_data = fetch_raw_query(query, params, mode=ROWS_TUPLE, arraysize=LIST_ARRAYSIZE)
+            raw_data = page.trim(raw_data, key=lambda row: (row[6], row[0]))
             
             # Formateamos la respuesta para que coincida EXACTAMENTE con lo que espera React
             response_data = []
-            for row in raw_data:
+            for report_id, title, description, project_name, _project_id, date_str, _report_date in raw_data:
                 response_data.append({
-                    "id": row.get('report_id'),      # Coincide con r.report_id
-                    "title": row.get('title'),       # Coincide con r.title
-                    "project": row.get('project_name'), # Coincide con p.name as project_name
-                    "description": row.get('description'),
-                    "date": row.get('date_str'),     # Coincide con as date_str
+                    "id": report_id,
+                    "title": title,
+                    "project": project_name,
+                    "description": description,
+                    "date": date_str,
                     "status": "Approved"             # Valor quemado (hardcoded) ya que la tabla no tiene status
                 })
 
-            return Response(response_data, status=200)
+            return Response(page.envelope(response_data), status=200)
         except Exception as e:
             logger.error(f"Error fetching reports: {e}")
             return Response({'error': str(e)}, status=500)
@@ -376,20 +362,45 @@ class ProjectReportsView(APIView):
 class AuditLogsView(APIView):
     permission_classes = [IsAuthenticated]
 
+    # type -> (vista, columna fecha, columna id); None = no es un feed por fecha
+    FEEDS = {
+        'approvals': ("vw_approval_workflow_status", 'approval_date', 'approval_id'),
+        'projects': ("vw_project_status_transitions", 'change_date', 'status_history_id'),
+        'finance': ("vw_ngo_financial_overview", None, None),
+    }
+    # type -> columna de ?status= (p. ej. las aprobaciones PENDIENTE del dashboard)
+    STATUS_COLUMNS = {
+        'approvals': 'approval_status',
+    }
+
     def get(self, request):
         log_type = request.query_params.get('type') 
-        query_map = {
-            'approvals': "SELECT * FROM vw_approval_workflow_status ORDER BY approval_date DESC",
-            'projects': "SELECT * FROM vw_project_status_transitions ORDER BY change_date DESC",
-            'finance': "SELECT * FROM vw_ngo_financial_overview"
-        }
-        
-        if log_type not in query_map:
+        if log_type not in self.FEEDS:
             return Response({'error': 'Invalid type'}, status=400)
 
+        view_name, date_column, id_column = self.FEEDS[log_type]
+
         try:
-            data = fetch_raw_query(query_map[log_type])
-            return Response(data, status=200)
+            if date_column is None:
+                data = fetch_raw_query(f"SELECT * FROM {view_name}", arraysize=LIST_ARRAYSIZE)
+                return Response({'results': data, 'next': None}, status=200)
+
+            try:
+                page = KeysetPage(request, date_column, id_column)
+            except InvalidCursor as e:
+                return Response({'error': str(e)}, status=400)
+
+            query, params = f"SELECT * FROM {view_name}", []
+            status_filter = request.query_params.get('status')
+            if status_filter and log_type in self.STATUS_COLUMNS:
+                query = and_where(query, f"{self.STATUS_COLUMNS[log_type]} = %s")
+                params.append(status_filter)
+
+            keyset_sql, keyset_params = page.where()
+            query = and_where(query, keyset_sql) + page.order_and_limit()
+            data = fetch_raw_query(query, params + keyset_params + page.limit_params(), arraysize=LIST_ARRAYSIZE)
+            data = page.trim(data, key=lambda row: (row[date_column], row[id_column]))
+            return Response(page.envelope(data), status=200)
         except Exception as e:
             return Response({'error': str(e)}, status=500)
 
@@ -398,10 +409,17 @@ class FinancialKPIView(APIView):
 
     def get(self, request):
         try:
-            data = fetch_raw_query("SELECT * FROM vw_ngo_financial_overview")
-            return Response(data[0] if data else {}, status=200)
+            data = get_or_refresh(
+                'financial_kpis', self.build_payload,
+                tables=VIEW_TABLES['vw_ngo_financial_overview']
+            )
+            return Response(data, status=200)
         except Exception as e:
             return Response({'error': str(e)}, status=500)
+
+    def build_payload(self):
+        data = cached_view_query('vw_ngo_financial_overview', "SELECT * FROM vw_ngo_financial_overview")
+        return data[0] if data else {}
         
 
 
@@ -419,21 +437,12 @@ class SystemConfigView(APIView):
         config_type = request.query_params.get('type')
         try:
             data = []
+            # Datos de referencia en memoria (core.refdata), ya con los alias del Frontend
             if config_type == 'currencies':
-                # Mapeamos columnas para que coincidan con lo que espera el Frontend (id, name, code, etc.)
-                sql = """
-                    SELECT currency_id as id, currency_name as name, 
-                           currency_code as code, symbol, exchange_rate_to_usd as rate 
-                    FROM Currency ORDER BY currency_id ASC
-                """
-                data = fetch_raw_query(sql)
+                data = refdata.get('currencies')
             
             elif config_type == 'donorTypes':
-                sql = """
-                    SELECT type_id as id, type_name as name, description 
-                    FROM Donor_Type ORDER BY type_id ASC
-                """
-                data = fetch_raw_query(sql)
+                data = refdata.get('donor_types')
             
             # Aquí puedes agregar más 'elif' para Categories, Specialties, etc. cuando tengas las tablas.
             
@@ -494,10 +503,12 @@ class SystemConfigView(APIView):
             if config_type == 'currencies':
                 with connection.cursor() as cursor:
                     cursor.execute("DELETE FROM Currency WHERE currency_id = %s", [item_id])
+                bump_tables('Currency')
             
             elif config_type == 'donorTypes':
                 with connection.cursor() as cursor:
                     cursor.execute("DELETE FROM Donor_Type WHERE type_id = %s", [item_id])
+                bump_tables('Donor_Type')
             
             else:
                 return Response({'error': 'Delete not supported for this type'}, status=400)
@@ -528,7 +539,7 @@ class ReportsAnalyticsView(APIView):
                     FROM vw_project_budget_status
                     ORDER BY budget_utilization_percent DESC
                 """
-                data = fetch_raw_query(sql)
+                data = cached_view_query('vw_project_budget_status', sql)
 
             elif report_type == 'donor_ranking':
                 # Ranking de donantes
@@ -538,7 +549,7 @@ class ReportsAnalyticsView(APIView):
                     FROM vw_donor_contributions_ranking
                     WHERE ROWNUM <= 10
                 """
-                data = fetch_raw_query(sql)
+                data = cached_view_query('vw_donor_contributions_ranking', sql)
 
             elif report_type == 'currency_trends':
                 # Tendencias por moneda
@@ -546,7 +557,7 @@ class ReportsAnalyticsView(APIView):
                     SELECT currency_code, total_donations_local, donation_count
                     FROM vw_donation_trends_by_currency
                 """
-                data = fetch_raw_query(sql)
+                data = cached_view_query('vw_donation_trends_by_currency', sql)
             
             else:
                 # Si no se envía tipo, devolvemos un resumen general (opcional)
@@ -571,13 +582,10 @@ class RepresentativeNGOView(APIView):
              return Response({'error': 'User has no representative_id linked'}, 404)
 
         try:
-            with connection.cursor() as cursor:
-                # 1. Obtener ID de la ONG
-                cursor.execute("SELECT ong_id FROM Representative WHERE representative_id = %s", [user.representative_id])
-                row = cursor.fetchone()
-                if not row or not row[0]:
-                    return Response({'error': 'Representative is not linked to any NGO'}, 404)
-                ong_id = row[0]
+            # 1. ID de la ONG (contexto del representante, cacheado)
+            ong_id = representative_ngo(user.representative_id)
+            if not ong_id:
+                return Response({'error': 'Representative is not linked to any NGO'}, 404)
 
             # 2. Datos Generales
             # CORRECCIÓN: Se eliminaron las columnas 'address', 'phone' y 'registration_date' de la consulta
@@ -0,0 +1,22 @@
+import React from 'react';
+import { Box, Button, CircularProgress } from '@mui/material';
+
+/**
+ * "Load more" for cursor-paginated lists; renders nothing once the feed is exhausted.
+ */
+export default function LoadMoreButton({ hasMore, loading, onClick, label = 'Load more', color = '#FF3F01' }) {
+    if (!hasMore) return null;
+    return (
+        <Box sx={{ display: 'flex', justifyContent: 'center', py: 2 }}>
+            <Button
+                variant="outlined"
+                onClick={onClick}
+                disabled={loading}
+                startIcon={loading ? <CircularProgress size={16} sx={{ color }} /> : null}
+                sx={{ color, borderColor: color, fontWeight: 600, textTransform: 'none', '&:hover': { borderColor: color } }}
+            >
+                {label}
+            </Button>
+        </Box>
+    );
+}
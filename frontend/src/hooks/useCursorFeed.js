@@ -0,0 +1,57 @@
+import { useState, useEffect, useCallback } from 'react';
+import { fetchPage } from '../utils/pagination';
+
+const authConfig = () => ({
+    headers: { Authorization: `Bearer ${localStorage.getItem('token')}` }
+});
+
+/**
+ * Custom hook for a cursor-paginated feed: loads the first page on mount and
+ * the following ones on demand, so a screen never crawls the whole feed.
+ * @param {string|null} url - Feed URL (filters included); null skips the fetch.
+ * @returns {{ items, hasMore, loading, loadingMore, error, loadMore, reload }}
+ */
+export const useCursorFeed = (url) => {
+    const [items, setItems] = useState([]);
+    const [next, setNext] = useState(null);
+    const [loading, setLoading] = useState(Boolean(url));
+    const [loadingMore, setLoadingMore] = useState(false);
+    const [error, setError] = useState(null);
+
+    const reload = useCallback(async () => {
+        if (!url) return;
+        setLoading(true);
+        try {
+            const page = await fetchPage(url, null, authConfig());
+            setItems(page.results);
+            setNext(page.next);
+            setError(null);
+        } catch (err) {
+            console.error(`Error fetching ${url}:`, err);
+            setError(err);
+        } finally {
+            setLoading(false);
+        }
+    }, [url]);
+
+    const loadMore = useCallback(async () => {
+        if (!url || !next || loadingMore) return;
+        setLoadingMore(true);
+        try {
+            const page = await fetchPage(url, next, authConfig());
+            setItems(prev => prev.concat(page.results));
+            setNext(page.next);
+        } catch (err) {
+            console.error(`Error fetching more of ${url}:`, err);
+            setError(err);
+        } finally {
+            setLoadingMore(false);
+        }
+    }, [url, next, loadingMore]);
+
+    useEffect(() => {
+        reload();
+    }, [reload]);
+
+    return { items, hasMore: Boolean(next), loading, loadingMore, error, loadMore, reload };
+};
@@ -1,5 +1,7 @@
 import React, { useState, useEffect } from "react";
 import axios from "axios";
+import { fetchPage } from "../utils/pagination";
+import LoadMoreButton from "../components/common/LoadMoreButton";
 import {
     Dialog,
     DialogTitle,
@@ -46,6 +48,9 @@ const ProjectDetailsModal = ({ open, onClose, project }) => {
     const [formData, setFormData] = useState({});
     const [loadingDetails, setLoadingDetails] = useState(false);
     const [projectDetails, setProjectDetails] = useState(null);
+    // Cursor de la siguiente página de donaciones (null = no hay más)
+    const [donationsNext, setDonationsNext] = useState(null);
+    const [loadingMoreDonations, setLoadingMoreDonations] = useState(false);
 
     useEffect(() => {
         if (project && open) {
@@ -72,6 +77,39 @@ const ProjectDetailsModal = ({ open, onClose, project }) => {
         }
     }, [project, open]);
 
+    const donationsUrl = (projectId) => `http://127.0.0.1:8000/api/finance/donations/?project_id=${projectId}`;
+
+    const toBreakdownRow = (d) => ({
+        item: `Donation from ${d.donor_name || 'Anonymous'}`,
+        date: d.donation_date || d.date || 'N/A',
+        currency: d.currency || d.currency_code || 'USD',
+        amount: `$${parseFloat(d.amount || 0).toLocaleString()}`
+    });
+
+    // Siguiente página de donaciones, a petición del usuario
+    const loadMoreDonations = async () => {
+        const projectId = project?.id || project?.project_id;
+        if (!projectId || !donationsNext) return;
+        const token = localStorage.getItem('token');
+
+        setLoadingMoreDonations(true);
+        try {
+            const page = await fetchPage(donationsUrl(projectId), donationsNext, {
+                headers: { Authorization: `Bearer ${token}` }
+            });
+            setProjectDetails(prev => ({
+                ...prev,
+                donations: [...(prev?.donations || []), ...page.results],
+                budgetBreakdown: [...(prev?.budgetBreakdown || []), ...page.results.map(toBreakdownRow)]
+            }));
+            setDonationsNext(page.next);
+        } catch (error) {
+            console.error("Error fetching more donations:", error);
+        } finally {
+            setLoadingMoreDonations(false);
+        }
+    };
+
     const fetchProjectDetails = async () => {
         const projectId = project?.id || project?.project_id;
         if (!projectId) return;
@@ -81,6 +119,7 @@ const ProjectDetailsModal = ({ open, onClose, project }) => {
 
         try {
             setLoadingDetails(true);
+            setDonationsNext(null);
             
             if (isVolunteer) {
                 // For volunteers: fetch project-specific info (location, specialties, team)
@@ -114,18 +153,24 @@ const ProjectDetailsModal = ({ open, onClose, project }) => {
                     });
                 }
             } else {
-                // For other roles: fetch approvals and donations
-                const [approvalsRes, donationsRes] = await Promise.all([
+                // For other roles: fetch approvals, the first page of donations
+                // and the project's totals (kept server-side, exact without
+                // loading every donation)
+                const [approvalsRes, donationsPage, budgetRes] = await Promise.all([
                     axios.get('http://127.0.0.1:8000/api/workflow/approvals/', {
                         headers: { Authorization: `Bearer ${token}` }
                     }).catch(() => ({ data: [] })),
-                    axios.get('http://127.0.0.1:8000/api/finance/donations/', {
+                    fetchPage(donationsUrl(projectId), null, {
+                        headers: { Authorization: `Bearer ${token}` }
+                    }).catch(() => ({ results: [], next: null })),
+                    axios.get(`http://127.0.0.1:8000/api/finance/budgets/?project_id=${projectId}`, {
                         headers: { Authorization: `Bearer ${token}` }
                     }).catch(() => ({ data: [] }))
                 ]);
 
                 const allApprovals = approvalsRes.data || [];
-                const allDonations = donationsRes.data || [];
+                const allDonations = donationsPage.results;
+                setDonationsNext(donationsPage.next);
 
                 // Filter by project_id
                 const approvals = allApprovals.filter(a => 
@@ -146,15 +191,12 @@ const ProjectDetailsModal = ({ open, onClose, project }) => {
                 }));
 
                 // Map donations to budget breakdown
-                const budgetBreakdown = donations.map(d => ({
-                    item: `Donation from ${d.donor_name || 'Anonymous'}`,
-                    date: d.donation_date || d.date || 'N/A',
-                    currency: d.currency || d.currency_code || 'USD',
-                    amount: `$${parseFloat(d.amount || 0).toLocaleString()}`
-                }));
+                const budgetBreakdown = donations.map(toBreakdownRow);
 
-                // Calculate total budget from donations or use placeholder
-                const totalDonations = donations.reduce((sum, d) => sum + parseFloat(d.amount || 0), 0);
+                // Total received for the whole project (vw_project_budget_status
+                // repeats it on each budget row) or use placeholder
+                const budgetRows = Array.isArray(budgetRes.data) ? budgetRes.data : [];
+                const totalDonations = parseFloat(budgetRows[0]?.total_received || 0);
                 const totalBudget = totalDonations > 0 
                     ? `$${totalDonations.toLocaleString()}`
                     : (project.goal || 'N/A');
@@ -574,6 +616,9 @@ const ProjectDetailsModal = ({ open, onClose, project }) => {
                                 </TableBody>
                             </Table>
                         </TableContainer>
+                        {!loadingDetails && (
+                            <LoadMoreButton hasMore={Boolean(donationsNext)} loading={loadingMoreDonations} onClick={loadMoreDonations} label="Load more donations" color={MAIN_ORANGE} />
+                        )}
                     </Box>
                 )}
             </DialogContent>
@@ -33,6 +33,7 @@ export default function AdminDashboard() {
     
     const [kpiData, setKpiData] = useState(initialKpiData);
     const [projectData, setProjectData] = useState([]);
+    const [projectTotal, setProjectTotal] = useState(0);
     const [chartData, setChartData] = useState({ trends: [], pie: [], totalProjects: 0 });
     const [loading, setLoading] = useState(true);
 
@@ -103,6 +104,7 @@ export default function AdminDashboard() {
             ]);
 
             setProjectData(data.active_projects_table || []);
+            setProjectTotal(data.total_project_count ?? (data.active_projects_table || []).length);
 
             // --- Cálculos para el estado de proyectos ---
             const pieRaw = Array.isArray(data.project_status_pie) ? data.project_status_pie : [];
@@ -249,7 +251,7 @@ export default function AdminDashboard() {
             {/* PROJECTS TABLE */}
             <Paper sx={{ p: 3, borderRadius: 3, boxShadow: 'none', border: '1px solid #E2E8F0' }}>
                 <Box display="flex" justifyContent="space-between" alignItems="center" mb={3}>
-                    <Typography variant="h5" fontWeight={700} color="#1E293B">Active Projects ({projectData.length})</Typography>
+                    <Typography variant="h5" fontWeight={700} color="#1E293B">Active Projects ({projectTotal})</Typography>
                     <Box display="flex" gap={1}>
                         <Button variant="outlined" startIcon={<FileDownload />} sx={{ textTransform: 'none', color: primaryColor, borderColor: primaryColor }}>Exportar CSV</Button>
                         <Button variant="contained" startIcon={<Add />} onClick={() => navigate('/admin/projects')} sx={{ bgcolor: primaryColor, '&:hover': { bgcolor: '#D93602' }, textTransform: 'none' }}>Nuevo</Button>
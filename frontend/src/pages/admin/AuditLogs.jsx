@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import axios from 'axios';
+import { fetchPage } from '../../utils/pagination';
 import { 
     Box, Typography, Paper, Table, TableBody, TableCell, TableContainer, 
     TableHead, TableRow, TextField, MenuItem, Button, Chip, 
@@ -20,6 +20,7 @@ const neutralTxt = '#6B7280';
 export default function AuditLogs() {
     const [activeTab, setActiveTab] = useState(0);
     const [auditData, setAuditData] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null); // Cursor de la siguiente página
     const [loading, setLoading] = useState(false);
     
     const [searchTerm, setSearchTerm] = useState('');
@@ -30,7 +31,7 @@ export default function AuditLogs() {
         fetchAuditLogs();
     }, [activeTab, dateRange.start, dateRange.end]);
 
-    const fetchAuditLogs = async () => {
+    const fetchAuditLogs = async (cursor = null) => {
         setLoading(true);
         const token = localStorage.getItem('token');
         
@@ -39,11 +40,12 @@ export default function AuditLogs() {
             if (dateRange.start) url += `&start_date=${dateRange.start}`;
             if (dateRange.end) url += `&end_date=${dateRange.end}`;
             
-            const response = await axios.get(url, {
+            const page = await fetchPage(url, cursor, {
                 headers: { Authorization: `Bearer ${token}` }
             });
             
-            setAuditData(response.data);
+            setAuditData(prev => (cursor ? [...prev, ...page.results] : page.results));
+            setNextCursor(page.next);
         } catch (error) {
             console.error("Error fetching audit logs:", error);
         } finally {
@@ -225,7 +227,7 @@ export default function AuditLogs() {
                             </TableRow>
                         </TableHead>
                         <TableBody>
-                            {loading ? (
+                            {loading && auditData.length === 0 ? (
                                 <TableRow>
                                     <TableCell colSpan={5} align="center" sx={{ py: 10 }}>
                                         <CircularProgress sx={{ color: primaryColor }} />
@@ -282,6 +284,12 @@ export default function AuditLogs() {
                     <Typography variant="caption" color="text.secondary">
                         Showing {getCurrentData().length} results
                     </Typography>
+                    {nextCursor && (
+                        <Button size="small" disabled={loading} onClick={() => fetchAuditLogs(nextCursor)}
+                            sx={{ color: primaryColor, textTransform: 'none', fontWeight: 700 }}>
+                            {loading ? 'Loading...' : 'Load more'}
+                        </Button>
+                    )}
                     <Pagination count={Math.ceil(getCurrentData().length / 10)} variant="outlined" shape="rounded" size="small" />
                 </Box>
             </Paper>
@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from "react";
-import axios from 'axios';
+import { fetchPage } from '../../utils/pagination';
 import {
   Box,
   Typography,
@@ -15,6 +15,7 @@ import {
   TableCell,
   TableContainer,
   Switch,
+  Button,
   CircularProgress // Importante importar esto
 } from "@mui/material";
 
@@ -26,21 +27,22 @@ export default function DonationsByProject() {
 
   const [rows, setRows] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null); // Cursor de la siguiente página
 
   // --- CARGA DE DATOS ---
   useEffect(() => {
     fetchDonations();
   }, []);
 
-  const fetchDonations = async () => {
+  const fetchDonations = async (cursor = null) => {
     const token = localStorage.getItem('token');
     try {
       setLoading(true);
-      const response = await axios.get('http://127.0.0.1:8000/api/finance/donations/', {
+      const page = await fetchPage('http://127.0.0.1:8000/api/finance/donations/', cursor, {
           headers: { Authorization: `Bearer ${token}` }
       });
       
-      const formattedData = response.data.map(item => ({
+      const formattedData = page.results.map(item => ({
           id: item.donation_id,
           donor: item.donor_name,
           project: item.project_name,
@@ -50,7 +52,8 @@ export default function DonationsByProject() {
           usd: `$${item.amount}` 
       }));
       
-      setRows(formattedData);
+      setRows(prev => (cursor ? [...prev, ...formattedData] : formattedData));
+      setNextCursor(page.next);
     } catch (error) {
       console.error("Error fetching donations:", error);
     } finally {
@@ -126,7 +129,7 @@ export default function DonationsByProject() {
           </TableHead>
 
           <TableBody>
-            {loading ? (
+            {loading && rows.length === 0 ? (
                 <TableRow>
                     <TableCell colSpan={5} align="center" sx={{ py: 3 }}>
                         <CircularProgress />
@@ -152,6 +155,14 @@ export default function DonationsByProject() {
           </TableBody>
         </Table>
       </TableContainer>
+
+      {nextCursor && (
+        <Box sx={{ display: "flex", justifyContent: "center", mt: 2 }}>
+          <Button variant="outlined" disabled={loading} onClick={() => fetchDonations(nextCursor)}>
+            {loading ? "Loading..." : "Load more"}
+          </Button>
+        </Box>
+      )}
     </Box>
   );
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
+import { fetchPage } from '../../utils/pagination';
 import { 
     Box, Typography, Grid, Paper, Button, Chip, LinearProgress, IconButton, CircularProgress
 } from '@mui/material';
@@ -64,12 +65,14 @@ export default function EmployeeDashboard() {
             const token = localStorage.getItem('token');
             setLoading(true);
             try {
-                // 1. Fetch Approvals (Auditoría)
-                const approvalsRes = await axios.get('http://127.0.0.1:8000/api/audit/logs/?type=approvals', {
+                // 1. Fetch Approvals (Auditoría): solo la primera página de las
+                // pendientes; si hay más, el KPI lo indica con "+"
+                const approvalsPage = await fetchPage('http://127.0.0.1:8000/api/audit/logs/?type=approvals&status=PENDIENTE', null, {
                     headers: { Authorization: `Bearer ${token}` }
                 });
 
-                const pending = approvalsRes.data.filter(item => item.approval_status === 'PENDIENTE');
+                const pending = approvalsPage.results;
+                const pendingLabel = `${pending.length}${approvalsPage.next ? '+' : ''}`;
                 const formattedApprovals = pending.map(item => ({
                     id: item.approval_id,
                     title: item.project_name || 'Sin Nombre',
@@ -101,7 +104,7 @@ export default function EmployeeDashboard() {
 
                 // 3. Update KPIs
                 setKpiValues(prev => prev.map(kpi => {
-                    if (kpi.id === 'pending') return { ...kpi, value: pending.length.toString() };
+                    if (kpi.id === 'pending') return { ...kpi, value: pendingLabel };
                     if (kpi.id === 'active') return { ...kpi, value: activeProjects.length.toString() };
                     return kpi;
                 }));
@@ -1,5 +1,7 @@
-import React, { useState, useEffect } from "react";
+import React, { useState } from "react";
 import axios from 'axios';
+import { useCursorFeed } from '../../hooks/useCursorFeed';
+import LoadMoreButton from '../../components/common/LoadMoreButton';
 import {
     Box,
     Typography,
@@ -29,51 +31,31 @@ export default function MyApprovals() {
     const [statusFilter, setStatusFilter] = useState("all");
     const [selected, setSelected] = useState(null);
     
-    // Estados para datos
-    const [requests, setRequests] = useState([]);
-    const [loading, setLoading] = useState(true);
     const [processing, setProcessing] = useState(false);
-    const [error, setError] = useState(null);
 
     // --- 1. FETCH DATA ---
-    const fetchApprovals = async () => {
-        const token = localStorage.getItem('token');
-        try {
-            setLoading(true);
-            // Usamos la vista de auditoría que ya trae la info necesaria
-            const response = await axios.get('http://127.0.0.1:8000/api/audit/logs/?type=approvals', {
-                headers: { Authorization: `Bearer ${token}` }
-            });
+    // Primera página de la vista de auditoría; el filtro de estado va al
+    // servidor y las siguientes páginas se piden con "Load more"
+    const feedUrl = 'http://127.0.0.1:8000/api/audit/logs/?type=approvals'
+        + (statusFilter === 'all' ? '' : `&status=${encodeURIComponent(statusFilter)}`);
+    const { items: approvals, hasMore, loading, loadingMore, error: feedError, loadMore, reload } = useCursorFeed(feedUrl);
+    const error = feedError ? "No se pudieron cargar las aprobaciones." : null;
 
-            // Mapeamos los datos de la BD a la estructura del frontend
-            const formattedData = response.data.map(item => ({
-                id: item.approval_id,
-                name: item.project_name || "Proyecto Sin Nombre",
-                submittedBy: item.assigned_to || "Sistema",
-                submittedOn: item.approval_date,
-                status: item.approval_status, // PENDIENTE, APROBADO, RECHAZADO
-                // La vista actual no trae descripción completa, construimos una informativa
-                description: `Project ID: ${item.project_id}. Esta solicitud ha estado pendiente por ${item.days_pending} días. Requiere revisión del presupuesto y alcance.`,
-                // Historial simulado basado en la fecha de creación (la vista no trae historial anidado)
-                history: [
-                    { label: "Submitted", date: item.approval_date },
-                    item.approval_status !== 'PENDIENTE' ? { label: "Processed", date: "Recently" } : null
-                ].filter(Boolean)
-            }));
-
-            setRequests(formattedData);
-            setError(null);
-        } catch (err) {
-            console.error("Error fetching approvals:", err);
-            setError("No se pudieron cargar las aprobaciones.");
-        } finally {
-            setLoading(false);
-        }
-    };
-
-    useEffect(() => {
-        fetchApprovals();
-    }, []);
+    // Mapeamos los datos de la BD a la estructura del frontend
+    const requests = approvals.map(item => ({
+        id: item.approval_id,
+        name: item.project_name || "Proyecto Sin Nombre",
+        submittedBy: item.assigned_to || "Sistema",
+        submittedOn: item.approval_date,
+        status: item.approval_status, // PENDIENTE, APROBADO, RECHAZADO
+        // La vista actual no trae descripción completa, construimos una informativa
+        description: `Project ID: ${item.project_id}. Esta solicitud ha estado pendiente por ${item.days_pending} días. Requiere revisión del presupuesto y alcance.`,
+        // Historial simulado basado en la fecha de creación (la vista no trae historial anidado)
+        history: [
+            { label: "Submitted", date: item.approval_date },
+            item.approval_status !== 'PENDIENTE' ? { label: "Processed", date: "Recently" } : null
+        ].filter(Boolean)
+    }));
 
     // --- 2. HANDLE ACTIONS (APPROVE/REJECT) ---
     const handleDecision = async (decision) => {
@@ -97,7 +79,7 @@ export default function MyApprovals() {
             // Éxito
             alert(`Solicitud ${decision.toLowerCase()} correctamente.`);
             setSelected(null);
-            fetchApprovals(); // Recargar lista
+            reload(); // Recargar lista
         } catch (err) {
             console.error("Error processing approval:", err);
             alert("Error al procesar la solicitud: " + (err.response?.data?.error || err.message));
@@ -107,11 +89,8 @@ export default function MyApprovals() {
     };
 
     // --- FILTRADO ---
-    const filtered = requests.filter((r) => {
-        const matches = r.name.toLowerCase().includes(query.toLowerCase());
-        const matchesStatus = statusFilter === "all" || r.status === statusFilter;
-        return matches && matchesStatus;
-    });
+    // El estado ya lo filtra el servidor; la búsqueda cubre las páginas cargadas
+    const filtered = requests.filter((r) => r.name.toLowerCase().includes(query.toLowerCase()));
 
     const statusColors = {
         PENDIENTE: { bg: "#FFF3CD", color: "#B58B00" },
@@ -221,6 +200,9 @@ export default function MyApprovals() {
                             </ListItem>
                         ))
                     )}
+                    {!loading && (
+                        <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={loadMore} color={MAIN_ORANGE} />
+                    )}
                 </List>
             </Paper>
 
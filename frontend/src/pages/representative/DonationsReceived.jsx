@@ -1,9 +1,10 @@
-import React, { useState, useEffect } from "react";
-import axios from 'axios';
+import React, { useState, useMemo } from "react";
+import { useCursorFeed } from '../../hooks/useCursorFeed';
+import LoadMoreButton from '../../components/common/LoadMoreButton';
 import {
     Box, Typography, Paper, TextField, Table, TableBody, TableCell, 
     TableContainer, TableHead, TableRow, Collapse, IconButton, Switch, 
-    FormControlLabel, CircularProgress
+    FormControlLabel, CircularProgress, Alert
 } from "@mui/material";
 import SearchIcon from "@mui/icons-material/Search";
 import KeyboardArrowDownIcon from "@mui/icons-material/KeyboardArrowDown";
@@ -16,88 +17,67 @@ export default function DonationsReceived() {
     const [query, setQuery] = useState("");
     const [timeFilter, setTimeFilter] = useState("year"); 
     const [currencyUSD, setCurrencyUSD] = useState(true);
-    const [rows, setRows] = useState([]); // Datos agrupados por proyecto
     const [openRow, setOpenRow] = useState(null);
-    const [loading, setLoading] = useState(true);
 
-    const [kpis, setKpis] = useState({
-        totalDonations: 0,
-        totalDonors: 0,
-        topProject: { name: "N/A", amount: 0 },
-    });
+    // 1. Donaciones más recientes (la API pagina por cursor): primera página
+    // al entrar y las siguientes con "Load more"
+    const { items: rawData, hasMore, loading, loadingMore, loadMore } = useCursorFeed(
+        localStorage.getItem('token') ? 'http://127.0.0.1:8000/api/finance/donations/' : null
+    );
 
-    useEffect(() => {
-        fetchDonationsData();
-    }, []);
+    // 2. Procesar Datos: Agrupar por Proyecto (sobre las páginas cargadas)
+    const { rows, kpis } = useMemo(() => {
+        const projectMap = {};
+        let globalTotal = 0;
+        const uniqueDonors = new Set();
 
-    const fetchDonationsData = async () => {
-        const token = localStorage.getItem('token');
-        if (!token) return;
+        rawData.forEach(d => {
+            const projName = d.project_name || "Unknown Project";
+            const amount = parseFloat(d.amount);
+            
+            if (!projectMap[projName]) {
+                projectMap[projName] = {
+                    id: d.project_id || Math.random(), // Fallback ID
+                    name: projName,
+                    total: 0,
+                    count: 0,
+                    recent: []
+                };
+            }
 
-        try {
-            setLoading(true);
-            // 1. Obtener todas las donaciones
-            const response = await axios.get('http://127.0.0.1:8000/api/finance/donations/', {
-                headers: { Authorization: `Bearer ${token}` }
+            projectMap[projName].total += amount;
+            projectMap[projName].count += 1;
+            projectMap[projName].recent.push({
+                donor: d.donor_name,
+                date: d.donation_date, // Asumimos formato YYYY-MM-DD
+                amount: `${d.currency || d.currency_code || '$'} ${amount.toLocaleString()}`
             });
-            const rawData = response.data;
-
-            // 2. Procesar Datos: Agrupar por Proyecto
-            const projectMap = {};
-            let globalTotal = 0;
-            const uniqueDonors = new Set();
-
-            rawData.forEach(d => {
-                const projName = d.project_name || "Unknown Project";
-                const amount = parseFloat(d.amount);
-                
-                if (!projectMap[projName]) {
-                    projectMap[projName] = {
-                        id: d.project_id || Math.random(), // Fallback ID
-                        name: projName,
-                        total: 0,
-                        count: 0,
-                        recent: []
-                    };
-                }
 
-                projectMap[projName].total += amount;
-                projectMap[projName].count += 1;
-                projectMap[projName].recent.push({
-                    donor: d.donor_name,
-                    date: d.donation_date, // Asumimos formato YYYY-MM-DD
-                    amount: `${d.currency || d.currency_code || '$'} ${amount.toLocaleString()}`
-                });
+            globalTotal += amount;
+            uniqueDonors.add(d.donor_name); // Usamos nombre como ID único simple
+        });
 
-                globalTotal += amount;
-                uniqueDonors.add(d.donor_name); // Usamos nombre como ID único simple
-            });
-
-            // Convertir mapa a array
-            const groupedRows = Object.values(projectMap);
+        // Convertir mapa a array
+        const groupedRows = Object.values(projectMap);
 
-            // 3. Calcular KPIs
-            // Encontrar proyecto top
-            let topProj = { name: "N/A", amount: 0 };
-            groupedRows.forEach(p => {
-                if (p.total > topProj.amount) {
-                    topProj = { name: p.name, amount: p.total };
-                }
-            });
+        // 3. Calcular KPIs
+        // Encontrar proyecto top
+        let topProj = { name: "N/A", amount: 0 };
+        groupedRows.forEach(p => {
+            if (p.total > topProj.amount) {
+                topProj = { name: p.name, amount: p.total };
+            }
+        });
 
-            setRows(groupedRows);
-            setKpis({
+        return {
+            rows: groupedRows,
+            kpis: {
                 totalDonations: globalTotal,
                 totalDonors: uniqueDonors.size,
                 topProject: topProj
-            });
-
-        } catch (error) {
-            console.error("Error fetching donations:", error);
-        } finally {
-            setLoading(false);
-        }
-    };
+            }
+        };
+    }, [rawData]);
 
     const filtered = rows.filter((r) =>
         r.name.toLowerCase().includes(query.toLowerCase())
@@ -127,6 +107,13 @@ export default function DonationsReceived() {
                 Donations Received
             </Typography>
 
+            {/* Los totales solo cubren las donaciones cargadas */}
+            {hasMore && (
+                <Alert severity="info" sx={{ mb: 3 }}>
+                    Totals cover the {rawData.length} most recent donations. Use "Load more donations" below to include older ones.
+                </Alert>
+            )}
+
             {/* ---------- KPI CARDS ---------- */}
             <Box sx={{ display: "flex", gap: 3, mb: 4, flexWrap: "wrap" }}>
                 {/* Total Donations */}
@@ -300,6 +287,8 @@ export default function DonationsReceived() {
                     </TableBody>
                 </Table>
             </TableContainer>
+
+            <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={loadMore} label="Load more donations" color={MAIN_ORANGE} />
         </Box>
     );
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from "react";
 import axios from 'axios';
+import { fetchPage } from '../../utils/pagination';
 import {
     Box, Typography, Grid, Paper, Button, Chip, LinearProgress,
     Dialog, DialogTitle, DialogContent, DialogActions, TextField,
@@ -64,8 +65,9 @@ export default function RepresentativeDashboard() {
                     headers: { Authorization: `Bearer ${token}` }
                 });
 
-                // 2. Obtener Aprobaciones (Para ver pendientes)
-                const approvalsRes = await axios.get('http://127.0.0.1:8000/api/audit/logs/?type=approvals', {
+                // 2. Obtener Aprobaciones pendientes: solo la primera página;
+                // si hay más, el KPI lo indica con "+"
+                const approvalsPage = await fetchPage('http://127.0.0.1:8000/api/audit/logs/?type=approvals&status=PENDIENTE', null, {
                     headers: { Authorization: `Bearer ${token}` }
                 });
 
@@ -82,7 +84,6 @@ export default function RepresentativeDashboard() {
 
                 // --- PROCESAMIENTO ---
                 const allProjects = projectsRes.data;
-                const allApprovals = approvalsRes.data;
                 const financeData = financeRes.data;
 
                 // KPI: My Projects (Total)
@@ -90,7 +91,7 @@ export default function RepresentativeDashboard() {
 
                 // KPI: Pending Approval (Solicitudes mías pendientes)
                 // Asumimos que el backend filtra por usuario, o filtramos aquí si es necesario
-                const myPendingApprovals = allApprovals.filter(a => a.approval_status === 'PENDIENTE'); 
+                const myPendingApprovals = approvalsPage.results;
                 
                 // KPI: Total Raised
                 const totalRaisedVal = financeData.reduce((acc, curr) => acc + (curr.total_received || 0), 0);
@@ -98,7 +99,7 @@ export default function RepresentativeDashboard() {
                 setKpiStats({
                     myProjects: myProjectsCount,
                     totalRaised: totalRaisedVal,
-                    pendingApproval: myPendingApprovals.length
+                    pendingApproval: `${myPendingApprovals.length}${approvalsPage.next ? '+' : ''}`
                 });
 
                 // Active Projects List (Mapeo para la vista)
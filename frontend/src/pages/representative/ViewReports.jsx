@@ -1,5 +1,6 @@
 import React, { useState, useEffect, useCallback } from "react";
 import axios from 'axios';
+import { fetchPage } from '../../utils/pagination';
 import {
     Box, Typography, Paper, TextField, Button, Table, TableBody, TableCell,
     TableContainer, TableHead, TableRow, Chip, MenuItem, Select, InputLabel,
@@ -19,6 +20,7 @@ const DARK_ORANGE = "#D93602";
 export default function ProjectReports() {
     // State
     const [reports, setReports] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null); // Cursor de la siguiente página
     const [projectsList, setProjectsList] = useState([]); // Para el dropdown de crear
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
@@ -41,15 +43,16 @@ export default function ProjectReports() {
     const [selectedReport, setSelectedReport] = useState(null);
 
     // --- FETCH DATA ---
-    const fetchReports = useCallback(async () => {
+    const fetchReports = useCallback(async (cursor = null) => {
         const token = localStorage.getItem('token');
         setError(null);
         try {
             setLoading(true);
-            const response = await axios.get('http://127.0.0.1:8000/api/workflow/reports/', {
+            const page = await fetchPage('http://127.0.0.1:8000/api/workflow/reports/', cursor, {
                 headers: { Authorization: `Bearer ${token}` }
             });
-            setReports(response.data);
+            setReports(prev => (cursor ? [...prev, ...page.results] : page.results));
+            setNextCursor(page.next);
         } catch (error) {
             console.error("Error loading reports:", error);
             setError("Error loading reports. Please try again.");
@@ -181,7 +184,7 @@ export default function ProjectReports() {
                         </TableRow>
                     </TableHead>
                     <TableBody>
-                        {loading ? (
+                        {loading && reports.length === 0 ? (
                             <TableRow><TableCell colSpan={5} align="center" sx={{py:3}}><CircularProgress size={30} sx={{color: MAIN_ORANGE}}/></TableCell></TableRow>
                         ) : filtered.length === 0 ? (
                             <TableRow><TableCell colSpan={5} align="center" sx={{py:3}}>No reports found.</TableCell></TableRow>
@@ -208,6 +211,15 @@ export default function ProjectReports() {
                 </Table>
             </TableContainer>
 
+            {nextCursor && (
+                <Box display="flex" justifyContent="center" mt={2}>
+                    <Button variant="outlined" disabled={loading} onClick={() => fetchReports(nextCursor)}
+                        sx={{ color: MAIN_ORANGE, borderColor: MAIN_ORANGE }}>
+                        {loading ? "Loading..." : "Load more"}
+                    </Button>
+                </Box>
+            )}
+
             {/* VIEW MODAL */}
             <Dialog open={viewOpen} onClose={handleCloseView} fullWidth maxWidth="sm">
                 <Box display="flex" justifyContent="space-between" alignItems="center" p={2} borderBottom="1px solid #f0f0f0">
@@ -0,0 +1,26 @@
+import axios from 'axios';
+
+/**
+ * Helpers for the cursor-paginated endpoints (donations, reports, audit logs).
+ * Those endpoints answer { results: [...], next: <cursor|null> }; the cursor
+ * is opaque and only has to be sent back as ?cursor=.
+ * Screens show the first page and ask for the next one on demand
+ * (hooks/useCursorFeed.js); they do not walk the whole feed.
+ */
+
+const withCursor = (url, cursor) => {
+    if (!cursor) return url;
+    const separator = url.includes('?') ? '&' : '?';
+    return `${url}${separator}cursor=${encodeURIComponent(cursor)}`;
+};
+
+/**
+ * Fetch a single page. Returns { results, next }.
+ */
+export const fetchPage = async (url, cursor = null, config = {}) => {
+    const response = await axios.get(withCursor(url, cursor), config);
+    return {
+        results: response.data.results || [],
+        next: response.data.next || null,
+    };
+};
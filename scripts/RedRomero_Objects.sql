@@ -210,8 +210,7 @@ CREATE TABLE Volunteer_Application (
     CONSTRAINT chk_application_status CHECK (status IN ('PENDIENTE', 'APROBADA', 'RECHAZADA', 'CANCELADA')),
     CONSTRAINT fk_application_volunteer FOREIGN KEY (volunteer_id) REFERENCES Volunteer(volunteer_id),
     CONSTRAINT fk_application_project FOREIGN KEY (project_id) REFERENCES Project(project_id),
-    CONSTRAINT fk_application_reviewer FOREIGN KEY (reviewed_by_employee_id) REFERENCES Employee(employee_id),
-    CONSTRAINT uq_volunteer_project_application UNIQUE (volunteer_id, project_id, status)
+    CONSTRAINT fk_application_reviewer FOREIGN KEY (reviewed_by_employee_id) REFERENCES Employee(employee_id)
 ) TABLESPACE DATA_TABLES_REDROMERO;
 
 
@@ -256,6 +255,77 @@ CREATE TABLE Donation (
     CONSTRAINT fk_donation_donor FOREIGN KEY (donor_id) REFERENCES Donor(donor_id)
 ) TABLESPACE DATA_TABLES_REDROMERO;
 
+-- Table: Donation_Rollup (donations per month, project and currency; kept by
+-- the donation procedures of PKG_FINANCE_CORE)
+CREATE TABLE Donation_Rollup (
+    month_start DATE NOT NULL,
+    project_id NUMBER NOT NULL,
+    currency_id NUMBER NOT NULL,
+    donation_count NUMBER NOT NULL,
+    total_amount NUMBER(15,2) NOT NULL,
+    min_amount NUMBER(15,2) NOT NULL,
+    max_amount NUMBER(15,2) NOT NULL,
+    CONSTRAINT pk_donation_rollup PRIMARY KEY (month_start, project_id, currency_id),
+    CONSTRAINT fk_dr_project FOREIGN KEY (project_id) REFERENCES Project(project_id),
+    CONSTRAINT fk_dr_currency FOREIGN KEY (currency_id) REFERENCES Currency(currency_id)
+) TABLESPACE DATA_TABLES_REDROMERO;
+
+-- Table: Donation_Donor_Rollup (donations per month, currency and donor, for
+-- unique donors; kept with Donation_Rollup)
+CREATE TABLE Donation_Donor_Rollup (
+    month_start DATE NOT NULL,
+    currency_id NUMBER NOT NULL,
+    donor_id NUMBER NOT NULL,
+    donation_count NUMBER NOT NULL,
+    CONSTRAINT pk_donation_donor_rollup PRIMARY KEY (month_start, currency_id, donor_id),
+    CONSTRAINT fk_ddr_currency FOREIGN KEY (currency_id) REFERENCES Currency(currency_id),
+    CONSTRAINT fk_ddr_donor FOREIGN KEY (donor_id) REFERENCES Donor(donor_id)
+) TABLESPACE DATA_TABLES_REDROMERO;
+
+-- Table: Project_Finance_Summary (budget and donation totals per project;
+-- kept by the triggers of RedRomero_Summaries.sql)
+CREATE TABLE Project_Finance_Summary (
+    project_id NUMBER PRIMARY KEY,
+    budget_count NUMBER DEFAULT 0 NOT NULL,
+    total_budget NUMBER(15,2) DEFAULT 0 NOT NULL,
+    donation_count NUMBER DEFAULT 0 NOT NULL,
+    total_received NUMBER(15,2) DEFAULT 0 NOT NULL,
+    CONSTRAINT fk_pfs_project FOREIGN KEY (project_id) REFERENCES Project(project_id) ON DELETE CASCADE
+) TABLESPACE DATA_TABLES_REDROMERO;
+
+-- Table: NGO_Donor_Summary (donations per NGO and donor, for unique donors;
+-- kept by the triggers of RedRomero_Summaries.sql)
+CREATE TABLE NGO_Donor_Summary (
+    ong_id NUMBER NOT NULL,
+    donor_id NUMBER NOT NULL,
+    donation_count NUMBER NOT NULL,
+    CONSTRAINT pk_ngo_donor_summary PRIMARY KEY (ong_id, donor_id),
+    CONSTRAINT fk_nds_ngo FOREIGN KEY (ong_id) REFERENCES NGO(ong_id) ON DELETE CASCADE,
+    CONSTRAINT fk_nds_donor FOREIGN KEY (donor_id) REFERENCES Donor(donor_id) ON DELETE CASCADE
+) TABLESPACE DATA_TABLES_REDROMERO;
+
+-- ========================================
+-- DASHBOARD SNAPSHOT TABLES
+-- ========================================
+
+-- Table: KPI_Snapshot (dashboard KPIs per metric and month; kept by the
+-- triggers of RedRomero_Summaries.sql, PKG_FINANCE_CORE and a daily job)
+CREATE TABLE KPI_Snapshot (
+    metric_name VARCHAR2(50) NOT NULL,
+    period_start DATE NOT NULL,
+    metric_value NUMBER(15,2) NOT NULL,
+    updated_at TIMESTAMP DEFAULT SYSTIMESTAMP NOT NULL,
+    CONSTRAINT pk_kpi_snapshot PRIMARY KEY (metric_name, period_start)
+) TABLESPACE DATA_TABLES_REDROMERO;
+
+-- Table: Volunteer_Activity_Summary (active assignments per volunteer, for
+-- the ACTIVE_VOLUNTEERS KPI)
+CREATE TABLE Volunteer_Activity_Summary (
+    volunteer_id NUMBER PRIMARY KEY,
+    active_assignments NUMBER NOT NULL,
+    CONSTRAINT fk_vas_volunteer FOREIGN KEY (volunteer_id) REFERENCES Volunteer(volunteer_id) ON DELETE CASCADE
+) TABLESPACE DATA_TABLES_REDROMERO;
+
 -- ========================================
 -- ASSIGNMENT TABLES (N:M)
 -- ========================================
@@ -345,8 +415,7 @@ CREATE TABLE Volunteer_Application (
     CONSTRAINT chk_application_status CHECK (status IN ('PENDING', 'APPROVED', 'REJECTED', 'CANCELLED')),
     CONSTRAINT fk_application_volunteer FOREIGN KEY (volunteer_id) REFERENCES Volunteer(volunteer_id),
     CONSTRAINT fk_application_project FOREIGN KEY (project_id) REFERENCES Project(project_id),
-    CONSTRAINT fk_application_reviewer FOREIGN KEY (reviewed_by_employee_id) REFERENCES Employee(employee_id),
-    CONSTRAINT uq_volunteer_project_application UNIQUE (volunteer_id, project_id, status)
+    CONSTRAINT fk_application_reviewer FOREIGN KEY (reviewed_by_employee_id) REFERENCES Employee(employee_id)
 ) TABLESPACE DATA_TABLES_REDROMERO;
 
 -- ========================================
@@ -457,6 +526,8 @@ CREATE INDEX idx_donation_donor ON Donation(donor_id) TABLESPACE INDEXES_REDROME
 CREATE INDEX idx_donation_date_currency ON Donation(donation_date, currency_id) TABLESPACE INDEXES_REDROMERO;
 CREATE INDEX idx_budget_project ON Budget(project_id) TABLESPACE INDEXES_REDROMERO;
 CREATE INDEX idx_budget_currency ON Budget(currency_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_donation_rollup_currency ON Donation_Rollup(currency_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_ddr_currency_donor ON Donation_Donor_Rollup(currency_id, donor_id) TABLESPACE INDEXES_REDROMERO;
 
 -- Indexes on approval tables
 CREATE INDEX idx_approval_project ON Approval(project_id) TABLESPACE INDEXES_REDROMERO;
@@ -488,7 +559,27 @@ CREATE INDEX idx_doc_donor ON Identity_Document(donor_id) TABLESPACE INDEXES_RED
 
 -- Indexes on reports
 CREATE INDEX idx_report_project_date ON Report(project_id, report_date) TABLESPACE INDEXES_REDROMERO;
+
+-- Indexes for keyset pagination (ORDER BY date DESC, id DESC)
+CREATE INDEX idx_report_date ON Report(report_date, report_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_approval_date ON Approval(approval_date, approval_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_ah_date ON Approval_History(change_date, history_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_bh_date ON Budget_History(change_date, history_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_psh_date ON Project_Status_History(change_date, status_history_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_dtl_date ON Donation_Transaction_Log(change_date, transaction_log_id) TABLESPACE INDEXES_REDROMERO;
+CREATE INDEX idx_pah_date ON Project_Assignment_History(assignment_date, assignment_history_id) TABLESPACE INDEXES_REDROMERO;
+
 -- Indexes on application
 CREATE INDEX idx_application_status ON Volunteer_Application(status) TABLESPACE INDEXES_REDROMERO;
 CREATE INDEX idx_application_volunteer ON Volunteer_Application(volunteer_id) TABLESPACE INDEXES_REDROMERO;
-CREATE INDEX idx_application_project ON Volunteer_Application(project_id) TABLESPACE INDEXES_REDROMERO;
\ No newline at end of file
+CREATE INDEX idx_application_project ON Volunteer_Application(project_id) TABLESPACE INDEXES_REDROMERO;
+-- At most one pending application per volunteer and project. Rows that are
+-- not pending have both keys NULL and stay out of the index, so a volunteer
+-- can apply again after a cancellation or rejection. Replaces the former
+-- uq_volunteer_project_application UNIQUE (volunteer_id, project_id, status);
+-- on an existing database drop it first:
+--   ALTER TABLE Volunteer_Application DROP CONSTRAINT uq_volunteer_project_application;
+CREATE UNIQUE INDEX uq_application_pending ON Volunteer_Application(
+    CASE WHEN status IN ('PENDING', 'PENDIENTE') THEN volunteer_id END,
+    CASE WHEN status IN ('PENDING', 'PENDIENTE') THEN project_id END
+) TABLESPACE INDEXES_REDROMERO;
\ No newline at end of file
@@ -288,6 +288,86 @@ CREATE OR REPLACE PACKAGE BODY PKG_FINANCE_CORE AS
         WHEN ZERO_DIVIDE THEN RAISE_APPLICATION_ERROR(-20003, 'Zero exchange rate error');
     END convert_currency;
 
+    -- Donation rollup (Donation_Rollup / Donation_Donor_Rollup, see
+    -- scripts/RedRomero_Summaries.sql section 3). Private: only the donation
+    -- CRUD below writes Donation, so it is the only place that keeps them current.
+    PROCEDURE rollup_add(
+        p_date IN DATE, p_proj IN NUMBER, p_curr IN NUMBER, p_donor IN NUMBER, p_amount IN NUMBER
+    ) IS
+        v_month DATE := TRUNC(p_date, 'MM');
+    BEGIN
+        UPDATE Donation_Rollup
+        SET donation_count = donation_count + 1,
+            total_amount = total_amount + p_amount,
+            min_amount = LEAST(min_amount, p_amount),
+            max_amount = GREATEST(max_amount, p_amount)
+        WHERE month_start = v_month AND project_id = p_proj AND currency_id = p_curr;
+        IF SQL%ROWCOUNT = 0 THEN
+            BEGIN
+                INSERT INTO Donation_Rollup (month_start, project_id, currency_id, donation_count,
+                                             total_amount, min_amount, max_amount)
+                VALUES (v_month, p_proj, p_curr, 1, p_amount, p_amount, p_amount);
+            EXCEPTION
+                -- Otra sesión abrió la celda a la vez
+                WHEN DUP_VAL_ON_INDEX THEN
+                    UPDATE Donation_Rollup
+                    SET donation_count = donation_count + 1,
+                        total_amount = total_amount + p_amount,
+                        min_amount = LEAST(min_amount, p_amount),
+                        max_amount = GREATEST(max_amount, p_amount)
+                    WHERE month_start = v_month AND project_id = p_proj AND currency_id = p_curr;
+            END;
+        END IF;
+        PKG_DASHBOARD_ANALYTICS.add_kpi_delta('MONTHLY_DONATIONS', p_amount, v_month);
+
+        UPDATE Donation_Donor_Rollup
+        SET donation_count = donation_count + 1
+        WHERE month_start = v_month AND currency_id = p_curr AND donor_id = p_donor;
+        IF SQL%ROWCOUNT = 0 THEN
+            BEGIN
+                INSERT INTO Donation_Donor_Rollup (month_start, currency_id, donor_id, donation_count)
+                VALUES (v_month, p_curr, p_donor, 1);
+            EXCEPTION
+                WHEN DUP_VAL_ON_INDEX THEN
+                    UPDATE Donation_Donor_Rollup
+                    SET donation_count = donation_count + 1
+                    WHERE month_start = v_month AND currency_id = p_curr AND donor_id = p_donor;
+            END;
+        END IF;
+    END rollup_add;
+
+    -- Recomputes one cell after an update or delete (MIN/MAX cannot be
+    -- subtracted). The row is locked first so the recount sees every
+    -- donation committed before it, including concurrent rollup_add calls.
+    PROCEDURE rollup_refresh(p_date IN DATE, p_proj IN NUMBER, p_curr IN NUMBER) IS
+        v_month DATE := TRUNC(p_date, 'MM');
+        v_old_total NUMBER;
+        v_count NUMBER; v_total NUMBER; v_min NUMBER; v_max NUMBER;
+    BEGIN
+        SELECT total_amount INTO v_old_total FROM Donation_Rollup
+        WHERE month_start = v_month AND project_id = p_proj AND currency_id = p_curr
+        FOR UPDATE;
+
+        SELECT COUNT(*), NVL(SUM(amount), 0), MIN(amount), MAX(amount)
+        INTO v_count, v_total, v_min, v_max
+        FROM Donation
+        WHERE project_id = p_proj AND currency_id = p_curr
+          AND donation_date >= v_month AND donation_date < ADD_MONTHS(v_month, 1);
+
+        IF v_count = 0 THEN
+            DELETE FROM Donation_Rollup
+            WHERE month_start = v_month AND project_id = p_proj AND currency_id = p_curr;
+        ELSE
+            UPDATE Donation_Rollup
+            SET donation_count = v_count, total_amount = v_total, min_amount = v_min, max_amount = v_max
+            WHERE month_start = v_month AND project_id = p_proj AND currency_id = p_curr;
+        END IF;
+        PKG_DASHBOARD_ANALYTICS.add_kpi_delta('MONTHLY_DONATIONS', v_total - v_old_total, v_month);
+    EXCEPTION
+        -- Celda ausente (rollup sin reconstruir tras una carga directa)
+        WHEN NO_DATA_FOUND THEN NULL;
+    END rollup_refresh;
+
     -- Donation CRUD
     PROCEDURE register_donation(
         p_date IN Donation.donation_date%TYPE, p_amount IN Donation.amount%TYPE,
@@ -296,19 +376,38 @@ CREATE OR REPLACE PACKAGE BODY PKG_FINANCE_CORE AS
     ) IS BEGIN
         INSERT INTO Donation(donation_date, amount, project_id, currency_id, donor_id)
         VALUES (p_date, p_amount, p_proj, p_curr, p_donor) RETURNING donation_id INTO p_new_id;
+        rollup_add(p_date, p_proj, p_curr, p_donor, p_amount);
     END;
 
     -- [ESTOS FALTABAN]
     PROCEDURE update_donation(p_id IN Donation.donation_id%TYPE, p_amount IN Donation.amount%TYPE) IS 
+        v_date Donation.donation_date%TYPE;
+        v_proj Donation.project_id%TYPE;
+        v_curr Donation.currency_id%TYPE;
     BEGIN
-        UPDATE Donation SET amount = p_amount WHERE donation_id = p_id;
+        UPDATE Donation SET amount = p_amount WHERE donation_id = p_id
+        RETURNING donation_date, project_id, currency_id INTO v_date, v_proj, v_curr;
         IF SQL%ROWCOUNT = 0 THEN RAISE_APPLICATION_ERROR(-20302, 'Donation not found'); END IF;
+        rollup_refresh(v_date, v_proj, v_curr);
     END;
 
     PROCEDURE delete_donation(p_id IN Donation.donation_id%TYPE) IS 
+        v_date Donation.donation_date%TYPE;
+        v_proj Donation.project_id%TYPE;
+        v_curr Donation.currency_id%TYPE;
+        v_donor Donation.donor_id%TYPE;
     BEGIN
-        DELETE FROM Donation WHERE donation_id = p_id;
+        DELETE FROM Donation WHERE donation_id = p_id
+        RETURNING donation_date, project_id, currency_id, donor_id INTO v_date, v_proj, v_curr, v_donor;
         IF SQL%ROWCOUNT = 0 THEN RAISE_APPLICATION_ERROR(-20304, 'Donation not found'); END IF;
+        rollup_refresh(v_date, v_proj, v_curr);
+
+        UPDATE Donation_Donor_Rollup
+        SET donation_count = donation_count - 1
+        WHERE month_start = TRUNC(v_date, 'MM') AND currency_id = v_curr AND donor_id = v_donor;
+        DELETE FROM Donation_Donor_Rollup
+        WHERE month_start = TRUNC(v_date, 'MM') AND currency_id = v_curr AND donor_id = v_donor
+          AND donation_count <= 0;
     END;
 
     -- Budget CRUD
@@ -563,13 +662,14 @@ CREATE OR REPLACE PACKAGE BODY PKG_WORKFORCE AS
             RETURN 'ERROR: You are already assigned to this project';
         END IF;
         
-        -- Verify no pending application exists
+        -- Verify no pending application exists (la tabla puede estar creada
+        -- con los estados en inglés o en español: ver RedRomero_Objects.sql)
         SELECT COUNT(*)
         INTO v_pending_application
         FROM Volunteer_Application
         WHERE volunteer_id = p_volunteer_id
           AND project_id = p_project_id
-          AND status = 'PENDING';
+          AND status IN ('PENDING', 'PENDIENTE');
         
         IF v_pending_application > 0 THEN
             RETURN 'ERROR: You already have a pending application for this project';
@@ -579,6 +679,10 @@ CREATE OR REPLACE PACKAGE BODY PKG_WORKFORCE AS
     END can_volunteer_apply;
 
     -- NEW PROCEDURE: Volunteer self-registration
+    -- One call does the whole application: checks, insert and the new id
+    -- (RETURNING INTO). Two concurrent applications of the same volunteer
+    -- both pass can_volunteer_apply; uq_application_pending lets only one
+    -- insert and the other gets the same error as the check.
     PROCEDURE volunteer_apply_to_project(
         p_volunteer_id IN NUMBER,
         p_project_id IN NUMBER,
@@ -611,24 +715,30 @@ CREATE OR REPLACE PACKAGE BODY PKG_WORKFORCE AS
             RAISE_APPLICATION_ERROR(-20003, v_validation);
         END IF;
         
-        -- Create application
+        -- Create application. application_date y status toman el DEFAULT de
+        -- la columna: SYSTIMESTAMP y el estado pendiente de la versión de la
+        -- tabla instalada ('PENDING' o 'PENDIENTE')
         INSERT INTO Volunteer_Application (
             volunteer_id,
-            project_id,
-            application_date,
-            status
+            project_id
         ) VALUES (
             p_volunteer_id,
-            p_project_id,
-            SYSTIMESTAMP,
-            'PENDING'
+            p_project_id
         ) RETURNING application_id INTO p_application_id;
         
         COMMIT;
         
     EXCEPTION
+        WHEN DUP_VAL_ON_INDEX THEN
+            -- Otra sesión registró la misma solicitud a la vez
+            ROLLBACK;
+            RAISE_APPLICATION_ERROR(-20003, 'ERROR: You already have a pending application for this project');
         WHEN OTHERS THEN
             ROLLBACK;
+            -- Los errores de validación llegan tal cual a la aplicación
+            IF SQLCODE BETWEEN -20003 AND -20001 THEN
+                RAISE;
+            END IF;
             RAISE_APPLICATION_ERROR(-20004, 'Error creating application: ' || SQLERRM);
     END volunteer_apply_to_project;
 
@@ -1008,10 +1118,20 @@ CREATE OR REPLACE PACKAGE PKG_DASHBOARD_ANALYTICS AS
     );
     TYPE t_kpi_table IS TABLE OF t_kpi_record;
     
-    -- Get all main KPIs in one call
+    -- Get all main KPIs in one call (read from KPI_Snapshot)
     FUNCTION get_main_kpis RETURN t_kpi_table PIPELINED;
     
-    -- Filtered data with pagination (No longer fetches total count)
+    -- KPI snapshots (KPI_Snapshot, scripts/RedRomero_Summaries.sql section 4).
+    -- p_period NULL: state metric of the current month, carried over from
+    -- the last month recorded. p_period given: flow metric of that month.
+    PROCEDURE add_kpi_delta(p_metric IN VARCHAR2, p_delta IN NUMBER, p_period IN DATE DEFAULT NULL);
+    
+    -- Recount of the current month (daily job JOB_REFRESH_KPI_SNAPSHOT)
+    PROCEDURE refresh_kpi_snapshot;
+    
+    -- Filtered data with pagination. Every row carries total_count, the
+    -- number of rows matching the filters (COUNT(*) OVER ()), so the page
+    -- and its total come back in the same round trip.
     PROCEDURE get_projects_paginated(
         p_page IN NUMBER DEFAULT 1,
         p_page_size IN NUMBER DEFAULT 10,
@@ -1029,6 +1149,15 @@ CREATE OR REPLACE PACKAGE PKG_DASHBOARD_ANALYTICS AS
     -- Data for Pie Chart
     PROCEDURE get_project_status_distribution(p_cursor OUT SYS_REFCURSOR);
     
+    -- Composite dashboards: every section is returned as an implicit result
+    -- set (DBMS_SQL.RETURN_RESULT), so the whole page costs one round trip.
+    -- Result order: active, hours, completed, specialties, contribution,
+    -- opportunities, volunteer name.
+    PROCEDURE get_volunteer_dashboard(p_volunteer_id IN NUMBER);
+    
+    -- Result order: ngo, financial, representative, active projects, success.
+    PROCEDURE get_representative_ngo_dashboard(p_representative_id IN NUMBER);
+    
     -- NOTE: get_projects_total_count has been REMOVED from the spec.
     
 END PKG_DASHBOARD_ANALYTICS;
@@ -1042,89 +1171,154 @@ CREATE OR REPLACE PACKAGE BODY PKG_DASHBOARD_ANALYTICS AS
     -- =========================================================================
     -- FUNCTION: get_main_kpis (PIPELINED)
     -- =========================================================================
+    -- Reads KPI_Snapshot: at most two index lookups per metric. The previous
+    -- value is the one recorded at the end of last month, not a
+    -- reconstruction from today's rows.
     FUNCTION get_main_kpis RETURN t_kpi_table PIPELINED IS
         v_kpi t_kpi_record;
-        v_current NUMBER;
-        v_previous NUMBER;
+        v_month DATE := TRUNC(SYSDATE, 'MM');
+
+        -- Último valor registrado hasta p_period (métricas de estado)
+        FUNCTION state_value(p_metric IN VARCHAR2, p_period IN DATE) RETURN NUMBER IS
+            v_value NUMBER;
+        BEGIN
+            SELECT metric_value INTO v_value
+            FROM KPI_Snapshot
+            WHERE metric_name = p_metric
+              AND period_start = (SELECT MAX(period_start) FROM KPI_Snapshot
+                                  WHERE metric_name = p_metric AND period_start <= p_period);
+            RETURN v_value;
+        EXCEPTION WHEN NO_DATA_FOUND THEN RETURN NULL;
+        END state_value;
+
+        -- Valor del mes p_period (métricas de flujo: sin fila, nada ocurrió)
+        FUNCTION flow_value(p_metric IN VARCHAR2, p_period IN DATE) RETURN NUMBER IS
+            v_value NUMBER;
+        BEGIN
+            SELECT metric_value INTO v_value
+            FROM KPI_Snapshot
+            WHERE metric_name = p_metric AND period_start = p_period;
+            RETURN v_value;
+        EXCEPTION WHEN NO_DATA_FOUND THEN RETURN 0;
+        END flow_value;
+
+        FUNCTION build(p_metric IN VARCHAR2, p_current IN NUMBER, p_previous IN NUMBER) RETURN t_kpi_record IS
+            v_row t_kpi_record;
+        BEGIN
+            v_row.metric_name := p_metric;
+            v_row.current_value := NVL(p_current, 0);
+            v_row.previous_value := NVL(p_previous, v_row.current_value);
+            v_row.percentage_change := ROUND(((v_row.current_value - v_row.previous_value)
+                                              / NULLIF(v_row.previous_value, 0)) * 100, 2);
+            v_row.trend := CASE 
+                WHEN v_row.current_value > v_row.previous_value THEN 'UP'
+                WHEN v_row.current_value < v_row.previous_value THEN 'DOWN'
+                ELSE 'STABLE'
+            END;
+            RETURN v_row;
+        END build;
     BEGIN
         -- KPI 1: Active Projects
-        SELECT COUNT(*) INTO v_current
-        FROM Project p
-        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
-        WHERE ps.status_name = 'ACTIVO';
-        
-        SELECT COUNT(*) INTO v_previous
-        FROM Project p
-        JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
-        WHERE ps.status_name = 'ACTIVO'
-          AND p.start_date < ADD_MONTHS(SYSDATE, -1);
-        
-        v_kpi.metric_name := 'ACTIVE_PROJECTS';
-        v_kpi.current_value := v_current;
-        v_kpi.previous_value := v_previous;
-        v_kpi.percentage_change := ROUND(((v_current - v_previous) / NULLIF(v_previous, 0)) * 100, 2);
-        v_kpi.trend := CASE 
-            WHEN v_current > v_previous THEN 'UP'
-            WHEN v_current < v_previous THEN 'DOWN'
-            ELSE 'STABLE'
-        END;
+        v_kpi := build('ACTIVE_PROJECTS', state_value('ACTIVE_PROJECTS', v_month),
+                       state_value('ACTIVE_PROJECTS', ADD_MONTHS(v_month, -1)));
         PIPE ROW(v_kpi);
         
         -- KPI 2: Total Donations (this month)
-        SELECT NVL(SUM(amount), 0) INTO v_current
-        FROM Donation
-        WHERE TRUNC(donation_date, 'MM') = TRUNC(SYSDATE, 'MM');
-        
-        SELECT NVL(SUM(amount), 0) INTO v_previous
-        FROM Donation
-        WHERE TRUNC(donation_date, 'MM') = TRUNC(ADD_MONTHS(SYSDATE, -1), 'MM');
-        
-        v_kpi.metric_name := 'MONTHLY_DONATIONS';
-        v_kpi.current_value := v_current;
-        v_kpi.previous_value := v_previous;
-        v_kpi.percentage_change := ROUND(((v_current - v_previous) / NULLIF(v_previous, 0)) * 100, 2);
-        v_kpi.trend := CASE 
-            WHEN v_current > v_previous THEN 'UP'
-            WHEN v_current < v_previous THEN 'DOWN'
-            ELSE 'STABLE'
-        END;
+        v_kpi := build('MONTHLY_DONATIONS', flow_value('MONTHLY_DONATIONS', v_month),
+                       flow_value('MONTHLY_DONATIONS', ADD_MONTHS(v_month, -1)));
         PIPE ROW(v_kpi);
         
         -- KPI 3: Active Volunteers
-        SELECT COUNT(DISTINCT volunteer_id) INTO v_current
-        FROM Volunteer_Project
-        WHERE status = 'A';
-        
-        SELECT COUNT(DISTINCT volunteer_id) INTO v_previous
-        FROM Volunteer_Project
-        WHERE status = 'A'
-          AND assignment_date < ADD_MONTHS(SYSDATE, -1);
-        
-        v_kpi.metric_name := 'ACTIVE_VOLUNTEERS';
-        v_kpi.current_value := v_current;
-        v_kpi.previous_value := v_previous;
-        v_kpi.percentage_change := ROUND(((v_current - v_previous) / NULLIF(v_previous, 0)) * 100, 2);
-        v_kpi.trend := CASE 
-            WHEN v_current > v_previous THEN 'UP'
-            WHEN v_current < v_previous THEN 'DOWN'
-            ELSE 'STABLE'
-        END;
+        v_kpi := build('ACTIVE_VOLUNTEERS', state_value('ACTIVE_VOLUNTEERS', v_month),
+                       state_value('ACTIVE_VOLUNTEERS', ADD_MONTHS(v_month, -1)));
         PIPE ROW(v_kpi);
         
         -- KPI 4: Active NGOs
-        SELECT COUNT(*) INTO v_current FROM NGO;
-        v_previous := v_current; -- Assume stable for NGOs
-        
-        v_kpi.metric_name := 'TOTAL_NGOS';
-        v_kpi.current_value := v_current;
-        v_kpi.previous_value := v_previous;
-        v_kpi.percentage_change := 0;
-        v_kpi.trend := 'STABLE';
+        v_kpi := build('TOTAL_NGOS', state_value('TOTAL_NGOS', v_month),
+                       state_value('TOTAL_NGOS', ADD_MONTHS(v_month, -1)));
         PIPE ROW(v_kpi);
         
         RETURN;
     END get_main_kpis;
 
+    -- =========================================================================
+    -- PROCEDURE: add_kpi_delta (called by PKG_FINANCE_CORE)
+    -- =========================================================================
+    PROCEDURE add_kpi_delta(p_metric IN VARCHAR2, p_delta IN NUMBER, p_period IN DATE DEFAULT NULL) IS
+        v_period DATE := TRUNC(NVL(p_period, SYSDATE), 'MM');
+        v_base NUMBER := 0;
+    BEGIN
+        IF NVL(p_delta, 0) = 0 THEN RETURN; END IF;
+
+        UPDATE KPI_Snapshot
+        SET metric_value = metric_value + p_delta, updated_at = SYSTIMESTAMP
+        WHERE metric_name = p_metric AND period_start = v_period;
+        IF SQL%ROWCOUNT = 0 THEN
+            IF p_period IS NULL THEN
+                -- Primer cambio del mes: parte del último valor registrado
+                SELECT NVL(MAX(metric_value), 0) INTO v_base
+                FROM KPI_Snapshot
+                WHERE metric_name = p_metric
+                  AND period_start = (SELECT MAX(period_start) FROM KPI_Snapshot
+                                      WHERE metric_name = p_metric AND period_start < v_period);
+            END IF;
+            BEGIN
+                INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at)
+                VALUES (p_metric, v_period, v_base + p_delta, SYSTIMESTAMP);
+            EXCEPTION
+                WHEN DUP_VAL_ON_INDEX THEN
+                    UPDATE KPI_Snapshot
+                    SET metric_value = metric_value + p_delta, updated_at = SYSTIMESTAMP
+                    WHERE metric_name = p_metric AND period_start = v_period;
+            END;
+        END IF;
+    END add_kpi_delta;
+
+    -- =========================================================================
+    -- PROCEDURE: refresh_kpi_snapshot (same statements as core/summaries.py)
+    -- =========================================================================
+    -- Recounts the state metrics of the current month, which also opens the
+    -- month's rows, and the monthly donation totals from Donation_Rollup.
+    -- Past months of the state metrics are history and are never rewritten.
+    PROCEDURE refresh_kpi_snapshot IS
+    BEGIN
+        DELETE FROM Volunteer_Activity_Summary;
+        INSERT INTO Volunteer_Activity_Summary (volunteer_id, active_assignments)
+        SELECT volunteer_id, COUNT(*) FROM Volunteer_Project WHERE status = 'A' GROUP BY volunteer_id;
+
+        DELETE FROM KPI_Snapshot
+        WHERE period_start = TRUNC(SYSDATE, 'MM') AND metric_name <> 'MONTHLY_DONATIONS';
+        INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at)
+        SELECT 'ACTIVE_PROJECTS', TRUNC(SYSDATE, 'MM'), COUNT(*), SYSTIMESTAMP
+        FROM Project p JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+        WHERE ps.status_name = 'ACTIVO'
+        UNION ALL
+        SELECT 'ACTIVE_VOLUNTEERS', TRUNC(SYSDATE, 'MM'), COUNT(*), SYSTIMESTAMP FROM Volunteer_Activity_Summary
+        UNION ALL
+        SELECT 'TOTAL_NGOS', TRUNC(SYSDATE, 'MM'), COUNT(*), SYSTIMESTAMP FROM NGO;
+
+        -- Sin historia (primera carga): estimación del cierre del mes anterior
+        INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at)
+        SELECT e.metric_name, ADD_MONTHS(TRUNC(SYSDATE, 'MM'), -1), e.metric_value, SYSTIMESTAMP
+        FROM (
+            SELECT 'ACTIVE_PROJECTS' AS metric_name, COUNT(*) AS metric_value
+            FROM Project p JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            WHERE ps.status_name = 'ACTIVO' AND p.start_date < TRUNC(SYSDATE, 'MM')
+            UNION ALL
+            SELECT 'ACTIVE_VOLUNTEERS', COUNT(DISTINCT volunteer_id)
+            FROM Volunteer_Project WHERE status = 'A' AND assignment_date < TRUNC(SYSDATE, 'MM')
+            UNION ALL
+            SELECT 'TOTAL_NGOS', COUNT(*) FROM NGO
+        ) e
+        WHERE NOT EXISTS (SELECT 1 FROM KPI_Snapshot k
+                          WHERE k.metric_name = e.metric_name AND k.period_start < TRUNC(SYSDATE, 'MM'));
+
+        DELETE FROM KPI_Snapshot WHERE metric_name = 'MONTHLY_DONATIONS';
+        INSERT INTO KPI_Snapshot (metric_name, period_start, metric_value, updated_at)
+        SELECT 'MONTHLY_DONATIONS', month_start, SUM(total_amount), SYSTIMESTAMP
+        FROM Donation_Rollup GROUP BY month_start;
+    END refresh_kpi_snapshot;
+
     -- =========================================================================
     -- PROCEDURE: get_donation_trends (Data for Area Chart)
     -- =========================================================================
@@ -1133,18 +1327,30 @@ CREATE OR REPLACE PACKAGE BODY PKG_DASHBOARD_ANALYTICS AS
         p_cursor OUT SYS_REFCURSOR
     ) IS
     BEGIN
+        -- Lee el rollup mensual (a lo sumo 12 meses x proyectos x monedas),
+        -- no Donation: el rango sobre month_start usa la clave primaria
         OPEN p_cursor FOR
             SELECT 
-                TO_CHAR(donation_date, 'YYYY-MM') AS mes,
-                TO_CHAR(donation_date, 'Month', 'NLS_DATE_LANGUAGE=ENGLISH') AS mes_nombre,
-                COUNT(*) AS num_donaciones,
-                NVL(SUM(amount), 0) AS monto_total,
-                NVL(AVG(amount), 0) AS monto_promedio,
-                COUNT(DISTINCT donor_id) AS donantes_unicos
-            FROM Donation
-            WHERE EXTRACT(YEAR FROM donation_date) = p_year
-            GROUP BY TO_CHAR(donation_date, 'YYYY-MM'), 
-                     TO_CHAR(donation_date, 'Month', 'NLS_DATE_LANGUAGE=ENGLISH')
+                TO_CHAR(r.month_start, 'YYYY-MM') AS mes,
+                TO_CHAR(r.month_start, 'Month', 'NLS_DATE_LANGUAGE=ENGLISH') AS mes_nombre,
+                r.num_donaciones,
+                r.monto_total,
+                NVL(r.monto_total / NULLIF(r.num_donaciones, 0), 0) AS monto_promedio,
+                NVL(dr.donantes_unicos, 0) AS donantes_unicos
+            FROM (
+                SELECT month_start, SUM(donation_count) AS num_donaciones, NVL(SUM(total_amount), 0) AS monto_total
+                FROM Donation_Rollup
+                WHERE month_start >= TO_DATE(p_year || '-01-01', 'YYYY-MM-DD')
+                  AND month_start < ADD_MONTHS(TO_DATE(p_year || '-01-01', 'YYYY-MM-DD'), 12)
+                GROUP BY month_start
+            ) r
+            LEFT JOIN (
+                SELECT month_start, COUNT(DISTINCT donor_id) AS donantes_unicos
+                FROM Donation_Donor_Rollup
+                WHERE month_start >= TO_DATE(p_year || '-01-01', 'YYYY-MM-DD')
+                  AND month_start < ADD_MONTHS(TO_DATE(p_year || '-01-01', 'YYYY-MM-DD'), 12)
+                GROUP BY month_start
+            ) dr ON r.month_start = dr.month_start
             ORDER BY mes;
     END get_donation_trends;
 
@@ -1165,7 +1371,7 @@ CREATE OR REPLACE PACKAGE BODY PKG_DASHBOARD_ANALYTICS AS
     END get_project_status_distribution;
 
     -- =========================================================================
-    -- PROCEDURE: get_projects_paginated (Unchanged body)
+    -- PROCEDURE: get_projects_paginated
     -- =========================================================================
     PROCEDURE get_projects_paginated(
         p_page IN NUMBER DEFAULT 1,
@@ -1187,16 +1393,213 @@ CREATE OR REPLACE PACKAGE BODY PKG_DASHBOARD_ANALYTICS AS
                 ps.status_name,
                 n.name AS ngo_name,
                 p.start_date,
-                p.end_date
+                p.end_date,
+                -- Se evalúa antes del OFFSET/FETCH: total de filas del filtro
+                COUNT(*) OVER () AS total_count
             FROM Project p
             JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
             JOIN NGO n ON p.ong_id = n.ong_id
             WHERE (p_status IS NULL OR ps.status_name = p_status)
             AND (p_ong_id IS NULL OR p.ong_id = p_ong_id)
-            ORDER BY p.start_date DESC
+            -- project_id desempata: sin él, las páginas podrían repetir u omitir
+            -- proyectos con la misma fecha de inicio
+            ORDER BY p.start_date DESC, p.project_id DESC
             OFFSET v_offset ROWS FETCH NEXT p_page_size ROWS ONLY;
     END get_projects_paginated;
 
+    -- =========================================================================
+    -- PROCEDURE: get_volunteer_dashboard (7 implicit result sets)
+    -- =========================================================================
+    PROCEDURE get_volunteer_dashboard(p_volunteer_id IN NUMBER) IS
+        c_active        SYS_REFCURSOR;
+        c_hours         SYS_REFCURSOR;
+        c_completed     SYS_REFCURSOR;
+        c_specialties   SYS_REFCURSOR;
+        c_contribution  SYS_REFCURSOR;
+        c_opportunities SYS_REFCURSOR;
+        c_name          SYS_REFCURSOR;
+    BEGIN
+        -- 1. Active projects
+        OPEN c_active FOR
+            SELECT COUNT(*) AS count
+            FROM Volunteer_Project vp
+            JOIN Project p ON vp.project_id = p.project_id
+            JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            WHERE vp.volunteer_id = p_volunteer_id
+            AND vp.status = 'A'
+            AND ps.status_name = 'ACTIVO';
+        DBMS_SQL.RETURN_RESULT(c_active);
+
+        -- 2. Hours this month (days assigned as proxy)
+        OPEN c_hours FOR
+            SELECT NVL(SUM(
+                CASE 
+                    WHEN vp.end_date IS NOT NULL THEN TRUNC(vp.end_date) - TRUNC(vp.assignment_date)
+                    ELSE TRUNC(SYSDATE) - TRUNC(vp.assignment_date)
+                END
+            ), 0) AS hours
+            FROM Volunteer_Project vp
+            WHERE vp.volunteer_id = p_volunteer_id
+            AND vp.status = 'A'
+            AND EXTRACT(MONTH FROM vp.assignment_date) = EXTRACT(MONTH FROM SYSDATE)
+            AND EXTRACT(YEAR FROM vp.assignment_date) = EXTRACT(YEAR FROM SYSDATE);
+        DBMS_SQL.RETURN_RESULT(c_hours);
+
+        -- 3. Projects completed
+        OPEN c_completed FOR
+            SELECT COUNT(*) AS count
+            FROM Volunteer_Project vp
+            JOIN Project p ON vp.project_id = p.project_id
+            JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            WHERE vp.volunteer_id = p_volunteer_id
+            AND ps.status_name = 'COMPLETADO';
+        DBMS_SQL.RETURN_RESULT(c_completed);
+
+        -- 4. Specialties
+        OPEN c_specialties FOR
+            SELECT s.specialty_name, s.description
+            FROM Volunteer_Specialty vs
+            JOIN Specialty s ON vs.specialty_id = s.specialty_id
+            WHERE vs.volunteer_id = p_volunteer_id
+            ORDER BY vs.assignment_date DESC;
+        DBMS_SQL.RETURN_RESULT(c_specialties);
+
+        -- 5. Contribution by month (current year)
+        OPEN c_contribution FOR
+            SELECT 
+                TO_CHAR(vp.assignment_date, 'MON') AS month,
+                TO_CHAR(vp.assignment_date, 'MM') AS month_num,
+                COUNT(*) AS project_count,
+                SUM(
+                    CASE 
+                        WHEN vp.end_date IS NOT NULL THEN TRUNC(vp.end_date) - TRUNC(vp.assignment_date)
+                        ELSE TRUNC(SYSDATE) - TRUNC(vp.assignment_date)
+                    END
+                ) AS hours
+            FROM Volunteer_Project vp
+            WHERE vp.volunteer_id = p_volunteer_id
+            AND EXTRACT(YEAR FROM vp.assignment_date) = EXTRACT(YEAR FROM SYSDATE)
+            GROUP BY TO_CHAR(vp.assignment_date, 'MON'), TO_CHAR(vp.assignment_date, 'MM')
+            ORDER BY TO_NUMBER(TO_CHAR(vp.assignment_date, 'MM'));
+        DBMS_SQL.RETURN_RESULT(c_contribution);
+
+        -- 6. Available opportunities (not assigned / not applied)
+        OPEN c_opportunities FOR
+            SELECT 
+                p.project_id,
+                p.name AS project_name,
+                n.name AS ngo_name,
+                n.city || ', ' || n.country AS location,
+                TO_CHAR(TRUNC(p.start_date), 'Mon DD, YYYY') AS start_date,
+                ROUND((p.end_date - p.start_date)) AS duration_days,
+                ps.status_name AS project_status,
+                (SELECT COUNT(*) FROM Volunteer_Project vp2 WHERE vp2.project_id = p.project_id AND vp2.status = 'A') AS team_size
+            FROM Project p
+            JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            JOIN NGO n ON p.ong_id = n.ong_id
+            WHERE ps.status_name = 'ACTIVO'
+            AND p.project_id NOT IN (
+                SELECT project_id FROM Volunteer_Project 
+                WHERE volunteer_id = p_volunteer_id AND status = 'A'
+            )
+            AND p.project_id NOT IN (
+                SELECT project_id FROM Volunteer_Application
+                WHERE volunteer_id = p_volunteer_id AND status IN ('PENDING', 'PENDIENTE')
+            )
+            -- Ordena primero y corta después: ROWNUM tomaba 5 filas cualesquiera
+            ORDER BY p.start_date DESC, p.project_id DESC
+            FETCH FIRST 5 ROWS ONLY;
+        DBMS_SQL.RETURN_RESULT(c_opportunities);
+
+        -- 7. Volunteer first name (greeting)
+        OPEN c_name FOR
+            SELECT first_name FROM Volunteer WHERE volunteer_id = p_volunteer_id;
+        DBMS_SQL.RETURN_RESULT(c_name);
+    END get_volunteer_dashboard;
+
+    -- =========================================================================
+    -- PROCEDURE: get_representative_ngo_dashboard (5 implicit result sets)
+    -- =========================================================================
+    PROCEDURE get_representative_ngo_dashboard(p_representative_id IN NUMBER) IS
+        v_ong_id      NGO.ong_id%TYPE;
+        c_ngo         SYS_REFCURSOR;
+        c_financial   SYS_REFCURSOR;
+        c_rep         SYS_REFCURSOR;
+        c_projects    SYS_REFCURSOR;
+        c_success     SYS_REFCURSOR;
+    BEGIN
+        BEGIN
+            SELECT ong_id INTO v_ong_id
+            FROM Representative
+            WHERE representative_id = p_representative_id;
+        EXCEPTION
+            WHEN NO_DATA_FOUND THEN v_ong_id := NULL;
+        END;
+
+        -- 1. NGO info (no rows if the representative has no NGO)
+        OPEN c_ngo FOR
+            SELECT n.ong_id, n.name, n.registration_number, n.country, n.city, 
+                   n.address, n.contact_email, n.phone
+            FROM NGO n
+            WHERE n.ong_id = v_ong_id;
+        DBMS_SQL.RETURN_RESULT(c_ngo);
+
+        -- 2. Financial overview. Los totales por proyecto salen de
+        -- Project_Finance_Summary: unir Budget y Donation en la misma consulta
+        -- multiplicaba las sumas cuando un proyecto tenía varios de cada uno
+        OPEN c_financial FOR
+            SELECT 
+                COUNT(p.project_id) AS total_projects,
+                NVL(SUM(s.budget_count), 0) AS active_budgets,
+                NVL(SUM(s.total_budget), 0) AS total_budget,
+                NVL(SUM(s.total_received), 0) AS total_donations_received
+            FROM Project p
+            LEFT JOIN Project_Finance_Summary s ON p.project_id = s.project_id
+            WHERE p.ong_id = v_ong_id;
+        DBMS_SQL.RETURN_RESULT(c_financial);
+
+        -- 3. Representative info
+        OPEN c_rep FOR
+            SELECT r.first_name || ' ' || r.last_name AS representative_name, r.email AS rep_email
+            FROM Representative r
+            WHERE r.representative_id = p_representative_id;
+        DBMS_SQL.RETURN_RESULT(c_rep);
+
+        -- 4. Active projects with budget info (one row per budget; the
+        -- donations received are the project's, from the summary)
+        OPEN c_projects FOR
+            SELECT 
+                p.project_id,
+                p.name AS project_name,
+                ps.status_name,
+                NVL(b.initial_amount, 0) AS budget_amount,
+                NVL(c.currency_code, 'USD') AS currency_code,
+                NVL(s.total_received, 0) AS total_received,
+                CASE 
+                    WHEN NVL(b.initial_amount, 0) > 0 
+                    THEN ROUND((NVL(s.total_received, 0) / b.initial_amount) * 100, 2)
+                    ELSE 0
+                END AS budget_utilization_percent
+            FROM Project p
+            JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            LEFT JOIN Project_Finance_Summary s ON p.project_id = s.project_id
+            LEFT JOIN Budget b ON p.project_id = b.project_id
+            LEFT JOIN Currency c ON b.currency_id = c.currency_id
+            WHERE p.ong_id = v_ong_id AND ps.status_name = 'ACTIVO'
+            ORDER BY p.name, b.budget_id;
+        DBMS_SQL.RETURN_RESULT(c_projects);
+
+        -- 5. Success rate inputs
+        OPEN c_success FOR
+            SELECT 
+                COUNT(CASE WHEN ps.status_name = 'COMPLETADO' THEN 1 END) AS completed,
+                COUNT(*) AS total
+            FROM Project p
+            JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
+            WHERE p.ong_id = v_ong_id;
+        DBMS_SQL.RETURN_RESULT(c_success);
+    END get_representative_ngo_dashboard;
+
     -- NOTE: get_projects_total_count body is deleted.
     
 END PKG_DASHBOARD_ANALYTICS;
@@ -1249,7 +1652,7 @@ GROUP BY
   d.donor_id, d.name, dt.type_name, c.currency_code
 ORDER BY total_amount_donated DESC;
 
--- VIEW 3: Project Budget Status
+-- VIEW 3: Project Budget Status (one row per budget; received = project total)
 CREATE OR REPLACE VIEW vw_project_budget_status AS
 SELECT
   p.project_id,
@@ -1257,19 +1660,16 @@ SELECT
   b.budget_id,
   b.initial_amount AS budget_amount,
   c.currency_code,
-  NVL(SUM(d.amount), 0) AS total_received,
-  b.initial_amount - NVL(SUM(d.amount), 0) AS remaining_budget,
-  ROUND((NVL(SUM(d.amount), 0) / NULLIF(b.initial_amount, 0)) * 100, 2) AS budget_utilization_percent,
+  NVL(s.total_received, 0) AS total_received,
+  b.initial_amount - NVL(s.total_received, 0) AS remaining_budget,
+  ROUND((NVL(s.total_received, 0) / NULLIF(b.initial_amount, 0)) * 100, 2) AS budget_utilization_percent,
   b.creation_date AS budget_created_date,
   p.start_date,
   p.end_date
 FROM Project p
 LEFT JOIN Budget b ON p.project_id = b.project_id
 LEFT JOIN Currency c ON b.currency_id = c.currency_id
-LEFT JOIN Donation d ON p.project_id = d.project_id
-GROUP BY
-  p.project_id, p.name, b.budget_id, b.initial_amount,
-  c.currency_code, b.creation_date, p.start_date, p.end_date;
+LEFT JOIN Project_Finance_Summary s ON p.project_id = s.project_id;
 
 -- VIEW 4: Volunteer Expertise Mapping
 CREATE OR REPLACE VIEW vw_volunteer_expertise_mapping AS
@@ -1334,22 +1734,26 @@ LEFT JOIN Approval_Status ask ON a.approval_status_id = ask.approval_status_id
 LEFT JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
 LEFT JOIN Employee e ON a.employee_id = e.employee_id;
 
--- VIEW 8: Donation Trends by Currency
+-- VIEW 8: Donation Trends by Currency (same columns, over the rollup)
 CREATE OR REPLACE VIEW vw_donation_trends_by_currency AS
 SELECT
   c.currency_id,
   c.currency_name,
   c.currency_code,
   c.symbol,
-  COUNT(d.donation_id) AS donation_count,
-  NVL(SUM(d.amount), 0) AS total_donations_local,
-  NVL(AVG(d.amount), 0) AS average_donation_local,
-  NVL(MIN(d.amount), 0) AS min_donation,
-  NVL(MAX(d.amount), 0) AS max_donation,
-  COUNT(DISTINCT d.project_id) AS projects_receiving,
-  COUNT(DISTINCT d.donor_id) AS unique_donors
+  NVL(SUM(r.donation_count), 0) AS donation_count,
+  NVL(SUM(r.total_amount), 0) AS total_donations_local,
+  NVL(SUM(r.total_amount) / NULLIF(SUM(r.donation_count), 0), 0) AS average_donation_local,
+  NVL(MIN(r.min_amount), 0) AS min_donation,
+  NVL(MAX(r.max_amount), 0) AS max_donation,
+  COUNT(DISTINCT r.project_id) AS projects_receiving,
+  NVL(MAX(dr.unique_donors), 0) AS unique_donors
 FROM Currency c
-LEFT JOIN Donation d ON c.currency_id = d.currency_id
+LEFT JOIN Donation_Rollup r ON c.currency_id = r.currency_id
+LEFT JOIN (
+  SELECT currency_id, COUNT(DISTINCT donor_id) AS unique_donors
+  FROM Donation_Donor_Rollup GROUP BY currency_id
+) dr ON c.currency_id = dr.currency_id
 GROUP BY
   c.currency_id, c.currency_name, c.currency_code, c.symbol;
 
@@ -1450,22 +1854,24 @@ LEFT JOIN Volunteer_Specialty vs ON vp.volunteer_id = vs.volunteer_id
 GROUP BY
   p.project_id, p.name, ps.status_name, p.start_date, p.end_date;
 
--- VIEW 13: NGO Financial Overview
+-- VIEW 13: NGO Financial Overview (budget and donation totals summed separately)
 CREATE OR REPLACE VIEW vw_ngo_financial_overview AS
 SELECT
   n.ong_id,
   n.name AS ngo_name,
-  COUNT(DISTINCT p.project_id) AS total_projects,
-  COUNT(DISTINCT b.budget_id) AS active_budgets,
-  NVL(SUM(b.initial_amount), 0) AS total_budget,
-  NVL(SUM(d.amount), 0) AS total_donations_received,
-  NVL(SUM(b.initial_amount), 0) - NVL(SUM(d.amount), 0) AS total_remaining_budget,
-  COUNT(DISTINCT don.donor_id) AS unique_donors
+  COUNT(p.project_id) AS total_projects,
+  NVL(SUM(s.budget_count), 0) AS active_budgets,
+  NVL(SUM(s.total_budget), 0) AS total_budget,
+  NVL(SUM(s.total_received), 0) AS total_donations_received,
+  NVL(SUM(s.total_budget), 0) - NVL(SUM(s.total_received), 0) AS total_remaining_budget,
+  NVL(MAX(ds.unique_donors), 0) AS unique_donors
 FROM NGO n
 LEFT JOIN Project p ON n.ong_id = p.ong_id
-LEFT JOIN Budget b ON p.project_id = b.project_id
-LEFT JOIN Donation d ON p.project_id = d.project_id
-LEFT JOIN Donor don ON d.donor_id = don.donor_id
+LEFT JOIN Project_Finance_Summary s ON p.project_id = s.project_id
+LEFT JOIN (
+  SELECT ong_id, COUNT(*) AS unique_donors
+  FROM NGO_Donor_Summary GROUP BY ong_id
+) ds ON n.ong_id = ds.ong_id
 GROUP BY
   n.ong_id, n.name;
 
@@ -0,0 +1,366 @@
+-- =============================================================================
+-- PURPOSE: Trigger-maintained financial summaries
+-- =============================================================================
+-- vw_project_budget_status and vw_ngo_financial_overview used to LEFT JOIN
+-- Budget and Donation in the same GROUP BY: every request scanned
+-- budgets x donations, and an NGO's totals were multiplied whenever a project
+-- had several budgets (and donations as many times as there were budgets).
+--
+-- The totals are now kept per project by row triggers on Budget, Donation
+-- and Project, and both views (RedRomero_ProgrammingObjectsv2.sql) read them
+-- in O(projects):
+--   Project_Finance_Summary : one row per project (budget and donation totals)
+--   NGO_Donor_Summary       : donations per (NGO, donor), for unique donors
+--
+-- Donation trends are served from a monthly rollup (section 3), kept by the
+-- donation procedures of PKG_FINANCE_CORE rather than by triggers:
+--   Donation_Rollup       : month x project x currency (count, sum, min, max)
+--   Donation_Donor_Rollup : month x currency x donor, for unique donors
+--
+-- The dashboard KPIs are read from monthly snapshots (section 4), kept by
+-- triggers, by the donation procedures and by a daily job:
+--   KPI_Snapshot               : metric x month
+--   Volunteer_Activity_Summary : active assignments per volunteer
+--
+-- The tables are created with the rest of the schema in RedRomero_Objects.sql;
+-- this script only adds the triggers that keep them and fills them. Run after
+-- RedRomero_Objects.sql, RedRomero_ProgrammingObjectsv2.sql and
+-- RedRomero_Logs.sql. Sections 2, 3 and 4 fill the tables from the current
+-- data; the same rebuild is available as `python manage.py rebuild_summaries`.
+-- =============================================================================
+
+-- =============================================================================
+-- SECTION 1: MAINTENANCE TRIGGERS
+-- =============================================================================
+
+-- 1.1. Every project has its summary row: Budget/Donation triggers only UPDATE
+--      it, so concurrent first writes to a project never race on an INSERT.
+CREATE OR REPLACE TRIGGER trg_project_summary_row
+AFTER INSERT ON Project
+FOR EACH ROW
+BEGIN
+    INSERT INTO Project_Finance_Summary (project_id) VALUES (:NEW.project_id);
+END;
+/
+
+-- 1.2. Budget totals per project
+CREATE OR REPLACE TRIGGER trg_budget_summary
+AFTER INSERT OR DELETE OR UPDATE OF initial_amount, project_id ON Budget
+FOR EACH ROW
+BEGIN
+    IF DELETING OR UPDATING THEN
+        UPDATE Project_Finance_Summary
+        SET budget_count = budget_count - 1,
+            total_budget = total_budget - :OLD.initial_amount
+        WHERE project_id = :OLD.project_id;
+    END IF;
+    IF INSERTING OR UPDATING THEN
+        UPDATE Project_Finance_Summary
+        SET budget_count = budget_count + 1,
+            total_budget = total_budget + :NEW.initial_amount
+        WHERE project_id = :NEW.project_id;
+    END IF;
+END;
+/
+
+-- 1.3. Donation totals per project and donors per NGO
+CREATE OR REPLACE TRIGGER trg_donation_summary
+AFTER INSERT OR DELETE OR UPDATE OF amount, project_id, donor_id ON Donation
+FOR EACH ROW
+DECLARE
+    v_ong_id NGO.ong_id%TYPE;
+BEGIN
+    IF DELETING OR UPDATING THEN
+        UPDATE Project_Finance_Summary
+        SET donation_count = donation_count - 1,
+            total_received = total_received - :OLD.amount
+        WHERE project_id = :OLD.project_id;
+
+        SELECT ong_id INTO v_ong_id FROM Project WHERE project_id = :OLD.project_id;
+        UPDATE NGO_Donor_Summary
+        SET donation_count = donation_count - 1
+        WHERE ong_id = v_ong_id AND donor_id = :OLD.donor_id;
+        DELETE FROM NGO_Donor_Summary
+        WHERE ong_id = v_ong_id AND donor_id = :OLD.donor_id AND donation_count <= 0;
+    END IF;
+
+    IF INSERTING OR UPDATING THEN
+        UPDATE Project_Finance_Summary
+        SET donation_count = donation_count + 1,
+            total_received = total_received + :NEW.amount
+        WHERE project_id = :NEW.project_id;
+
+        SELECT ong_id INTO v_ong_id FROM Project WHERE project_id = :NEW.project_id;
+        UPDATE NGO_Donor_Summary
+        SET donation_count = donation_count + 1
+        WHERE ong_id = v_ong_id AND donor_id = :NEW.donor_id;
+        IF SQL%ROWCOUNT = 0 THEN
+            BEGIN
+                INSERT INTO NGO_Donor_Summary (ong_id, donor_id, donation_count)
+                VALUES (v_ong_id, :NEW.donor_id, 1);
+            EXCEPTION
+                -- Otra sesión registró la primera donación de este donante a la ONG
+                WHEN DUP_VAL_ON_INDEX THEN
+                    UPDATE NGO_Donor_Summary
+                    SET donation_count = donation_count + 1
+                    WHERE ong_id = v_ong_id AND donor_id = :NEW.donor_id;
+            END;
+        END IF;
+    END IF;
+END;
+/
+
+-- 1.4. A project moved to another NGO takes its donors with it
+CREATE OR REPLACE TRIGGER trg_project_ngo_summary
+AFTER UPDATE OF ong_id ON Project
+FOR EACH ROW
+WHEN (OLD.ong_id <> NEW.ong_id)
+BEGIN
+    FOR r IN (SELECT donor_id, COUNT(*) AS donations
+              FROM Donation WHERE project_id = :NEW.project_id
+              GROUP BY donor_id) LOOP
+        UPDATE NGO_Donor_Summary
+        SET donation_count = donation_count - r.donations
+        WHERE ong_id = :OLD.ong_id AND donor_id = r.donor_id;
+
+        MERGE INTO NGO_Donor_Summary s
+        USING (SELECT :NEW.ong_id AS ong_id, r.donor_id AS donor_id FROM dual) x
+        ON (s.ong_id = x.ong_id AND s.donor_id = x.donor_id)
+        WHEN MATCHED THEN UPDATE SET s.donation_count = s.donation_count + r.donations
+        WHEN NOT MATCHED THEN INSERT (ong_id, donor_id, donation_count)
+            VALUES (x.ong_id, x.donor_id, r.donations);
+    END LOOP;
+    DELETE FROM NGO_Donor_Summary WHERE ong_id = :OLD.ong_id AND donation_count <= 0;
+END;
+/
+
+-- =============================================================================
+-- SECTION 2: INITIAL LOAD (same statements as core/summaries.py)
+-- =============================================================================
+
+DELETE FROM Project_Finance_Summary;
+
+INSERT INTO Project_Finance_Summary (project_id, budget_count, total_budget, donation_count, total_received)
+SELECT
+  p.project_id,
+  NVL(b.budget_count, 0),
+  NVL(b.total_budget, 0),
+  NVL(d.donation_count, 0),
+  NVL(d.total_received, 0)
+FROM Project p
+LEFT JOIN (
+  SELECT project_id, COUNT(*) AS budget_count, SUM(initial_amount) AS total_budget
+  FROM Budget GROUP BY project_id
+) b ON p.project_id = b.project_id
+LEFT JOIN (
+  SELECT project_id, COUNT(*) AS donation_count, SUM(amount) AS total_received
+  FROM Donation GROUP BY project_id
+) d ON p.project_id = d.project_id;
+
+DELETE FROM NGO_Donor_Summary;
+
+INSERT INTO NGO_Donor_Summary (ong_id, donor_id, donation_count)
+SELECT p.ong_id, d.donor_id, COUNT(*)
+FROM Donation d
+JOIN Project p ON d.project_id = p.project_id
+GROUP BY p.ong_id, d.donor_id;
+
+COMMIT;
+
+-- =============================================================================
+-- SECTION 3: MONTHLY DONATION ROLLUP
+-- =============================================================================
+-- get_donation_trends, the trends of the admin reports page and
+-- vw_donation_trends_by_currency grouped the whole Donation table by
+-- TO_CHAR/EXTRACT of the date, which no index serves. They now read one row
+-- per month, project and currency that received donations.
+--
+-- Maintained by PKG_FINANCE_CORE.register_donation / update_donation /
+-- delete_donation. Rows loaded straight into Donation (RedRomero_Data.sql,
+-- generate_dataset) are only counted after a rebuild (section 3.1).
+
+-- 3.1. Initial load (same statements as core/summaries.py)
+DELETE FROM Donation_Rollup;
+
+INSERT INTO Donation_Rollup (month_start, project_id, currency_id, donation_count, total_amount, min_amount, max_amount)
+SELECT TRUNC(donation_date, 'MM'), project_id, currency_id, COUNT(*), SUM(amount), MIN(amount), MAX(amount)
+FROM Donation
+GROUP BY TRUNC(donation_date, 'MM'), project_id, currency_id;
+
+DELETE FROM Donation_Donor_Rollup;
+
+INSERT INTO Donation_Donor_Rollup (month_start, currency_id, donor_id, donation_count)
+SELECT TRUNC(donation_date, 'MM'), currency_id, donor_id, COUNT(*)
+FROM Donation
+GROUP BY TRUNC(donation_date, 'MM'), currency_id, donor_id;
+
+COMMIT;
+
+-- =============================================================================
+-- SECTION 4: KPI SNAPSHOTS
+-- =============================================================================
+-- PKG_DASHBOARD_ANALYTICS.get_main_kpis counted active projects, donations
+-- of this month and the last, distinct active volunteers and NGOs on every
+-- dashboard load, and rebuilt "a month ago" from start/assignment dates. It
+-- now reads one KPI_Snapshot row per metric and month:
+--   ACTIVE_PROJECTS, ACTIVE_VOLUNTEERS, TOTAL_NGOS : state at the end of the
+--     month (the current month's row is the live value). Months without
+--     changes have no row: the last earlier row still holds.
+--   MONTHLY_DONATIONS : donations of the month (flow; no row = 0).
+--
+-- The state metrics are moved by the triggers below, so every write path
+-- (packages and plain SQL from the views) counts. MONTHLY_DONATIONS follows
+-- Donation_Rollup in PKG_FINANCE_CORE. JOB_REFRESH_KPI_SNAPSHOT recounts
+-- the current month every night; its first run of a month opens the rows.
+
+-- 4.1. Triggers
+-- Each trigger MERGEs its delta into the current month's row; a month's first
+-- change starts from the last value recorded. JOB_REFRESH_KPI_SNAPSHOT opens
+-- the rows just after the 1st, so the insert branch is rarely taken.
+CREATE OR REPLACE TRIGGER trg_kpi_active_projects
+AFTER INSERT OR DELETE OR UPDATE OF project_status_id ON Project
+FOR EACH ROW
+DECLARE
+    v_old NUMBER := 0;
+    v_new NUMBER := 0;
+BEGIN
+    IF NOT INSERTING THEN
+        SELECT COUNT(*) INTO v_old FROM Project_Status
+        WHERE project_status_id = :OLD.project_status_id AND status_name = 'ACTIVO';
+    END IF;
+    IF NOT DELETING THEN
+        SELECT COUNT(*) INTO v_new FROM Project_Status
+        WHERE project_status_id = :NEW.project_status_id AND status_name = 'ACTIVO';
+    END IF;
+    IF v_new <> v_old THEN
+        MERGE INTO KPI_Snapshot k
+        USING (
+            SELECT 'ACTIVE_PROJECTS' AS metric_name, TRUNC(SYSDATE, 'MM') AS period_start,
+                   v_new - v_old AS delta,
+                   -- Primer cambio del mes: parte del último valor registrado
+                   NVL((SELECT MAX(metric_value) FROM KPI_Snapshot
+                        WHERE metric_name = 'ACTIVE_PROJECTS'
+                          AND period_start = (SELECT MAX(period_start) FROM KPI_Snapshot
+                                              WHERE metric_name = 'ACTIVE_PROJECTS'
+                                                AND period_start < TRUNC(SYSDATE, 'MM'))), 0) AS base
+            FROM DUAL
+        ) d
+        ON (k.metric_name = d.metric_name AND k.period_start = d.period_start)
+        WHEN MATCHED THEN
+            UPDATE SET k.metric_value = k.metric_value + d.delta, k.updated_at = SYSTIMESTAMP
+        WHEN NOT MATCHED THEN
+            INSERT (metric_name, period_start, metric_value, updated_at)
+            VALUES (d.metric_name, d.period_start, d.base + d.delta, SYSTIMESTAMP);
+    END IF;
+END;
+/
+
+-- Un voluntario cuenta una vez aunque tenga varias asignaciones activas
+CREATE OR REPLACE TRIGGER trg_kpi_active_volunteers
+AFTER INSERT OR DELETE OR UPDATE OF status, volunteer_id ON Volunteer_Project
+FOR EACH ROW
+DECLARE
+    v_left NUMBER;
+    v_delta NUMBER := 0;
+BEGIN
+    IF (DELETING OR UPDATING) AND :OLD.status = 'A' THEN
+        UPDATE Volunteer_Activity_Summary
+        SET active_assignments = active_assignments - 1
+        WHERE volunteer_id = :OLD.volunteer_id
+        RETURNING active_assignments INTO v_left;
+        IF SQL%ROWCOUNT > 0 AND v_left <= 0 THEN
+            DELETE FROM Volunteer_Activity_Summary WHERE volunteer_id = :OLD.volunteer_id;
+            v_delta := v_delta - 1;
+        END IF;
+    END IF;
+
+    IF (INSERTING OR UPDATING) AND :NEW.status = 'A' THEN
+        UPDATE Volunteer_Activity_Summary
+        SET active_assignments = active_assignments + 1
+        WHERE volunteer_id = :NEW.volunteer_id;
+        IF SQL%ROWCOUNT = 0 THEN
+            BEGIN
+                INSERT INTO Volunteer_Activity_Summary (volunteer_id, active_assignments)
+                VALUES (:NEW.volunteer_id, 1);
+                v_delta := v_delta + 1;
+            EXCEPTION
+                -- Otra sesión activó a la vez la primera asignación del voluntario
+                WHEN DUP_VAL_ON_INDEX THEN
+                    UPDATE Volunteer_Activity_Summary
+                    SET active_assignments = active_assignments + 1
+                    WHERE volunteer_id = :NEW.volunteer_id;
+            END;
+        END IF;
+    END IF;
+
+    IF v_delta <> 0 THEN
+        MERGE INTO KPI_Snapshot k
+        USING (
+            SELECT 'ACTIVE_VOLUNTEERS' AS metric_name, TRUNC(SYSDATE, 'MM') AS period_start,
+                   v_delta AS delta,
+                   -- Primer cambio del mes: parte del último valor registrado
+                   NVL((SELECT MAX(metric_value) FROM KPI_Snapshot
+                        WHERE metric_name = 'ACTIVE_VOLUNTEERS'
+                          AND period_start = (SELECT MAX(period_start) FROM KPI_Snapshot
+                                              WHERE metric_name = 'ACTIVE_VOLUNTEERS'
+                                                AND period_start < TRUNC(SYSDATE, 'MM'))), 0) AS base
+            FROM DUAL
+        ) d
+        ON (k.metric_name = d.metric_name AND k.period_start = d.period_start)
+        WHEN MATCHED THEN
+            UPDATE SET k.metric_value = k.metric_value + d.delta, k.updated_at = SYSTIMESTAMP
+        WHEN NOT MATCHED THEN
+            INSERT (metric_name, period_start, metric_value, updated_at)
+            VALUES (d.metric_name, d.period_start, d.base + d.delta, SYSTIMESTAMP);
+    END IF;
+END;
+/
+
+CREATE OR REPLACE TRIGGER trg_kpi_total_ngos
+AFTER INSERT OR DELETE ON NGO
+FOR EACH ROW
+DECLARE
+    v_delta NUMBER;
+BEGIN
+    v_delta := CASE WHEN INSERTING THEN 1 ELSE -1 END;
+    MERGE INTO KPI_Snapshot k
+    USING (
+        SELECT 'TOTAL_NGOS' AS metric_name, TRUNC(SYSDATE, 'MM') AS period_start,
+               v_delta AS delta,
+               -- Primer cambio del mes: parte del último valor registrado
+               NVL((SELECT MAX(metric_value) FROM KPI_Snapshot
+                    WHERE metric_name = 'TOTAL_NGOS'
+                      AND period_start = (SELECT MAX(period_start) FROM KPI_Snapshot
+                                          WHERE metric_name = 'TOTAL_NGOS'
+                                            AND period_start < TRUNC(SYSDATE, 'MM'))), 0) AS base
+        FROM DUAL
+    ) d
+    ON (k.metric_name = d.metric_name AND k.period_start = d.period_start)
+    WHEN MATCHED THEN
+        UPDATE SET k.metric_value = k.metric_value + d.delta, k.updated_at = SYSTIMESTAMP
+    WHEN NOT MATCHED THEN
+        INSERT (metric_name, period_start, metric_value, updated_at)
+        VALUES (d.metric_name, d.period_start, d.base + d.delta, SYSTIMESTAMP);
+END;
+/
+
+-- 4.2. Initial load (same statements as core/summaries.py)
+BEGIN
+    PKG_DASHBOARD_ANALYTICS.refresh_kpi_snapshot;
+    COMMIT;
+END;
+/
+
+-- 4.3. Daily recount; the run after midnight of the 1st opens the new month
+BEGIN
+    DBMS_SCHEDULER.CREATE_JOB(
+        job_name        => 'JOB_REFRESH_KPI_SNAPSHOT',
+        job_type        => 'PLSQL_BLOCK',
+        job_action      => 'BEGIN PKG_DASHBOARD_ANALYTICS.refresh_kpi_snapshot; COMMIT; END;',
+        start_date      => SYSTIMESTAMP,
+        repeat_interval => 'FREQ=DAILY;BYHOUR=0;BYMINUTE=5',
+        enabled         => TRUE,
+        comments        => 'Recount of KPI_Snapshot for the current month (scripts/RedRomero_Summaries.sql)'
+    );
+END;
+/
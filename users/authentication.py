@@ -0,0 +1,110 @@
+"""
+JWT authentication that builds request.user from the access token claims.
+
+The login serializer (CustomTokenObtainPairSerializer) puts into the token
+everything the views read from the user: username, role and the
+employee/volunteer/representative ids. Requests then authenticate without
+loading System_User from Oracle.
+
+Tokens stay valid until they expire, so deactivating a user or changing
+their role must go through `revoke_user()`. That records a small entry in
+the shared cache, and any token issued before it (by login time, which a
+refresh does not renew) is rejected. The entry is the only revocation check,
+so the cache must be shared by every worker: outside DEBUG the app refuses
+to start on a process-local backend (check_revocation_cache).
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+
+REVOKED_KEY = 'jwt-revoked:{}'
+
+# Claims añadidos al token en el login
+ROLE_CLAIM = 'role'
+AUTH_TIME_CLAIM = 'auth_time'
+
+
+def add_user_claims(token, user):
+    token['username'] = user.username
+    token[ROLE_CLAIM] = user.user_role
+    token['employee_id'] = user.employee_id
+    token['volunteer_id'] = user.volunteer_id
+    token['representative_id'] = user.representative_id
+    token[AUTH_TIME_CLAIM] = int(time.time())
+    return token
+
+
+def revoke_user(user_id):
+    """Reject every token issued to `user_id` up to now."""
+    # Basta con guardarlo lo que dura un refresh token: después no queda
+    # ningún token emitido antes de la revocación
+    lifetime = settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME']
+    cache.set(REVOKED_KEY.format(user_id), int(time.time()), int(lifetime.total_seconds()))
+
+
+# Backends que no comparten datos entre procesos (Dummy ni siquiera guarda)
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def check_revocation_cache():
+    """Raise ImproperlyConfigured if revocations would not reach every worker."""
+    if settings.DEBUG or not getattr(settings, 'JWT_CLAIMS_USER', True):
+        return
+    backend = settings.CACHES['default']['BACKEND']
+    if backend in PROCESS_LOCAL_CACHES:
+        raise ImproperlyConfigured(
+            f"JWT_CLAIMS_USER needs a cache shared by all workers to revoke tokens; "
+            f"{backend} is per process. Set CACHE_BACKEND/CACHE_LOCATION (Redis, Memcached) "
+            f"or JWT_CLAIMS_USER=0."
+        )
+
+
+class ClaimsUser(TokenUser):
+    """Request user backed by the access token (no System_User row behind it)."""
+
+    @cached_property
+    def user_id(self):
+        return self.id
+
+    @cached_property
+    def user_role(self):
+        return self.token.get(ROLE_CLAIM)
+
+    @cached_property
+    def employee_id(self):
+        return self.token.get('employee_id')
+
+    @cached_property
+    def volunteer_id(self):
+        return self.token.get('volunteer_id')
+
+    @cached_property
+    def representative_id(self):
+        return self.token.get('representative_id')
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that returns a ClaimsUser instead of querying
+    System_User. Tokens issued before the claims were added (or with
+    JWT_CLAIMS_USER off) fall back to the database lookup.
+    """
+
+    def get_user(self, validated_token):
+        if not getattr(settings, 'JWT_CLAIMS_USER', True) or ROLE_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        user = ClaimsUser(validated_token)
+        revoked_at = cache.get(REVOKED_KEY.format(user.user_id))
+        if revoked_at is not None and validated_token.get(AUTH_TIME_CLAIM, 0) <= revoked_at:
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+        return user
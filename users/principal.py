@@ -0,0 +1,66 @@
+"""
+Cached tenancy context of the logged-in principal.
+
+- Representative -> the NGO it belongs to.
+- Employee -> the set of projects it supervises (it has an Approval on them).
+
+Both are resolved once and kept in the shared cache for an access-token
+lifetime, together with the version of the table they were read from (see
+core/cache.py). A write to Representative or Approval (create_approval,
+process_approval, a representative update...) makes the cached context stale,
+and the next call reloads it.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from core import metrics
+from core.cache import table_versions
+from core.db import ROWS_TUPLE, fetch_raw_query
+
+CONTEXT_KEY = 'principal:{}:{}'
+
+
+def _timeout():
+    return int(settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].total_seconds())
+
+
+def _resolve(kind, principal_id, tables, load):
+    key = CONTEXT_KEY.format(kind, principal_id)
+    versions = table_versions(tables)
+    entry = cache.get(key)
+    if entry is not None and entry[1] == versions:
+        metrics.cache_lookup('principal', 'hit')
+        return entry[0]
+    metrics.cache_lookup('principal', 'miss')
+    value = load()
+    cache.set(key, (value, versions), _timeout())
+    return value
+
+
+def representative_ngo(representative_id):
+    """ong_id of the representative's NGO, or None if it has none."""
+    def load():
+        rows = fetch_raw_query(
+            "SELECT ong_id FROM Representative WHERE representative_id = %s",
+            [representative_id], mode=ROWS_TUPLE
+        )
+        return rows[0][0] if rows else None
+    return _resolve('rep', representative_id, ('Representative',), load)
+
+
+def supervised_projects(employee_id):
+    """frozenset of project ids the employee supervises."""
+    def load():
+        rows = fetch_raw_query(
+            "SELECT DISTINCT project_id FROM Approval WHERE employee_id = %s",
+            [employee_id], mode=ROWS_TUPLE
+        )
+        return frozenset(row[0] for row in rows)
+    return _resolve('emp', employee_id, ('Approval',), load)
+
+
+def supervises(employee_id, project_id):
+    try:
+        return int(project_id) in supervised_projects(employee_id)
+    except (TypeError, ValueError):
+        return False
@@ -1,6 +1,8 @@
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework import serializers
 
+from .authentication import add_user_claims
+
 # ==============================================================================
 # 1. Custom Serializer for JWT Tokens
 #    Includes custom fields (user_id, role) in the token response.
@@ -9,12 +11,16 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
     Custom Serializer for the SystemUser model, adjusting fields for Oracle PK.
     """
+    @classmethod
+    def get_token(cls, user):
+        # Rol e ids van en el token: ClaimsJWTAuthentication no consulta System_User
+        return add_user_claims(super().get_token(user), user)
+
     def validate(self, attrs):
         data = super().validate(attrs)
         data['user_id'] = self.user.user_id 
         data['username'] = self.user.username
         data['role'] = self.user.user_role
-        print(data)
         return data
 
 # ==============================================================================
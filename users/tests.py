@@ -1,3 +1,63 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from benchmarks.harness import Session
+
+
+# El cliente del harness usa Host: localhost
+@skipUnless(settings.DB_ENGINE == 'standin', 'needs DB_ENGINE=standin')
+@override_settings(ALLOWED_HOSTS=['localhost'])
+class AuditLogViewTests(TestCase):
+    """GET /api/admin/audit/ over a generated dataset (run with DB_ENGINE=standin)."""
+
+    URL = '/api/admin/audit/'
+    TAB_TYPES = (0, 1, 2, 3, 4)
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('generate_dataset', ngos=3, employees=3, volunteers=10, donors=10, projects=10,
+                     donations=40, history=40, password='bench123', stdout=StringIO())
+
+    def setUp(self):
+        self.session = Session('ADMIN', 'gen_admin')
+        self.session.login('bench123')
+
+    def get(self, query):
+        sample, body = self.session.request('get', f'{self.URL}?{query}')
+        return sample.status, body
+
+    def test_next_cursor_continues_the_feed(self):
+        for tab in self.TAB_TYPES:
+            with self.subTest(type=tab):
+                code, first = self.get(f'type={tab}&page_size=3')
+                self.assertEqual(code, 200, first)
+                self.assertIsNotNone(first['next'])
+
+                code, second = self.get(f"type={tab}&page_size=3&cursor={first['next']}")
+                self.assertEqual(code, 200, second)
+                self.assertTrue(second['results'])
+                seen = {row['id'] for row in first['results']}
+                self.assertFalse(seen & {row['id'] for row in second['results']})
+
+    def test_search_filters_in_sql(self):
+        for tab in self.TAB_TYPES:
+            with self.subTest(type=tab):
+                code, body = self.get(f'type={tab}&search=a')
+                self.assertEqual(code, 200, body)
+                for row in body['results']:
+                    text = f"{row['user']} {row['details']} {row['project']}".lower()
+                    self.assertIn('a', text)
+
+                code, body = self.get(f'type={tab}&search=zzzz-no-match')
+                self.assertEqual(code, 200, body)
+                self.assertEqual(body['results'], [])
+
+    def test_invalid_type_is_rejected(self):
+        for value in ('x', '9'):
+            with self.subTest(type=value):
+                code, body = self.get(f'type={value}')
+                self.assertEqual(code, 400, body)
@@ -4,82 +4,134 @@ from datetime import date, datetime
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
 from django.db import connection
 from rest_framework import status
-import oracledb 
 from django.contrib.auth.hashers import make_password
+from core.db import (
+    ROWS_TUPLE,
+    fetch_raw_query, fetch_pipelined_function, fetch_procedure_cursor,
+    fetch_implicit_results, execute_procedure_native,
+)
+from core.pagination import KeysetPage, InvalidCursor, and_where, get_page_size
+from core.streaming import streaming_json_response
+from core.concurrency import run_concurrently
+from core.cache import bump_tables
+from core.querycache import cached_procedure_cursor, cached_view_query
+from core.swr import get_or_refresh
+from core import singleflight
+from core import refdata
 from .serializers import UserProfileSerializer
+from .authentication import revoke_user
+from .principal import representative_ngo, supervises
 logger = logging.getLogger(__name__)
 
-# --- HELPER FUNCTIONS ---
 
-def dictfetchall(cursor):
-    """Return all rows from a cursor as a dict with lowercase keys."""
-    columns = [col[0].lower() for col in cursor.description]
-    return [
-        dict(zip(columns, row))
-        for row in cursor.fetchall()
-    ]
+def _or_default(value, default):
+    """`default` only for a NULL column; 0 and '' are real values."""
+    return default if value is None else value
 
-def fetch_pipelined_function(function_name):
-    """Executes an Oracle PIPELINED function."""
-    with connection.cursor() as cursor:
-        try:
-            cursor.execute(f"SELECT * FROM TABLE({function_name}())")
-            return dictfetchall(cursor)
-        except Exception as e:
-            logger.error(f"Error executing pipelined function {function_name}: {e}")
-            return []
-
-def fetch_procedure_cursor(procedure_call, params=None, out_args_count=0):
-    """
-    Executes a stored procedure and handles the Ref Cursor.
-    Adapted to handle native variables if needed, but defaults to simple cursor calls.
-    """
-    with connection.cursor() as cursor:
+# --- DASHBOARD VIEW ---
+
+class AdminDashboardData(APIView):
+    # Tablas de las que salen los KPIs y los gráficos
+    SOURCE_TABLES = ('Project', 'Project_Status', 'NGO', 'Donation', 'Volunteer', 'Approval',
+                     'Donation_Rollup', 'Donation_Donor_Rollup', 'KPI_Snapshot')
+
+    # Tablas de la tabla de proyectos paginada
+    PROJECT_TABLES = ('Project', 'Project_Status', 'NGO')
+    DEFAULT_PROJECT_PAGE_SIZE = 10
+    DEFAULT_PROJECT_STATUS = 'ACTIVO'
+
+    def get(self, request, *args, **kwargs):
+        # ?page=&page_size=&status=&ong_id= filtran la tabla de proyectos;
+        # status vacío = todos los estados
         try:
-            # Native connection access (kept for future flexibility)
-            native_conn = connection.connection
-            
-            out_vars = []
-            for _ in range(out_args_count):
-                out_vars.append(native_conn.var(oracledb.NUMBER))
-            
-            # Ref Cursor
-            ref_cursor = native_conn.cursor()
-            
-            args = []
-            if params: args.extend(params)
-            args.extend(out_vars)
-            args.append(ref_cursor) 
-            
-            cursor.callproc(procedure_call, args)
-            
-            data = dictfetchall(ref_cursor)
-            ref_cursor.close()
-            
-            if out_args_count > 0:
-                return data, out_vars[0].getvalue()
-                
-            return data, None
+            page = int(request.query_params.get('page', 1))
+            ong_id = request.query_params.get('ong_id') or None
+            ong_id = int(ong_id) if ong_id is not None else None
+        except ValueError:
+            return Response({"error": "page and ong_id must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+        if page < 1:
+            return Response({"error": "page must be 1 or greater"}, status=status.HTTP_400_BAD_REQUEST)
+        page_size = get_page_size(request, default=self.DEFAULT_PROJECT_PAGE_SIZE)
+        status_name = request.query_params.get('status', self.DEFAULT_PROJECT_STATUS) or None
+
+        # Se sirve del cache aunque esté algo viejo; se refresca en segundo plano.
+        # La entrada SWR es una sola (KPIs, gráficos y la primera página sin
+        # filtros); las demás páginas van al cache de resultados, cuyas claves
+        # expiran con QUERY_CACHE_TIMEOUT.
+        response_data = dict(get_or_refresh('admin_dashboard', self.build_payload, tables=self.SOURCE_TABLES))
+        filters = (page, page_size, status_name, ong_id)
+        if filters != (1, self.DEFAULT_PROJECT_PAGE_SIZE, self.DEFAULT_PROJECT_STATUS, None):
+            response_data.update(self.build_projects_page(*filters))
+        return Response(response_data, status=status.HTTP_200_OK)
 
-        except Exception as e:
-            logger.error(f"Error executing procedure {procedure_call}: {e}")
-            return [], None 
+    def fetch_projects(self, page, page_size, status_name, ong_id):
+        return cached_procedure_cursor(
+            'PKG_DASHBOARD_ANALYTICS.get_projects_paginated',
+            [page, page_size, status_name, ong_id],
+            tables=self.PROJECT_TABLES,
+        )
 
-def fetch_raw_query(query, params=None):
-    """Executes a raw SQL query."""
-    with connection.cursor() as cursor:
-        cursor.execute(query, params if params else [])
-        return dictfetchall(cursor)
+    def build_projects_page(self, page, page_size, status_name, ong_id, projects_raw=None):
+        # Cada fila trae total_count (COUNT(*) OVER ()): página y total en una sola ida
+        if projects_raw is None:
+            projects_raw = self.fetch_projects(page, page_size, status_name, ong_id)
+        if projects_raw:
+            total_count = projects_raw[0]['total_count']
+        elif page > 1:
+            # Página más allá del final: sin filas no hay total; se pide una fila
+            first = self.fetch_projects(1, 1, status_name, ong_id)
+            total_count = first[0]['total_count'] if first else 0
+        else:
+            total_count = 0
 
-# --- DASHBOARD VIEW ---
+        projects_table_data = []
+        for project in projects_raw:
+            end_date = project.get('end_date') 
+            progress_label = "Date N/A"
+            
+            if end_date:
+                if isinstance(end_date, datetime): end_date = end_date.date()
+                if isinstance(end_date, date):
+                    days_left = (end_date - date.today()).days
+                    if days_left > 0: progress_label = f"{days_left} days left"
+                    elif days_left == 0: progress_label = "Due today"
+                    else: progress_label = "Finished"
+            
+            projects_table_data.append({
+                'id': project['project_id'], 
+                'project': project['name'],  
+                'ngo': project['ngo_name'],  
+                'state': project['status_name'],
+                'progressLabel': progress_label,
+            })
 
-class AdminDashboardData(APIView):
+        return {
+            "active_projects_table": projects_table_data,
+            "total_project_count": int(total_count),
+            "page": page,
+            "page_size": page_size,
+        }
+
+    def build_payload(self):
+        # Las tres consultas son independientes: en modo paralelo cada una
+        # usa su propia sesión del pool y la latencia es la de la más lenta.
+        today = date.today()
+        results = run_concurrently({
+            'kpis': lambda: fetch_pipelined_function('PKG_DASHBOARD_ANALYTICS.get_main_kpis'),
+            'trends': lambda: fetch_procedure_cursor('PKG_DASHBOARD_ANALYTICS.get_donation_trends', [today.year], out_args_count=0),
+            'status': lambda: fetch_procedure_cursor('PKG_DASHBOARD_ANALYTICS.get_project_status_distribution', out_args_count=0),
+            'projects': lambda: fetch_procedure_cursor(
+                'PKG_DASHBOARD_ANALYTICS.get_projects_paginated',
+                [1, self.DEFAULT_PROJECT_PAGE_SIZE, self.DEFAULT_PROJECT_STATUS, None],
+                out_args_count=0
+            ),
+        }, parallel=settings.DASHBOARD_PARALLEL_QUERIES)
 
-    def get(self, request, *args, **kwargs):
         # 1. KPIs
-        kpis_raw = fetch_pipelined_function('PKG_DASHBOARD_ANALYTICS.get_main_kpis')
+        kpis_raw = results['kpis']
         kpi_map = {}
 
         for kpi in kpis_raw:
@@ -105,49 +157,24 @@ class AdminDashboardData(APIView):
                 'trend': formatted_trend if kpi.get('trend') != 'STABLE' else f"={abs(raw_change)}% No change",
             }
         
-       # 2. Projects Table
-        projects_raw, _ = fetch_procedure_cursor(
-            'PKG_DASHBOARD_ANALYTICS.get_projects_paginated', 
-            [1, 10, 'ACTIVO', None],
-            out_args_count=0 
-        )
-
-        projects_table_data = []
-        for project in projects_raw:
-            end_date = project.get('end_date') 
-            progress_label = "Date N/A"
-            
-            if end_date:
-                if isinstance(end_date, datetime): end_date = end_date.date()
-                if isinstance(end_date, date):
-                    days_left = (end_date - date.today()).days
-                    if days_left > 0: progress_label = f"{days_left} days left"
-                    elif days_left == 0: progress_label = "Due today"
-                    else: progress_label = "Finished"
-            
-            projects_table_data.append({
-                'id': project['project_id'], 
-                'project': project['name'],  
-                'ngo': project['ngo_name'],  
-                'state': project['status_name'],
-                'progressLabel': progress_label,
-            })
-
-        total_count = len(projects_table_data) 
-
-        # 3. Charts
-        donation_trends_raw, _ = fetch_procedure_cursor('PKG_DASHBOARD_ANALYTICS.get_donation_trends', [date.today().year], out_args_count=0) 
+        # 2. Charts
+        donation_trends_raw, _ = results['trends']
         donation_trends = [
             {'name': row['mes_nombre'][:3], 'value': row['monto_total']}
             for row in donation_trends_raw
         ]
         
-        project_status_pie_raw, _ = fetch_procedure_cursor('PKG_DASHBOARD_ANALYTICS.get_project_status_distribution', out_args_count=0)
+        project_status_pie_raw, _ = results['status']
         project_status_pie = [
             {'name': row['status_name'], 'value': row['cantidad']}
             for row in project_status_pie_raw
         ]
 
+        # 3. Primera página de proyectos (sin filtros)
+        projects_raw, _ = results['projects']
+        projects_page = self.build_projects_page(
+            1, self.DEFAULT_PROJECT_PAGE_SIZE, self.DEFAULT_PROJECT_STATUS, None, projects_raw=projects_raw)
+
         response_data = {
             "active_projects": kpi_map.get('ACTIVE_PROJECTS', {'value': '0', 'trend': 'N/A'}),
             "monthly_donations": kpi_map.get('MONTHLY_DONATIONS', {'value': '0', 'trend': 'N/A'}),
@@ -155,11 +182,10 @@ class AdminDashboardData(APIView):
             "registered_ngos": kpi_map.get('TOTAL_NGOS', {'value': '0', 'trend': 'N/A'}),
             "donation_trends": donation_trends,
             "project_status_pie": project_status_pie,
-            "active_projects_table": projects_table_data,
-            "total_project_count": total_count
+            **projects_page,
         }
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        return response_data
 
 # --- USER MANAGEMENT VIEW ---
 
@@ -167,20 +193,25 @@ class UserManagementView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        """List users."""
-        sql = "SELECT * FROM vw_system_user_activity ORDER BY user_id DESC"
-        users_data = fetch_raw_query(sql)
-        
-        formatted_users = []
-        for user in users_data:
-            formatted_users.append({
-                'id': user['user_id'],
-                'name': user['user_full_name'],
-                'email': user.get('email', 'N/A'),      
-                'role': user['user_role'], 
-                'status': user.get('status_label', 'Unknown') 
-            })
-        return Response(formatted_users, status=status.HTTP_200_OK)
+        """List users (streamed in fetchmany batches)."""
+        sql = """SELECT user_id, user_full_name, email, user_role, status_label
+                 FROM vw_system_user_activity ORDER BY user_id DESC"""
+
+        def format_user(row):
+            user_id, full_name, email, role, status_label = row
+            return {
+                'id': user_id,
+                'name': full_name,
+                'email': email,      
+                'role': role, 
+                'status': status_label or 'Unknown'
+            }
+
+        try:
+            return streaming_json_response(sql, row_builder=format_user, mode=ROWS_TUPLE)
+        except Exception as e:
+            logger.error(f"Error fetching users: {e}")
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def post(self, request):
         """Create a full user profile using PKG_SYSTEM_SECURITY."""
@@ -231,8 +262,7 @@ class UserManagementView(APIView):
             logger.info(f"Creating user with: {in_params}")
 
             # 3. Execute Procedure WITHOUT OUT params
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_SYSTEM_SECURITY.create_full_user', in_params)
+            execute_procedure_native('PKG_SYSTEM_SECURITY.create_full_user', in_params)
             
             return Response({'message': 'User profile created successfully'}, status=status.HTTP_201_CREATED)
 
@@ -251,10 +281,21 @@ class UserManagementView(APIView):
         new_status = request.data.get('status')
 
         try:
+            current = fetch_raw_query(
+                "SELECT username, user_role FROM System_User WHERE user_id = %s", [user_id]
+            )
+            execute_procedure_native('PKG_SYSTEM_SECURITY.update_user', [user_id, new_username, new_role])
             with connection.cursor() as cursor:
-                cursor.callproc('PKG_SYSTEM_SECURITY.update_user', [user_id, new_username, new_role])
                 is_active_val = 1 if new_status == 'Active' else 0
                 cursor.execute("UPDATE System_User SET is_active = %s WHERE user_id = %s", [is_active_val, user_id])
+            bump_tables('System_User')
+
+            # Usuario, rol y estado viajan en el token: si cambian, los tokens
+            # emitidos hasta ahora dejan de valer
+            previous = current[0] if current else {}
+            if (not is_active_val or previous.get('username') != new_username
+                    or previous.get('user_role') != new_role):
+                revoke_user(user_id)
             
             return Response({'message': 'User updated'}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -263,36 +304,24 @@ class UserManagementView(APIView):
 class SystemConfigView(APIView):
     permission_classes = [IsAuthenticated]
 
+    # type del frontend -> dataset de core.refdata
+    REFDATA_TYPES = {
+        'categories': 'project_categories',
+        'specialties': 'specialties',
+        'donorTypes': 'donor_types',
+        'sdgGoals': 'sdg_goals',
+        'currencies': 'currencies',
+        'statuses': 'project_statuses',
+    }
+
     def get(self, request):
         config_type = request.query_params.get('type')
         data = []
         
         try:
-            if config_type == 'categories':
-                sql = """
-                    SELECT c.category_id as id, c.category_name as name, c.description, 
-                           p.category_name as parent
-                    FROM Project_Category c
-                    LEFT JOIN Project_Category p ON c.parent_category_id = p.category_id
-                    WHERE c.is_active = 'Y'
-                    ORDER BY c.category_name
-                """
-                data = fetch_raw_query(sql)
-
-            elif config_type == 'specialties':
-                data = fetch_raw_query("SELECT specialty_id as id, specialty_name as name, description FROM Specialty")
-
-            elif config_type == 'donorTypes':
-                data = fetch_raw_query("SELECT type_id as id, type_name as name, description FROM Donor_Type")
-
-            elif config_type == 'sdgGoals':
-                data = fetch_raw_query("""SELECT sdg_id as "id", goal_name as "name", goal_number as "number", description as "description" FROM SDG_Goal ORDER BY goal_number""")
-
-            elif config_type == 'currencies':
-                data = fetch_raw_query("SELECT currency_id as id, currency_name as name, currency_code as code, symbol, exchange_rate_to_usd as rate FROM Currency")
-
-            elif config_type == 'statuses':
-                data = fetch_raw_query("SELECT project_status_id as id, status_name as name FROM Project_Status")
+            # Datos de referencia servidos desde memoria (core.refdata)
+            if config_type in self.REFDATA_TYPES:
+                data = refdata.get(self.REFDATA_TYPES[config_type])
 
             return Response(data, status=200)
 
@@ -305,43 +334,40 @@ class SystemConfigView(APIView):
         d = request.data 
         
         try:
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-
-                if config_type == 'categories':
-                    parent_id = None
-                    if d.get('parent') and d.get('parent') != 'None':
-                        res = fetch_raw_query(f"SELECT category_id FROM Project_Category WHERE category_name = '{d.get('parent')}'")
-                        if res:
-                            parent_id = res[0]['category_id']
-                    
+            if config_type == 'categories':
+                parent_id = None
+                if d.get('parent') and d.get('parent') != 'None':
+                    res = fetch_raw_query("SELECT category_id FROM Project_Category WHERE category_name = %s", [d.get('parent')])
+                    if res:
+                        parent_id = res[0]['category_id']
+                
+                with connection.cursor() as cursor:
                     cursor.execute(
                         "INSERT INTO Project_Category (category_name, description, parent_category_id) VALUES (%s, %s, %s)",
                         [d.get('name'), d.get('description'), parent_id]
                     )
-                    
-                elif config_type == 'specialties':
-                    native_cursor.callproc('PKG_WORKFORCE.create_specialty', [d.get('name'), d.get('description'), out_id])
+                bump_tables('Project_Category')
+                
+            elif config_type == 'specialties':
+                execute_procedure_native('PKG_WORKFORCE.create_specialty', [d.get('name'), d.get('description')], out_param_index=-1)
 
-                elif config_type == 'donorTypes':
-                    native_cursor.callproc('PKG_FINANCE_CORE.create_donor_type', [d.get('name'), d.get('description'), out_id])
+            elif config_type == 'donorTypes':
+                execute_procedure_native('PKG_FINANCE_CORE.create_donor_type', [d.get('name'), d.get('description')], out_param_index=-1)
 
-                elif config_type == 'sdgGoals':
-                    native_cursor.callproc('PKG_PROJECT_MGMT.create_sdg_goal', 
-                        [d.get('number'), d.get('name'), d.get('description'), 'icon_url_placeholder', out_id])
+            elif config_type == 'sdgGoals':
+                execute_procedure_native('PKG_PROJECT_MGMT.create_sdg_goal', 
+                    [d.get('number'), d.get('name'), d.get('description'), 'icon_url_placeholder'], out_param_index=-1)
 
-                elif config_type == 'currencies':
-                    native_cursor.callproc('PKG_FINANCE_CORE.create_currency', 
-                        [d.get('name'), d.get('code'), d.get('symbol'), out_id])
-                    if d.get('rate'):
+            elif config_type == 'currencies':
+                execute_procedure_native('PKG_FINANCE_CORE.create_currency', 
+                    [d.get('name'), d.get('code'), d.get('symbol')], out_param_index=-1)
+                if d.get('rate'):
+                    with connection.cursor() as cursor:
                         cursor.execute("UPDATE Currency SET exchange_rate_to_usd = %s WHERE currency_code = %s", [d.get('rate'), d.get('code')])
+                    bump_tables('Currency')
 
-                elif config_type == 'statuses':
-                    native_cursor.callproc('PKG_PROJECT_MGMT.create_project_status', [d.get('name'), out_id])
-
-                native_cursor.close()
+            elif config_type == 'statuses':
+                execute_procedure_native('PKG_PROJECT_MGMT.create_project_status', [d.get('name')], out_param_index=-1)
 
             return Response({'message': 'Created successfully'}, status=201)
 
@@ -370,6 +396,7 @@ class SystemConfigView(APIView):
         try:
             with connection.cursor() as cursor:
                 cursor.execute(f"DELETE FROM {table} WHERE {pk} = %s", [item_id])
+            bump_tables(table)
             return Response({'message': 'Deleted'}, status=200)
         except Exception as e:
             if 'ORA-02292' in str(e):
@@ -443,9 +470,10 @@ class UserProfileView(APIView):
                         "UPDATE System_User SET password = %s WHERE user_id = %s",
                         [d['password'], user.user_id]
                     )
+                    bump_tables('System_User')
 
                 if role == 'EMPLOYEE' and user.employee_id:
-                    cursor.callproc('PKG_WORKFORCE.update_employee', [
+                    execute_procedure_native('PKG_WORKFORCE.update_employee', [
                         user.employee_id,
                         d.get('first_name'),
                         d.get('last_name'),
@@ -457,9 +485,10 @@ class UserProfileView(APIView):
                             "UPDATE Employee SET address = %s WHERE employee_id = %s",
                             [d['address'], user.employee_id]
                         )
+                        bump_tables('Employee')
 
                 elif role == 'VOLUNTEER' and user.volunteer_id:
-                    cursor.callproc('PKG_WORKFORCE.update_volunteer', [
+                    execute_procedure_native('PKG_WORKFORCE.update_volunteer', [
                         user.volunteer_id,
                         d.get('first_name'),
                         d.get('last_name'),
@@ -471,6 +500,7 @@ class UserProfileView(APIView):
                             "UPDATE Volunteer SET address = %s WHERE volunteer_id = %s",
                             [d['address'], user.volunteer_id]
                         )
+                        bump_tables('Volunteer')
 
                 elif role == 'REPRESENTATIVE' and user.representative_id:
                     cursor.execute("""
@@ -485,9 +515,10 @@ class UserProfileView(APIView):
                         d.get('address'),
                         user.representative_id
                     ])
+                    bump_tables('Representative')
 
                 elif role == 'ADMIN':
-                    cursor.callproc('PKG_SYSTEM_SECURITY.update_user', [
+                    execute_procedure_native('PKG_SYSTEM_SECURITY.update_user', [
                         user.user_id,
                         user.username,
                         role
@@ -499,158 +530,165 @@ class UserProfileView(APIView):
             return Response({"error": "Database error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 class AuditLogView(APIView):
 
+    # Cada pestaña expone: id, date_str, action, user_name, details, project_name
+    # más la fecha cruda (sort_date) que usa la paginación por cursor.
+    TAB_QUERIES = {
+        # =========================================================
+        # TAB 0: APPROVAL HISTORY
+        # =========================================================
+        0: ("h.change_date", """
+            SELECT 
+                h.history_id AS row_id,
+                TO_CHAR(h.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
+                h.new_status as action,
+                e.first_name || ' ' || e.last_name as user_name,
+                COALESCE(h.comments, 'Changed from ' || h.previous_status || ' to ' || h.new_status) as details,
+                p.name as project_name,
+                h.change_date AS sort_date
+            FROM Approval_History h
+            JOIN Employee e ON h.employee_id = e.employee_id
+            JOIN Approval a ON h.approval_id = a.approval_id
+            JOIN Project p ON a.project_id = p.project_id
+            WHERE 1=1 {date_filter_sql}
+        """),
+        # =========================================================
+        # TAB 1: BUDGET HISTORY
+        # =========================================================
+        1: ("h.change_date", """
+            SELECT 
+                h.history_id AS row_id,
+                TO_CHAR(h.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
+                h.action_type as action,
+                e.first_name || ' ' || e.last_name as user_name,
+                h.reason || ' (Prev: ' || NVL(TO_CHAR(h.old_amount), '0') || ' -> New: ' || h.new_amount || ')' as details,
+                p.name as project_name,
+                h.change_date AS sort_date
+            FROM Budget_History h
+            JOIN Employee e ON h.employee_id = e.employee_id
+            JOIN Budget b ON h.budget_id = b.budget_id
+            JOIN Project p ON b.project_id = p.project_id
+            WHERE 1=1 {date_filter_sql}
+        """),
+        # =========================================================
+        # TAB 2: PROJECT STATUS HISTORY
+        # =========================================================
+        2: ("h.change_date", """
+            SELECT 
+                h.status_history_id AS row_id,
+                TO_CHAR(h.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
+                'Status Change' as action,
+                e.first_name || ' ' || e.last_name as user_name,
+                'Changed from ' || NVL(h.previous_status, 'N/A') || ' to ' || h.new_status || '. ' || NVL(h.reason, '') as details,
+                p.name as project_name,
+                h.change_date AS sort_date
+            FROM Project_Status_History h
+            JOIN Employee e ON h.employee_id = e.employee_id
+            JOIN Project p ON h.project_id = p.project_id
+            WHERE 1=1 {date_filter_sql}
+        """),
+        # =========================================================
+        # TAB 3: DONATION TRANSACTION LOG
+        # =========================================================
+        3: ("t.change_date", """
+            SELECT 
+                t.transaction_log_id AS row_id,
+                TO_CHAR(t.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
+                t.action_type as action,
+                COALESCE(e.first_name || ' ' || e.last_name, u.username) as user_name,
+                NVL(t.reason, 'Update amount') || ' (Prev: ' || NVL(TO_CHAR(t.old_amount), '0') || ' -> New: ' || NVL(TO_CHAR(t.new_amount), '-') || ')' as details,
+                p.name as project_name,
+                t.change_date AS sort_date
+            FROM Donation_Transaction_Log t
+            JOIN Donation d ON t.donation_id = d.donation_id
+            JOIN Project p ON d.project_id = p.project_id
+            LEFT JOIN System_User u ON t.changed_by_user_id = u.user_id
+            LEFT JOIN Employee e ON u.employee_id = e.employee_id
+            WHERE 1=1 {date_filter_sql}
+        """),
+        # =========================================================
+        # TAB 4: ASSIGNMENT HISTORY
+        # =========================================================
+        4: ("h.assignment_date", """
+            SELECT 
+                h.assignment_history_id AS row_id,
+                TO_CHAR(h.assignment_date, 'YYYY-MM-DD HH24:MI') as date_str,
+                h.action as action,
+                COALESCE(e_admin.first_name || ' ' || e_admin.last_name, u.username) as user_name,
+                h.reason || ' Target: ' || h.assignment_type || ' ' || 
+                COALESCE(v.first_name || ' ' || v.last_name, e_target.first_name || ' ' || e_target.last_name) as details,
+                p.name as project_name,
+                h.assignment_date AS sort_date
+            FROM Project_Assignment_History h
+            JOIN Project p ON h.project_id = p.project_id
+            LEFT JOIN System_User u ON h.assigned_by_user_id = u.user_id
+            LEFT JOIN Employee e_admin ON u.employee_id = e_admin.employee_id
+            -- Joins para saber a QUIÉN asignaron
+            LEFT JOIN Volunteer v ON h.volunteer_id = v.volunteer_id
+            LEFT JOIN Employee e_target ON h.employee_id = e_target.employee_id
+            WHERE 1=1 {date_filter_sql}
+        """),
+    }
+
     def get(self, request):
-        tab_type = int(request.query_params.get('type', 0))
+        try:
+            tab_type = int(request.query_params.get('type', 0))
+        except ValueError:
+            tab_type = None
+        if tab_type not in self.TAB_QUERIES:
+            return Response({"error": "Invalid type"}, status=status.HTTP_400_BAD_REQUEST)
+
         start_date = request.query_params.get('start_date')
         end_date = request.query_params.get('end_date')
         search_term = request.query_params.get('search', '').lower()
-        
-        results = []
-        
+
+        try:
+            page = KeysetPage(request, 'sort_date', 'row_id')
+        except InvalidCursor as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        date_column, inner_sql = self.TAB_QUERIES[tab_type]
+
+        # Rangos sobre la columna cruda (sin TRUNC) para que Oracle use el índice de fecha
         date_filter_sql = ""
         params = []
-        
         if start_date:
-            date_filter_sql += " AND TRUNC(change_date) >= TO_DATE(%s, 'YYYY-MM-DD')"
+            date_filter_sql += f" AND {date_column} >= TO_TIMESTAMP(%s, 'YYYY-MM-DD')"
             params.append(start_date)
         if end_date:
-            date_filter_sql += " AND TRUNC(change_date) <= TO_DATE(%s, 'YYYY-MM-DD')"
+            date_filter_sql += f" AND {date_column} < TO_TIMESTAMP(%s, 'YYYY-MM-DD') + INTERVAL '1' DAY"
             params.append(end_date)
 
+        # La búsqueda se hace en SQL: filtrar en Python dejaría páginas incompletas
+        # WHERE propio fuera del paréntesis: and_where ve el WHERE interior y
+        # añadiría AND tras el cierre de la subconsulta
+        sql = f"SELECT * FROM ({inner_sql.format(date_filter_sql=date_filter_sql)}) q WHERE 1=1"
+        if search_term:
+            sql = and_where(sql, "LOWER(NVL(user_name, 'System') || ' ' || details || ' ' || project_name) LIKE %s")
+            params.append(f"%{search_term}%")
+
+        keyset_sql, keyset_params = page.where()
+        sql = and_where(sql, keyset_sql) + page.order_and_limit()
+        params += keyset_params + page.limit_params()
+
         try:
-            with connection.cursor() as cursor:
-                
-                # =========================================================
-                # TAB 0: APPROVAL HISTORY
-                # =========================================================
-                if tab_type == 0:
-                    sql = f"""
-                        SELECT 
-                            h.history_id,
-                            TO_CHAR(h.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
-                            h.new_status as action,
-                            e.first_name || ' ' || e.last_name as user_name,
-                            COALESCE(h.comments, 'Changed from ' || h.previous_status || ' to ' || h.new_status) as details,
-                            p.name as project_name
-                        FROM Approval_History h
-                        JOIN Employee e ON h.employee_id = e.employee_id
-                        JOIN Approval a ON h.approval_id = a.approval_id
-                        JOIN Project p ON a.project_id = p.project_id
-                        WHERE 1=1 {date_filter_sql}
-                        ORDER BY h.change_date DESC
-                    """
-                
-                # =========================================================
-                # TAB 1: BUDGET HISTORY
-                # =========================================================
-                elif tab_type == 1:
-                    sql = f"""
-                        SELECT 
-                            h.history_id,
-                            TO_CHAR(h.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
-                            h.action_type as action,
-                            e.first_name || ' ' || e.last_name as user_name,
-                            h.reason || ' (Prev: ' || NVL(TO_CHAR(h.old_amount), '0') || ' -> New: ' || h.new_amount || ')' as details,
-                            p.name as project_name
-                        FROM Budget_History h
-                        JOIN Employee e ON h.employee_id = e.employee_id
-                        JOIN Budget b ON h.budget_id = b.budget_id
-                        JOIN Project p ON b.project_id = p.project_id
-                        WHERE 1=1 {date_filter_sql}
-                        ORDER BY h.change_date DESC
-                    """
-
-                # =========================================================
-                # TAB 2: PROJECT STATUS HISTORY
-                # =========================================================
-                elif tab_type == 2:
-                    sql = f"""
-                        SELECT 
-                            h.status_history_id,
-                            TO_CHAR(h.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
-                            'Status Change' as action,
-                            e.first_name || ' ' || e.last_name as user_name,
-                            'Changed from ' || NVL(h.previous_status, 'N/A') || ' to ' || h.new_status || '. ' || NVL(h.reason, '') as details,
-                            p.name as project_name
-                        FROM Project_Status_History h
-                        JOIN Employee e ON h.employee_id = e.employee_id
-                        JOIN Project p ON h.project_id = p.project_id
-                        WHERE 1=1 {date_filter_sql}
-                        ORDER BY h.change_date DESC
-                    """
-
-                # =========================================================
-                # TAB 3: DONATION TRANSACTION LOG
-                # =========================================================
-                elif tab_type == 3:
-                    sql = f"""
-                        SELECT 
-                            t.transaction_log_id,
-                            TO_CHAR(t.change_date, 'YYYY-MM-DD HH24:MI') as date_str,
-                            t.action_type as action,
-                            COALESCE(e.first_name || ' ' || e.last_name, u.username) as user_name,
-                            NVL(t.reason, 'Update amount') || ' (Prev: ' || NVL(TO_CHAR(t.old_amount), '0') || ' -> New: ' || NVL(TO_CHAR(t.new_amount), '-') || ')' as details,
-                            p.name as project_name
-                        FROM Donation_Transaction_Log t
-                        JOIN Donation d ON t.donation_id = d.donation_id
-                        JOIN Project p ON d.project_id = p.project_id
-                        LEFT JOIN System_User u ON t.changed_by_user_id = u.user_id
-                        LEFT JOIN Employee e ON u.employee_id = e.employee_id
-                        WHERE 1=1 {date_filter_sql}
-                        ORDER BY t.change_date DESC
-                    """
-
-                # =========================================================
-                # TAB 4: ASSIGNMENT HISTORY
-                # =========================================================
-                elif tab_type == 4:
-                    if start_date: 
-                        date_filter_sql = date_filter_sql.replace("change_date", "assignment_date")
-                    
-                    sql = f"""
-                        SELECT 
-                            h.assignment_history_id,
-                            TO_CHAR(h.assignment_date, 'YYYY-MM-DD HH24:MI') as date_str,
-                            h.action as action,
-                            COALESCE(e_admin.first_name || ' ' || e_admin.last_name, u.username) as user_name,
-                            h.reason || ' Target: ' || h.assignment_type || ' ' || 
-                            COALESCE(v.first_name || ' ' || v.last_name, e_target.first_name || ' ' || e_target.last_name) as details,
-                            p.name as project_name
-                        FROM Project_Assignment_History h
-                        JOIN Project p ON h.project_id = p.project_id
-                        LEFT JOIN System_User u ON h.assigned_by_user_id = u.user_id
-                        LEFT JOIN Employee e_admin ON u.employee_id = e_admin.employee_id
-                        -- Joins para saber a QUIÉN asignaron
-                        LEFT JOIN Volunteer v ON h.volunteer_id = v.volunteer_id
-                        LEFT JOIN Employee e_target ON h.employee_id = e_target.employee_id
-                        WHERE 1=1 {date_filter_sql}
-                        ORDER BY h.assignment_date DESC
-                    """
-
-                cursor.execute(sql, params)
-                rows = cursor.fetchall()
-
-                for row in rows:
-                    item = {
-                        "id": row[0],
-                        "date": row[1],
-                        "action": row[2],
-                        "user": row[3] if row[3] else "System",
-                        "details": row[4],
-                        "project": row[5]
-                    }
-                    
-                    if search_term:
-                        search_string = f"{item['user']} {item['details']} {item['project']}".lower()
-                        if search_term in search_string:
-                            results.append(item)
-                    else:
-                        results.append(item)
+            rows = fetch_raw_query(sql, params, mode=ROWS_TUPLE, arraysize=page.page_size + 1)
+            rows = page.trim(rows, key=lambda row: (row[6], row[0]))
+
+            results = []
+            for row_id, date_str, action, user_name, details, project_name, _sort_date in rows:
+                results.append({
+                    "id": row_id,
+                    "date": date_str,
+                    "action": action,
+                    "user": user_name if user_name else "System",
+                    "details": details,
+                    "project": project_name
+                })
 
-            return Response(results, status=status.HTTP_200_OK)
+            return Response(page.envelope(results), status=status.HTTP_200_OK)
 
         except Exception as e:
-            print("Error en AuditLogView:", e)
+            logger.error(f"Error en AuditLogView: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
@@ -658,90 +696,92 @@ class ReportsAnalyticsView(APIView):
 
     def get(self, request):
         try:
-            data = {
-                "trends": [],
-                "distribution": [],
-                "reports": [],
-                "project_stats": []
-            }
+            # Peticiones idénticas simultáneas (p. ej. tras un deploy) comparten
+            # una sola ejecución de las cuatro consultas
+            data = singleflight.do(singleflight.request_key(request), self.build_payload)
+            return Response(data, status=status.HTTP_200_OK)
 
-            with connection.cursor() as cursor:
-                # 1. TRENDS
-                cursor.execute("""
-                    SELECT 
-                        TO_CHAR(d.donation_date, 'Mon', 'NLS_DATE_LANGUAGE=SPANISH') as mes,
-                        c.currency_code,
-                        SUM(d.amount) as total
-                    FROM Donation d
-                    JOIN Currency c ON d.currency_id = c.currency_id
-                    WHERE d.donation_date >= ADD_MONTHS(SYSDATE, -6)
-                    GROUP BY TO_CHAR(d.donation_date, 'Mon', 'NLS_DATE_LANGUAGE=SPANISH'), 
-                             TRUNC(d.donation_date, 'MM'), c.currency_code
-                    ORDER BY TRUNC(d.donation_date, 'MM')
-                """)
-                rows_trends = cursor.fetchall()
-                trends_map = {}
-                for row in rows_trends:
-                    month, currency, amount = row[0], row[1], row[2]
-                    if month not in trends_map:
-                        trends_map[month] = {"month": month}
-                    trends_map[month][currency] = amount
-                data["trends"] = list(trends_map.values())
-
-                # 2. DISTRIBUTION
-                cursor.execute("""
-                    SELECT currency_code, symbol, total_amount_in_currency 
-                    FROM vw_currency_exchange_rate_status
-                """)
-                rows_dist = cursor.fetchall()
-                for row in rows_dist:
-                    data["distribution"].append({
-                        "name": f"{row[0]} ({row[1]})",
-                        "value": row[2]
-                    })
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-                # 3. REPORT TABLE (Last 5)
-                cursor.execute("""
-                    SELECT 
-                        report_id, project_name, report_title, 
-                        TO_CHAR(report_date, 'YYYY-MM-DD'), 
-                        days_since_report, reports_per_project
-                    FROM vw_report_generation_activity
-                    ORDER BY report_date DESC
-                    FETCH NEXT 5 ROWS ONLY 
-                """)
-                rows_reports = cursor.fetchall()
-                for row in rows_reports:
-                    data["reports"].append({
-                        "report_id": row[0],
-                        "project_name": row[1],
-                        "report_title": row[2],
-                        "report_date": row[3],
-                        "days_since_report": row[4],
-                        "reports_per_project": row[5]
-                    })
+    def build_payload(self):
+        data = {
+            "trends": [],
+            "distribution": [],
+            "reports": [],
+            "project_stats": []
+        }
 
-                # 4. PROJECT STATISTICS (Top 10 by activity)
-                cursor.execute("""
-                    SELECT project_name, COUNT(*) as total
-                    FROM vw_report_generation_activity 
-                    GROUP BY project_name
-                    ORDER BY total DESC
-                    FETCH NEXT 10 ROWS ONLY
-                """)
-                
-                rows_stats = cursor.fetchall()
-                data["project_stats"] = [] 
-                for row in rows_stats:
-                    data["project_stats"].append({
-                        "name": row[0],  
-                        "reports": row[1] 
-                    })
+        # Por core.db y no connection.cursor(): cada consulta cuenta para el
+        # presupuesto de la vista, Server-Timing, las métricas y el slow log
+
+        # 1. TRENDS (rollup mensual: meses completos desde hace seis)
+        rows_trends = fetch_raw_query("""
+            SELECT 
+                TO_CHAR(r.month_start, 'Mon', 'NLS_DATE_LANGUAGE=SPANISH') as mes,
+                c.currency_code,
+                SUM(r.total_amount) as total
+            FROM Donation_Rollup r
+            JOIN Currency c ON r.currency_id = c.currency_id
+            WHERE r.month_start >= TRUNC(ADD_MONTHS(SYSDATE, -6), 'MM')
+            GROUP BY r.month_start, c.currency_code
+            ORDER BY r.month_start
+        """, mode=ROWS_TUPLE)
+        trends_map = {}
+        for row in rows_trends:
+            month, currency, amount = row[0], row[1], row[2]
+            if month not in trends_map:
+                trends_map[month] = {"month": month}
+            trends_map[month][currency] = amount
+        data["trends"] = list(trends_map.values())
+
+        # 2. DISTRIBUTION
+        rows_dist = fetch_raw_query("""
+            SELECT currency_code, symbol, total_amount_in_currency 
+            FROM vw_currency_exchange_rate_status
+        """, mode=ROWS_TUPLE)
+        for row in rows_dist:
+            data["distribution"].append({
+                "name": f"{row[0]} ({row[1]})",
+                "value": row[2]
+            })
 
-            return Response(data, status=status.HTTP_200_OK)
+        # 3. REPORT TABLE (Last 5)
+        rows_reports = fetch_raw_query("""
+            SELECT 
+                report_id, project_name, report_title, 
+                TO_CHAR(report_date, 'YYYY-MM-DD'), 
+                days_since_report, reports_per_project
+            FROM vw_report_generation_activity
+            ORDER BY report_date DESC
+            FETCH NEXT 5 ROWS ONLY 
+        """, mode=ROWS_TUPLE)
+        for row in rows_reports:
+            data["reports"].append({
+                "report_id": row[0],
+                "project_name": row[1],
+                "report_title": row[2],
+                "report_date": row[3],
+                "days_since_report": row[4],
+                "reports_per_project": row[5]
+            })
 
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        # 4. PROJECT STATISTICS (Top 10 by activity)
+        rows_stats = fetch_raw_query("""
+            SELECT project_name, COUNT(*) as total
+            FROM vw_report_generation_activity 
+            GROUP BY project_name
+            ORDER BY total DESC
+            FETCH NEXT 10 ROWS ONLY
+        """, mode=ROWS_TUPLE)
+        data["project_stats"] = [] 
+        for row in rows_stats:
+            data["project_stats"].append({
+                "name": row[0],  
+                "reports": row[1] 
+            })
+
+        return data
 
 # ==============================================================================
 # WORKFORCE & OPERATIONS VIEWS
@@ -766,28 +806,23 @@ class NGOListView(APIView):
         """Create new NGO using PKG_WORKFORCE.create_ngo."""
         data = request.data
         try:
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_WORKFORCE.create_ngo', [
-                    data.get('name'),
-                    data.get('registration_number'),
-                    data.get('country'),
-                    data.get('contact_email'),
-                    out_id
-                ])
-                
-                # Update city and address if provided
-                if data.get('city') or data.get('address') or data.get('phone'):
+            new_id = execute_procedure_native('PKG_WORKFORCE.create_ngo', [
+                data.get('name'),
+                data.get('registration_number'),
+                data.get('country'),
+                data.get('contact_email')
+            ], out_param_index=-1)
+            
+            # Update city and address if provided
+            if data.get('city') or data.get('address') or data.get('phone'):
+                with connection.cursor() as cursor:
                     cursor.execute(
                         "UPDATE NGO SET city = %s, address = %s, phone = %s WHERE ong_id = %s",
-                        [data.get('city', ''), data.get('address', ''), data.get('phone', ''), out_id.getvalue()]
+                        [data.get('city', ''), data.get('address', ''), data.get('phone', ''), new_id]
                     )
-                
-                native_cursor.close()
-                return Response({"message": "NGO created successfully", "ong_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+                bump_tables('NGO')
+            
+            return Response({"message": "NGO created successfully", "ong_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error creating NGO: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -816,6 +851,7 @@ class NGOUpdateView(APIView):
                         ong_id
                     ]
                 )
+            bump_tables('NGO')
             return Response({"message": "NGO updated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error updating NGO: {e}")
@@ -827,8 +863,7 @@ class NGOUpdateView(APIView):
         if not ong_id:
             return Response({"error": "ong_id is required"}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_WORKFORCE.delete_ngo', [int(ong_id)])
+            execute_procedure_native('PKG_WORKFORCE.delete_ngo', [int(ong_id)])
             return Response({"message": "NGO deleted successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error deleting NGO: {e}")
@@ -840,12 +875,11 @@ class EmployeeListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        """List all employees."""
+        """List all employees (streamed in fetchmany batches)."""
         try:
             sql = """SELECT employee_id, first_name, last_name, birth_date, address, 
                      email, phone, hire_date FROM Employee ORDER BY hire_date DESC"""
-            employees = fetch_raw_query(sql)
-            return Response(employees, status=status.HTTP_200_OK)
+            return streaming_json_response(sql)
         except Exception as e:
             logger.error(f"Error fetching employees: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -858,23 +892,16 @@ class EmployeeListView(APIView):
             birth_date = datetime.strptime(data.get('birth_date'), '%Y-%m-%d').date() if data.get('birth_date') else None
             hire_date = datetime.strptime(data.get('hire_date'), '%Y-%m-%d').date() if data.get('hire_date') else None
             
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_WORKFORCE.create_employee', [
-                    data.get('first_name'),
-                    data.get('last_name'),
-                    birth_date,
-                    data.get('address', ''),
-                    data.get('email'),
-                    data.get('phone', ''),
-                    hire_date,
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "Employee created successfully", "employee_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_WORKFORCE.create_employee', [
+                data.get('first_name'),
+                data.get('last_name'),
+                birth_date,
+                data.get('address', ''),
+                data.get('email'),
+                data.get('phone', ''),
+                hire_date
+            ], out_param_index=-1)
+            return Response({"message": "Employee created successfully", "employee_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error creating employee: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -887,17 +914,18 @@ class EmployeeUpdateView(APIView):
         data = request.data
         employee_id = data.get('employee_id')
         try:
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_WORKFORCE.update_employee', [
-                    employee_id,
-                    data.get('first_name'),
-                    data.get('last_name'),
-                    data.get('email'),
-                    data.get('phone', '')
-                ])
-                # Update address if provided
-                if data.get('address'):
+            execute_procedure_native('PKG_WORKFORCE.update_employee', [
+                employee_id,
+                data.get('first_name'),
+                data.get('last_name'),
+                data.get('email'),
+                data.get('phone', '')
+            ])
+            # Update address if provided
+            if data.get('address'):
+                with connection.cursor() as cursor:
                     cursor.execute("UPDATE Employee SET address = %s WHERE employee_id = %s", [data.get('address'), employee_id])
+                bump_tables('Employee')
             return Response({"message": "Employee updated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error updating employee: {e}")
@@ -906,8 +934,7 @@ class EmployeeUpdateView(APIView):
     def delete(self, request, employee_id):
         """Delete employee using PKG_WORKFORCE.delete_employee."""
         try:
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_WORKFORCE.delete_employee', [employee_id])
+            execute_procedure_native('PKG_WORKFORCE.delete_employee', [employee_id])
             return Response({"message": "Employee deleted successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error deleting employee: {e}")
@@ -919,12 +946,11 @@ class VolunteerListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        """List all volunteers."""
+        """List all volunteers (streamed in fetchmany batches)."""
         try:
             sql = """SELECT volunteer_id, first_name, last_name, birth_date, address, 
                      email, phone, 'Active' as status FROM Volunteer ORDER BY last_name, first_name"""
-            volunteers = fetch_raw_query(sql)
-            return Response(volunteers, status=status.HTTP_200_OK)
+            return streaming_json_response(sql)
         except Exception as e:
             logger.error(f"Error fetching volunteers: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -936,22 +962,15 @@ class VolunteerListView(APIView):
             from datetime import datetime
             birth_date = datetime.strptime(data.get('birth_date'), '%Y-%m-%d').date() if data.get('birth_date') else None
             
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_WORKFORCE.create_volunteer', [
-                    data.get('first_name'),
-                    data.get('last_name'),
-                    birth_date,
-                    data.get('address', ''),
-                    data.get('email'),
-                    data.get('phone', ''),
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "Volunteer created successfully", "volunteer_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_WORKFORCE.create_volunteer', [
+                data.get('first_name'),
+                data.get('last_name'),
+                birth_date,
+                data.get('address', ''),
+                data.get('email'),
+                data.get('phone', '')
+            ], out_param_index=-1)
+            return Response({"message": "Volunteer created successfully", "volunteer_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error creating volunteer: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -964,20 +983,21 @@ class VolunteerUpdateView(APIView):
         data = request.data
         volunteer_id = data.get('volunteer_id')
         try:
+            execute_procedure_native('PKG_WORKFORCE.update_volunteer', [
+                volunteer_id,
+                data.get('first_name'),
+                data.get('last_name'),
+                data.get('email'),
+                data.get('phone', '')
+            ])
             with connection.cursor() as cursor:
-                cursor.callproc('PKG_WORKFORCE.update_volunteer', [
-                    volunteer_id,
-                    data.get('first_name'),
-                    data.get('last_name'),
-                    data.get('email'),
-                    data.get('phone', '')
-                ])
                 # Update address if provided
                 if data.get('address'):
                     cursor.execute("UPDATE Volunteer SET address = %s WHERE volunteer_id = %s", [data.get('address'), volunteer_id])
                 # Update status if provided
                 if data.get('status'):
                     cursor.execute("UPDATE Volunteer SET status = %s WHERE volunteer_id = %s", [data.get('status'), volunteer_id])
+            bump_tables('Volunteer')
             return Response({"message": "Volunteer updated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error updating volunteer: {e}")
@@ -990,8 +1010,7 @@ class VolunteerUpdateView(APIView):
         if not volunteer_id:
             return Response({"error": "volunteer_id is required"}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_WORKFORCE.delete_volunteer', [int(volunteer_id)])
+            execute_procedure_native('PKG_WORKFORCE.delete_volunteer', [int(volunteer_id)])
             return Response({"message": "Volunteer deleted successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error deleting volunteer: {e}")
@@ -1004,18 +1023,11 @@ class VolunteerSpecialtyView(APIView):
         """Assign specialty to volunteer using PKG_WORKFORCE.add_volunteer_specialty."""
         data = request.data
         try:
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_WORKFORCE.add_volunteer_specialty', [
-                    data.get('volunteer_id'),
-                    data.get('specialty_id'),
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "Specialty assigned successfully", "assignment_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_WORKFORCE.add_volunteer_specialty', [
+                data.get('volunteer_id'),
+                data.get('specialty_id')
+            ], out_param_index=-1)
+            return Response({"message": "Specialty assigned successfully", "assignment_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error assigning specialty: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1063,23 +1075,16 @@ class RepresentativeListView(APIView):
             from datetime import datetime
             birth_date = datetime.strptime(data.get('birth_date'), '%Y-%m-%d').date() if data.get('birth_date') else None
             
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_WORKFORCE.create_representative', [
-                    data.get('first_name'),
-                    data.get('last_name'),
-                    birth_date,
-                    data.get('address', ''),
-                    data.get('email'),
-                    data.get('phone', ''),
-                    data.get('ong_id'),
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "Representative created successfully", "representative_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_WORKFORCE.create_representative', [
+                data.get('first_name'),
+                data.get('last_name'),
+                birth_date,
+                data.get('address', ''),
+                data.get('email'),
+                data.get('phone', ''),
+                data.get('ong_id')
+            ], out_param_index=-1)
+            return Response({"message": "Representative created successfully", "representative_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error creating representative: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1107,6 +1112,7 @@ class RepresentativeUpdateView(APIView):
                         representative_id
                     ]
                 )
+            bump_tables('Representative')
             return Response({"message": "Representative updated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error updating representative: {e}")
@@ -1150,23 +1156,16 @@ class ProjectListView(APIView):
             start_date = datetime.strptime(data.get('start_date'), '%Y-%m-%d').date() if data.get('start_date') else None
             end_date = datetime.strptime(data.get('end_date'), '%Y-%m-%d').date() if data.get('end_date') else None
             
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_PROJECT_MGMT.create_project', [
-                    data.get('name'),
-                    data.get('description', ''),
-                    start_date,
-                    end_date,
-                    data.get('project_status_id'),
-                    data.get('ong_id'),
-                    data.get('representative_id'),
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "Project created successfully", "project_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_PROJECT_MGMT.create_project', [
+                data.get('name'),
+                data.get('description', ''),
+                start_date,
+                end_date,
+                data.get('project_status_id'),
+                data.get('ong_id'),
+                data.get('representative_id')
+            ], out_param_index=-1)
+            return Response({"message": "Project created successfully", "project_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error creating project: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1198,17 +1197,16 @@ class ProjectUpdateView(APIView):
                 except ValueError:
                     logger.warning(f"Invalid end_date format: {data.get('end_date')}")
             
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_PROJECT_MGMT.update_project_details', [
-                    project_id,
-                    data.get('name'),
-                    data.get('description', ''),
-                    start_date,
-                    end_date,
-                    data.get('project_status_id'),
-                    data.get('ong_id'),
-                    data.get('representative_id')
-                ])
+            execute_procedure_native('PKG_PROJECT_MGMT.update_project_details', [
+                project_id,
+                data.get('name'),
+                data.get('description', ''),
+                start_date,
+                end_date,
+                data.get('project_status_id'),
+                data.get('ong_id'),
+                data.get('representative_id')
+            ])
             return Response({"message": "Project updated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error updating project: {e}")
@@ -1223,8 +1221,7 @@ class ProjectCloseView(APIView):
         if not project_id:
             return Response({"error": "project_id is required"}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_PROJECT_MGMT.close_project', [project_id])
+            execute_procedure_native('PKG_PROJECT_MGMT.close_project', [project_id])
             return Response({"message": "Project closed successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error closing project: {e}")
@@ -1239,8 +1236,7 @@ class ProjectReactivateView(APIView):
         if not project_id:
             return Response({"error": "project_id is required"}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_PROJECT_MGMT.reactivate_project', [project_id])
+            execute_procedure_native('PKG_PROJECT_MGMT.reactivate_project', [project_id])
             return Response({"message": "Project reactivated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error reactivating project: {e}")
@@ -1255,18 +1251,11 @@ class VolunteerProjectAssignmentView(APIView):
         """Assign volunteer to project using PKG_WORKFORCE.assign_volunteer_to_project."""
         data = request.data
         try:
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_WORKFORCE.assign_volunteer_to_project', [
-                    data.get('project_id'),
-                    data.get('volunteer_id'),
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "Volunteer assigned successfully", "assignment_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_WORKFORCE.assign_volunteer_to_project', [
+                data.get('project_id'),
+                data.get('volunteer_id')
+            ], out_param_index=-1)
+            return Response({"message": "Volunteer assigned successfully", "assignment_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error assigning volunteer: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1298,6 +1287,7 @@ class ProjectCategoryAssignmentView(APIView):
                     data.get('is_primary', 'N'),
                     user.user_id
                 ])
+                bump_tables('Project_Category_Assignment')
                 return Response({"message": "Category assigned successfully"}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error assigning category: {e}")
@@ -1311,20 +1301,13 @@ class ProjectSDGAssignmentView(APIView):
         data = request.data
         user = request.user
         try:
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_PROJECT_MGMT.assign_sdg', [
-                    data.get('project_id'),
-                    data.get('sdg_id'),
-                    data.get('contribution_level', 'MEDIO'),
-                    user.user_id,
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "SDG assigned successfully", "project_sdg_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_PROJECT_MGMT.assign_sdg', [
+                data.get('project_id'),
+                data.get('sdg_id'),
+                data.get('contribution_level', 'MEDIO'),
+                user.user_id
+            ], out_param_index=-1)
+            return Response({"message": "SDG assigned successfully", "project_sdg_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error assigning SDG: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1338,7 +1321,7 @@ class VolunteerExpertiseMappingView(APIView):
         """Get volunteer expertise mapping from vw_volunteer_expertise_mapping."""
         try:
             sql = "SELECT * FROM vw_volunteer_expertise_mapping ORDER BY volunteer_name"
-            data = fetch_raw_query(sql)
+            data = cached_view_query('vw_volunteer_expertise_mapping', sql)
             return Response(data, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error fetching volunteer expertise: {e}")
@@ -1370,97 +1353,39 @@ class VolunteerDashboardDataView(APIView):
         
         try:
             volunteer_id = user.volunteer_id
-            
-            # Helper function to safely get integer values
-            def safe_get_int(d, key, default=0):
-                if not d:
-                    return default
-                val = d.get(key.lower()) or d.get(key.upper()) or d.get(key) or default
-                return int(val) if val else default
-            
-            def safe_get_str(d, key, default='N/A'):
-                if not d:
-                    return default
-                return d.get(key.lower()) or d.get(key.upper()) or d.get(key) or default
-            
+
+            # Todas las secciones llegan en un solo round trip como
+            # result sets implícitos (DBMS_SQL.RETURN_RESULT)
+            sections = fetch_implicit_results(
+                'PKG_DASHBOARD_ANALYTICS.get_volunteer_dashboard', [volunteer_id],
+                names=['active', 'hours', 'completed', 'specialties',
+                       'contribution', 'opportunities', 'volunteer_name']
+            )
+
             # 1. Active Projects Count
-            sql_active = """
-                SELECT COUNT(*) as count
-                FROM Volunteer_Project vp
-                JOIN Project p ON vp.project_id = p.project_id
-                JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
-                WHERE vp.volunteer_id = %s 
-                AND vp.status = 'A'
-                AND ps.status_name = 'ACTIVO'
-            """
-            active_projects_data = fetch_raw_query(sql_active, [volunteer_id])
-            active_projects = safe_get_int(active_projects_data[0], 'count', 0) if active_projects_data else 0
+            active_projects_data = sections['active']
+            active_projects = int(active_projects_data[0]['count']) if active_projects_data else 0
             
             # 2. Hours This Month (using days_assigned as proxy, can be improved)
-            sql_hours = """
-                SELECT NVL(SUM(
-                    CASE 
-                        WHEN vp.end_date IS NOT NULL THEN TRUNC(vp.end_date) - TRUNC(vp.assignment_date)
-                        ELSE TRUNC(SYSDATE) - TRUNC(vp.assignment_date)
-                    END
-                ), 0) as hours
-                FROM Volunteer_Project vp
-                WHERE vp.volunteer_id = %s
-                AND vp.status = 'A'
-                AND EXTRACT(MONTH FROM vp.assignment_date) = EXTRACT(MONTH FROM SYSDATE)
-                AND EXTRACT(YEAR FROM vp.assignment_date) = EXTRACT(YEAR FROM SYSDATE)
-            """
-            hours_data = fetch_raw_query(sql_hours, [volunteer_id])
-            hours_this_month = safe_get_int(hours_data[0], 'hours', 0) if hours_data else 0
+            hours_data = sections['hours']
+            hours_this_month = int(hours_data[0]['hours']) if hours_data else 0
             
             # 3. Projects Completed
-            sql_completed = """
-                SELECT COUNT(*) as count
-                FROM Volunteer_Project vp
-                JOIN Project p ON vp.project_id = p.project_id
-                JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
-                WHERE vp.volunteer_id = %s
-                AND ps.status_name = 'COMPLETADO'
-            """
-            completed_data = fetch_raw_query(sql_completed, [volunteer_id])
-            projects_completed = safe_get_int(completed_data[0], 'count', 0) if completed_data else 0
+            completed_data = sections['completed']
+            projects_completed = int(completed_data[0]['count']) if completed_data else 0
             
             # 4. Rating Average (placeholder - would need a rating system)
             rating_average = 4.8  # Default value, can be calculated from feedback table if exists
             
             # 5. Specialties
-            sql_specialties = """
-                SELECT s.specialty_name, s.description
-                FROM Volunteer_Specialty vs
-                JOIN Specialty s ON vs.specialty_id = s.specialty_id
-                WHERE vs.volunteer_id = %s
-                ORDER BY vs.assignment_date DESC
-            """
-            specialties_data = fetch_raw_query(sql_specialties, [volunteer_id])
+            specialties_data = sections['specialties']
             specialties = [{
-                'name': s.get('specialty_name') or s.get('SPECIALTY_NAME'),
-                'desc': s.get('description') or s.get('DESCRIPTION') or 'No description'
+                'name': s['specialty_name'],
+                'desc': _or_default(s['description'], 'No description')
             } for s in specialties_data]
             
             # 6. Contribution Data (hours by month for current year)
-            sql_contribution = """
-                SELECT 
-                    TO_CHAR(vp.assignment_date, 'MON') as month,
-                    TO_CHAR(vp.assignment_date, 'MM') as month_num,
-                    COUNT(*) as project_count,
-                    SUM(
-                        CASE 
-                            WHEN vp.end_date IS NOT NULL THEN TRUNC(vp.end_date) - TRUNC(vp.assignment_date)
-                            ELSE TRUNC(SYSDATE) - TRUNC(vp.assignment_date)
-                        END
-                    ) as hours
-                FROM Volunteer_Project vp
-                WHERE vp.volunteer_id = %s
-                AND EXTRACT(YEAR FROM vp.assignment_date) = EXTRACT(YEAR FROM SYSDATE)
-                GROUP BY TO_CHAR(vp.assignment_date, 'MON'), TO_CHAR(vp.assignment_date, 'MM')
-                ORDER BY TO_NUMBER(TO_CHAR(vp.assignment_date, 'MM'))
-            """
-            contribution_data = fetch_raw_query(sql_contribution, [volunteer_id])
+            contribution_data = sections['contribution']
             
             # Map to frontend format (JAN, APR, JUL, OCT)
             month_map = {
@@ -1469,8 +1394,8 @@ class VolunteerDashboardDataView(APIView):
             }
             contribution_chart = []
             for row in contribution_data:
-                month_name = (row.get('month') or row.get('MONTH') or '').upper()[:3]
-                hours = safe_get_int(row, 'hours', 0)
+                month_name = _or_default(row['month'], '').upper()[:3]
+                hours = int(_or_default(row['hours'], 0))
                 if month_name in ['JAN', 'APR', 'JUL', 'OCT']:
                     contribution_chart.append({
                         'month': month_name,
@@ -1486,64 +1411,38 @@ class VolunteerDashboardDataView(APIView):
             contribution_chart.sort(key=lambda x: month_map.get(x['month'], 0))
             
             # 7. Available Opportunities (projects not yet assigned to this volunteer)
-            sql_opportunities = """
-                SELECT 
-                    p.project_id,
-                    p.name as project_name,
-                    n.name as ngo_name,
-                    n.city || ', ' || n.country as location,
-                    TO_CHAR(TRUNC(p.start_date), 'Mon DD, YYYY') as start_date,
-                    ROUND((p.end_date - p.start_date)) as duration_days,
-                    ps.status_name as project_status,
-                    (SELECT COUNT(*) FROM Volunteer_Project vp2 WHERE vp2.project_id = p.project_id AND vp2.status = 'A') as team_size
-                FROM Project p
-                JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
-                JOIN NGO n ON p.ong_id = n.ong_id
-                WHERE ps.status_name = 'ACTIVO'
-                AND p.project_id NOT IN (
-                    SELECT project_id FROM Volunteer_Project 
-                    WHERE volunteer_id = %s AND status = 'A'
-                )
-                AND p.project_id NOT IN (
-                    SELECT project_id FROM Volunteer_Application
-                    WHERE volunteer_id = %s AND status IN ('PENDING', 'PENDIENTE')
-                )
-                AND ROWNUM <= 5
-                ORDER BY p.start_date DESC
-            """
-            opportunities_data = fetch_raw_query(sql_opportunities, [volunteer_id, volunteer_id])
+            opportunities_data = sections['opportunities']
             opportunities = []
             for opp in opportunities_data:
-                duration_days = safe_get_int(opp, 'duration_days', 0)
+                # duration_days es NULL sin fecha de fin
+                duration_days = int(_or_default(opp['duration_days'], 0))
                 duration_weeks = f"{round(duration_days / 7)} Weeks" if duration_days > 0 else "Ongoing"
-                team_size = safe_get_int(opp, 'team_size', 0)
-                
+                team_size = int(opp['team_size'])
+                start_date = _or_default(opp['start_date'], 'N/A')
+
                 opportunities.append({
-                    'id': safe_get_int(opp, 'project_id', 0),
-                    'project_id': safe_get_int(opp, 'project_id', 0),
-                    'title': safe_get_str(opp, 'project_name', 'Unknown Project'),
-                    'name': safe_get_str(opp, 'project_name', 'Unknown Project'),
-                    'org': safe_get_str(opp, 'ngo_name', 'Unknown NGO'),
-                    'ngo_name': safe_get_str(opp, 'ngo_name', 'Unknown NGO'),
-                    'location': safe_get_str(opp, 'location', 'Unknown Location'),
+                    'id': opp['project_id'],
+                    'project_id': opp['project_id'],
+                    'title': opp['project_name'],
+                    'name': opp['project_name'],
+                    'org': opp['ngo_name'],
+                    'ngo_name': opp['ngo_name'],
+                    'location': _or_default(opp['location'], 'Unknown Location'),
                     'match': 95,  # Placeholder - could calculate based on specialties
                     'tags': {
                         'specialty': 'Various',  # Could be improved
-                        'start': safe_get_str(opp, 'start_date', 'N/A'),
+                        'start': start_date,
                         'duration': duration_weeks,
                         'team': f"{team_size} Volunteers"
                     },
                     'isNew': True,  # Could check if project was created recently
-                    'status_name': safe_get_str(opp, 'project_status', 'ACTIVO'),
-                    'start_date': safe_get_str(opp, 'start_date', 'N/A')
+                    'status_name': opp['project_status'],
+                    'start_date': start_date
                 })
             
             # Get volunteer name for greeting
-            sql_volunteer_name = """
-                SELECT first_name FROM Volunteer WHERE volunteer_id = %s
-            """
-            volunteer_name_data = fetch_raw_query(sql_volunteer_name, [volunteer_id])
-            volunteer_name = volunteer_name_data[0].get('first_name') or volunteer_name_data[0].get('FIRST_NAME') if volunteer_name_data else 'Volunteer'
+            volunteer_name_data = sections['volunteer_name']
+            volunteer_name = volunteer_name_data[0]['first_name'] if volunteer_name_data else 'Volunteer'
             
             return Response({
                 'volunteerName': volunteer_name,
@@ -1652,7 +1551,7 @@ class VolunteerExploreProjectsView(APIView):
                 WHERE vs.volunteer_id = %s
             """
             volunteer_specialties = fetch_raw_query(sql_specialties, [volunteer_id])
-            volunteer_specialty_ids = [s.get('specialty_id') or s.get('SPECIALTY_ID') for s in volunteer_specialties]
+            volunteer_specialty_ids = [s['specialty_id'] for s in volunteer_specialties]
             
             # Enhance projects with match percentage and other data
             enhanced_projects = []
@@ -1660,20 +1559,21 @@ class VolunteerExploreProjectsView(APIView):
                 # Calculate match based on project requirements (simplified - could be improved)
                 match_percentage = 95  # Placeholder, could calculate based on project categories/specialties
                 
-                duration_days = int(proj.get('duration_days', 0) or 0)
+                # duration_days es NULL sin fecha de fin
+                duration_days = int(_or_default(proj['duration_days'], 0))
                 duration_weeks = f"{round(duration_days / 7)} Weeks" if duration_days > 0 else "Ongoing"
-                team_size = int(proj.get('current_volunteers', 0) or 0)
-                
+                team_size = int(proj['current_volunteers'])
+
                 enhanced_projects.append({
-                    'project_id': proj.get('project_id') or proj.get('PROJECT_ID'),
-                    'project_name': proj.get('project_name') or proj.get('PROJECT_NAME'),
-                    'description': proj.get('description') or proj.get('DESCRIPTION') or 'No description available',
-                    'start_date': proj.get('start_date') or proj.get('START_DATE'),
-                    'end_date': proj.get('end_date') or proj.get('END_DATE'),
-                    'ngo_name': proj.get('ngo_name') or proj.get('NGO_NAME'),
-                    'city': proj.get('city') or proj.get('CITY'),
-                    'country': proj.get('country') or proj.get('COUNTRY'),
-                    'status_name': proj.get('status_name') or proj.get('STATUS_NAME'),
+                    'project_id': proj['project_id'],
+                    'project_name': proj['project_name'],
+                    'description': _or_default(proj['description'], 'No description available'),
+                    'start_date': proj['start_date'],
+                    'end_date': proj['end_date'],
+                    'ngo_name': proj['ngo_name'],
+                    'city': proj['city'],
+                    'country': proj['country'],
+                    'status_name': proj['status_name'],
                     'current_volunteers': team_size,
                     'duration_weeks': duration_weeks,
                     'match_percentage': match_percentage
@@ -1737,7 +1637,7 @@ class VolunteerProjectDetailsView(APIView):
                 WHERE vp.project_id = %s AND vp.status = 'A'
             """
             specialties_data = fetch_raw_query(sql_specialties, [project_id, project_id])
-            specialties = [s.get('specialty_name') or s.get('SPECIALTY_NAME') for s in specialties_data if s.get('specialty_name') or s.get('SPECIALTY_NAME')]
+            specialties = [s['specialty_name'] for s in specialties_data if s['specialty_name']]
             
             # Get team members (volunteers assigned to project)
             sql_team = """
@@ -1751,31 +1651,27 @@ class VolunteerProjectDetailsView(APIView):
             """
             team_data = fetch_raw_query(sql_team, [project_id])
             team_members = [{
-                'name': t.get('volunteer_name') or t.get('VOLUNTEER_NAME'),
+                'name': t['volunteer_name'],
                 'role': 'Volunteer'
             } for t in team_data]
             
-            def safe_get_str(d, key, default='N/A'):
-                if not d:
-                    return default
-                return d.get(key.lower()) or d.get(key.upper()) or d.get(key) or default
-            
-            duration_days = int(safe_get_str(project, 'duration_days', 0) or 0)
+            # duration_days es NULL sin fecha de fin
+            duration_days = int(_or_default(project['duration_days'], 0))
             duration_weeks = f"{round(duration_days / 7)} Weeks" if duration_days > 0 else "Ongoing"
-            
+
             return Response({
-                'project_id': int(safe_get_str(project, 'project_id', 0) or 0),
-                'project_name': safe_get_str(project, 'project_name', 'Unknown Project'),
-                'description': safe_get_str(project, 'description', 'No description available'),
-                'start_date': safe_get_str(project, 'start_date', 'N/A'),
-                'end_date': safe_get_str(project, 'end_date', 'N/A'),
-                'location': safe_get_str(project, 'location', 'N/A'),
-                'city': safe_get_str(project, 'city', 'N/A'),
-                'country': safe_get_str(project, 'country', 'N/A'),
-                'ngo_name': safe_get_str(project, 'ngo_name', 'N/A'),
-                'status_name': safe_get_str(project, 'status_name', 'ACTIVO'),
+                'project_id': int(project['project_id']),
+                'project_name': project['project_name'],
+                'description': _or_default(project['description'], 'No description available'),
+                'start_date': _or_default(project['start_date'], 'N/A'),
+                'end_date': _or_default(project['end_date'], 'N/A'),
+                'location': _or_default(project['location'], 'N/A'),
+                'city': _or_default(project['city'], 'N/A'),
+                'country': _or_default(project['country'], 'N/A'),
+                'ngo_name': project['ngo_name'],
+                'status_name': project['status_name'],
                 'duration_weeks': duration_weeks,
-                'current_volunteers': int(safe_get_str(project, 'current_volunteers', 0) or 0),
+                'current_volunteers': int(project['current_volunteers']),
                 'specialties': specialties if specialties else ['Various'],
                 'team_members': team_members
             }, status=status.HTTP_200_OK)
@@ -1798,127 +1694,33 @@ class VolunteerApplyProjectView(APIView):
         project_id = request.data.get('project_id')
         if not project_id:
             return Response({"error": "project_id is required"}, status=status.HTTP_400_BAD_REQUEST)
-        
         try:
-            volunteer_id = int(user.volunteer_id)
             project_id_int = int(project_id)
-            
-            # Validate user corresponds to volunteer
-            sql_check_user = """
-                SELECT volunteer_id FROM System_User 
-                WHERE user_id = %s AND user_role = 'VOLUNTEER'
-            """
-            user_check = fetch_raw_query(sql_check_user, [user.user_id])
-            if not user_check or user_check[0].get('volunteer_id') != volunteer_id:
-                return Response({"error": "Unauthorized user"}, status=status.HTTP_403_FORBIDDEN)
-            
-            # Check if volunteer is already assigned
-            sql_check_assigned = """
-                SELECT COUNT(*) as count
-                FROM Volunteer_Project
-                WHERE volunteer_id = %s AND project_id = %s AND status = 'A'
-            """
-            assigned_check = fetch_raw_query(sql_check_assigned, [volunteer_id, project_id_int])
-            if assigned_check and int(assigned_check[0].get('count', 0) or 0) > 0:
-                return Response({"error": "You are already assigned to this project"}, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Check if there's already a pending application (try both Spanish and English)
-            sql_check_pending = """
-                SELECT COUNT(*) as count
-                FROM Volunteer_Application
-                WHERE volunteer_id = %s AND project_id = %s 
-                AND status IN ('PENDING', 'PENDIENTE')
-            """
-            pending_check = fetch_raw_query(sql_check_pending, [volunteer_id, project_id_int])
-            if pending_check and int(pending_check[0].get('count', 0) or 0) > 0:
-                return Response({"error": "You already have a pending application for this project"}, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Insert application directly - try Spanish first, fallback to English
-            # First, check what status values are accepted by querying the constraint
-            sql_insert = """
-                INSERT INTO Volunteer_Application (
-                    volunteer_id,
-                    project_id,
-                    application_date,
-                    status
-                ) VALUES (
-                    %s,
-                    %s,
-                    SYSTIMESTAMP,
-                    'PENDIENTE'
-                )
-            """
-            
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(sql_insert, [volunteer_id, project_id_int])
-                    # Get the application_id
-                    sql_get_id = """
-                        SELECT application_id 
-                        FROM Volunteer_Application 
-                        WHERE volunteer_id = %s AND project_id = %s 
-                        AND status = 'PENDIENTE'
-                        ORDER BY application_date DESC
-                        FETCH FIRST 1 ROW ONLY
-                    """
-                    app_data = fetch_raw_query(sql_get_id, [volunteer_id, project_id_int])
-                    application_id = app_data[0].get('application_id') if app_data else None
-                    
-                    connection.commit()
-                    
-                    return Response({
-                        "message": "Application submitted successfully",
-                        "application_id": application_id
-                    }, status=status.HTTP_201_CREATED)
-            except Exception as insert_error:
-                error_str = str(insert_error)
-                # If Spanish doesn't work, try English
-                if 'CHK_APPLICATION_STATUS' in error_str or 'restricción' in error_str.lower():
-                    sql_insert_en = """
-                        INSERT INTO Volunteer_Application (
-                            volunteer_id,
-                            project_id,
-                            application_date,
-                            status
-                        ) VALUES (
-                            %s,
-                            %s,
-                            SYSTIMESTAMP,
-                            'PENDING'
-                        )
-                    """
-                    try:
-                        with connection.cursor() as cursor:
-                            cursor.execute(sql_insert_en, [volunteer_id, project_id_int])
-                            sql_get_id_en = """
-                                SELECT application_id 
-                                FROM Volunteer_Application 
-                                WHERE volunteer_id = %s AND project_id = %s 
-                                AND status = 'PENDING'
-                                ORDER BY application_date DESC
-                                FETCH FIRST 1 ROW ONLY
-                            """
-                            app_data = fetch_raw_query(sql_get_id_en, [volunteer_id, project_id_int])
-                            application_id = app_data[0].get('application_id') if app_data else None
-                            connection.commit()
-                            
-                            return Response({
-                                "message": "Application submitted successfully",
-                                "application_id": application_id
-                            }, status=status.HTTP_201_CREATED)
-                    except Exception as insert_error_en:
-                        logger.error(f"Error inserting application (English): {insert_error_en}")
-                        raise insert_error_en
-                else:
-                    raise insert_error
+        except (TypeError, ValueError):
+            return Response({"error": "project_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            # Una sola llamada: valida usuario y proyecto, inserta y devuelve el
+            # id (RETURNING INTO). Con dos clics simultáneos uq_application_pending
+            # deja pasar solo un INSERT; el otro recibe el error de duplicado.
+            application_id = execute_procedure_native(
+                'PKG_WORKFORCE.volunteer_apply_to_project',
+                [int(user.volunteer_id), project_id_int, user.user_id],
+                out_param_index=-1
+            )
+            return Response({
+                "message": "Application submitted successfully",
+                "application_id": int(application_id) if application_id is not None else None
+            }, status=status.HTTP_201_CREATED)
                     
         except Exception as e:
+            error_msg = str(e).split('\n')[0]
+            # -20001/-20002: el usuario no es ese voluntario; -20003: can_volunteer_apply
+            if 'ORA-20001' in error_msg or 'ORA-20002' in error_msg:
+                return Response({"error": "Unauthorized user"}, status=status.HTTP_403_FORBIDDEN)
+            if 'ORA-20003' in error_msg:
+                return Response({"error": error_msg.split('ERROR: ', 1)[-1]}, status=status.HTTP_400_BAD_REQUEST)
             logger.error(f"Error applying to project: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            error_msg = str(e)
-            if 'already have a pending application' in error_msg.lower() or 'already assigned' in error_msg.lower():
-                return Response({"error": "You already have a pending application or are assigned to this project"}, status=status.HTTP_400_BAD_REQUEST)
             return Response({"error": error_msg}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # --- REPRESENTATIVE ENDPOINTS ---
@@ -1962,14 +1764,12 @@ class RepresentativeMyProjectsView(APIView):
             start_date = datetime.strptime(data.get('start_date'), '%Y-%m-%d').date() if data.get('start_date') else None
             end_date = datetime.strptime(data.get('end_date'), '%Y-%m-%d').date() if data.get('end_date') else None
             
-            # Get NGO ID from representative
+            # Get NGO ID from representative (cached principal context)
+            ong_id = representative_ngo(user.representative_id)
+            if not ong_id:
+                return Response({"error": "Representative not found"}, status=status.HTTP_404_NOT_FOUND)
+
             with connection.cursor() as cursor:
-                cursor.execute("SELECT ong_id FROM Representative WHERE representative_id = %s", [user.representative_id])
-                row = cursor.fetchone()
-                if not row:
-                    return Response({"error": "Representative not found"}, status=status.HTTP_404_NOT_FOUND)
-                ong_id = row[0]
-                
                 # Use project_status_id from request, or default to PLANIFICACION
                 status_id = data.get('project_status_id')
                 if not status_id:
@@ -1981,22 +1781,16 @@ class RepresentativeMyProjectsView(APIView):
                 else:
                     status_id = int(status_id)
             
-            native_conn = connection.connection
-            native_cursor = native_conn.cursor()
-            out_id = native_cursor.var(oracledb.NUMBER)
-            
-            native_cursor.callproc('PKG_PROJECT_MGMT.create_project', [
+            new_id = execute_procedure_native('PKG_PROJECT_MGMT.create_project', [
                 data.get('name'),
                 data.get('description', ''),
                 start_date,
                 end_date,
                 status_id,
                 ong_id,
-                user.representative_id,
-                out_id
-            ])
-            native_cursor.close()
-            return Response({"message": "Project draft created successfully", "project_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+                user.representative_id
+            ], out_param_index=-1)
+            return Response({"message": "Project draft created successfully", "project_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error creating project draft: {e}")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -2010,125 +1804,51 @@ class RepresentativeMyNGOView(APIView):
         if user.user_role != 'REPRESENTATIVE' or not user.representative_id:
             return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         try:
+            # NGO, finanzas, representante, proyectos activos y tasa de éxito
+            # en un solo round trip (result sets implícitos)
+            sections = fetch_implicit_results(
+                'PKG_DASHBOARD_ANALYTICS.get_representative_ngo_dashboard', [user.representative_id],
+                names=['ngo', 'financial', 'rep', 'projects', 'success']
+            )
+
             # Get basic NGO info
-            sql_ngo = """SELECT n.ong_id, n.name, n.registration_number, n.country, n.city, 
-                         n.address, n.contact_email, n.phone
-                         FROM NGO n
-                         JOIN Representative r ON n.ong_id = r.ong_id
-                         WHERE r.representative_id = %s"""
-            ngo_data = fetch_raw_query(sql_ngo, [user.representative_id])
+            ngo_data = sections['ngo']
             
             if not ngo_data:
                 return Response({"error": "NGO not found"}, status=status.HTTP_404_NOT_FOUND)
             
             ngo = ngo_data[0]
-            # Handle both lowercase and uppercase keys
-            ong_id = ngo.get('ong_id') or ngo.get('ONG_ID')
-            if not ong_id:
-                logger.error(f"Could not extract ong_id from ngo data: {ngo}")
-                return Response({"error": "Invalid NGO data"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
-            # Get financial overview - calculate directly instead of using view
-            try:
-                sql_financial = """SELECT 
-                                  COUNT(DISTINCT p.project_id) as total_projects,
-                                  COUNT(DISTINCT b.budget_id) as active_budgets,
-                                  NVL(SUM(b.initial_amount), 0) as total_budget,
-                                  NVL(SUM(d.amount), 0) as total_donations_received
-                                  FROM NGO n
-                                  LEFT JOIN Project p ON n.ong_id = p.ong_id
-                                  LEFT JOIN Budget b ON p.project_id = b.project_id
-                                  LEFT JOIN Donation d ON p.project_id = d.project_id
-                                  WHERE n.ong_id = %s"""
-                financial_data = fetch_raw_query(sql_financial, [ong_id])
-                financial = financial_data[0] if financial_data else {}
-            except Exception as fin_err:
-                logger.error(f"Error fetching financial data: {fin_err}")
-                financial = {}
-            
-            # Get representative info
-            try:
-                sql_rep = """SELECT r.first_name || ' ' || r.last_name as representative_name, r.email as rep_email
-                             FROM Representative r
-                             WHERE r.representative_id = %s"""
-                rep_data = fetch_raw_query(sql_rep, [user.representative_id])
-                rep = rep_data[0] if rep_data else {}
-            except Exception as rep_err:
-                logger.error(f"Error fetching representative data: {rep_err}")
-                rep = {}
-            
-            # Get active projects with budget info
-            sql_projects = """SELECT 
-                             p.project_id,
-                             p.name as project_name,
-                             ps.status_name,
-                             NVL(b.initial_amount, 0) as budget_amount,
-                             NVL(c.currency_code, 'USD') as currency_code,
-                             NVL(SUM(d.amount), 0) as total_received,
-                             CASE 
-                                 WHEN NVL(b.initial_amount, 0) > 0 
-                                 THEN ROUND((NVL(SUM(d.amount), 0) / b.initial_amount) * 100, 2)
-                                 ELSE 0
-                             END as budget_utilization_percent
-                             FROM Project p
-                             JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
-                             LEFT JOIN Budget b ON p.project_id = b.project_id
-                             LEFT JOIN Currency c ON b.currency_id = c.currency_id
-                             LEFT JOIN Donation d ON p.project_id = d.project_id
-                             WHERE p.ong_id = %s AND ps.status_name = 'ACTIVO'
-                             GROUP BY p.project_id, p.name, ps.status_name, b.initial_amount, c.currency_code
-                             ORDER BY p.name"""
-            try:
-                active_projects = fetch_raw_query(sql_projects, [ong_id])
-            except Exception as proj_err:
-                logger.error(f"Error fetching active projects: {proj_err}")
-                active_projects = []
-            
+
+            # Las secciones financiera y de éxito son agregados (siempre una
+            # fila); el representante es quien hace la petición
+            financial = sections['financial'][0]
+            rep = sections['rep'][0] if sections['rep'] else {'representative_name': None, 'rep_email': None}
+            active_projects = sections['projects']
+
             # Calculate success rate (completed / total projects)
-            try:
-                sql_success = """SELECT 
-                                COUNT(CASE WHEN ps.status_name = 'COMPLETADO' THEN 1 END) as completed,
-                                COUNT(*) as total
-                                FROM Project p
-                                JOIN Project_Status ps ON p.project_status_id = ps.project_status_id
-                                WHERE p.ong_id = %s"""
-                success_data = fetch_raw_query(sql_success, [ong_id])
-                success = success_data[0] if success_data else {}
-            except Exception as success_err:
-                logger.error(f"Error fetching success rate data: {success_err}")
-                success = {'completed': 0, 'total': 0}
-            def safe_get_success(key):
-                val = success.get(key.lower()) or success.get(key.upper()) or success.get(key) or 0
-                return int(val) if val else 0
-            completed = safe_get_success('completed')
-            total = safe_get_success('total')
+            success = sections['success'][0]
+            completed = int(_or_default(success['completed'], 0))
+            total = int(_or_default(success['total'], 0))
             success_rate = f"{round((completed / max(total, 1)) * 100, 1)}%" if total > 0 else "0%"
-            
-            # Helper function to safely get values from dict (handles both lowercase and uppercase keys)
-            def safe_get(d, key, default=None):
-                """Get value from dict handling both lowercase and uppercase keys"""
-                if not d:
-                    return default
-                return d.get(key.lower()) or d.get(key.upper()) or d.get(key) or default
-            
+
             # Structure response
             response_data = {
-                "name": safe_get(ngo, 'name', 'N/A'),
-                "city": safe_get(ngo, 'city', 'N/A'),
-                "country": safe_get(ngo, 'country', 'N/A'),
+                "name": ngo['name'],
+                "city": _or_default(ngo['city'], 'N/A'),
+                "country": _or_default(ngo['country'], 'N/A'),
                 "memberSince": '2024',  # Default value, can be updated later if registration_date exists
                 "overview": {
-                    "totalProjects": int(safe_get(financial, 'total_projects', 0) or 0),
-                    "active": int(safe_get(financial, 'active_budgets', 0) or 0),
-                    "totalRaised": float(safe_get(financial, 'total_donations_received', 0) or 0),
+                    "totalProjects": int(_or_default(financial['total_projects'], 0)),
+                    "active": int(_or_default(financial['active_budgets'], 0)),
+                    "totalRaised": float(_or_default(financial['total_donations_received'], 0)),
                     "successRate": success_rate
                 },
                 "contact": {
-                    "address": safe_get(ngo, 'address', 'N/A'),
-                    "phone": safe_get(ngo, 'phone', 'N/A'),
-                    "email": safe_get(ngo, 'contact_email') or safe_get(ngo, 'CONTACT_EMAIL') or 'N/A',
-                    "representative": safe_get(rep, 'representative_name', 'N/A'),
-                    "repEmail": safe_get(rep, 'rep_email') or safe_get(rep, 'REP_EMAIL') or 'N/A'
+                    "address": _or_default(ngo['address'], 'N/A'),
+                    "phone": _or_default(ngo['phone'], 'N/A'),
+                    "email": _or_default(ngo['contact_email'], 'N/A'),
+                    "representative": _or_default(rep['representative_name'], 'N/A'),
+                    "repEmail": _or_default(rep['rep_email'], 'N/A')
                 },
                 "activeProjects": active_projects or []
             }
@@ -2267,17 +1987,16 @@ class EmployeeProjectManagementView(APIView):
             start_date = datetime.strptime(data.get('start_date'), '%Y-%m-%d').date() if data.get('start_date') else None
             end_date = datetime.strptime(data.get('end_date'), '%Y-%m-%d').date() if data.get('end_date') else None
             
-            with connection.cursor() as cursor:
-                cursor.callproc('PKG_PROJECT_MGMT.update_project_details', [
-                    project_id,
-                    data.get('name'),
-                    data.get('description', ''),
-                    start_date,
-                    end_date,
-                    data.get('project_status_id'),
-                    data.get('ong_id'),
-                    data.get('representative_id')
-                ])
+            execute_procedure_native('PKG_PROJECT_MGMT.update_project_details', [
+                project_id,
+                data.get('name'),
+                data.get('description', ''),
+                start_date,
+                end_date,
+                data.get('project_status_id'),
+                data.get('ong_id'),
+                data.get('representative_id')
+            ])
             return Response({"message": "Project updated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error updating project: {e}")
@@ -2364,27 +2083,14 @@ class EmployeeVolunteerAssignmentView(APIView):
         
         # Verify that the employee supervises this project
         try:
-            check_sql = """
-                SELECT COUNT(*) as cnt
-                FROM Approval a
-                WHERE a.project_id = %s AND a.employee_id = %s
-            """
-            check_result = fetch_raw_query(check_sql, [project_id, user.employee_id])
-            if not check_result or check_result[0].get('cnt', 0) == 0:
+            if not supervises(user.employee_id, project_id):
                 return Response({"error": "You can only assign volunteers to projects you supervise"}, status=status.HTTP_403_FORBIDDEN)
             
-            with connection.cursor() as cursor:
-                native_conn = connection.connection
-                native_cursor = native_conn.cursor()
-                out_id = native_cursor.var(oracledb.NUMBER)
-                
-                native_cursor.callproc('PKG_WORKFORCE.assign_volunteer_to_project', [
-                    int(project_id),
-                    int(volunteer_id),
-                    out_id
-                ])
-                native_cursor.close()
-                return Response({"message": "Volunteer assigned successfully", "assignment_id": out_id.getvalue()}, status=status.HTTP_201_CREATED)
+            new_id = execute_procedure_native('PKG_WORKFORCE.assign_volunteer_to_project', [
+                int(project_id),
+                int(volunteer_id)
+            ], out_param_index=-1)
+            return Response({"message": "Volunteer assigned successfully", "assignment_id": new_id}, status=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Error assigning volunteer: {e}")
             import traceback
@@ -2403,14 +2109,9 @@ class EmployeeVolunteerAssignmentView(APIView):
         
         try:
             # Verify that the employee supervises the project for this assignment
-            check_sql = """
-                SELECT vp.project_id
-                FROM Volunteer_Project vp
-                JOIN Approval a ON vp.project_id = a.project_id AND a.employee_id = %s
-                WHERE vp.assignment_id = %s
-            """
-            check_result = fetch_raw_query(check_sql, [user.employee_id, assignment_id])
-            if not check_result:
+            check_sql = "SELECT project_id FROM Volunteer_Project WHERE assignment_id = %s"
+            check_result = fetch_raw_query(check_sql, [assignment_id], mode=ROWS_TUPLE)
+            if not check_result or not supervises(user.employee_id, check_result[0][0]):
                 return Response({"error": "Assignment not found or you don't supervise this project"}, status=status.HTTP_404_NOT_FOUND)
             
             # Update assignment status to 'I' (Inactive) and set end_date
@@ -2421,6 +2122,8 @@ class EmployeeVolunteerAssignmentView(APIView):
             """
             with connection.cursor() as cursor:
                 cursor.execute(update_sql, [assignment_id])
+            # trg_kpi_active_volunteers actualiza también el KPI de voluntarios
+            bump_tables('Volunteer_Project', 'Volunteer_Activity_Summary', 'KPI_Snapshot')
             
             return Response({"message": "Volunteer removed successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -2435,10 +2138,9 @@ class ProjectStatusListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        """List all project statuses."""
+        """List all project statuses (reference data cache)."""
         try:
-            sql = "SELECT project_status_id as id, status_name as name FROM Project_Status ORDER BY project_status_id"
-            statuses = fetch_raw_query(sql)
+            statuses = refdata.get('project_statuses')
             return Response(statuses, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Error fetching project statuses: {e}")